@@ -0,0 +1,71 @@
+"""add_tag_tier_percentile
+
+Revision ID: l3h4i5j6k7l8
+Revises: k2g3h4i5j6k7
+Create Date: 2026-10-17 00:00:00.000000
+
+변경 내용:
+1. tag_tier_percentile 테이블 신규 생성
+   - 태그별 티어 누적 백분위(percentile_start / percentile_end)를 사전 계산해 저장
+   - 추천 쿼리가 매 시도마다 윈도우 함수로 태그 전체를 집계하지 않도록 함
+   - ProblemMetadataSyncService.recalculate_tag_tier_ranges()에서 갱신
+2. 기존 데이터로 초기 적재 (다음 주간 동기화 전까지 사용)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'l3h4i5j6k7l8'
+down_revision: Union[str, None] = 'k2g3h4i5j6k7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tag_tier_percentile',
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.Column('tier', sa.Integer(), nullable=False),
+        sa.Column('percentile_start', sa.Float(), nullable=False),
+        sa.Column('percentile_end', sa.Float(), nullable=False),
+        sa.Column('problem_cnt', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('NOW()')),
+        sa.ForeignKeyConstraint(['tag_id'], ['tag.tag_id'], ),
+        sa.ForeignKeyConstraint(['tier'], ['tier.tier_id'], ),
+        sa.PrimaryKeyConstraint('tag_id', 'tier'),
+        comment='태그별 티어 누적 백분위 (추천 쿼리용 사전 계산 테이블)',
+    )
+
+    op.execute(sa.text("""
+        INSERT INTO tag_tier_percentile (
+            tag_id, tier, percentile_start, percentile_end, problem_cnt, updated_at
+        )
+        SELECT
+            c.tag_id,
+            c.tier,
+            1 - COALESCE(SUM(c.problem_cnt) OVER (
+                PARTITION BY c.tag_id ORDER BY c.tier
+                ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+            ), 0) / SUM(c.problem_cnt) OVER (PARTITION BY c.tag_id),
+            1 - SUM(c.problem_cnt) OVER (
+                PARTITION BY c.tag_id ORDER BY c.tier
+                ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+            ) / SUM(c.problem_cnt) OVER (PARTITION BY c.tag_id),
+            c.problem_cnt,
+            NOW()
+        FROM (
+            SELECT pt.tag_id, p.problem_tier_level AS tier, COUNT(*) AS problem_cnt
+            FROM problem p
+            JOIN problem_tag pt ON p.problem_id = pt.problem_id
+            JOIN tag t ON t.tag_id = pt.tag_id
+            WHERE p.deleted_at IS NULL
+              AND p.solved_user_count >= t.min_solved_person_count
+            GROUP BY pt.tag_id, p.problem_tier_level
+        ) c
+    """))
+
+
+def downgrade() -> None:
+    op.drop_table('tag_tier_percentile')
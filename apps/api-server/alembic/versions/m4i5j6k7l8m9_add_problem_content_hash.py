@@ -0,0 +1,33 @@
+"""add_problem_content_hash
+
+Revision ID: m4i5j6k7l8m9
+Revises: l3h4i5j6k7l8
+Create Date: 2026-10-17 00:00:00.000000
+
+변경 내용:
+1. problem.content_hash 컬럼 추가
+   - 제목 / 티어 / 맞은 사람 수 구간 / 태그 집합의 해시 (ProblemContentHash)
+   - ProblemMetadataSyncService가 해시가 달라진 문제만 다시 쓰도록 함 (delta 동기화)
+   - 기존 행은 NULL → 첫 동기화에서 한 번 전체 기록됨
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'm4i5j6k7l8m9'
+down_revision: Union[str, None] = 'l3h4i5j6k7l8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'problem',
+        sa.Column('content_hash', sa.String(length=32), nullable=True, comment='동기화 내용 해시'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('problem', 'content_hash')
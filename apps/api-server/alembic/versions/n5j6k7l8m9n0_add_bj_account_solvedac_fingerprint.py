@@ -0,0 +1,33 @@
+"""add_bj_account_solvedac_fingerprint
+
+Revision ID: n5j6k7l8m9n0
+Revises: m4i5j6k7l8m9
+Create Date: 2026-10-17 00:00:00.000000
+
+변경 내용:
+1. bj_account.solvedac_fingerprint 컬럼 추가
+   - 마지막 동기화 시점의 푼 문제 수 / 레이팅 / 레벨별 푼 문제 수 (SolvedacFingerprint)
+   - UpdateBjAccountUsecase가 변경 없는 계정은 건너뛰고, 늘어난 레벨만 검색하도록 함
+   - 기존 행은 NULL → 첫 갱신에서 한 번 전체 수집 후 채워짐
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'n5j6k7l8m9n0'
+down_revision: Union[str, None] = 'm4i5j6k7l8m9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'bj_account',
+        sa.Column('solvedac_fingerprint', sa.JSON(), nullable=True, comment='마지막 동기화 시점 solved.ac 상태 요약'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('bj_account', 'solvedac_fingerprint')
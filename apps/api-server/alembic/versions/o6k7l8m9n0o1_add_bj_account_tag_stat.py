@@ -0,0 +1,74 @@
+"""add_bj_account_tag_stat
+
+Revision ID: o6k7l8m9n0o1
+Revises: n5j6k7l8m9n0
+Create Date: 2026-10-17 00:00:00.000000
+
+변경 내용:
+1. bj_account_tag_stat 테이블 신규 생성
+   - (bj_account_id, user_account_id, tag_id)별 푼 문제 수 / 최고 티어 / 마지막 풀이 날짜
+   - 추천 / 유저 태그 화면이 매번 problem_history ⋈ problem_tag ⋈ problem을 집계하지 않도록 함
+   - UpdateBjAccountUsecase(신규 problem_history), UserActivityRepository(날짜 기록 저장)에서 증분 갱신
+2. 활성 account_link 기준으로 초기 적재
+   - 이후 재적재 / 정합성 확인: python scripts/rebuild_bj_account_tag_stat.py [--check]
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'o6k7l8m9n0o1'
+down_revision: Union[str, None] = 'n5j6k7l8m9n0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'bj_account_tag_stat',
+        sa.Column('bj_account_id', sa.String(length=50), nullable=False),
+        sa.Column('user_account_id', sa.Integer(), nullable=False),
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.Column('solved_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('highest_tier_id', sa.Integer(), nullable=True),
+        sa.Column('last_solved_date', sa.Date(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('NOW()')),
+        sa.PrimaryKeyConstraint('bj_account_id', 'user_account_id', 'tag_id'),
+        comment='백준 계정 태그별 통계 (사전 계산 테이블)',
+    )
+    op.create_index('idx_bj_account_tag_stat_user', 'bj_account_tag_stat', ['user_account_id'])
+
+    op.execute(sa.text("""
+        INSERT INTO bj_account_tag_stat (
+            bj_account_id, user_account_id, tag_id,
+            solved_count, highest_tier_id, last_solved_date, updated_at
+        )
+        SELECT
+            al.bj_account_id,
+            al.user_account_id,
+            pt.tag_id,
+            COUNT(DISTINCT ph.problem_id),
+            MAX(p.problem_tier_level),
+            MAX(dr.marked_date),
+            NOW()
+        FROM account_link al
+        JOIN problem_history ph ON ph.bj_account_id = al.bj_account_id
+        JOIN problem_tag pt ON pt.problem_id = ph.problem_id
+        JOIN problem p ON p.problem_id = ph.problem_id
+        LEFT JOIN user_problem_status ups
+            ON ups.problem_id = ph.problem_id
+            AND ups.user_account_id = al.user_account_id
+            AND ups.solved_yn = TRUE
+            AND ups.deleted_at IS NULL
+        LEFT JOIN problem_date_record dr
+            ON dr.user_problem_status_id = ups.user_problem_status_id
+            AND dr.record_type = 'SOLVED'
+            AND dr.deleted_at IS NULL
+        WHERE al.deleted_at IS NULL
+        GROUP BY al.bj_account_id, al.user_account_id, pt.tag_id
+    """))
+
+
+def downgrade() -> None:
+    op.drop_table('bj_account_tag_stat')
@@ -0,0 +1,34 @@
+"""add_account_link_tag_stat_built_at
+
+Revision ID: p7l8m9n0o1p2
+Revises: o6k7l8m9n0o1
+Create Date: 2026-10-17 00:00:00.000000
+
+변경 내용:
+1. account_link.tag_stat_built_at 컬럼 추가
+   - bj_account_tag_stat 전체 적재 시각 (BjAccountTagStatRepository.rebuild에서 기록)
+   - 통계 행이 0개인 계정을 "미적재"로 오인해 매 조회마다 직접 집계하지 않도록 함
+2. 활성 연동은 o6k7l8m9n0o1에서 이미 적재되었으므로 현재 시각으로 채움
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'p7l8m9n0o1p2'
+down_revision: Union[str, None] = 'o6k7l8m9n0o1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'account_link',
+        sa.Column('tag_stat_built_at', sa.DateTime(), nullable=True, comment='bj_account_tag_stat 전체 적재 시각'),
+    )
+    op.execute(sa.text("UPDATE account_link SET tag_stat_built_at = NOW() WHERE deleted_at IS NULL"))
+
+
+def downgrade() -> None:
+    op.drop_column('account_link', 'tag_stat_built_at')
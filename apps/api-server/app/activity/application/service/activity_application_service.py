@@ -21,7 +21,7 @@ from app.activity.application.query.monthly_activity_data_query import (
 from app.activity.domain.entity.user_problem_status import UserProblemStatus
 from app.problem.application.query.problems_info_query import ProblemsInfoQuery
 from app.activity.domain.entity.user_activity import UserActivity
-from app.activity.domain.event.payloads import BatchProblemsUpdatedPayload, GetProblemsInfoPayload, GetTagSummaryPayload, GetTagSummaryResultPayload, GetTagSummarysPayload, GetTagSummarysResultPayload
+from app.activity.domain.event.payloads import BatchProblemsUpdatedPayload, GetProblemsInfoPayload, ProblemStatusChangedPayload, GetTagSummaryPayload, GetTagSummaryResultPayload, GetTagSummarysPayload, GetTagSummarysResultPayload
 from app.activity.domain.entity.user_date_record import UserDateRecord
 from app.activity.domain.repository.user_activity_repository import UserActivityRepository
 from app.activity.domain.repository.user_date_record_repository import UserDateRecordRepository
@@ -299,6 +299,8 @@ class ActivityApplicationService:
                 udr = UserDateRecord.create(user_id, bj_account_id_str, d, count)
                 await self.user_date_record_repository.upsert(udr)
 
+        await self._publish_problem_status_changed(command.user_account_id)
+
     @transactional
     async def update_solved_and_will_solve_problems(
         self,
@@ -572,6 +574,7 @@ class ActivityApplicationService:
         activity.ban_problem(ProblemId(command.problem_id))
 
         await self.user_activity_repository.save_problem_banned_record(activity)
+        await self._publish_problem_status_changed(command.user_account_id)
 
     @transactional
     async def unban_problem(self, command: BanProblemCommand):
@@ -580,6 +583,17 @@ class ActivityApplicationService:
 
         activity.remove_ban_problem(ProblemId(command.problem_id))
         await self.user_activity_repository.save_problem_banned_record(activity)
+        await self._publish_problem_status_changed(command.user_account_id)
+
+    async def _publish_problem_status_changed(self, user_account_id: int) -> None:
+        """풀이/밴 기록 변경 이벤트 발행 (after_commit, 추천 제외 캐시 무효화용)"""
+        await self.domain_event_bus.publish(
+            DomainEvent(
+                event_type="PROBLEM_STATUS_CHANGED",
+                data=ProblemStatusChangedPayload(user_account_id=user_account_id),
+            ),
+            after_commit=True,
+        )
 
     def _validate_order_consistency(self, problem_ids: list[int]):
         if len(problem_ids) != len(set(problem_ids)):
@@ -29,4 +29,9 @@ class GetProblemsInfoPayload(BaseModel):
 class BatchProblemsUpdatedPayload(BaseModel):
     user_account_id: int
     problem_ids: list[int]
-    date: str
\ No newline at end of file
+    date: str
+
+
+class ProblemStatusChangedPayload(BaseModel):
+    """풀이/밴 문제 기록 변경 알림 (추천 제외 캐시 무효화용)"""
+    user_account_id: int
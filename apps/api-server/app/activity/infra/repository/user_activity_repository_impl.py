@@ -3,7 +3,7 @@ from calendar import monthrange
 from datetime import date, datetime
 from typing import override
 
-from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy import and_, delete, func, or_, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -16,8 +16,9 @@ from app.activity.infra.mapper.user_problem_status_mapper import UserProblemStat
 from app.activity.infra.model.user_problem_status import UserProblemStatusModel
 from app.activity.infra.model.problem_date_record import ProblemDateRecordModel, RecordType
 from app.activity.infra.model.tag_custom import TagCustomModel
+from app.baekjoon.domain.repository.bj_account_tag_stat_repository import BjAccountTagStatRepository
 from app.common.domain.vo.identifiers import UserAccountId
-from app.core.database import Database
+from app.core.database import Database, request_cached
 from app.user.infra.model.account_link import AccountLinkModel
 from app.user.infra.model.user_account import UserAccountModel
 
@@ -30,27 +31,40 @@ class UserActivityRepositoryImpl(UserActivityRepository):
     - ProblemDateRecordModel: 날짜별 디테일 (1:N의 N)
     """
 
-    def __init__(self, db: Database):
+    def __init__(
+        self,
+        db: Database,
+        bj_account_tag_stat_repository: BjAccountTagStatRepository | None = None
+    ):
         self.db = db
+        self.bj_account_tag_stat_repository = bj_account_tag_stat_repository
 
     @property
     def session(self) -> AsyncSession:
         return self.db.get_current_session()
 
     async def _get_active_bj_account_id(self, user_account_id_value: int) -> str | None:
-        """현재 활성 BJ 계정 ID 조회 (account_link.deleted_at IS NULL)"""
-        stmt = (
-            select(AccountLinkModel.bj_account_id)
-            .where(
-                and_(
-                    AccountLinkModel.user_account_id == user_account_id_value,
-                    AccountLinkModel.deleted_at.is_(None)
+        """현재 활성 BJ 계정 ID 조회 (account_link.deleted_at IS NULL)
+
+        한 요청에서 여러 finder가 같은 유저로 호출되므로 세션 범위로 memoize
+        """
+        async def load() -> str | None:
+            stmt = (
+                select(AccountLinkModel.bj_account_id)
+                .where(
+                    and_(
+                        AccountLinkModel.user_account_id == user_account_id_value,
+                        AccountLinkModel.deleted_at.is_(None)
+                    )
                 )
+                .limit(1)
             )
-            .limit(1)
+            result = await self.session.execute(stmt)
+            return result.scalar_one_or_none()
+
+        return await request_cached(
+            ("active_bj_account_id", user_account_id_value), load, depends_on=("account_link",)
         )
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
 
     @override
     async def find_by_user_account_id(
@@ -383,19 +397,248 @@ class UserActivityRepositoryImpl(UserActivityRepository):
         for entity in statuses:
             await self._save_status_with_date_records(entity)
         await self.session.flush()
+        await self._refresh_tag_stat_dates(statuses)
 
     @override
     async def save_all_problem_records(
         self,
         statuses: list[UserProblemStatus]
     ) -> None:
-        """푼 문제 일괄 저장 (Upsert)"""
+        """푼 문제 일괄 저장 (Upsert)
+
+        계정 연동 / 스케줄러 갱신에서 수천 건이 들어오므로 건별 조회 대신 집합 단위로 저장한다.
+        """
         if not statuses:
             return
-        for entity in statuses:
-            await self._save_status_with_date_records(entity)
+        await self._bulk_save_statuses(statuses)
+        await self._refresh_tag_stat_dates(statuses)
+
+    async def _refresh_tag_stat_dates(self, statuses: list[UserProblemStatus]) -> None:
+        """날짜 기록이 바뀐 문제의 bj_account_tag_stat.last_solved_date 갱신 (BJ 계정에 묶인 상태만)"""
+        if self.bj_account_tag_stat_repository is None:
+            return
+        problem_ids_by_user: dict[int, set[int]] = {}
+        for status in statuses:
+            if status.bj_account_id is not None:
+                problem_ids_by_user.setdefault(status.user_account_id.value, set()).add(status.problem_id.value)
+        for user_account_id, problem_ids in problem_ids_by_user.items():
+            await self.bj_account_tag_stat_repository.refresh_last_solved_dates(
+                UserAccountId(user_account_id), sorted(problem_ids)
+            )
+
+    async def _bulk_save_statuses(self, statuses: list[UserProblemStatus]) -> None:
+        """UserProblemStatus (+ date_records) 일괄 Upsert
+
+        _save_status_with_date_records와 같은 규칙을 배치 단위로 적용한다.
+        1. 기존 status / 활성 SOLVED date_record를 IN 쿼리 2번으로 미리 조회
+        2. status를 multi-row INSERT ... ON DUPLICATE KEY UPDATE로 저장 (기존 행은 PK로 갱신)
+           새로 만든 status가 있으면 ID를 한 번 더 조회
+        3. WILL_SOLVE → SOLVED로 바뀐 status의 활성 WILL_SOLVE 기록을 UPDATE 1번으로 소프트 삭제
+        4. date_record를 multi-row INSERT ... ON DUPLICATE KEY UPDATE로 저장
+           (ID가 있으면 갱신, 없으면 생성 - 활성 SOLVED가 이미 있는 status에는 새 SOLVED를 만들지 않음)
+
+        VALUES 절이 placeholder로만 이루어져 있어 드라이버가 executemany를 한 문장으로 보낸다.
+        같은 (user, bj_account, problem)이 한 배치에 여러 번 오면 마지막 상태가 남는다.
+        """
+        # 세션에 남은 ORM 변경을 먼저 반영해야 아래 SQL이 같은 상태를 봄
         await self.session.flush()
 
+        existing = await self._find_status_rows({self._status_key(entity) for entity in statuses})
+        active_solved = await self._find_active_solved_record_ids({status_id for status_id, _ in existing.values()})
+
+        status_ids: dict[tuple[int, str | None, int], int] = {
+            key: status_id for key, (status_id, _) in existing.items()
+        }
+        solved_now: dict[tuple[int, str | None, int], bool] = {
+            key: solved_yn for key, (_, solved_yn) in existing.items()
+        }
+        will_solve_to_delete: set[int] = set()
+        for entity in statuses:
+            key = self._status_key(entity)
+            # WILL_SOLVE → SOLVED 전환: 기존 활성 WILL_SOLVE date_record 소프트 삭제 대상
+            if key in status_ids and not solved_now[key] and entity.solved_yn:
+                will_solve_to_delete.add(status_ids[key])
+            solved_now[key] = entity.solved_yn
+
+        await self.session.execute(
+            text("""
+                INSERT INTO user_problem_status (
+                    user_problem_status_id, user_account_id, bj_account_id, problem_id,
+                    banned_yn, solved_yn, representative_tag_id, memo_title, content,
+                    created_at, updated_at, deleted_at
+                )
+                VALUES (
+                    :id, :uid, :bj, :pid,
+                    :banned, :solved, :tag, :memo_title, :content,
+                    :created_at, :updated_at, :deleted_at
+                )
+                ON DUPLICATE KEY UPDATE
+                    banned_yn             = VALUES(banned_yn),
+                    solved_yn             = VALUES(solved_yn),
+                    representative_tag_id = VALUES(representative_tag_id),
+                    memo_title            = VALUES(memo_title),
+                    content               = VALUES(content),
+                    updated_at            = VALUES(updated_at),
+                    deleted_at            = VALUES(deleted_at)
+            """),
+            [
+                {
+                    "id": status_ids.get(self._status_key(entity)),
+                    "uid": entity.user_account_id.value,
+                    "bj": entity.bj_account_id,
+                    "pid": entity.problem_id.value,
+                    "banned": entity.banned_yn,
+                    "solved": entity.solved_yn,
+                    "tag": entity.representative_tag_id.value if entity.representative_tag_id else None,
+                    "memo_title": entity.memo_title,
+                    "content": entity.content,
+                    "created_at": entity.created_at,
+                    "updated_at": entity.updated_at,
+                    "deleted_at": entity.deleted_at,
+                }
+                for entity in statuses
+            ],
+        )
+
+        new_keys = {self._status_key(entity) for entity in statuses} - status_ids.keys()
+        if new_keys:
+            created = await self._find_status_rows(new_keys)
+            status_ids.update({key: status_id for key, (status_id, _) in created.items()})
+
+        if will_solve_to_delete:
+            now = datetime.now()
+            await self.session.execute(
+                update(ProblemDateRecordModel)
+                .where(
+                    and_(
+                        ProblemDateRecordModel.user_problem_status_id.in_(will_solve_to_delete),
+                        ProblemDateRecordModel.record_type == RecordType.WILL_SOLVE,
+                        ProblemDateRecordModel.deleted_at.is_(None),
+                    )
+                )
+                .values(deleted_at=now, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+
+        date_record_rows = self._build_date_record_rows(statuses, status_ids, active_solved)
+        if date_record_rows:
+            await self.session.execute(
+                text("""
+                    INSERT INTO problem_date_record (
+                        problem_date_record_id, user_problem_status_id,
+                        marked_date, record_type, display_order,
+                        created_at, updated_at, deleted_at
+                    )
+                    VALUES (
+                        :id, :status_id,
+                        :marked_date, :record_type, :display_order,
+                        :created_at, :updated_at, :deleted_at
+                    )
+                    ON DUPLICATE KEY UPDATE
+                        marked_date   = VALUES(marked_date),
+                        display_order = VALUES(display_order),
+                        updated_at    = VALUES(updated_at),
+                        deleted_at    = VALUES(deleted_at)
+                """),
+                date_record_rows,
+            )
+
+        # SQL로 직접 바꾼 행이 세션에 로드된 ORM 객체로 남아 있으면 이후 조회가 옛 값을 보므로 만료시킴
+        for obj in list(self.session.identity_map.values()):
+            if isinstance(obj, (UserProblemStatusModel, ProblemDateRecordModel)):
+                self.session.expire(obj)
+
+    @staticmethod
+    def _status_key(entity: UserProblemStatus) -> tuple[int, str | None, int]:
+        return entity.user_account_id.value, entity.bj_account_id, entity.problem_id.value
+
+    async def _find_status_rows(
+        self,
+        keys: set[tuple[int, str | None, int]]
+    ) -> dict[tuple[int, str | None, int], tuple[int, bool]]:
+        """(user, bj_account, problem) → (user_problem_status_id, solved_yn) - (user, bj_account)별 problem_id IN 조건을 한 쿼리로"""
+        problem_ids_by_owner: dict[tuple[int, str | None], list[int]] = {}
+        for user_account_id, bj_account_id, problem_id in keys:
+            problem_ids_by_owner.setdefault((user_account_id, bj_account_id), []).append(problem_id)
+
+        conditions = [
+            and_(
+                UserProblemStatusModel.user_account_id == user_account_id,
+                # BANNED 레코드: bj_account_id IS NULL
+                UserProblemStatusModel.bj_account_id.is_(None) if bj_account_id is None
+                else UserProblemStatusModel.bj_account_id == bj_account_id,
+                UserProblemStatusModel.problem_id.in_(problem_ids),
+            )
+            for (user_account_id, bj_account_id), problem_ids in problem_ids_by_owner.items()
+        ]
+        stmt = select(
+            UserProblemStatusModel.user_problem_status_id,
+            UserProblemStatusModel.user_account_id,
+            UserProblemStatusModel.bj_account_id,
+            UserProblemStatusModel.problem_id,
+            UserProblemStatusModel.solved_yn,
+        ).where(or_(*conditions))
+        result = await self.session.execute(stmt)
+        return {
+            (row.user_account_id, row.bj_account_id, row.problem_id): (row.user_problem_status_id, row.solved_yn)
+            for row in result.all()
+        }
+
+    async def _find_active_solved_record_ids(self, status_ids: set[int]) -> dict[int, set[int]]:
+        """status ID → 활성 SOLVED date_record ID 집합"""
+        if not status_ids:
+            return {}
+        stmt = select(
+            ProblemDateRecordModel.problem_date_record_id,
+            ProblemDateRecordModel.user_problem_status_id,
+        ).where(
+            and_(
+                ProblemDateRecordModel.user_problem_status_id.in_(status_ids),
+                ProblemDateRecordModel.record_type == RecordType.SOLVED,
+                ProblemDateRecordModel.deleted_at.is_(None),
+            )
+        )
+        result = await self.session.execute(stmt)
+        active: dict[int, set[int]] = {}
+        for row in result.all():
+            active.setdefault(row.user_problem_status_id, set()).add(row.problem_date_record_id)
+        return active
+
+    def _build_date_record_rows(
+        self,
+        statuses: list[UserProblemStatus],
+        status_ids: dict[tuple[int, str | None, int], int],
+        active_solved: dict[int, set[int]],
+    ) -> list[dict]:
+        rows = []
+        for entity in statuses:
+            status_id = status_ids[self._status_key(entity)]
+            solved_ids = active_solved.setdefault(status_id, set())
+            for date_record in entity.date_records:
+                is_solved = date_record.record_type == RecordType.SOLVED
+                if date_record.problem_date_record_id:
+                    if is_solved:
+                        if date_record.deleted_at is None:
+                            solved_ids.add(date_record.problem_date_record_id)
+                        else:
+                            solved_ids.discard(date_record.problem_date_record_id)
+                elif is_solved:
+                    # 새 SOLVED 생성 시 활성 SOLVED 중복 방지 (Req 3)
+                    if solved_ids:
+                        continue
+                    solved_ids.add(0)  # 0: 이번 배치에서 새로 만든 활성 SOLVED
+                rows.append({
+                    "id": date_record.problem_date_record_id,
+                    "status_id": status_id,
+                    "marked_date": date_record.marked_date,
+                    "record_type": date_record.record_type.value,
+                    "display_order": date_record.display_order,
+                    "created_at": date_record.created_at,
+                    "updated_at": date_record.updated_at,
+                    "deleted_at": date_record.deleted_at,
+                })
+        return rows
+
     @override
     async def save_problem_status(self, status: UserProblemStatus) -> None:
         """단일 UserProblemStatus 저장"""
@@ -403,6 +646,7 @@ class UserActivityRepositoryImpl(UserActivityRepository):
             return
         await self._save_status_with_date_records(status)
         await self.session.flush()
+        await self._refresh_tag_stat_dates([status])
 
     @override
     async def find_only_tag_custom_by_user_account_id(
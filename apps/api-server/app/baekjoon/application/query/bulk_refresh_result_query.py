@@ -0,0 +1,22 @@
+"""스케줄러 일괄 계정 갱신 결과 Query"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class BulkRefreshResultQuery:
+    total_count: int             # 전체 대상 계정 수
+    resumed_count: int = 0       # 체크포인트 이전이라 건너뛴 계정 수 (재시작 시)
+    succeeded_count: int = 0
+    failed_count: int = 0
+    retried_count: int = 0       # 재시도한 횟수 (계정별 시도 합)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def processed_count(self) -> int:
+        return self.succeeded_count + self.failed_count
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 계정 수"""
+        return self.processed_count / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.baekjoon.domain.entity.link_job import LinkJob
+
+
+@dataclass
+class LinkJobQuery:
+    """비동기 백준 계정 연동 작업 상태"""
+    job_id: str
+    bj_account_id: str
+    status: str
+    stage: str | None
+    error_code: str | None
+    error_message: str | None
+    created_at: datetime
+    updated_at: datetime
+
+    @staticmethod
+    def from_entity(job: LinkJob) -> 'LinkJobQuery':
+        return LinkJobQuery(
+            job_id=job.job_id,
+            bj_account_id=job.bj_account_id,
+            status=job.status.value,
+            stage=job.stage.value if job.stage else None,
+            error_code=job.error_code,
+            error_message=job.error_message,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        )
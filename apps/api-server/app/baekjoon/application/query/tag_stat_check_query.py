@@ -0,0 +1,30 @@
+"""태그별 통계(bj_account_tag_stat) 재적재 / 정합성 확인 결과 Query"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TagStatMismatchQuery:
+    bj_account_id: str
+    user_account_id: int
+    missing_tag_ids: list[int] = field(default_factory=list)     # 집계에는 있지만 저장되지 않은 태그
+    unexpected_tag_ids: list[int] = field(default_factory=list)  # 저장됐지만 집계에는 없는 태그
+    changed_tag_ids: list[int] = field(default_factory=list)     # 값(개수 / 티어 / 날짜)이 다른 태그
+
+
+@dataclass
+class TagStatCheckResultQuery:
+    checked_count: int                # 확인한 (백준 계정, 유저) 수
+    mismatches: list[TagStatMismatchQuery] = field(default_factory=list)
+    fixed_count: int = 0              # fix=True로 다시 적재한 수
+
+    @property
+    def consistent(self) -> bool:
+        return not self.mismatches
+
+
+@dataclass
+class TagStatRebuildResultQuery:
+    rebuilt_count: int                # 재적재한 (백준 계정, 유저) 수
+    row_count: int = 0                # 저장된 태그 행 수 합계
+    deleted_unlinked_count: int = 0   # 연동이 끊긴 계정의 행 삭제 수
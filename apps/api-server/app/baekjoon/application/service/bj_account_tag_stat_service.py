@@ -0,0 +1,136 @@
+import logging
+
+from app.baekjoon.application.query.tag_stat_check_query import (
+    TagStatCheckResultQuery,
+    TagStatMismatchQuery,
+    TagStatRebuildResultQuery
+)
+from app.baekjoon.domain.repository.baekjoon_account_repository import BaekjoonAccountRepository
+from app.baekjoon.domain.repository.bj_account_tag_stat_repository import BjAccountTagStatRepository
+from app.common.domain.vo.identifiers import BaekjoonAccountId, UserAccountId
+from app.core.database import transactional
+
+logger = logging.getLogger(__name__)
+
+
+class BjAccountTagStatService:
+    """태그별 통계(bj_account_tag_stat) 재적재 / 정합성 확인
+
+    평소에는 연동 / 갱신 / 날짜 기록 저장 시 증분 갱신되고,
+    문제 메타데이터 동기화(티어 / 태그 변경)처럼 증분으로 따라가지 않는 변경은 여기서 다시 적재한다.
+    (백준 계정, 유저)마다 별도 트랜잭션으로 처리해 긴 잠금을 피한다.
+    """
+
+    def __init__(
+        self,
+        baekjoon_account_repository: BaekjoonAccountRepository,
+        bj_account_tag_stat_repository: BjAccountTagStatRepository
+    ):
+        self.baekjoon_account_repository = baekjoon_account_repository
+        self.bj_account_tag_stat_repository = bj_account_tag_stat_repository
+
+    async def rebuild_all(self, bj_account_id: str | None = None) -> TagStatRebuildResultQuery:
+        """활성 연동 전체(또는 지정 계정) 재적재. 전체 실행 시 연동이 끊긴 행도 정리"""
+        pairs = await self._find_linked_pairs(bj_account_id)
+        result = TagStatRebuildResultQuery(rebuilt_count=0)
+
+        for bj_id, user_id in pairs:
+            result.row_count += await self.rebuild(bj_id, user_id)
+            result.rebuilt_count += 1
+
+        if bj_account_id is None:
+            result.deleted_unlinked_count = await self._delete_unlinked()
+
+        logger.info(
+            f"[BjAccountTagStatService] 재적재 완료: {result.rebuilt_count}개 연동, "
+            f"{result.row_count}행, 정리 {result.deleted_unlinked_count}행"
+        )
+        return result
+
+    async def rebuild_tags(self, tag_ids: set[int] | None) -> TagStatRebuildResultQuery:
+        """문제 메타데이터 동기화 후 재적재 (tag_ids가 None이면 전체 재적재, 아니면 해당 태그 행만 재집계)"""
+        if tag_ids is None:
+            return await self.rebuild_all()
+
+        result = TagStatRebuildResultQuery(rebuilt_count=0)
+        if not tag_ids:
+            return result
+
+        for bj_id, user_id in await self._find_linked_pairs(None, tag_ids):
+            result.row_count += await self.rebuild(bj_id, user_id, tag_ids)
+            result.rebuilt_count += 1
+
+        logger.info(
+            f"[BjAccountTagStatService] 태그 {len(tag_ids)}개 재집계 완료: "
+            f"{result.rebuilt_count}개 연동, {result.row_count}행"
+        )
+        return result
+
+    @transactional
+    async def rebuild(
+        self,
+        bj_account_id: BaekjoonAccountId,
+        user_account_id: UserAccountId,
+        tag_ids: set[int] | None = None
+    ) -> int:
+        return await self.bj_account_tag_stat_repository.rebuild(bj_account_id, user_account_id, tag_ids)
+
+    async def check_all(self, bj_account_id: str | None = None, fix: bool = False) -> TagStatCheckResultQuery:
+        """저장된 통계와 problem_history 직접 집계 비교 (fix=True면 불일치 연동만 재적재)"""
+        pairs = await self._find_linked_pairs(bj_account_id)
+        result = TagStatCheckResultQuery(checked_count=len(pairs))
+
+        for bj_id, user_id in pairs:
+            mismatch = await self.check(bj_id, user_id)
+            if mismatch is None:
+                continue
+            result.mismatches.append(mismatch)
+            if fix:
+                await self.rebuild(bj_id, user_id)
+                result.fixed_count += 1
+
+        return result
+
+    @transactional(readonly=True)
+    async def check(
+        self,
+        bj_account_id: BaekjoonAccountId,
+        user_account_id: UserAccountId
+    ) -> TagStatMismatchQuery | None:
+        """(백준 계정, 유저) 한 쌍의 정합성 확인. 일치하면 None"""
+        stored = {
+            stat.tag_id.value: stat
+            for stat in await self.bj_account_tag_stat_repository.find_by_account(bj_account_id, user_account_id)
+        }
+        expected = {
+            stat.tag_id.value: stat
+            for stat in await self.baekjoon_account_repository.aggregate_tag_stats(bj_account_id, user_account_id)
+        }
+
+        mismatch = TagStatMismatchQuery(
+            bj_account_id=bj_account_id.value,
+            user_account_id=user_account_id.value,
+            missing_tag_ids=sorted(expected.keys() - stored.keys()),
+            unexpected_tag_ids=sorted(stored.keys() - expected.keys()),
+            changed_tag_ids=sorted(
+                tag_id for tag_id in expected.keys() & stored.keys() if expected[tag_id] != stored[tag_id]
+            ),
+        )
+        if mismatch.missing_tag_ids or mismatch.unexpected_tag_ids or mismatch.changed_tag_ids:
+            return mismatch
+        return None
+
+    @transactional(readonly=True)
+    async def _find_linked_pairs(
+        self,
+        bj_account_id: str | None,
+        tag_ids: set[int] | None = None
+    ) -> list[tuple[BaekjoonAccountId, UserAccountId]]:
+        return await self.bj_account_tag_stat_repository.find_linked_pairs(
+            BaekjoonAccountId(bj_account_id) if bj_account_id else None,
+            tag_ids
+        )
+
+    @transactional
+    async def _delete_unlinked(self) -> int:
+        return await self.bj_account_tag_stat_repository.delete_unlinked()
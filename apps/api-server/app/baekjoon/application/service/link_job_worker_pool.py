@@ -0,0 +1,104 @@
+import asyncio
+import logging
+
+from app.baekjoon.application.command.link_bj_account_command import LinkBjAccountCommand
+from app.baekjoon.application.usecase.link_bj_account_usecase import LinkBjAccountUsecase
+from app.baekjoon.domain.entity.link_job import LinkJob, LinkJobStage
+from app.baekjoon.domain.gateway.link_job_gateway import LinkJobGateway
+from app.core.database import get_global_database, reset_database_context, set_database_context
+from app.core.error_codes import ErrorCode
+from app.core.exception import APIException
+
+logger = logging.getLogger(__name__)
+
+_DEQUEUE_TIMEOUT = 5       # BRPOP 대기 시간 (초) - 종료 시 취소 응답성
+_ERROR_BACKOFF = 1.0       # 큐 조회 실패 시 재시도 대기 (초)
+
+
+class LinkJobWorkerPool:
+    """비동기 백준 계정 연동 작업을 처리하는 워커 풀
+
+    프로세스마다 worker_count개의 워커가 공유 큐에서 작업을 꺼내 처리한다.
+    연동 1건이 DB 커넥션 1개를 쓰므로 동시 연동에 쓰이는 커넥션 수는 (프로세스 수 x worker_count)로 제한된다.
+    워커 태스크는 요청 미들웨어 밖에서 돌기 때문에 작업마다 Database 컨텍스트를 직접 설정한다 (스케줄러 작업과 동일).
+    """
+
+    def __init__(
+        self,
+        link_job_gateway: LinkJobGateway,
+        link_bj_account_usecase: LinkBjAccountUsecase,
+        worker_count: int = 2,
+    ):
+        self.link_job_gateway = link_job_gateway
+        self.link_bj_account_usecase = link_bj_account_usecase
+        self.worker_count = worker_count
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"link-job-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+        logger.info(f"[LinkJobWorkerPool] 워커 {self.worker_count}개 시작")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                job = await self.link_job_gateway.dequeue(timeout=_DEQUEUE_TIMEOUT)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[LinkJobWorkerPool] 작업 조회 실패: {e}")
+                await asyncio.sleep(_ERROR_BACKOFF)
+                continue
+
+            if job is not None:
+                await self.process(job)
+
+    async def process(self, job: LinkJob) -> None:
+        """작업 1건 실행 - 결과(성공/실패)는 작업 상태로 남기고 예외는 밖으로 내보내지 않음 (취소는 실패로 기록 후 전파)"""
+        job.start()
+        await self._save(job)
+
+        async def on_progress(stage: LinkJobStage) -> None:
+            job.advance(stage)
+            await self._save(job)
+
+        try:
+            token = set_database_context(get_global_database())
+            try:
+                await self.link_bj_account_usecase.execute(
+                    LinkBjAccountCommand(user_account_id=job.user_account_id, bj_account_id=job.bj_account_id),
+                    on_progress=on_progress,
+                )
+            finally:
+                reset_database_context(token)
+        except asyncio.CancelledError:
+            # 종료 중 취소 - RUNNING으로 남으면 active 키가 만료될 때까지 재연동이 막히므로 실패로 기록
+            logger.warning(f"[LinkJobWorkerPool] 종료로 연동 중단: job={job.job_id}, bj_account={job.bj_account_id}")
+            job.fail(ErrorCode.LINK_JOB_INTERRUPTED.value.code, ErrorCode.LINK_JOB_INTERRUPTED.value.message)
+            await self._save(job)
+            raise
+        except APIException as e:
+            job.fail(e.error_code, e.message)
+        except Exception as e:
+            logger.exception(f"[LinkJobWorkerPool] 연동 실패: job={job.job_id}, bj_account={job.bj_account_id}, error={e}")
+            job.fail(ErrorCode.INTERNAL_SERVER_ERROR.value.code, ErrorCode.INTERNAL_SERVER_ERROR.value.message)
+        else:
+            job.succeed()
+        await self._save(job)
+
+    async def _save(self, job: LinkJob) -> None:
+        # 상태 저장 실패로 연동 자체를 멈추지 않음 (조회 시 마지막으로 저장된 상태가 보임)
+        try:
+            await self.link_job_gateway.save(job)
+        except Exception as e:
+            logger.error(f"[LinkJobWorkerPool] 작업 상태 저장 실패: job={job.job_id}, error={e}")
@@ -23,7 +23,7 @@ from app.core.exception import APIException
 from app.study.application.query.study_query import MyStudyItemQuery
 from app.study.domain.repository.study_repository import StudyRepository
 from app.study.domain.repository.user_search_repository import UserSearchRepository
-from app.tier.domain.repository.tier_repository import TierRepository
+from app.tier.domain.vo.tier_table import TierTable
 
 logger = logging.getLogger(__name__)
 
@@ -35,17 +35,17 @@ class GetBaekjoonMeUsecase:
         self,
         baekjoon_account_repository: BaekjoonAccountRepository,
         user_date_record_repository: UserDateRecordRepository,
-        tier_repository: TierRepository,
         domain_event_bus: DomainEventBus,
         study_repository: StudyRepository,
         user_search_repository: UserSearchRepository,
+        tier_table: TierTable | None = None,
     ):
         self.baekjoon_account_repository = baekjoon_account_repository
         self.user_date_record_repository = user_date_record_repository
-        self.tier_repository = tier_repository
         self.domain_event_bus = domain_event_bus
         self.study_repository = study_repository
         self.user_search_repository = user_search_repository
+        self.tier_table = tier_table or TierTable.static()
 
     @transactional(readonly=True)
     async def execute(self, command: GetBaekjoonMeCommand) -> BaekjoonMeQuery:
@@ -75,9 +75,8 @@ class GetBaekjoonMeUsecase:
 
         bj_account, linked_at = account_with_link
 
-        # 3. Tier 정보 조회
-        tier = await self.tier_repository.find_by_id(bj_account.current_tier_id)
-        tier_name = tier.tier_code
+        # 3. Tier 이름 변환 (tier_id와 tier_level은 solved.ac 레벨로 동일)
+        tier_name = self.tier_table.code(bj_account.current_tier_id.value)
 
         # 4. 최근 365일 user_date_record 조회 (streak 대체)
         end_date = date.today()
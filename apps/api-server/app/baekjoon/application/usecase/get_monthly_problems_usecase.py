@@ -1,14 +1,7 @@
-# 필요한 임포트 추가
-from collections import defaultdict
-from datetime import date
-from dataclasses import dataclass, field
-from calendar import monthrange
-
-# 기존 임포트 유지
 import logging
-from datetime import datetime
+from calendar import monthrange
+from datetime import date
 
-from app.activity.application.query.monthly_activity_data_query import MonthlyActivityDataQuery
 from app.baekjoon.application.command.get_monthly_problems_command import GetMonthlyProblemsCommand
 from app.baekjoon.application.query.monthly_problems_query import (
     MonthlyDayDataQuery,
@@ -17,253 +10,150 @@ from app.baekjoon.application.query.monthly_problems_query import (
     SolvedProblemQuery,
     WillSolveProblemQuery
 )
-from app.baekjoon.domain.event.get_monthly_activity_data_payload import GetMonthlyActivityDataPayload
-from app.baekjoon.domain.event.get_problems_info_payload import GetProblemsInfoPayload
 from app.baekjoon.domain.repository.baekjoon_account_repository import BaekjoonAccountRepository
-from app.baekjoon.domain.repository.problem_history_repository import ProblemHistoryRepository
-from app.common.domain.entity.domain_event import DomainEvent
-from app.common.domain.service.event_publisher import DomainEventBus
+from app.baekjoon.domain.repository.monthly_calendar_repository import MonthlyCalendarRepository
+from app.baekjoon.domain.vo.monthly_calendar_entry import MonthlyCalendarEntry
 from app.common.domain.vo.identifiers import TagId, UserAccountId
 from app.core.database import transactional
 from app.core.error_codes import ErrorCode
 from app.core.exception import APIException
-from app.problem.application.query.problems_info_query import ProblemsInfoQuery, ProblemInfoQuery
-from app.tag.application.command.tag_command import GetTagInfosCommand
-from app.tag.application.query.tag_query import TagInfosQuery
+from app.problem.application.query.problems_info_query import TagAliasQuery, TagInfoQuery, TagTargetQuery
+from app.tag.domain.repository.tag_repository import TagRepository
+from app.target.domain.repository.target_repository import TargetRepository
 
 logger = logging.getLogger(__name__)
 
-# ProblemEntry 데이터 클래스 정의
-@dataclass
-class ProblemEntry:
-    problem_id: int
-    display_date: date  # The date this problem should be displayed on
-    order: int          # Order within the day
-    is_solved: bool     # True if solved (streak or problem record), False if will_solve
-    is_streak: bool     # True if it originated from a streak
-    source: str         # 'streak', 'record', 'will_solve' (for debugging/clarity)
-    representative_tag_id: int | None = None  # 대표 태그 ID
 
 class GetMonthlyProblemsUsecase:
-    """월간 문제 조회 Usecase"""
+    """월간 문제 조회 Usecase
+
+    월간 캘린더 projection(MonthlyCalendarRepository) 한 번의 쿼리로 날짜별 기록과 문제 / 티어 / 대표 태그를 읽고,
+    문제 태그 상세(별칭, 목표)는 참조 데이터 캐시를 거치는 Tag / Target Repository로 채운다.
+    응답 DTO는 이미 검증된 값으로 만들므로 model_construct로 재검증 없이 조립한다.
+    """
 
     def __init__(
         self,
         baekjoon_account_repository: BaekjoonAccountRepository,
-        problem_history_repository: ProblemHistoryRepository,
-        domain_event_bus: DomainEventBus
+        monthly_calendar_repository: MonthlyCalendarRepository,
+        tag_repository: TagRepository,
+        target_repository: TargetRepository
     ):
         self.baekjoon_account_repository = baekjoon_account_repository
-        self.problem_history_repository = problem_history_repository
-        self.domain_event_bus = domain_event_bus
+        self.monthly_calendar_repository = monthly_calendar_repository
+        self.tag_repository = tag_repository
+        self.target_repository = target_repository
 
     @transactional(readonly=True)
     async def execute(self, command: GetMonthlyProblemsCommand) -> MonthlyProblemsQuery:
         user_account_id = UserAccountId(command.user_account_id)
 
-        # 1. Activity domain 데이터 요청 (월간 활동 계획 및 기록)
-        activity_data = await self._fetch_activity_data(command)
-
-        # 2. 백준 계정 조회
-        bj_account = await self.baekjoon_account_repository.find_by_user_id(user_account_id)
-        if not bj_account:
-            raise APIException(ErrorCode.INVALID_REQUEST)
-
-        # 3. 이번 달 실제 풀이 이력 조회 (날짜별 스트릭 기준)
-        # {problem_id: solved_date}
-        real_solved_by_date = await self.problem_history_repository.find_by_account_and_month_with_streak(
-            bj_account.bj_account_id, command.year, command.month
+        # 1. 이번 달 기록 조회 (활성 BJ 계정 기준, 날짜 / 순서 정렬)
+        entries = await self.monthly_calendar_repository.find_month_entries(
+            user_account_id, command.year, command.month
         )
 
-        # 4. 대표 태그 ID 맵 생성 (problem_id -> representative_tag_id)
-        representative_tag_map: dict[int, int | None] = {}
-        for daily in activity_data.daily_activities:
-            for p in daily.solved_problems:
-                representative_tag_map[p.problem_id] = p.representative_tag_id
-            for p in daily.will_solve_problems:
-                representative_tag_map[p.problem_id] = p.representative_tag_id
-
-        # 5. 문제 상세 정보 조회 (Problem Domain)
-        # 모든 가능한 문제 ID를 수집하여 상세 정보를 한 번에 조회합니다.
-        all_problem_ids_for_detail = set()
-        for daily in activity_data.daily_activities:
-            all_problem_ids_for_detail.update(p.problem_id for p in daily.solved_problems)
-            all_problem_ids_for_detail.update(p.problem_id for p in daily.will_solve_problems)
-        all_problem_ids_for_detail.update(real_solved_by_date.keys())
-
-        problems_info = await self._fetch_problems_info(all_problem_ids_for_detail)
-
-        # 6. 데이터 병합 및 우선순위 적용
-        merged_problem_map: dict[int, ProblemEntry] = {}
-
-        # a. Streaks 우선 처리
-        for problem_id, solved_date in real_solved_by_date.items():
-            merged_problem_map[problem_id] = ProblemEntry(
-                problem_id=problem_id,
-                display_date=solved_date,
-                order=-1,  # Placeholder, will be updated by record if available on same day
-                is_solved=True,
-                is_streak=True,
-                source='streak',
-                representative_tag_id=representative_tag_map.get(problem_id)
-            )
-
-        # b. Problem Records 처리 (streak보다 후순위, will_solve보다 선순위)
-        for daily in activity_data.daily_activities:
-            current_date = daily.target_date
-            for index, p in enumerate(daily.solved_problems):
-                problem_id = p.problem_id
-                if problem_id in merged_problem_map:
-                    existing_entry = merged_problem_map[problem_id]
-                    # Rule 6 (Order priority): 동일 날짜에 streak과 record가 있으면 record의 order를 따름
-                    if existing_entry.display_date == current_date:
-                        existing_entry.order = index
-                    # 대표 태그는 record의 것을 우선 사용
-                    if p.representative_tag_id is not None:
-                        existing_entry.representative_tag_id = p.representative_tag_id
-                else:
-                    # Streak이 없는 Problem Record
-                    merged_problem_map[problem_id] = ProblemEntry(
-                        problem_id=problem_id,
-                        display_date=current_date,
-                        order=index,
-                        is_solved=True,
-                        is_streak=False,
-                        source='record',
-                        representative_tag_id=p.representative_tag_id
-                    )
-
-        # c. Will Solve Problems 처리 (가장 낮은 우선순위)
-        # 같은 problem_id를 여러 날짜에 등록 가능하므로 별도 리스트로 관리
-        will_solve_entries: list[ProblemEntry] = []
-        for daily in activity_data.daily_activities:
-            current_date = daily.target_date
-            for index, p in enumerate(daily.will_solve_problems):
-                problem_id = p.problem_id
-                # solved/streak이 있는 문제는 will_solve로 표시하지 않음
-                if problem_id not in merged_problem_map:
-                    will_solve_entries.append(ProblemEntry(
-                        problem_id=problem_id,
-                        display_date=current_date,
-                        order=index,
-                        is_solved=False,
-                        is_streak=False,
-                        source='will_solve',
-                        representative_tag_id=p.representative_tag_id
-                    ))
-
-        # 7. 대표 태그 정보 일괄 조회
-        all_entries = list(merged_problem_map.values()) + will_solve_entries
-        all_tag_ids = {
-            entry.representative_tag_id
-            for entry in all_entries
-            if entry.representative_tag_id is not None
-        }
-        tag_info_map = await self._fetch_tag_infos(all_tag_ids)
-
-        # 8. 일별 데이터 재조립 및 최종 형식으로 변환
-        final_daily_data = defaultdict(lambda: {'solved_problems': [], 'will_solve_problems': []})
-        all_processed_problem_ids = set()
-
-        for entry in all_entries:
-            problem_info = problems_info.problems.get(entry.problem_id)
-            if not problem_info:
-                logger.warning(f"Problem ID {entry.problem_id} not found in problems_info. Skipping.")
-                continue
-
-            all_processed_problem_ids.add(entry.problem_id)
-
-            # 대표 태그 정보 조회
-            rep_tag_summary = None
-            if entry.representative_tag_id and entry.representative_tag_id in tag_info_map:
-                tag_info = tag_info_map[entry.representative_tag_id]
-                rep_tag_summary = RepresentativeTagSummary(
-                    tag_id=tag_info.tag_id,
-                    tag_code=tag_info.tag_code,
-                    tag_display_name=tag_info.tag_display_name
-                )
-
-            if entry.is_solved:
-                final_daily_data[entry.display_date]['solved_problems'].append(
-                    (entry.order, SolvedProblemQuery(
-                        **problem_info.model_dump(),
-                        real_solved_yn=entry.is_streak,
-                        representative_tag=rep_tag_summary
-                    ))
-                )
-            else:
-                final_daily_data[entry.display_date]['will_solve_problems'].append(
-                    (entry.order, WillSolveProblemQuery(
-                        **problem_info.model_dump(),
-                        representative_tag=rep_tag_summary
-                    ))
-                )
+        # 기록이 없을 때만 계정 연동 여부 확인 (연동되지 않은 유저는 기존과 같이 INVALID_REQUEST)
+        if not entries:
+            bj_account = await self.baekjoon_account_repository.find_by_user_id(user_account_id)
+            if not bj_account:
+                raise APIException(ErrorCode.INVALID_REQUEST)
+
+        # 2. 우선순위 적용: SOLVED는 문제당 가장 이른 날짜 1건, WILL_SOLVE는 푼 문제가 아니면 날짜별로 모두
+        solved_entries: dict[int, MonthlyCalendarEntry] = {}
+        will_solve_entries: list[MonthlyCalendarEntry] = []
+        seen_will_solve: set[tuple[int, date]] = set()
+        for entry in entries:
+            if entry.solved:
+                solved_entries.setdefault(entry.problem_id, entry)
+            elif (entry.problem_id, entry.marked_date) not in seen_will_solve:
+                seen_will_solve.add((entry.problem_id, entry.marked_date))
+                will_solve_entries.append(entry)
+        will_solve_entries = [e for e in will_solve_entries if e.problem_id not in solved_entries]
+
+        # 3. 문제 태그 상세 (태그별 한 번만 만들어 여러 문제가 공유)
+        tag_query_map = await self._build_tag_query_map(
+            {tag_id for e in solved_entries.values() for tag_id in e.tag_ids}
+            | {tag_id for e in will_solve_entries for tag_id in e.tag_ids}
+        )
 
-        monthly_data_list = []
+        # 4. 일별 버킷에 순서대로 적재 (entries가 이미 날짜 / 순서 정렬이라 재정렬 불필요)
         _, last_day = monthrange(command.year, command.month)
+        solved_by_day: list[list[SolvedProblemQuery]] = [[] for _ in range(last_day)]
+        will_solve_by_day: list[list[WillSolveProblemQuery]] = [[] for _ in range(last_day)]
 
-        for day in range(1, last_day + 1):
-            current_date = date(command.year, command.month, day)
-            day_data = final_daily_data[current_date]
-
-            sorted_solved = sorted(day_data['solved_problems'], key=lambda x: x[0])
-            sorted_will_solve = sorted(day_data['will_solve_problems'], key=lambda x: x[0])
-
-            # Extract the query objects from the sorted tuples
-            solved_queries = [item[1] for item in sorted_solved]
-            will_solve_queries = [item[1] for item in sorted_will_solve]
-
-            monthly_data_list.append(MonthlyDayDataQuery(
-                target_date=current_date.isoformat(),
-                solved_problem_count=len(solved_queries),
-                will_solve_problem_count=len(will_solve_queries),
-                solved_problems=solved_queries,
-                will_solve_problems=will_solve_queries
+        for entry in solved_entries.values():
+            solved_by_day[entry.marked_date.day - 1].append(SolvedProblemQuery.model_construct(
+                **self._problem_fields(entry, tag_query_map),
+                real_solved_yn=False,  # 스트릭 제거 후 항상 False
+            ))
+        for entry in will_solve_entries:
+            will_solve_by_day[entry.marked_date.day - 1].append(WillSolveProblemQuery.model_construct(
+                **self._problem_fields(entry, tag_query_map),
             ))
 
-        return MonthlyProblemsQuery(
-            total_problem_count=len(all_processed_problem_ids),
-            monthly_data=monthly_data_list
-        )
+        monthly_data = [
+            MonthlyDayDataQuery.model_construct(
+                target_date=date(command.year, command.month, day + 1).isoformat(),
+                solved_problem_count=len(solved_by_day[day]),
+                will_solve_problem_count=len(will_solve_by_day[day]),
+                solved_problems=solved_by_day[day],
+                will_solve_problems=will_solve_by_day[day],
+            )
+            for day in range(last_day)
+        ]
 
-    async def _fetch_activity_data(self, command: GetMonthlyProblemsCommand) -> MonthlyActivityDataQuery:
-        event = DomainEvent(
-            event_type="GET_MONTHLY_ACTIVITY_DATA_REQUESTED",
-            data=GetMonthlyActivityDataPayload(
-                user_account_id=command.user_account_id,
-                year=command.year,
-                month=command.month
-            ),
-            result_type=MonthlyActivityDataQuery
+        total_problem_ids = solved_entries.keys() | {e.problem_id for e in will_solve_entries}
+        return MonthlyProblemsQuery.model_construct(
+            total_problem_count=len(total_problem_ids),
+            monthly_data=monthly_data
         )
-        data = await self.domain_event_bus.publish(event)
-        if not data:
-            raise APIException(ErrorCode.INVALID_REQUEST)
-        return data
 
-    async def _fetch_problems_info(self, problem_ids: set[int]) -> ProblemsInfoQuery:
-        if not problem_ids:
-            return ProblemsInfoQuery(problems={})
-        event = DomainEvent(
-            event_type="GET_PROBLEM_INFOS_REQUESTED",
-            data=GetProblemsInfoPayload(problem_ids=list(problem_ids)),
-            result_type=ProblemsInfoQuery
-        )
-        return await self.domain_event_bus.publish(event)
+    @staticmethod
+    def _problem_fields(entry: MonthlyCalendarEntry, tag_query_map: dict[int, TagInfoQuery]) -> dict:
+        """SolvedProblemQuery / WillSolveProblemQuery 공통 필드"""
+        representative_tag = None
+        if entry.representative_tag_id is not None and entry.representative_tag_code is not None:
+            representative_tag = RepresentativeTagSummary.model_construct(
+                tag_id=entry.representative_tag_id,
+                tag_code=entry.representative_tag_code,
+                tag_display_name=entry.representative_tag_display_name
+            )
+        return {
+            "problem_id": entry.problem_id,
+            "problem_title": entry.problem_title,
+            "problem_tier_level": entry.problem_tier_level,
+            "problem_tier_name": entry.problem_tier_name,
+            "problem_class_level": entry.problem_class_level,
+            "tags": [tag_query_map[tag_id] for tag_id in entry.tag_ids if tag_id in tag_query_map],
+            "representative_tag": representative_tag,
+        }
 
-    async def _fetch_tag_infos(self, tag_ids: set[int]) -> dict[int, any]:
-        """태그 ID 목록으로 태그 정보를 조회하여 {tag_id: TagSummaryQuery} 맵 반환"""
+    async def _build_tag_query_map(self, tag_ids: set[int]) -> dict[int, TagInfoQuery]:
+        """태그 ID 목록으로 {tag_id: TagInfoQuery} 맵 생성 (삭제된 태그는 제외)"""
         if not tag_ids:
             return {}
 
-        event = DomainEvent(
-            event_type="GET_TAG_INFOS_REQUESTED",
-            data=GetTagInfosCommand(tag_ids=[TagId(tid) for tid in tag_ids]),
-            result_type=TagInfosQuery
-        )
-        result: TagInfosQuery | None = await self.domain_event_bus.publish(event)
+        tags = await self.tag_repository.find_by_ids_and_active([TagId(tag_id) for tag_id in tag_ids])
+        targets = await self.target_repository.find_all_active()
 
-        if not result:
-            return {}
-
-        return {tag.tag_id: tag for tag in result.tags}
+        tag_targets_map: dict[int, list[TagTargetQuery]] = {}
+        for target in targets:
+            target_query = TagTargetQuery.model_construct(
+                target_id=target.target_id.value,
+                target_code=target.code,
+                target_display_name=target.display_name
+            )
+            for target_tag in target.required_tags:
+                tag_targets_map.setdefault(target_tag.tag_id.value, []).append(target_query)
+
+        return {
+            tag.tag_id.value: TagInfoQuery.model_construct(
+                tag_id=tag.tag_id.value,
+                tag_code=tag.code,
+                tag_display_name=tag.tag_display_name,
+                tag_aliases=[TagAliasQuery.model_construct(alias=alias['alias']) for alias in tag.aliases or []],
+                tag_targets=tag_targets_map.get(tag.tag_id.value, [])
+            )
+            for tag in tags
+        }
@@ -0,0 +1,68 @@
+from typing import AsyncIterator
+
+from app.baekjoon.application.command.link_bj_account_command import LinkBjAccountCommand
+from app.baekjoon.application.query.link_job_query import LinkJobQuery
+from app.baekjoon.domain.entity.link_job import LinkJob
+from app.baekjoon.domain.gateway.link_job_gateway import LinkJobGateway
+from app.core.error_codes import ErrorCode
+from app.core.exception import APIException
+
+
+class LinkBjAccountJobUsecase:
+    """
+    백준 계정 비동기 연동 시나리오
+
+    1. 연동 요청 → 작업 등록 후 작업 ID 즉시 반환 (solved.ac 수집 / DB 저장 없음)
+       같은 유저의 진행 중 작업이 있으면 새로 만들지 않고 그 작업을 반환 (슬롯 선점은 원자적)
+    2. LinkJobWorkerPool이 큐에서 작업을 꺼내 LinkBjAccountUsecase로 연동 수행
+    3. 작업 상태 조회 / SSE 구독으로 진행 상황 확인
+    """
+
+    _ENQUEUE_ATTEMPTS = 3
+
+    def __init__(self, link_job_gateway: LinkJobGateway):
+        self.link_job_gateway = link_job_gateway
+
+    async def enqueue(self, command: LinkBjAccountCommand) -> LinkJobQuery:
+        job = LinkJob.create(
+            user_account_id=command.user_account_id,
+            bj_account_id=command.bj_account_id,
+        )
+        # 동시 요청이 모두 작업을 만들지 않도록 진행 중 작업 슬롯 선점에 성공한 요청만 큐에 추가
+        for _ in range(self._ENQUEUE_ATTEMPTS):
+            active_job_id = await self.link_job_gateway.enqueue(job)
+            if active_job_id == job.job_id:
+                return LinkJobQuery.from_entity(job)
+            if active_job_id is None:
+                continue
+
+            active_job = await self.link_job_gateway.find_by_id(active_job_id)
+            if active_job is not None and not active_job.is_finished:
+                return LinkJobQuery.from_entity(active_job)
+            # 끝났거나 만료된 작업이 슬롯을 남김 → 그 작업의 슬롯일 때만 비우고 다시 선점
+            await self.link_job_gateway.release_active_job(command.user_account_id, active_job_id)
+
+        raise APIException(ErrorCode.INTERNAL_SERVER_ERROR)
+
+    async def get(self, job_id: str, user_account_id: int) -> LinkJobQuery:
+        job = await self._find_own_job(job_id, user_account_id)
+        return LinkJobQuery.from_entity(job)
+
+    async def watch(self, job_id: str, user_account_id: int, heartbeat: float) -> AsyncIterator[LinkJobQuery | None]:
+        """작업 상태 변경 구독 (heartbeat초 동안 변경이 없으면 None)
+
+        소유자 확인은 스트림 시작 전에 끝내서 SSE 응답 대신 일반 에러 응답이 나가도록 한다.
+        """
+        await self._find_own_job(job_id, user_account_id)
+        return self._watch(job_id, heartbeat)
+
+    async def _watch(self, job_id: str, heartbeat: float) -> AsyncIterator[LinkJobQuery | None]:
+        async for job in self.link_job_gateway.watch(job_id, heartbeat):
+            yield LinkJobQuery.from_entity(job) if job is not None else None
+
+    async def _find_own_job(self, job_id: str, user_account_id: int) -> LinkJob:
+        job = await self.link_job_gateway.find_by_id(job_id)
+        # 다른 유저의 작업은 존재 여부도 노출하지 않음
+        if job is None or job.user_account_id != user_account_id:
+            raise APIException(ErrorCode.LINK_JOB_NOT_FOUND)
+        return job
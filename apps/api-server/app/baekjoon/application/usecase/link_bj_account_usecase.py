@@ -1,13 +1,18 @@
 from datetime import datetime
+from typing import Awaitable, Callable
+
 from app.activity.domain.entity.user_date_record import UserDateRecord
 from app.activity.domain.entity.user_problem_status import UserProblemStatus
 from app.activity.domain.repository.user_date_record_repository import UserDateRecordRepository
 from app.activity.domain.repository.user_activity_repository import UserActivityRepository
 from app.baekjoon.application.command.link_bj_account_command import LinkBjAccountCommand
 from app.baekjoon.domain.entity.baekjoon_account import BaekjoonAccount
+from app.baekjoon.domain.entity.link_job import LinkJobStage
 from app.baekjoon.domain.event.link_bj_account_payload import LinkBjAccountPayload
 from app.baekjoon.domain.gateway.solvedac_gateway import SolvedacGateway
 from app.baekjoon.domain.repository.baekjoon_account_repository import BaekjoonAccountRepository
+from app.baekjoon.domain.repository.bj_account_tag_stat_repository import BjAccountTagStatRepository
+from app.baekjoon.domain.vo.solvedac_data import SolvedacUserDataVO
 from app.common.domain.entity.domain_event import DomainEvent
 from app.common.domain.service.event_publisher import DomainEventBus
 from app.common.domain.vo.identifiers import BaekjoonAccountId, ProblemId, TierId, UserAccountId
@@ -22,11 +27,14 @@ class LinkBjAccountUsecase:
     백준 계정과 연동하는 시나리오
 
     1. 백준 id와 유저 계정 id를 입력 받음
-    2. 백준 id가 DB에 있다면 바로 연동 후 종료. 없다면 solvedAC API로 백준 계정 히스토리를 받음
+    2. solvedAC API로 백준 계정 히스토리를 받음 (트랜잭션 밖)
+       백준 id가 DB에 있다면 이 유저의 기록만 생성 후 종료
     3. 백준 계정 테이블 저장
     4. 문제 히스토리 저장 (streak_id 없이)
     5. solved.ac history → user_date_record 생성
     6. 전체 문제 → user_problem_status 생성 (solved_yn=True, 날짜 미매핑)
+    7. 이 유저의 태그별 통계(bj_account_tag_stat) 적재
+    8. 연동 이벤트 발행 (이전 연동 soft delete) 후 이전 연동의 통계 행 삭제
     """
 
     def __init__(
@@ -37,6 +45,7 @@ class LinkBjAccountUsecase:
         user_date_record_repository: UserDateRecordRepository,
         user_activity_repository: UserActivityRepository,
         problem_update_service: ProblemUpdateService,
+        bj_account_tag_stat_repository: BjAccountTagStatRepository | None = None,
     ):
         self.baekjoon_account_repository = baekjoon_account_repository
         self.solvedac_gateway = solvedac_gateway
@@ -44,11 +53,40 @@ class LinkBjAccountUsecase:
         self.user_date_record_repository = user_date_record_repository
         self.user_activity_repository = user_activity_repository
         self.problem_update_service = problem_update_service
+        self.bj_account_tag_stat_repository = bj_account_tag_stat_repository
 
-    @transactional
     async def execute(
         self,
-        command: LinkBjAccountCommand
+        command: LinkBjAccountCommand,
+        on_progress: Callable[[LinkJobStage], Awaitable[None]] | None = None,
+    ) -> None:
+        """
+        Args:
+            command: 연동 명령
+            on_progress: 진행 단계 콜백 (비동기 연동 작업에서 SSE 진행 상황 전달용)
+        """
+        # solved.ac 수집은 수십 초가 걸릴 수 있으므로 트랜잭션(DB 커넥션) 밖에서 수행
+        # 기존 bj_account에 새 유저가 연동하는 경우에도
+        # 다른 유저의 user_date_record를 재사용하지 않음:
+        #   - 수동 문제 등록(주관적 날짜 배정)
+        #   - 00:00~06:00 시간대 전날 조정 로직
+        #   - 스케줄러 오류/재시도 로직
+        #   위 요인들로 인해 다른 유저의 데이터가 오염되어 있을 수 있음
+        # → solved.ac에서 히스토리를 새로 fetch하여 이 유저만의 데이터 생성
+        await self._notify(on_progress, LinkJobStage.FETCHING_SOLVEDAC)
+        user_data = await self.solvedac_gateway.fetch_user_data_first(command.bj_account_id)
+
+        if user_data is None:
+            raise APIException(ErrorCode.BAEKJOON_USER_NOT_FOUND)
+
+        await self._link(command, user_data, on_progress)
+
+    @transactional
+    async def _link(
+        self,
+        command: LinkBjAccountCommand,
+        user_data: SolvedacUserDataVO,
+        on_progress: Callable[[LinkJobStage], Awaitable[None]] | None,
     ) -> None:
         bj_account_id = BaekjoonAccountId(command.bj_account_id)
         user_account_id = UserAccountId(command.user_account_id)
@@ -65,19 +103,9 @@ class LinkBjAccountUsecase:
         )
 
         if existing_account:
-            # 기존 bj_account에 새 유저가 연동하는 경우
-            # 다른 유저의 user_date_record를 재사용하지 않음:
-            #   - 수동 문제 등록(주관적 날짜 배정)
-            #   - 00:00~06:00 시간대 전날 조정 로직
-            #   - 스케줄러 오류/재시도 로직
-            #   위 요인들로 인해 다른 유저의 데이터가 오염되어 있을 수 있음
-            # → solved.ac에서 히스토리를 새로 fetch하여 이 유저만의 데이터 생성
-            user_data = await self.solvedac_gateway.fetch_user_data_first(command.bj_account_id)
-
-            if user_data is None:
-                raise APIException(ErrorCode.BAEKJOON_USER_NOT_FOUND)
-
+            # 기존 bj_account에 새 유저가 연동하는 경우 → 이 유저의 기록만 생성
             # 이 유저의 user_date_record 생성 (solved.ac 히스토리 기반, 새로 fetch)
+            await self._notify(on_progress, LinkJobStage.SAVING_HISTORY)
             await self._create_user_date_records_from_history(
                 user_account_id=user_account_id,
                 bj_account_id=command.bj_account_id,
@@ -87,24 +115,22 @@ class LinkBjAccountUsecase:
             # 이 유저의 user_problem_status 생성 (user_data.problems 기반)
             # BaekjoonAccountMapper.to_entity()는 problem_histories=[]를 반환하므로
             # 이미 fetch한 user_data.problems를 사용
+            await self._notify(on_progress, LinkJobStage.ENSURING_PROBLEMS)
             all_problem_ids = [p.problem_id for p in user_data.problems]
             valid_problem_ids = await self.problem_update_service.ensure_problems_exist(all_problem_ids)
+            await self._notify(on_progress, LinkJobStage.CREATING_STATUSES)
             await self._create_user_problem_statuses(
                 user_account_id=user_account_id,
                 bj_account_id=command.bj_account_id,
                 problem_ids=valid_problem_ids
             )
+            await self._rebuild_tag_stats(bj_account_id, user_account_id)
 
             event.data.problem_count = len(user_data.problems)
             await self.domain_event_bus.publish(event)
+            await self._delete_unlinked_tag_stats(user_account_id)
             return
 
-        # 2-2. 존재하지 않으면 solved.ac에서 데이터 수집
-        user_data = await self.solvedac_gateway.fetch_user_data_first(command.bj_account_id)
-
-        if user_data is None:
-            raise APIException(ErrorCode.BAEKJOON_USER_NOT_FOUND)
-
         # 3. BaekjoonAccount 엔티티 생성
         baekjoon_account = BaekjoonAccount.create(
             bj_account_id=bj_account_id,
@@ -120,6 +146,7 @@ class LinkBjAccountUsecase:
 
         # 4. 문제 히스토리 기록 (streak_id 없이)
         # problem 테이블 보장 먼저 (FK 제약: problem_history.problem_id → problem.problem_id)
+        await self._notify(on_progress, LinkJobStage.ENSURING_PROBLEMS)
         all_problem_ids = [p.problem_id for p in user_data.problems]
         valid_problem_ids = await self.problem_update_service.ensure_problems_exist(all_problem_ids)
         valid_id_set = set(valid_problem_ids)
@@ -131,6 +158,7 @@ class LinkBjAccountUsecase:
                 )
 
         # 5. 저장
+        await self._notify(on_progress, LinkJobStage.SAVING_HISTORY)
         await self.baekjoon_account_repository.save(baekjoon_account)
 
         # 6. solved.ac history → user_date_record 생성
@@ -141,14 +169,36 @@ class LinkBjAccountUsecase:
         )
 
         # 7. 전체 문제 → user_problem_status 생성 (solved_yn=True, 날짜 미매핑)
+        await self._notify(on_progress, LinkJobStage.CREATING_STATUSES)
         await self._create_user_problem_statuses(
             user_account_id=user_account_id,
             bj_account_id=command.bj_account_id,
             problem_ids=valid_problem_ids
         )
 
+        # 8. 태그별 통계 적재 (problem_history + 이 유저의 날짜 기록 기준)
+        await self._rebuild_tag_stats(bj_account_id, user_account_id)
+
         event.data.problem_count = len(user_data.problems)
         await self.domain_event_bus.publish(event)
+        await self._delete_unlinked_tag_stats(user_account_id)
+
+    async def _rebuild_tag_stats(self, bj_account_id: BaekjoonAccountId, user_account_id: UserAccountId) -> None:
+        if self.bj_account_tag_stat_repository is not None:
+            await self.bj_account_tag_stat_repository.rebuild(bj_account_id, user_account_id)
+
+    async def _delete_unlinked_tag_stats(self, user_account_id: UserAccountId) -> None:
+        # 재연동 시 이전 연동은 soft delete되므로 그 (백준 계정, 유저)의 통계 행도 함께 정리
+        if self.bj_account_tag_stat_repository is not None:
+            await self.bj_account_tag_stat_repository.delete_unlinked(user_account_id)
+
+    @staticmethod
+    async def _notify(
+        on_progress: Callable[[LinkJobStage], Awaitable[None]] | None,
+        stage: LinkJobStage,
+    ) -> None:
+        if on_progress is not None:
+            await on_progress(stage)
 
     async def _create_user_date_records_from_history(
         self,
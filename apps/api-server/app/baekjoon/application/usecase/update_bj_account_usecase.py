@@ -1,15 +1,19 @@
+import asyncio
 import logging
+import time
 from datetime import datetime, date
 
 from app.activity.domain.entity.problem_date_record import ProblemDateRecord, RecordType
 from app.activity.domain.entity.user_problem_status import UserProblemStatus
 from app.activity.domain.repository.user_date_record_repository import UserDateRecordRepository
 from app.activity.domain.repository.user_activity_repository import UserActivityRepository
+from app.baekjoon.application.query.bulk_refresh_result_query import BulkRefreshResultQuery
 from app.baekjoon.domain.entity.baekjoon_account import BaekjoonAccount
 from app.baekjoon.domain.entity.problem_history import ProblemHistory
 from app.baekjoon.domain.event.bj_sync_payload import BjAccountSyncedPayload
 from app.baekjoon.domain.gateway.solvedac_gateway import SolvedacGateway
 from app.baekjoon.domain.repository.baekjoon_account_repository import BaekjoonAccountRepository
+from app.baekjoon.domain.repository.bj_account_tag_stat_repository import BjAccountTagStatRepository
 from app.baekjoon.domain.repository.problem_history_repository import ProblemHistoryRepository
 from app.common.domain.entity.domain_event import DomainEvent
 from app.common.domain.entity.system_log import SystemLog
@@ -19,6 +23,7 @@ from app.common.domain.enums import SystemLogType, SystemLogStatus
 from app.common.domain.repository.system_log_repository import SystemLogRepository
 from app.common.domain.service.event_publisher import DomainEventBus
 from app.common.domain.vo.identifiers import BaekjoonAccountId, ProblemId, TierId, UserAccountId
+from app.common.infra.client.redis_client import AsyncRedisClient
 from app.core.database import transactional
 from app.core.error_codes import ErrorCode
 from app.core.exception import APIException
@@ -27,6 +32,13 @@ from sqlalchemy import select, and_
 
 logger = logging.getLogger(__name__)
 
+_BULK_CONCURRENCY = 4               # 일괄 갱신 동시 worker 수 (solved.ac 요청 속도는 gateway의 토큰 버킷이 제한)
+_BULK_MAX_ATTEMPTS = 3              # 계정별 최대 시도 횟수
+_BULK_RETRY_BACKOFF = 2.0           # 재시도 대기 기본값 (초, 시도마다 2배)
+_BULK_PROGRESS_INTERVAL = 50        # 진행 로그 간격 (계정 수)
+_BULK_CHECKPOINT_KEY = "bj-account:bulk-refresh:checkpoint:{run_date}"
+_BULK_CHECKPOINT_TTL = 60 * 60 * 48
+
 
 class UpdateBjAccountUsecase:
     """
@@ -37,6 +49,12 @@ class UpdateBjAccountUsecase:
     3. 신규 문제 → user_problem_status 생성 (solved_yn=True, 날짜 미매핑)
     4. 오늘 날짜 user_date_record 생성/업데이트
     5. system_log에 SUCCESS/FAILED 기록 (SCHEDULER 또는 REFRESH 타입)
+
+    execute_bulk()는 스케줄러용 일괄 갱신:
+    - _BULK_CONCURRENCY개 worker가 계정을 나눠 처리하고, 계정마다 독립 트랜잭션으로 커밋
+    - 실패한 계정은 _BULK_MAX_ATTEMPTS회까지 지수 백오프로 재시도
+    - bj_account_id 순으로 "여기까지 모두 끝남" 지점을 Redis 체크포인트로 남겨
+      같은 날 재실행하면 이어서 처리
     """
 
     def __init__(
@@ -49,6 +67,8 @@ class UpdateBjAccountUsecase:
         system_log_repository: SystemLogRepository,
         problem_update_service: ProblemUpdateService,
         domain_event_bus: DomainEventBus,
+        redis_client: AsyncRedisClient | None = None,
+        bj_account_tag_stat_repository: BjAccountTagStatRepository | None = None,
     ):
         self.baekjoon_account_repository = baekjoon_account_repository
         self.solvedac_gateway = solvedac_gateway
@@ -58,6 +78,8 @@ class UpdateBjAccountUsecase:
         self.system_log_repository = system_log_repository
         self.problem_update_service = problem_update_service
         self.domain_event_bus = domain_event_bus
+        self.redis_client = redis_client
+        self.bj_account_tag_stat_repository = bj_account_tag_stat_repository
 
     @transactional
     async def execute(self, user_account_id: int) -> None:
@@ -72,20 +94,155 @@ class UpdateBjAccountUsecase:
             log_type=SystemLogType.REFRESH,
         )
 
-    @transactional
-    async def execute_bulk(self) -> None:
-        bj_accounts: list[BaekjoonAccount] = await self.baekjoon_account_repository.find_all()
-        for bj_account in bj_accounts:
+    async def execute_bulk(self) -> BulkRefreshResultQuery:
+        """전체 백준 계정 일괄 갱신 (스케줄러용)"""
+        started = time.monotonic()
+        run_date = date.today()
+        bj_accounts = sorted(await self._find_all_accounts(), key=lambda account: account.bj_account_id.value)
+
+        checkpoint = await self._load_checkpoint(run_date)
+        pending = [account for account in bj_accounts if checkpoint is None or account.bj_account_id.value > checkpoint]
+        result = BulkRefreshResultQuery(total_count=len(bj_accounts), resumed_count=len(bj_accounts) - len(pending))
+        if result.resumed_count:
+            logger.info(
+                f"[UpdateBjAccountUsecase] 일괄 갱신 재개: checkpoint={checkpoint}, "
+                f"skip={result.resumed_count}, remaining={len(pending)}"
+            )
+
+        queue: asyncio.Queue[tuple[int, BaekjoonAccount]] = asyncio.Queue()
+        for index, bj_account in enumerate(pending):
+            queue.put_nowait((index, bj_account))
+
+        # 체크포인트는 bj_account_id 순으로 앞에서부터 연속해서 성공한 지점까지만 전진
+        # (실패한 계정 이후는 중단 후 재개 시 다시 갱신)
+        succeeded = [False] * len(pending)
+        watermark = 0
+
+        async def worker() -> None:
+            nonlocal watermark
+            while not queue.empty():
+                index, bj_account = queue.get_nowait()
+                if await self._refresh_with_retry(bj_account, result):
+                    result.succeeded_count += 1
+                    succeeded[index] = True
+                else:
+                    result.failed_count += 1
+
+                advanced = watermark
+                while advanced < len(succeeded) and succeeded[advanced]:
+                    advanced += 1
+                if advanced > watermark:
+                    watermark = advanced
+                    await self._save_checkpoint(run_date, pending[advanced - 1].bj_account_id.value)
+
+                if result.processed_count % _BULK_PROGRESS_INTERVAL == 0:
+                    elapsed = time.monotonic() - started
+                    logger.info(
+                        f"[UpdateBjAccountUsecase] 일괄 갱신 진행: {result.processed_count}/{len(pending)} "
+                        f"(실패 {result.failed_count}, {result.processed_count / elapsed:.2f} accounts/s)"
+                    )
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(min(_BULK_CONCURRENCY, len(pending))):
+                tg.create_task(worker())
+
+        await self._clear_checkpoint(run_date)
+        result.elapsed_seconds = time.monotonic() - started
+        logger.info(
+            f"[UpdateBjAccountUsecase] 일괄 갱신 완료: total={result.total_count}, resumed={result.resumed_count}, "
+            f"succeeded={result.succeeded_count}, failed={result.failed_count}, retried={result.retried_count}, "
+            f"elapsed={result.elapsed_seconds:.1f}s, throughput={result.throughput:.2f} accounts/s"
+        )
+        return result
+
+    @transactional(readonly=True)
+    async def _find_all_accounts(self) -> list[BaekjoonAccount]:
+        return await self.baekjoon_account_repository.find_all()
+
+    async def _refresh_with_retry(self, bj_account: BaekjoonAccount, result: BulkRefreshResultQuery) -> bool:
+        """계정 1개 갱신 (실패 시 지수 백오프 재시도, 최종 실패는 FAILED system_log 기록)"""
+        last_error: Exception | None = None
+        for attempt in range(_BULK_MAX_ATTEMPTS):
+            if attempt:
+                result.retried_count += 1
+                await asyncio.sleep(_BULK_RETRY_BACKOFF * (2 ** (attempt - 1)))
             try:
-                await self._sync_solved_ac(bj_account, log_type=SystemLogType.SCHEDULER)
+                await self._refresh_account(bj_account)
+                return True
+            except APIException as e:
+                last_error = e
+                # 존재하지 않는 유저는 재시도해도 결과가 같음
+                if e.error_code == ErrorCode.BAEKJOON_USER_NOT_FOUND.value.code:
+                    break
             except Exception as e:
-                logger.error(f"[UpdateBjAccountUsecase] 계정 업데이트 실패: {bj_account.bj_account_id.value}, error={e}")
+                last_error = e
+            logger.warning(
+                f"[UpdateBjAccountUsecase] 계정 업데이트 실패 ({attempt + 1}/{_BULK_MAX_ATTEMPTS}): "
+                f"{bj_account.bj_account_id.value}, error={last_error}"
+            )
+
+        logger.error(f"[UpdateBjAccountUsecase] 계정 업데이트 실패: {bj_account.bj_account_id.value}, error={last_error}")
+        try:
+            await self._save_failed_log(bj_account.bj_account_id, str(last_error))
+        except Exception as log_err:
+            logger.error(f"[UpdateBjAccountUsecase] system_log 저장 실패: {log_err}")
+        return False
+
+    @transactional
+    async def _refresh_account(self, bj_account: BaekjoonAccount) -> None:
+        """계정 1개를 독립 트랜잭션으로 갱신 (실패 시 이 계정의 변경만 롤백)"""
+        await self._sync_solved_ac(bj_account, log_type=SystemLogType.SCHEDULER, record_failure=False)
+
+    @transactional
+    async def _save_failed_log(self, bj_account_id: BaekjoonAccountId, error: str) -> None:
+        log = self._build_failed_log(
+            log_type=SystemLogType.SCHEDULER,
+            bj_account_id=bj_account_id,
+            run_date=date.today(),
+            error=error,
+            restrict_to_user_id=None,
+        )
+        await self.system_log_repository.save(log)
+
+    async def _load_checkpoint(self, run_date: date) -> str | None:
+        if self.redis_client is None:
+            return None
+        try:
+            # 핸들이 JSON 값("true", "1e5" 등)으로 해석되지 않도록 {"last": handle} 형태로 저장
+            checkpoint = await self.redis_client.get(_BULK_CHECKPOINT_KEY.format(run_date=run_date.isoformat()))
+            if not isinstance(checkpoint, dict) or not isinstance(checkpoint.get("last"), str):
+                return None
+            return checkpoint["last"]
+        except Exception as e:
+            logger.warning(f"[UpdateBjAccountUsecase] 체크포인트 조회 실패, 처음부터 진행: {e}")
+            return None
+
+    async def _save_checkpoint(self, run_date: date, bj_account_id: str) -> None:
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.set(
+                _BULK_CHECKPOINT_KEY.format(run_date=run_date.isoformat()),
+                {"last": bj_account_id},
+                ex=_BULK_CHECKPOINT_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"[UpdateBjAccountUsecase] 체크포인트 저장 실패: {e}")
+
+    async def _clear_checkpoint(self, run_date: date) -> None:
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.delete(_BULK_CHECKPOINT_KEY.format(run_date=run_date.isoformat()))
+        except Exception as e:
+            logger.warning(f"[UpdateBjAccountUsecase] 체크포인트 삭제 실패: {e}")
 
     async def _sync_solved_ac(
         self,
         bj_account: BaekjoonAccount,
         log_type: SystemLogType,
         restrict_to_user_id: int | None = None,
+        record_failure: bool = True,
     ):
         today = date.today()
 
@@ -94,12 +251,21 @@ class UpdateBjAccountUsecase:
                 bj_account.bj_account_id
             )
 
-            # solved.ac 데이터 수집
-            user_data = await self.solvedac_gateway.fetch_user_data_first(bj_account.bj_account_id.value)
+            # solved.ac 데이터 수집 (마지막 fingerprint와 비교해 바뀐 부분만)
+            user_data = await self.solvedac_gateway.fetch_user_data(
+                bj_account.bj_account_id.value,
+                bj_account.solvedac_fingerprint,
+                existing_problem_history_ids,
+            )
 
             if user_data is None:
                 raise APIException(ErrorCode.BAEKJOON_USER_NOT_FOUND)
 
+            # 스케줄러: 변경 없는 계정은 갱신 생략 (사용자 새로고침은 정합성 보정을 위해 계속 진행)
+            if not user_data.changed and log_type == SystemLogType.SCHEDULER:
+                logger.info(f"[UpdateBjAccountUsecase] 변경 없음, 갱신 생략: {bj_account.bj_account_id.value}")
+                return
+
             # 유저 기본 정보 업데이트
             bj_account.update_tier(TierId(user_data.user_info.tier))
             bj_account.update_rating(user_data.user_info.rating)
@@ -113,11 +279,14 @@ class UpdateBjAccountUsecase:
             new_problems = [p for p in user_data.problems if p.problem_id not in existing_problem_history_ids]
 
             # 신규 problem_history 저장 (streak_id 없이)
+            # 모든 신규 문제가 저장된 경우에만 fingerprint 갱신 (누락분은 다음 갱신 때 다시 수집)
+            all_new_problems_saved = True
             if new_problems:
                 # problem 테이블 보장 먼저 (FK 제약: problem_history.problem_id → problem.problem_id)
                 new_problem_ids = [p.problem_id for p in new_problems]
                 valid_problem_ids_list = await self.problem_update_service.ensure_problems_exist(new_problem_ids)
                 valid_id_set = set(valid_problem_ids_list)
+                all_new_problems_saved = valid_id_set.issuperset(new_problem_ids)
 
                 new_history_entities = [
                     ProblemHistory.create(
@@ -129,9 +298,24 @@ class UpdateBjAccountUsecase:
                 ]
                 await self.problem_history_repository.save_all(new_history_entities)
 
+                # 태그별 통계에 신규 문제 반영 (날짜는 아래 user_problem_status 저장 시 갱신)
+                if self.bj_account_tag_stat_repository is not None:
+                    await self.bj_account_tag_stat_repository.apply_new_history(
+                        bj_account.bj_account_id,
+                        [entity.problem_id.value for entity in new_history_entities],
+                    )
+
                 # valid_id_set 기준으로 new_problems 필터링 (이후 added_problem_ids 계산에 반영)
                 new_problems = [p for p in new_problems if p.problem_id in valid_id_set]
 
+            if all_new_problems_saved:
+                bj_account.update_solvedac_fingerprint(user_data.fingerprint)
+            else:
+                logger.warning(
+                    f"[UpdateBjAccountUsecase] 저장되지 않은 신규 문제가 있어 fingerprint 유지: "
+                    f"{bj_account.bj_account_id.value}"
+                )
+
             # bj_account 통계 업데이트
             await self.baekjoon_account_repository.update_stat(bj_account)
 
@@ -233,7 +417,9 @@ class UpdateBjAccountUsecase:
             await self.system_log_repository.save(log)
 
         except Exception as e:
-            # system_log에 FAILED 기록
+            # system_log에 FAILED 기록 (일괄 갱신은 재시도가 끝난 뒤 별도 트랜잭션으로 기록)
+            if not record_failure:
+                raise
             try:
                 log = self._build_failed_log(
                     log_type=log_type,
@@ -4,6 +4,7 @@ from datetime import datetime, date
 from app.baekjoon.domain.entity.problem_history import ProblemHistory
 from app.baekjoon.domain.entity.tag_skill_history import TagSkillHistory
 from app.baekjoon.domain.entity.tier_history import TierHistory
+from app.baekjoon.domain.vo.solvedac_fingerprint import SolvedacFingerprint
 from app.common.domain.vo.primitives import Rating
 from app.common.domain.vo.primitives import Statistics
 from app.common.domain.vo.identifiers import BaekjoonAccountId, ProblemId, TagId, TagSkillId, TierId
@@ -19,6 +20,7 @@ class BaekjoonAccount:
     created_at: datetime
     updated_at: datetime
     deleted_at: datetime|None = None
+    solvedac_fingerprint: SolvedacFingerprint|None = None
     tier_histories: list[TierHistory] = field(default_factory=list)
     tag_skill_histories: list[TagSkillHistory] = field(default_factory=list)
     problem_histories: list[ProblemHistory] = field(default_factory=list)
@@ -74,6 +76,10 @@ class BaekjoonAccount:
         self.rating = Rating(new_rating)
         self.updated_at = datetime.now()
 
+    def update_solvedac_fingerprint(self, fingerprint: SolvedacFingerprint) -> None:
+        """도메인 로직 - 마지막 동기화 시점의 solved.ac 상태 요약 갱신"""
+        self.solvedac_fingerprint = fingerprint
+
     def record_problem_solved(self, problem_id: ProblemId, solved_date: date | None = None) -> None:
         """도메인 로직 - 문제 해결 기록"""
         self.problem_histories.append(
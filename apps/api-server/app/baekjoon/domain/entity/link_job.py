@@ -0,0 +1,101 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+
+class LinkJobStatus(str, Enum):
+    """백준 계정 연동 작업 상태"""
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class LinkJobStage(str, Enum):
+    """연동 작업 진행 단계 (RUNNING 중 SSE로 전달)"""
+    FETCHING_SOLVEDAC = "FETCHING_SOLVEDAC"    # solved.ac 유저 데이터 수집
+    ENSURING_PROBLEMS = "ENSURING_PROBLEMS"    # problem 테이블 보장
+    SAVING_HISTORY = "SAVING_HISTORY"          # 계정 / 문제 히스토리 / 날짜별 기록 저장
+    CREATING_STATUSES = "CREATING_STATUSES"    # user_problem_status 생성
+
+
+@dataclass
+class LinkJob:
+    """Entity - 비동기 백준 계정 연동 작업 1건
+
+    연동 요청은 작업만 등록하고 바로 응답하며, 워커가 실제 연동을 수행하면서 상태를 갱신한다.
+    작업 상태는 진행 상황 조회 / SSE 전달용 단기 데이터이므로 일정 시간이 지나면 사라져도 된다.
+    """
+    job_id: str
+    user_account_id: int
+    bj_account_id: str
+    status: LinkJobStatus
+    created_at: datetime
+    updated_at: datetime
+    stage: LinkJobStage | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+
+    @staticmethod
+    def create(user_account_id: int, bj_account_id: str) -> 'LinkJob':
+        now = datetime.now()
+        return LinkJob(
+            job_id=uuid.uuid4().hex,
+            user_account_id=user_account_id,
+            bj_account_id=bj_account_id,
+            status=LinkJobStatus.QUEUED,
+            created_at=now,
+            updated_at=now,
+        )
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (LinkJobStatus.SUCCEEDED, LinkJobStatus.FAILED)
+
+    def start(self) -> None:
+        self.status = LinkJobStatus.RUNNING
+        self.updated_at = datetime.now()
+
+    def advance(self, stage: LinkJobStage) -> None:
+        """진행 단계 갱신"""
+        self.stage = stage
+        self.updated_at = datetime.now()
+
+    def succeed(self) -> None:
+        self.status = LinkJobStatus.SUCCEEDED
+        self.stage = None
+        self.updated_at = datetime.now()
+
+    def fail(self, error_code: str, error_message: str) -> None:
+        self.status = LinkJobStatus.FAILED
+        self.error_code = error_code
+        self.error_message = error_message
+        self.updated_at = datetime.now()
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "user_account_id": self.user_account_id,
+            "bj_account_id": self.bj_account_id,
+            "status": self.status.value,
+            "stage": self.stage.value if self.stage else None,
+            "error_code": self.error_code,
+            "error_message": self.error_message,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'LinkJob':
+        return LinkJob(
+            job_id=data["job_id"],
+            user_account_id=data["user_account_id"],
+            bj_account_id=data["bj_account_id"],
+            status=LinkJobStatus(data["status"]),
+            stage=LinkJobStage(data["stage"]) if data.get("stage") else None,
+            error_code=data.get("error_code"),
+            error_message=data.get("error_message"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from app.baekjoon.domain.entity.link_job import LinkJob
+
+
+class LinkJobGateway(ABC):
+    """비동기 백준 계정 연동 작업 큐 Gateway 인터페이스
+
+    작업 큐 + 작업 상태 저장 + 상태 변경 알림을 담당한다.
+    큐는 워커 프로세스 간에 공유되어야 한다 (어느 워커가 작업을 가져가든 상관없음).
+    """
+
+    @abstractmethod
+    async def enqueue(self, job: LinkJob) -> str | None:
+        """유저의 진행 중 작업 슬롯을 원자적으로 선점한 경우에만 작업을 큐에 추가
+
+        Returns:
+            슬롯을 점유한 작업 ID (선점에 성공했으면 job.job_id, 아니면 이미 점유 중인 작업 ID)
+            선점에 실패한 뒤 슬롯이 비어 점유 작업을 알 수 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    async def release_active_job(self, user_account_id: int, job_id: str) -> None:
+        """슬롯이 job_id 작업에 점유되어 있을 때만 비움 (끝났거나 만료된 작업이 남긴 슬롯 정리용)"""
+        pass
+
+    @abstractmethod
+    async def dequeue(self, timeout: float) -> LinkJob | None:
+        """큐에서 작업을 하나 꺼냄 (timeout초 동안 없으면 None)"""
+        pass
+
+    @abstractmethod
+    async def save(self, job: LinkJob) -> None:
+        """작업 상태 저장 + 구독자에게 변경 알림"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, job_id: str) -> LinkJob | None:
+        """작업 ID로 조회 (없거나 만료되었으면 None)"""
+        pass
+
+    @abstractmethod
+    async def find_active_job_id(self, user_account_id: int) -> str | None:
+        """유저의 진행 중(QUEUED/RUNNING) 작업 ID 조회"""
+        pass
+
+    @abstractmethod
+    def watch(self, job_id: str, heartbeat: float) -> AsyncIterator[LinkJob | None]:
+        """작업 상태 변경 구독
+
+        현재 상태를 먼저 내보내고, 이후 변경될 때마다 내보낸다.
+        heartbeat초 동안 변경이 없으면 None을 내보내고, 작업이 끝나면(SUCCEEDED/FAILED) 종료한다.
+        작업이 만료되었거나 RUNNING 상태로 오래 멈춰 있으면(워커 종료 등) 그대로 종료한다.
+        """
+        pass
@@ -2,7 +2,8 @@
 
 from abc import ABC, abstractmethod
 
-from app.baekjoon.domain.vo.solvedac_data import SolvedacUserDataVO
+from app.baekjoon.domain.vo.solvedac_data import SolvedacUserDataVO, SolvedacUserDeltaVO
+from app.baekjoon.domain.vo.solvedac_fingerprint import SolvedacFingerprint
 
 
 class SolvedacGateway(ABC):
@@ -26,15 +27,23 @@ class SolvedacGateway(ABC):
         pass
     
     @abstractmethod
-    async def fetch_user_data(self, bj_user_id: str) -> SolvedacUserDataVO | None:
+    async def fetch_user_data(
+        self,
+        bj_user_id: str,
+        previous: SolvedacFingerprint | None,
+        known_problem_ids: set[int],
+    ) -> SolvedacUserDeltaVO | None:
         """
-        백준 유저 ID로 solved.ac에서 유저 데이터 수집
+        이전 스냅샷과 비교해 바뀐 부분만 solved.ac에서 수집
 
         Args:
             bj_user_id: 백준 유저 ID (닉네임)
+            previous: 마지막 동기화 때 저장한 fingerprint (없으면 전체 수집)
+            known_problem_ids: 이미 기록된 푼 문제 ID (새로 푼 문제 탐색 종료 조건)
 
         Returns:
-            SolvedacUserDataVO: 쿼리를 통해 수집하는 유저의 푼 문제
+            SolvedacUserDeltaVO: 변경 여부와 새로 푼 문제 (또는 전체 목록)
+            None: 존재하지 않는 유저
 
         Raises:
             APIException: API 요청 실패 또는 제한 초과
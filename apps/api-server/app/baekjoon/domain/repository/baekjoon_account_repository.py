@@ -41,7 +41,7 @@ class BaekjoonAccountRepository(ABC):
         account_id: BaekjoonAccountId,
         user_account_id: UserAccountId | None = None
     ) -> list[TagAccountStat]:
-        """백준 계정의 모든 태그별 통계 조회 (영속성 없이 계산)
+        """백준 계정의 모든 태그별 통계 조회 (bj_account_tag_stat 사전 계산 값)
 
         Args:
             account_id: 백준 계정 ID
@@ -51,4 +51,13 @@ class BaekjoonAccountRepository(ABC):
             태그별 통계 목록. last_solved_date는 streak_date 우선, 없으면 problem_record의 marked_date 사용
         """
         pass
+
+    @abstractmethod
+    async def aggregate_tag_stats(
+        self,
+        account_id: BaekjoonAccountId,
+        user_account_id: UserAccountId | None = None
+    ) -> list[TagAccountStat]:
+        """problem_history에서 태그별 통계 직접 집계 (get_tag_stats와 같은 형태, 정합성 확인용)"""
+        pass
     
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""BjAccountTagStat Repository 인터페이스"""
+
+from abc import ABC, abstractmethod
+
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.common.domain.vo.identifiers import BaekjoonAccountId, UserAccountId
+
+
+class BjAccountTagStatRepository(ABC):
+    """백준 계정 태그별 통계(사전 계산 테이블) Repository 인터페이스
+
+    행은 (bj_account_id, user_account_id, tag_id) 단위로 저장된다.
+    """
+
+    @abstractmethod
+    async def apply_new_history(self, bj_account_id: BaekjoonAccountId, problem_ids: list[int]) -> None:
+        """신규 problem_history 반영 (problem_history 저장 직후 호출)
+
+        problem_ids는 이번에 처음 저장된 문제여야 한다 (기존 문제를 다시 넘기면 solved_count가 중복 증가).
+        아직 통계 행이 없는 연동 유저는 증분 대신 전체 재계산한다.
+        """
+        pass
+
+    @abstractmethod
+    async def refresh_last_solved_dates(self, user_account_id: UserAccountId, problem_ids: list[int]) -> None:
+        """해당 문제들이 속한 태그의 last_solved_date 재계산 (날짜 기록 저장 / 삭제 후 호출)"""
+        pass
+
+    @abstractmethod
+    async def rebuild(
+        self,
+        bj_account_id: BaekjoonAccountId,
+        user_account_id: UserAccountId,
+        tag_ids: set[int] | None = None
+    ) -> int:
+        """(백준 계정, 유저)의 통계 행 재계산 (tag_ids 지정 시 해당 태그 행만, 없으면 전체 + 적재 완료 표시)
+
+        Returns:
+            저장된 태그 행 수
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_account(
+        self,
+        bj_account_id: BaekjoonAccountId,
+        user_account_id: UserAccountId
+    ) -> list[TagAccountStat]:
+        """저장된 통계 행 조회 (PK 범위 스캔, 정합성 확인용)"""
+        pass
+
+    @abstractmethod
+    async def find_linked_pairs(
+        self,
+        bj_account_id: BaekjoonAccountId | None = None,
+        tag_ids: set[int] | None = None
+    ) -> list[tuple[BaekjoonAccountId, UserAccountId]]:
+        """활성 account_link의 (백준 계정, 유저) 목록
+
+        bj_account_id 지정 시 해당 계정만, tag_ids 지정 시 그 태그의 통계 행이 있거나
+        problem_history에 그 태그 문제가 있는 연동만 돌려준다.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_unlinked(self, user_account_id: UserAccountId | None = None) -> int:
+        """활성 account_link가 없는 (백준 계정, 유저)의 통계 행 삭제 (user_account_id 지정 시 해당 유저만)
+
+        Returns:
+            삭제된 행 수
+        """
+        pass
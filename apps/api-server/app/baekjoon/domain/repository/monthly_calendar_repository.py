@@ -0,0 +1,23 @@
+"""MonthlyCalendar Repository 인터페이스"""
+
+from abc import ABC, abstractmethod
+
+from app.baekjoon.domain.vo.monthly_calendar_entry import MonthlyCalendarEntry
+from app.common.domain.vo.identifiers import UserAccountId
+
+
+class MonthlyCalendarRepository(ABC):
+    """월간 캘린더 조회 전용 Repository 인터페이스"""
+
+    @abstractmethod
+    async def find_month_entries(
+        self,
+        user_account_id: UserAccountId,
+        year: int,
+        month: int
+    ) -> list[MonthlyCalendarEntry]:
+        """활성 BJ 계정의 해당 월 SOLVED / WILL_SOLVE 기록 조회
+
+        (marked_date, display_order) 오름차순으로 반환
+        """
+        pass
@@ -0,0 +1,25 @@
+"""월간 캘린더 조회용 Value Objects"""
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True, slots=True)
+class MonthlyCalendarEntry:
+    """월간 캘린더의 날짜별 문제 기록 1건 (조회 전용 projection)
+
+    user_problem_status + problem_date_record + problem + 대표 태그를
+    한 번의 쿼리로 읽은 결과(티어 이름은 TierTable로 변환)라 식별자 VO로 감싸지 않고 원시 값을 그대로 담는다.
+    """
+    marked_date: date
+    display_order: int
+    solved: bool                       # True: SOLVED 기록, False: WILL_SOLVE 기록
+    problem_id: int
+    problem_title: str
+    problem_tier_level: int
+    problem_tier_name: str
+    problem_class_level: int | None
+    tag_ids: tuple[int, ...]           # 문제 태그 ID (problem_tag 등록 순)
+    representative_tag_id: int | None = None
+    representative_tag_code: str | None = None
+    representative_tag_display_name: str | None = None
@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from datetime import datetime, date
 
+from app.baekjoon.domain.vo.solvedac_fingerprint import SolvedacFingerprint
+
 
 @dataclass(frozen=True)
 class ProblemTagVO:
@@ -130,3 +132,15 @@ class SolvedacUserDataVO:
             history=history,
             collected_at=collected_at
         )
+
+
+@dataclass(frozen=True)
+class SolvedacUserDeltaVO:
+    """변경 감지 기반 증분 수집 결과 (SolvedacGateway.fetch_user_data)"""
+
+    user_id: str
+    user_info: SolvedacUserInfoVO
+    fingerprint: SolvedacFingerprint
+    changed: bool                   # False면 이전 스냅샷과 동일 → 갱신 생략 가능
+    is_full: bool                   # True면 problems가 전체 푼 문제 목록 (전체 재수집)
+    problems: list[SolvedProblemVO]  # is_full=False면 새로 푼 문제만
@@ -0,0 +1,57 @@
+"""solved.ac 유저 변경 감지용 Value Objects"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SolvedacFingerprint:
+    """유저 상태 요약 (푼 문제 수, 레이팅, 레벨별 푼 문제 수)
+
+    user/show + user/problem_stats 두 번의 요청으로 만들 수 있어
+    전체 문제 목록을 받기 전에 변경 여부와 새로 푼 문제가 있는 레벨을 판단하는 데 사용한다.
+    """
+    solved_count: int
+    rating: int
+    level_counts: tuple[tuple[int, int], ...]  # (level, solved) - level 오름차순, solved > 0만
+
+    @staticmethod
+    def of(solved_count: int, rating: int, level_counts: dict[int, int]) -> 'SolvedacFingerprint':
+        return SolvedacFingerprint(
+            solved_count=solved_count,
+            rating=rating,
+            level_counts=tuple(sorted((level, cnt) for level, cnt in level_counts.items() if cnt > 0)),
+        )
+
+    @staticmethod
+    def from_dict(data: dict) -> 'SolvedacFingerprint':
+        return SolvedacFingerprint.of(
+            solved_count=data.get("solved_count", 0),
+            rating=data.get("rating", 0),
+            level_counts={int(level): cnt for level, cnt in data.get("level_counts", {}).items()},
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "solved_count": self.solved_count,
+            "rating": self.rating,
+            "level_counts": {str(level): cnt for level, cnt in self.level_counts},
+        }
+
+    def grown_levels(self, previous: 'SolvedacFingerprint') -> dict[int, int] | None:
+        """이전 상태 대비 레벨별로 늘어난 푼 문제 수
+
+        Returns:
+            {level: 늘어난 수} - 늘어나기만 한 경우
+            None: 어떤 레벨이든 줄어든 경우 (재채점 등) → 전체 재수집 필요
+        """
+        before = dict(previous.level_counts)
+        grown: dict[int, int] = {}
+        for level, cnt in self.level_counts:
+            diff = cnt - before.pop(level, 0)
+            if diff < 0:
+                return None
+            if diff > 0:
+                grown[level] = diff
+        if before:  # 이전에 있던 레벨이 사라짐
+            return None
+        return grown
@@ -0,0 +1,137 @@
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import AsyncIterator
+
+from app.baekjoon.domain.entity.link_job import LinkJob, LinkJobStatus
+from app.baekjoon.domain.gateway.link_job_gateway import LinkJobGateway
+from app.common.infra.client.redis_client import AsyncRedisClient
+
+logger = logging.getLogger(__name__)
+
+_JOB_TTL = timedelta(days=1)
+_ACTIVE_TTL = timedelta(minutes=10)  # 워커가 죽어 작업이 끝나지 않아도 유저가 다시 요청할 수 있도록
+_STALLED_AFTER = _ACTIVE_TTL  # RUNNING 상태로 이만큼 갱신이 없으면 워커가 죽은 것으로 보고 구독 종료
+_QUEUE_KEY = "bj-link-job:queue"
+
+# 슬롯을 점유한 작업이 기대한 작업일 때만 삭제 (읽기와 삭제 사이에 다른 요청이 선점한 슬롯은 건드리지 않음)
+_RELEASE_ACTIVE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _job_key(job_id: str) -> str:
+    return f"bj-link-job:{job_id}"
+
+
+def _active_key(user_account_id: int) -> str:
+    return f"bj-link-job:active:{user_account_id}"
+
+
+def _channel(job_id: str) -> str:
+    return f"bj-link-job:events:{job_id}"
+
+
+def _is_stalled(job: LinkJob) -> bool:
+    return job.status == LinkJobStatus.RUNNING and datetime.now() - job.updated_at > _STALLED_AFTER
+
+
+class LinkJobGatewayImpl(LinkJobGateway):
+    """Redis를 사용한 연동 작업 큐 Gateway 구현
+
+    - 작업 상태: bj-link-job:{job_id} 키에 TTL과 함께 저장
+    - 큐: bj-link-job:queue 리스트 (LPUSH / BRPOP) - 모든 워커 프로세스가 공유
+    - 변경 알림: bj-link-job:events:{job_id} 채널로 작업 상태 발행 (SSE 연결이 다른 워커에 있어도 전달됨)
+    """
+
+    def __init__(self, redis_client: AsyncRedisClient):
+        self.redis_client = redis_client
+
+    async def enqueue(self, job: LinkJob) -> str | None:
+        # 선점에 진 요청이 승자의 작업 상태를 바로 읽을 수 있도록 작업 상태를 먼저 저장
+        await self.redis_client.set(_job_key(job.job_id), job.to_dict(), ex=_JOB_TTL)
+        # AsyncRedisClient.get이 숫자로만 된 ID를 JSON 숫자로 해석하지 않도록 dict로 저장
+        claimed = await self.redis_client.set(
+            _active_key(job.user_account_id), {"job_id": job.job_id}, ex=_ACTIVE_TTL, nx=True
+        )
+        if claimed:
+            client = await self.redis_client.get_client()
+            await client.lpush(_QUEUE_KEY, job.job_id)
+            return job.job_id
+
+        await self.redis_client.delete(_job_key(job.job_id))
+        # 선점 실패와 조회 사이에 점유 작업이 끝나 슬롯이 비었으면 None
+        return await self.find_active_job_id(job.user_account_id)
+
+    async def release_active_job(self, user_account_id: int, job_id: str) -> None:
+        client = await self.redis_client.get_client()
+        await client.eval(
+            _RELEASE_ACTIVE_SCRIPT,
+            1,
+            _active_key(user_account_id),
+            json.dumps({"job_id": job_id}, ensure_ascii=False),
+        )
+
+    async def dequeue(self, timeout: float) -> LinkJob | None:
+        client = await self.redis_client.get_client()
+        popped = await client.brpop(_QUEUE_KEY, timeout=timeout)
+        if not popped:
+            return None
+        _, job_id = popped
+        job = await self.find_by_id(job_id)
+        if job is None:
+            logger.warning(f"[LinkJobGateway] 만료된 작업 건너뜀: {job_id}")
+        return job
+
+    async def save(self, job: LinkJob) -> None:
+        await self.redis_client.set(_job_key(job.job_id), job.to_dict(), ex=_JOB_TTL)
+        if job.is_finished:
+            await self.redis_client.delete(_active_key(job.user_account_id))
+        try:
+            await self.redis_client.publish(_channel(job.job_id), job.to_dict())
+        except Exception as e:
+            # 구독자는 다음 변경 또는 상태 조회로 따라잡을 수 있으므로 작업은 계속 진행
+            logger.error(f"[LinkJobGateway] 작업 상태 발행 실패: {job.job_id}, {e}")
+
+    async def find_by_id(self, job_id: str) -> LinkJob | None:
+        value = await self.redis_client.get(_job_key(job_id))
+        if not isinstance(value, dict):
+            return None
+        return LinkJob.from_dict(value)
+
+    async def find_active_job_id(self, user_account_id: int) -> str | None:
+        value = await self.redis_client.get(_active_key(user_account_id))
+        return value.get("job_id") if isinstance(value, dict) else None
+
+    async def watch(self, job_id: str, heartbeat: float) -> AsyncIterator[LinkJob | None]:
+        channel = _channel(job_id)
+        # 구독을 먼저 한 뒤 현재 상태를 읽어야 그 사이의 변경을 놓치지 않음
+        pubsub = await self.redis_client.subscribe(channel)
+        try:
+            job = await self.find_by_id(job_id)
+            if job is None:
+                return
+            yield job
+            while not job.is_finished:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=heartbeat)
+                if message is None:
+                    # 발행을 놓쳤거나 워커가 중간에 죽은 경우를 대비해 저장된 상태를 다시 확인
+                    latest = await self.find_by_id(job_id)
+                    if latest is None or _is_stalled(latest):
+                        logger.warning(f"[LinkJobGateway] 만료되었거나 멈춘 작업 구독 종료: {job_id}")
+                        return
+                    if latest.updated_at > job.updated_at:
+                        job = latest
+                        yield job
+                        continue
+                    yield None
+                    continue
+                if message.get("type") != "message":
+                    continue
+                job = LinkJob.from_dict(json.loads(message["data"]))
+                yield job
+        finally:
+            await self.redis_client.unsubscribe(pubsub, channel)
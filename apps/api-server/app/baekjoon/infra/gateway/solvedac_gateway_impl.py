@@ -3,30 +3,55 @@
 import logging
 import asyncio
 from datetime import datetime
-import time
 from typing import Any
 
 import httpx
 
 from app.baekjoon.domain.gateway.solvedac_gateway import SolvedacGateway
-from app.baekjoon.domain.vo.solvedac_data import SolvedacUserDataVO
+from app.baekjoon.domain.vo.solvedac_data import (
+    SolvedacUserDataVO,
+    SolvedacUserDeltaVO,
+    SolvedacUserInfoVO,
+    SolvedProblemVO,
+)
+from app.baekjoon.domain.vo.solvedac_fingerprint import SolvedacFingerprint
+from app.common.infra.client.http_client import borrow_client
+from app.common.infra.client.redis_client import AsyncRedisClient
+from app.common.infra.client.single_flight import SingleFlight
+from app.config.tier_config import TIER_CONFIG
 from app.core.error_codes import ErrorCode
 from app.core.exception import APIException
 
 logger = logging.getLogger(__name__)
 
+# solved.ac 검색 쿼리의 난이도 필터 (*b5, *g1, ... / Unrated는 *0)
+_LEVEL_QUERY_TOKENS = {
+    row["tier_level"]: "*0" if row["tier_level"] == 0 else f"*{row['tier_code'].lower()}"
+    for row in TIER_CONFIG
+}
+
 
 class SolvedacGatewayImpl(SolvedacGateway):
     """solved.ac API 데이터 수집 Gateway 구현체"""
 
-    def __init__(self, request_delay: float = 0.5, concurrent_requests: int = 3):
-        self.request_delay = request_delay
+    def __init__(
+        self,
+        concurrent_requests: int = 3,
+        http_client: httpx.AsyncClient | None = None,
+        redis_client: AsyncRedisClient | None = None,
+    ):
         self.concurrent_requests = concurrent_requests  # 동시 요청 개수
+        # 공유 클라이언트 (없으면 호출마다 임시 클라이언트)
+        # solved.ac 속도 제한 / 429 재시도 / 서킷 브레이커는 공유 클라이언트의 transport 정책이 적용한다
+        self.http_client = http_client
+        self.single_flight: SingleFlight[dict | None] = SingleFlight(
+            namespace="solvedac:user-data",
+            redis_client=redis_client,
+        )
         self.base_url = "https://solved.ac/api/v3/search/problem"
         self.user_show_url_template = "https://solved.ac/api/v3/user/show?handle={user_id}"
         self.history_url_template = "https://solved.ac/api/v3/user/history?handle={user_id}&topic=solvedCount"
         # 유저의 푼 문제를 검사할 때, API 요청 수를 줄이기 위한 로직        
-        self.tag_stats_url = "https://solved.ac/api/v3/user/problem_tag_stats?handle={user_id}"
         self.level_stats_url = "https://solved.ac/api/v3/user/problem_stats?handle={user_id}"
 
         
@@ -34,6 +59,9 @@ class SolvedacGatewayImpl(SolvedacGateway):
         """
         백준 유저 ID로 solved.ac에서 유저 데이터 수집 (병렬 처리)
 
+        같은 핸들에 대한 동시 호출(계정 연동 + 새로고침 + 스케줄러, 여러 유저의 같은 핸들 연동)은
+        SingleFlight로 하나의 수집을 공유한다 (프로세스 내 + Redis 락으로 워커 간).
+
         Args:
             bj_user_id: 백준 유저 ID (닉네임)
 
@@ -41,10 +69,24 @@ class SolvedacGatewayImpl(SolvedacGateway):
             SolvedacUserDataVO: 유저의 모든 푼 문제 및 히스토리 데이터
             None: 존재하지 않는 유저이거나 푼 문제가 없는 경우
         """
+        # solved.ac 핸들은 대소문자를 구분하지 않음
+        result = await self.single_flight.do(
+            bj_user_id.lower(),
+            lambda: self._collect_user_data(bj_user_id),
+        )
+        if result is None:
+            return None
+
+        user_data = SolvedacUserDataVO.from_collector_response(result)
+        logger.info(f"[SolvedacGateway] 데이터 수집 완료: {user_data.total_count}개 문제, {len(user_data.history)}개 히스토리")
+        return user_data
+
+    async def _collect_user_data(self, bj_user_id: str) -> dict | None:
+        """solved.ac에서 유저 데이터를 수집해 collector 응답 형태(dict, JSON 직렬화 가능)로 반환"""
         logger.info(f"[SolvedacGateway] 유저 데이터 수집 시작: {bj_user_id}")
 
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
+            async with borrow_client(self.http_client, timeout=120.0) as client:
                 # 1단계: 첫 페이지, 유저 정보, 히스토리 병렬 요청
                 first_page_task = self._fetch_problem_page(client, bj_user_id, 1)
                 user_info_task = self._fetch_user_info(client, bj_user_id)
@@ -71,7 +113,7 @@ class SolvedacGatewayImpl(SolvedacGateway):
                         "history": history_data,
                         "collected_at": datetime.now().isoformat()
                     }
-                    return SolvedacUserDataVO.from_collector_response(result)
+                    return result
 
                 total_count = first_page_data.get("count", 0)
                 all_problems = first_page_data.get("items", [])
@@ -85,7 +127,6 @@ class SolvedacGatewayImpl(SolvedacGateway):
                         await self._fetch_remaining_pages_parallel(client, bj_user_id, total_pages)
                     )
 
-                # VO로 변환
                 result = {
                     "user_id": bj_user_id,
                     "count": len(all_problems),
@@ -95,10 +136,7 @@ class SolvedacGatewayImpl(SolvedacGateway):
                     "history": history_data,
                     "collected_at": datetime.now().isoformat()
                 }
-
-                user_data = SolvedacUserDataVO.from_collector_response(result)
-                logger.info(f"[SolvedacGateway] 데이터 수집 완료: {user_data.total_count}개 문제, {len(user_data.history)}개 히스토리")
-                return user_data
+                return result
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -113,122 +151,144 @@ class SolvedacGatewayImpl(SolvedacGateway):
             logger.error(f"[SolvedacGateway] 예상치 못한 에러: {e}")
             raise APIException(ErrorCode.INTERNAL_SERVER_ERROR)
     
-    async def fetch_user_data(self, bj_user_id: str, original_solved_data) -> SolvedacUserDataVO | None:
-        raise NotImplementedError
-    #     try:
-    #         async with httpx.AsyncClient(timeout=120.0) as client:
-    #             # 1단계: 첫 페이지, 유저 정보, 히스토리 병렬 요청
-    #             user_info_task = self._fetch_user_info(client, bj_user_id)
-    #             tag_stat_task = self._get_tag_stats(client, bj_user_id)
-    #             level_stat_task = self._get_level_stats(client, bj_user_id)
-                
-    #             user_info_data, tag_stat_data, level_stat_data = await asyncio.gather(
-    #                 user_info_task, tag_stat_task, level_stat_task
-    #             )
-                
-    #             self.check_update(original_solved_data, tag_stat_data, level_stat_data)
-                
-    #             # VO로 변환
-    #             result = {
-    #                 "user_id": bj_user_id,
-    #                 "count": len(changed_problems),
-    #                 "total_count": total_count,
-    #                 "items": changed_problems,
-    #                 "user_info": user_info_data,
-    #                 "history": changed_history_data,
-    #                 "collected_at": datetime.now().isoformat()
-    #             }
-
-    #             user_data = SolvedacUserDataVO.from_collector_response(result)
-    #             logger.info(f"[SolvedacGateway] 데이터 수집 완료: {user_data.total_count}개 문제, {len(user_data.history)}개 히스토리")
-    #             return user_data
-
-    #     except httpx.HTTPStatusError as e:
-    #         if e.response.status_code == 404:
-    #             logger.warning(f"[SolvedacGateway] 존재하지 않는 유저: {bj_user_id}")
-    #             return None
-    #         logger.error(f"[SolvedacGateway] HTTP 에러: {e}")
-    #         raise APIException(ErrorCode.EXTERNAL_API_ERROR)
-    #     except httpx.RequestError as e:
-    #         logger.error(f"[SolvedacGateway] 요청 에러: {e}")
-    #         raise APIException(ErrorCode.EXTERNAL_API_ERROR)
-    #     except Exception as e:
-    #         logger.error(f"[SolvedacGateway] 예상치 못한 에러: {e}")
-    #         raise APIException(ErrorCode.INTERNAL_SERVER_ERROR)
-    
-    def _get_tag_stats(self, client) -> list[dict]:
-        """유저가 푼 태그별 문제 수 수집"""
+    async def fetch_user_data(
+        self,
+        bj_user_id: str,
+        previous: SolvedacFingerprint | None,
+        known_problem_ids: set[int],
+    ) -> SolvedacUserDeltaVO | None:
+        """
+        변경 감지 기반 증분 수집
+
+        1. user/show + user/problem_stats로 fingerprint 생성 (요청 2회)
+        2. 이전 fingerprint와 같으면 변경 없음으로 바로 반환
+        3. 레벨별 푼 문제 수가 늘기만 했으면 늘어난 레벨만 검색해 새로 푼 문제를 찾음
+        4. 이전 스냅샷이 없거나 어떤 레벨이든 줄었으면(재채점 등) fetch_user_data_first로 전체 수집
+        """
         try:
-            response = client.get(self.tag_stats_url)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("items", [])
-        except client.exceptions.RequestException as e:
-            print(f"[업데이트기] 태그 통계 에러: {e}")
-            return []
-        
-    def _get_level_stats(self, client) -> list[dict]:
-        """유저가 푼 티어별 문제 수 수집"""
+            async with borrow_client(self.http_client, timeout=120.0) as client:
+                user_info_data, level_stats = await asyncio.gather(
+                    self._fetch_user_info(client, bj_user_id),
+                    self._fetch_level_stats(client, bj_user_id),
+                )
+                if user_info_data is None:
+                    return None
+
+                if user_info_data and level_stats is not None:
+                    fingerprint = SolvedacFingerprint.of(
+                        solved_count=user_info_data.get("solvedCount", 0),
+                        rating=user_info_data.get("rating", 0),
+                        level_counts={item.get("level", 0): item.get("solved", 0) for item in level_stats},
+                    )
+                    user_info = SolvedacUserInfoVO.from_api_response(user_info_data)
+
+                    if fingerprint == previous:
+                        logger.info(f"[SolvedacGateway] 변경 없음: {bj_user_id}")
+                        return SolvedacUserDeltaVO(
+                            user_id=bj_user_id,
+                            user_info=user_info,
+                            fingerprint=fingerprint,
+                            changed=False,
+                            is_full=False,
+                            problems=[],
+                        )
+
+                    grown_levels = fingerprint.grown_levels(previous) if previous is not None else None
+                    if grown_levels is not None:
+                        problems: list[dict] = []
+                        for level, grown_count in grown_levels.items():
+                            problems.extend(await self._fetch_new_problems_at_level(
+                                client, bj_user_id, level, grown_count, known_problem_ids
+                            ))
+                        logger.info(
+                            f"[SolvedacGateway] 증분 수집 완료: {bj_user_id}, "
+                            f"레벨 {sorted(grown_levels)}에서 {len(problems)}개 신규 문제"
+                        )
+                        return SolvedacUserDeltaVO(
+                            user_id=bj_user_id,
+                            user_info=user_info,
+                            fingerprint=fingerprint,
+                            changed=True,
+                            is_full=False,
+                            problems=[SolvedProblemVO.from_api_response(item) for item in problems],
+                        )
+                else:
+                    fingerprint = None
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"[SolvedacGateway] 존재하지 않는 유저: {bj_user_id}")
+                return None
+            logger.error(f"[SolvedacGateway] HTTP 에러: {e}")
+            raise APIException(ErrorCode.EXTERNAL_API_ERROR)
+        except httpx.RequestError as e:
+            logger.error(f"[SolvedacGateway] 요청 에러: {e}")
+            raise APIException(ErrorCode.EXTERNAL_API_ERROR)
+
+        # 전체 수집 (첫 동기화 / 푼 문제 수 감소 / fingerprint 조회 실패)
+        full_data = await self.fetch_user_data_first(bj_user_id)
+        if full_data is None:
+            return None
+        if fingerprint is None:
+            fingerprint = SolvedacFingerprint.of(
+                solved_count=full_data.user_info.solved_count,
+                rating=full_data.user_info.rating,
+                level_counts=self._count_levels(full_data.problems),
+            )
+        return SolvedacUserDeltaVO(
+            user_id=bj_user_id,
+            user_info=full_data.user_info,
+            fingerprint=fingerprint,
+            changed=True,
+            is_full=True,
+            problems=full_data.problems,
+        )
+
+    @staticmethod
+    def _count_levels(problems: list[SolvedProblemVO]) -> dict[int, int]:
+        counts: dict[int, int] = {}
+        for problem in problems:
+            counts[problem.level] = counts.get(problem.level, 0) + 1
+        return counts
+
+    async def _fetch_level_stats(self, client: httpx.AsyncClient, user_id: str) -> list[dict] | None:
+        """레벨별 푼 문제 수 (user/problem_stats API, 실패 시 None)"""
         try:
-            response = client.get(self.level_stats_url)
+            response = await client.get(self.level_stats_url.format(user_id=user_id))
             response.raise_for_status()
             data = response.json()
             # level_stats API는 리스트를 직접 반환
-            return data if isinstance(data, list) else []
-        except client.exceptions.RequestException as e:
-            print(f"[업데이트기] 티어 통계 에러: {e}")
-            return []
-    
-    def check_update(self, solved_stat_data: dict | None, tag_stat_data, level_stat_task) -> dict[str, Any]:
-        """
-        변경사항 확인 및 업데이트
+            return data if isinstance(data, list) else None
+        except Exception as e:
+            logger.warning(f"[SolvedacGateway] 레벨 통계 수집 실패: {e}")
+            return None
+
+    async def _fetch_new_problems_at_level(
+        self,
+        client: httpx.AsyncClient,
+        user_id: str,
+        level: int,
+        grown_count: int,
+        known_problem_ids: set[int],
+    ) -> list[dict]:
+        """해당 레벨에서 푼 문제를 검색해 known_problem_ids에 없는 문제를 grown_count개 찾을 때까지 페이지를 넘김"""
+        query = f"solved_by:{user_id} {_LEVEL_QUERY_TOKENS[level]}"
+        found: list[dict] = []
+        page = 1
+        while True:
+            response = await client.get(
+                f"{self.base_url}?query={query}&sort=id&direction=desc&page={page}"
+            )
+            response.raise_for_status()
+            data = response.json()
+            items = data.get("items", [])
+            found.extend(item for item in items if item.get("problemId") not in known_problem_ids)
+
+            total_pages = (data.get("count", 0) - 1) // 50 + 1
+            if len(found) >= grown_count or not items or page >= total_pages:
+                return found
+            page += 1
 
-        Args:
-            cached_data: 이전에 저장된 데이터 (tag_stats, level_stats 포함)
-        """
-        print(f"[업데이트기] 시작 (유저: {self.user_id})...")
-        start_time = time.time()
-
-        # 태그별 통계 수집
-        tag_stats = tag_stat_data
-
-        # 티어별 통계 수집
-        level_stats = level_stat_task
-
-        result = {
-            "user_id": self.user_id,
-            "tag_stats": tag_stats,
-            "level_stats": level_stats,
-            "checked_at": datetime.now().isoformat(),
-            "has_changes": False
-        }
-
-        # 캐시된 데이터와 비교
-        if solved_stat_data:
-            old_tag_stats = {item["tag"]["key"]: item["solved"] for item in solved_stat_data.get("tag_stats", [])}
-            new_tag_stats = {item["tag"]["key"]: item["solved"] for item in tag_stats}
-
-            old_level_stats = {item["level"]: item["solved"] for item in solved_stat_data.get("level_stats", [])}
-            new_level_stats = {item["level"]: item["solved"] for item in level_stats}
-
-            tag_changes = {k: v for k, v in new_tag_stats.items() if old_tag_stats.get(k, 0) != v}
-            level_changes = {k: v for k, v in new_level_stats.items() if old_level_stats.get(k, 0) != v}
-
-            if tag_changes or level_changes:
-                result["has_changes"] = True
-                result["tag_changes"] = tag_changes
-                result["level_changes"] = level_changes
-                print(f"[업데이트기] 변경 감지: 태그 {len(tag_changes)}개, 티어 {len(level_changes)}개")
-            else:
-                print(f"[업데이트기] 변경사항 없음")
-        else:
-            print(f"[업데이트기] 첫 수집 - 태그 {len(tag_stats)}개, 티어 {len(level_stats)}개")
-
-        elapsed = time.time() - start_time
-        print(f"[업데이트기] 완료 (소요시간: {elapsed:.2f}초)")
-
-        return result
-    
     async def _fetch_problem_page(self, client: httpx.AsyncClient, user_id: str, page: int) -> dict[str, Any] | None:
         """문제 목록 단일 페이지 요청"""
         query = f"solved_by:{user_id}"
@@ -250,9 +310,7 @@ class SolvedacGatewayImpl(SolvedacGateway):
             batch_end = min(batch_start + self.concurrent_requests, total_pages + 1)
             pages_to_fetch = range(batch_start, batch_end)
 
-            # 딜레이 후 병렬 요청
-            await asyncio.sleep(self.request_delay)
-
+            # 요청 간격은 공유 클라이언트의 토큰 버킷이 조절
             tasks = [
                 self._fetch_problem_page(client, user_id, page)
                 for page in pages_to_fetch
@@ -298,7 +356,6 @@ class SolvedacGatewayImpl(SolvedacGateway):
     async def _fetch_solve_history(self, client: httpx.AsyncClient, user_id: str) -> list[dict]:
         """유저의 문제 해결 히스토리 수집"""
         try:
-            await asyncio.sleep(self.request_delay)
             url = self.history_url_template.format(user_id=user_id)
             response = await client.get(url)
             response.raise_for_status()
@@ -1,6 +1,7 @@
 """BaekjoonAccount 엔티티와 Model 간 변환 매퍼"""
 
 from app.baekjoon.domain.entity.baekjoon_account import BaekjoonAccount
+from app.baekjoon.domain.vo.solvedac_fingerprint import SolvedacFingerprint
 from app.baekjoon.infra.model.bj_account import BjAccountModel
 from app.common.domain.vo.identifiers import BaekjoonAccountId, TierId
 from app.common.domain.vo.primitives import Rating, Statistics
@@ -24,6 +25,9 @@ class BaekjoonAccountMapper:
         model.contribution_count = entity.statistics.contribution_count
         model.class_ = entity.statistics.class_level
         model.longest_streak = entity.statistics.longest_streak
+        model.solvedac_fingerprint = (
+            entity.solvedac_fingerprint.to_dict() if entity.solvedac_fingerprint else None
+        )
 
         # 메타데이터
         model.created_at = entity.created_at
@@ -48,6 +52,9 @@ class BaekjoonAccountMapper:
             created_at=model.created_at,
             updated_at=model.updated_at,
             deleted_at=model.deleted_at,
+            solvedac_fingerprint=(
+                SolvedacFingerprint.from_dict(model.solvedac_fingerprint) if model.solvedac_fingerprint else None
+            ),
             tier_histories=[],
             tag_skill_histories=[],
             problem_histories=[]
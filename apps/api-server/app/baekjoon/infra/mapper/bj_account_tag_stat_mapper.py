@@ -0,0 +1,19 @@
+"""BjAccountTagStat Model → TagAccountStat 변환 매퍼"""
+
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.baekjoon.infra.model.bj_account_tag_stat import BjAccountTagStatModel
+from app.common.domain.vo.identifiers import TagId, TierId
+
+
+class BjAccountTagStatMapper:
+    """bj_account_tag_stat 행을 TagAccountStat으로 변환하는 매퍼"""
+
+    @staticmethod
+    def to_vo(model: BjAccountTagStatModel) -> TagAccountStat:
+        """SQLAlchemy 모델을 TagAccountStat으로 변환"""
+        return TagAccountStat(
+            tag_id=TagId(model.tag_id),
+            solved_problem_count=model.solved_count,
+            highest_tier_id=TierId(model.highest_tier_id) if model.highest_tier_id else None,
+            last_solved_date=model.last_solved_date
+        )
@@ -1,6 +1,6 @@
 from datetime import datetime, date
 from typing import Optional
-from sqlalchemy import String, DateTime, Integer, ForeignKey, Date
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Date, JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -17,6 +17,7 @@ class BjAccountModel(Base):
     contribution_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     class_: Mapped[int] = mapped_column("class", Integer, nullable=False, default=0)
     longest_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    solvedac_fingerprint: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, comment='마지막 동기화 시점 solved.ac 상태 요약')
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -0,0 +1,28 @@
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import Date, DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class BjAccountTagStatModel(Base):
+    """백준 계정 × 연동 유저별 태그 통계 (get_tag_stats 집계 결과를 저장한 사전 계산 테이블)
+
+    - solved_count / highest_tier_id: problem_history 기준 (계정 단위 값이지만 유저별 행에 함께 저장)
+    - last_solved_date: 해당 유저의 SOLVED problem_date_record 기준
+    - 유저 탈퇴 / 계정 삭제 시 Repository에서 함께 삭제하므로 FK는 두지 않음
+    """
+    __tablename__ = "bj_account_tag_stat"
+    __table_args__ = (
+        Index('idx_bj_account_tag_stat_user', 'user_account_id'),
+        {'comment': '백준 계정 태그별 통계 (사전 계산 테이블)'},
+    )
+
+    bj_account_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    user_account_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tag_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    solved_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    highest_tier_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    last_solved_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,5 +1,7 @@
 """BaekjoonAccount Repository 구현"""
 
+import copy
+from dataclasses import replace
 from datetime import date, datetime
 from typing import override
 from sqlalchemy import and_, func, select, case, null, literal
@@ -9,11 +11,13 @@ from app.baekjoon.domain.entity.baekjoon_account import BaekjoonAccount
 from app.baekjoon.domain.repository.baekjoon_account_repository import BaekjoonAccountRepository
 from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
 from app.baekjoon.infra.mapper.baekjoon_account_mapper import BaekjoonAccountMapper
+from app.baekjoon.infra.mapper.bj_account_tag_stat_mapper import BjAccountTagStatMapper
 from app.baekjoon.infra.mapper.problem_history_mapper import ProblemHistoryMapper
 from app.baekjoon.infra.model.bj_account import BjAccountModel
+from app.baekjoon.infra.model.bj_account_tag_stat import BjAccountTagStatModel
 from app.baekjoon.infra.model.problem_history import ProblemHistoryModel
 from app.common.domain.vo.identifiers import BaekjoonAccountId, TagId, TierId, UserAccountId
-from app.core.database import Database
+from app.core.database import Database, invalidate_request_cache, request_cached
 from app.problem.infra.model.problem import ProblemModel
 from app.problem.infra.model.problem_tag import ProblemTagModel
 from app.user.infra.model.account_link import AccountLinkModel
@@ -37,6 +41,7 @@ class BaekjoonAccountRepositoryImpl(BaekjoonAccountRepository):
         model = BaekjoonAccountMapper.to_model(account)
         self.session.add(model)
         await self.session.flush()  # bj_account FK 참조 전에 반드시 flush
+        invalidate_request_cache("bj_account")
 
         # 문제 히스토리 저장
         for history in account.problem_histories:
@@ -54,6 +59,8 @@ class BaekjoonAccountRepositoryImpl(BaekjoonAccountRepository):
             existing_model.tier_id = account.current_tier_id.value
             existing_model.rating = account.rating.value
             existing_model.class_ = account.statistics.class_level
+            if account.solvedac_fingerprint is not None:
+                existing_model.solvedac_fingerprint = account.solvedac_fingerprint.to_dict()
             existing_model.updated_at = datetime.now()
             model = existing_model
         else:
@@ -61,6 +68,7 @@ class BaekjoonAccountRepositoryImpl(BaekjoonAccountRepository):
             self.session.add(model)
 
         await self.session.flush()
+        invalidate_request_cache("bj_account")
         return BaekjoonAccountMapper.to_entity(model)
 
     @override
@@ -79,26 +87,35 @@ class BaekjoonAccountRepositoryImpl(BaekjoonAccountRepository):
 
     @override
     async def find_by_user_id(self, user_id: UserAccountId) -> BaekjoonAccount | None:
-        """유저 계정 ID로 백준 계정 조회 (AccountLink를 통해)"""
-        stmt = (
-            select(BjAccountModel)
-            .join(
-                AccountLinkModel,
-                BjAccountModel.bj_account_id == AccountLinkModel.bj_account_id
-            )
-            .where(
-                and_(
-                    AccountLinkModel.user_account_id == user_id.value,
-                    AccountLinkModel.deleted_at.is_(None),
-                    BjAccountModel.deleted_at.is_(None)
+        """유저 계정 ID로 백준 계정 조회 (AccountLink를 통해)
+
+        한 요청에서 여러 번 호출되므로 세션 범위로 memoize (엔티티는 호출마다 복사본 반환)
+        """
+        async def load() -> BaekjoonAccount | None:
+            stmt = (
+                select(BjAccountModel)
+                .join(
+                    AccountLinkModel,
+                    BjAccountModel.bj_account_id == AccountLinkModel.bj_account_id
+                )
+                .where(
+                    and_(
+                        AccountLinkModel.user_account_id == user_id.value,
+                        AccountLinkModel.deleted_at.is_(None),
+                        BjAccountModel.deleted_at.is_(None)
+                    )
                 )
             )
-        )
 
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+            result = await self.session.execute(stmt)
+            model = result.scalar_one_or_none()
 
-        return BaekjoonAccountMapper.to_entity(model) if model else None
+            return BaekjoonAccountMapper.to_entity(model) if model else None
+
+        account = await request_cached(
+            ("bj_account_by_user_id", user_id.value), load, depends_on=("account_link", "bj_account")
+        )
+        return copy.deepcopy(account)
 
     @override
     async def find_by_user_id_with_link_date(
@@ -152,6 +169,52 @@ class BaekjoonAccountRepositoryImpl(BaekjoonAccountRepository):
     ) -> list[TagAccountStat]:
         """백준 계정의 모든 태그별 통계 조회
 
+        활성 account_link ⋈ bj_account_tag_stat(PK: bj_account_id, user_account_id, tag_id) 한 번으로 읽는다.
+        - user_account_id 없음: 적재된 활성 연동 유저 중 첫 유저의 행을 쓰고 last_solved_date는 NULL (기존 집계와 동일)
+        - 적재 여부는 account_link.tag_stat_built_at으로 판단 (적재됐지만 푼 문제가 없는 계정은 빈 목록)
+        - 아직 적재되지 않은 계정은 aggregate_tag_stats로 직접 집계
+        """
+        stmt = (
+            select(AccountLinkModel.user_account_id, AccountLinkModel.tag_stat_built_at, BjAccountTagStatModel)
+            .outerjoin(
+                BjAccountTagStatModel,
+                and_(
+                    BjAccountTagStatModel.bj_account_id == AccountLinkModel.bj_account_id,
+                    BjAccountTagStatModel.user_account_id == AccountLinkModel.user_account_id,
+                ),
+            )
+            .where(
+                AccountLinkModel.bj_account_id == account_id.value,
+                AccountLinkModel.deleted_at.is_(None),
+            )
+        )
+        if user_account_id:
+            stmt = stmt.where(AccountLinkModel.user_account_id == user_account_id.value)
+        stmt = stmt.order_by(AccountLinkModel.user_account_id, BjAccountTagStatModel.tag_id)
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        built_user_account_id = next((uid for uid, built_at, _ in rows if built_at is not None), None)
+        if built_user_account_id is None:
+            return await self.aggregate_tag_stats(account_id, user_account_id)
+
+        stats = [
+            BjAccountTagStatMapper.to_vo(model)
+            for uid, _, model in rows
+            if uid == built_user_account_id and model is not None
+        ]
+        if user_account_id:
+            return stats
+        return [replace(stat, last_solved_date=None) for stat in stats]
+
+    @override
+    async def aggregate_tag_stats(
+        self,
+        account_id: BaekjoonAccountId,
+        user_account_id: UserAccountId | None = None
+    ) -> list[TagAccountStat]:
+        """problem_history ⋈ problem_tag ⋈ problem 직접 집계 (bj_account_tag_stat 재적재 / 정합성 확인 기준)
+
         streak 제거 후: problem_date_record를 기반으로 last_solved_date 계산
         """
         if user_account_id:
@@ -0,0 +1,286 @@
+"""BjAccountTagStat Repository 구현"""
+
+from typing import override
+
+from sqlalchemy import bindparam, delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.baekjoon.domain.repository.bj_account_tag_stat_repository import BjAccountTagStatRepository
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.baekjoon.infra.mapper.bj_account_tag_stat_mapper import BjAccountTagStatMapper
+from app.baekjoon.infra.model.bj_account_tag_stat import BjAccountTagStatModel
+from app.common.domain.vo.identifiers import BaekjoonAccountId, UserAccountId
+from app.core.database import Database
+
+# (백준 계정, 유저) 한 쌍의 태그별 통계 집계 (BaekjoonAccountRepositoryImpl.aggregate_tag_stats와 같은 규칙)
+# - {tag_filter}: 태그 범위 재집계 시 pt.tag_id 조건
+_REBUILD_SQL_TEMPLATE = """
+    INSERT INTO bj_account_tag_stat (
+        bj_account_id, user_account_id, tag_id,
+        solved_count, highest_tier_id, last_solved_date, updated_at
+    )
+    SELECT
+        :bj_account_id,
+        :user_account_id,
+        pt.tag_id,
+        COUNT(DISTINCT ph.problem_id),
+        MAX(p.problem_tier_level),
+        MAX(dr.marked_date),
+        NOW()
+    FROM problem_history ph
+    JOIN problem_tag pt ON pt.problem_id = ph.problem_id
+    JOIN problem p ON p.problem_id = ph.problem_id
+    LEFT JOIN user_problem_status ups
+        ON ups.problem_id = ph.problem_id
+        AND ups.user_account_id = :user_account_id
+        AND ups.solved_yn = TRUE
+        AND ups.deleted_at IS NULL
+    LEFT JOIN problem_date_record dr
+        ON dr.user_problem_status_id = ups.user_problem_status_id
+        AND dr.record_type = 'SOLVED'
+        AND dr.deleted_at IS NULL
+    WHERE ph.bj_account_id = :bj_account_id{tag_filter}
+    GROUP BY pt.tag_id
+"""
+_REBUILD_SQL = text(_REBUILD_SQL_TEMPLATE.format(tag_filter=""))
+_REBUILD_TAGS_SQL = text(
+    _REBUILD_SQL_TEMPLATE.format(tag_filter="\n        AND pt.tag_id IN :tag_ids")
+).bindparams(bindparam("tag_ids", expanding=True))
+
+# 신규 problem_history 문제만 집계해 기존 행에 더함
+# - highest_tier_id / last_solved_date는 NULL을 고려해 큰 값 유지 (GREATEST는 인자에 NULL이 있으면 NULL)
+_APPLY_NEW_HISTORY_SQL = text("""
+    INSERT INTO bj_account_tag_stat (
+        bj_account_id, user_account_id, tag_id,
+        solved_count, highest_tier_id, last_solved_date, updated_at
+    )
+    SELECT
+        :bj_account_id,
+        al.user_account_id,
+        pt.tag_id,
+        COUNT(DISTINCT p.problem_id),
+        MAX(p.problem_tier_level),
+        MAX(dr.marked_date),
+        NOW()
+    FROM account_link al
+    JOIN problem p ON p.problem_id IN :problem_ids
+    JOIN problem_tag pt ON pt.problem_id = p.problem_id
+    LEFT JOIN user_problem_status ups
+        ON ups.problem_id = p.problem_id
+        AND ups.user_account_id = al.user_account_id
+        AND ups.solved_yn = TRUE
+        AND ups.deleted_at IS NULL
+    LEFT JOIN problem_date_record dr
+        ON dr.user_problem_status_id = ups.user_problem_status_id
+        AND dr.record_type = 'SOLVED'
+        AND dr.deleted_at IS NULL
+    WHERE al.bj_account_id = :bj_account_id
+        AND al.user_account_id IN :user_account_ids
+        AND al.deleted_at IS NULL
+    GROUP BY al.user_account_id, pt.tag_id
+    ON DUPLICATE KEY UPDATE
+        solved_count     = solved_count + VALUES(solved_count),
+        highest_tier_id  = COALESCE(GREATEST(highest_tier_id, VALUES(highest_tier_id)),
+                                    highest_tier_id, VALUES(highest_tier_id)),
+        last_solved_date = COALESCE(GREATEST(last_solved_date, VALUES(last_solved_date)),
+                                    last_solved_date, VALUES(last_solved_date)),
+        updated_at       = VALUES(updated_at)
+""").bindparams(
+    bindparam("problem_ids", expanding=True),
+    bindparam("user_account_ids", expanding=True),
+)
+
+# 날짜 기록이 바뀐 문제의 태그만 골라 last_solved_date 재계산 (idx_bj_account_tag_stat_user 사용)
+_REFRESH_LAST_SOLVED_DATES_SQL = text("""
+    UPDATE bj_account_tag_stat s
+    SET s.last_solved_date = (
+            SELECT MAX(dr.marked_date)
+            FROM problem_history ph
+            JOIN problem_tag pt
+                ON pt.problem_id = ph.problem_id
+                AND pt.tag_id = s.tag_id
+            JOIN user_problem_status ups
+                ON ups.problem_id = ph.problem_id
+                AND ups.user_account_id = s.user_account_id
+                AND ups.solved_yn = TRUE
+                AND ups.deleted_at IS NULL
+            JOIN problem_date_record dr
+                ON dr.user_problem_status_id = ups.user_problem_status_id
+                AND dr.record_type = 'SOLVED'
+                AND dr.deleted_at IS NULL
+            WHERE ph.bj_account_id = s.bj_account_id
+        ),
+        s.updated_at = NOW()
+    WHERE s.user_account_id = :user_account_id
+        AND s.tag_id IN (
+            SELECT DISTINCT pt2.tag_id FROM problem_tag pt2 WHERE pt2.problem_id IN :problem_ids
+        )
+""").bindparams(bindparam("problem_ids", expanding=True))
+
+# 지정 태그의 통계가 있거나 생길 수 있는 연동 (태그가 빠진 문제는 기존 행, 새로 붙은 문제는 problem_history로 찾음)
+_HAS_TAGS_CONDITION = """
+    AND (
+        EXISTS (
+            SELECT 1 FROM bj_account_tag_stat s
+            WHERE s.bj_account_id = account_link.bj_account_id
+                AND s.user_account_id = account_link.user_account_id
+                AND s.tag_id IN :tag_ids
+        )
+        OR EXISTS (
+            SELECT 1 FROM problem_history ph
+            JOIN problem_tag pt ON pt.problem_id = ph.problem_id
+            WHERE ph.bj_account_id = account_link.bj_account_id
+                AND pt.tag_id IN :tag_ids
+        )
+    )
+"""
+
+_LINKED_USERS_SQL = text("""
+    SELECT
+        al.user_account_id,
+        al.tag_stat_built_at IS NOT NULL AS built
+    FROM account_link al
+    WHERE al.bj_account_id = :bj_account_id
+        AND al.deleted_at IS NULL
+""")
+
+# 전체 재적재 완료 표시 - 통계 행이 0개여도 적재된 계정으로 본다
+_MARK_BUILT_SQL = text("""
+    UPDATE account_link
+    SET tag_stat_built_at = NOW()
+    WHERE bj_account_id = :bj_account_id
+        AND user_account_id = :user_account_id
+        AND deleted_at IS NULL
+""")
+
+_DELETE_UNLINKED_SQL = """
+    DELETE s FROM bj_account_tag_stat s
+    LEFT JOIN account_link al
+        ON al.bj_account_id = s.bj_account_id
+        AND al.user_account_id = s.user_account_id
+        AND al.deleted_at IS NULL
+    WHERE al.account_link_id IS NULL
+"""
+
+
+class BjAccountTagStatRepositoryImpl(BjAccountTagStatRepository):
+    """BjAccountTagStat Repository 구현체
+
+    MySQL 전용 upsert(INSERT ... SELECT ... ON DUPLICATE KEY UPDATE)를 쓰므로 text SQL로 작성한다.
+    ORM으로 추가한 행이 반영되도록 쓰기 전에 flush한다.
+    """
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    @property
+    def session(self) -> AsyncSession:
+        return self.db.get_current_session()
+
+    @override
+    async def apply_new_history(self, bj_account_id: BaekjoonAccountId, problem_ids: list[int]) -> None:
+        if not problem_ids:
+            return
+        await self.session.flush()
+
+        result = await self.session.execute(_LINKED_USERS_SQL, {"bj_account_id": bj_account_id.value})
+        built_user_ids: list[int] = []
+        for user_account_id, built in result.all():
+            if built:
+                built_user_ids.append(user_account_id)
+            else:
+                await self.rebuild(bj_account_id, UserAccountId(user_account_id))
+
+        if built_user_ids:
+            await self.session.execute(
+                _APPLY_NEW_HISTORY_SQL,
+                {
+                    "bj_account_id": bj_account_id.value,
+                    "problem_ids": list(problem_ids),
+                    "user_account_ids": built_user_ids,
+                },
+            )
+
+    @override
+    async def refresh_last_solved_dates(self, user_account_id: UserAccountId, problem_ids: list[int]) -> None:
+        if not problem_ids:
+            return
+        await self.session.flush()
+        await self.session.execute(
+            _REFRESH_LAST_SOLVED_DATES_SQL,
+            {"user_account_id": user_account_id.value, "problem_ids": list(problem_ids)},
+        )
+
+    @override
+    async def rebuild(
+        self,
+        bj_account_id: BaekjoonAccountId,
+        user_account_id: UserAccountId,
+        tag_ids: set[int] | None = None
+    ) -> int:
+        await self.session.flush()
+        stmt = delete(BjAccountTagStatModel).where(
+            BjAccountTagStatModel.bj_account_id == bj_account_id.value,
+            BjAccountTagStatModel.user_account_id == user_account_id.value,
+        )
+        params = {"bj_account_id": bj_account_id.value, "user_account_id": user_account_id.value}
+        if tag_ids is not None:
+            stmt = stmt.where(BjAccountTagStatModel.tag_id.in_(sorted(tag_ids)))
+            params["tag_ids"] = sorted(tag_ids)
+        await self.session.execute(stmt)
+        result = await self.session.execute(_REBUILD_SQL if tag_ids is None else _REBUILD_TAGS_SQL, params)
+        if tag_ids is None:
+            await self.session.execute(_MARK_BUILT_SQL, params)
+        return result.rowcount
+
+    @override
+    async def find_by_account(
+        self,
+        bj_account_id: BaekjoonAccountId,
+        user_account_id: UserAccountId
+    ) -> list[TagAccountStat]:
+        stmt = (
+            select(BjAccountTagStatModel)
+            .where(
+                BjAccountTagStatModel.bj_account_id == bj_account_id.value,
+                BjAccountTagStatModel.user_account_id == user_account_id.value,
+            )
+            .order_by(BjAccountTagStatModel.tag_id)
+        )
+        result = await self.session.execute(stmt)
+        return [BjAccountTagStatMapper.to_vo(model) for model in result.scalars().all()]
+
+    @override
+    async def find_linked_pairs(
+        self,
+        bj_account_id: BaekjoonAccountId | None = None,
+        tag_ids: set[int] | None = None
+    ) -> list[tuple[BaekjoonAccountId, UserAccountId]]:
+        sql = """
+            SELECT bj_account_id, user_account_id
+            FROM account_link
+            WHERE deleted_at IS NULL
+        """
+        params = {}
+        if bj_account_id is not None:
+            sql += " AND bj_account_id = :bj_account_id"
+            params["bj_account_id"] = bj_account_id.value
+        if tag_ids is not None:
+            sql += _HAS_TAGS_CONDITION
+            params["tag_ids"] = sorted(tag_ids)
+        stmt = text(sql + " ORDER BY bj_account_id, user_account_id")
+        if tag_ids is not None:
+            stmt = stmt.bindparams(bindparam("tag_ids", expanding=True))
+        result = await self.session.execute(stmt, params)
+        return [(BaekjoonAccountId(bj), UserAccountId(uid)) for bj, uid in result.all()]
+
+    @override
+    async def delete_unlinked(self, user_account_id: UserAccountId | None = None) -> int:
+        await self.session.flush()
+        sql = _DELETE_UNLINKED_SQL
+        params = {}
+        if user_account_id is not None:
+            sql += " AND s.user_account_id = :user_account_id"
+            params["user_account_id"] = user_account_id.value
+        result = await self.session.execute(text(sql), params)
+        return result.rowcount
@@ -0,0 +1,115 @@
+"""MonthlyCalendar Repository 구현"""
+
+from calendar import monthrange
+from datetime import date
+from typing import override
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.activity.domain.entity.problem_date_record import RecordType
+from app.baekjoon.domain.repository.monthly_calendar_repository import MonthlyCalendarRepository
+from app.baekjoon.domain.vo.monthly_calendar_entry import MonthlyCalendarEntry
+from app.common.domain.vo.identifiers import UserAccountId
+from app.core.database import Database
+from app.tier.domain.vo.tier_table import TierTable
+
+# 상태 + 날짜 기록 + 문제 + 대표 태그 + 문제 태그 ID를 한 번에 조회 (티어 이름은 TierTable로 변환)
+# - 활성 BJ 계정은 account_link 스칼라 서브쿼리로 한 번만 평가 (기존 _get_active_bj_account_id와 동일하게 LIMIT 1)
+# - SOLVED는 solved_yn=1, WILL_SOLVE는 solved_yn=0 상태의 기록만 (기존 월간 조회 조건과 동일)
+_MONTH_ENTRIES_SQL = text("""
+    SELECT
+        dr.marked_date,
+        dr.display_order,
+        dr.record_type,
+        p.problem_id,
+        p.problem_title,
+        p.problem_tier_level,
+        p.class_level,
+        (
+            SELECT GROUP_CONCAT(pt.tag_id ORDER BY pt.problem_tag_id)
+            FROM problem_tag pt
+            WHERE pt.problem_id = p.problem_id
+        ) AS tag_ids,
+        rt.tag_id,
+        rt.tag_code,
+        rt.tag_display_name
+    FROM user_problem_status ups
+    JOIN problem_date_record dr
+        ON dr.user_problem_status_id = ups.user_problem_status_id
+        AND dr.deleted_at IS NULL
+        AND dr.marked_date BETWEEN :start_date AND :end_date
+    JOIN problem p
+        ON p.problem_id = ups.problem_id
+        AND p.deleted_at IS NULL
+    LEFT JOIN tag rt
+        ON rt.tag_id = ups.representative_tag_id
+        AND rt.deleted_at IS NULL
+    WHERE ups.user_account_id = :user_account_id
+        AND ups.bj_account_id = (
+            SELECT al.bj_account_id
+            FROM account_link al
+            WHERE al.user_account_id = :user_account_id
+                AND al.deleted_at IS NULL
+            LIMIT 1
+        )
+        AND ups.deleted_at IS NULL
+        AND (
+            (ups.solved_yn = 1 AND dr.record_type = :solved)
+            OR (ups.solved_yn = 0 AND dr.record_type = :will_solve)
+        )
+    ORDER BY dr.marked_date, dr.display_order, dr.problem_date_record_id
+""")
+
+
+class MonthlyCalendarRepositoryImpl(MonthlyCalendarRepository):
+    """월간 캘린더 조회 전용 Repository 구현체"""
+
+    def __init__(self, db: Database, tier_table: TierTable | None = None):
+        self.db = db
+        self.tier_table = tier_table or TierTable.static()
+
+    @property
+    def session(self) -> AsyncSession:
+        return self.db.get_current_session()
+
+    @override
+    async def find_month_entries(
+        self,
+        user_account_id: UserAccountId,
+        year: int,
+        month: int
+    ) -> list[MonthlyCalendarEntry]:
+        _, last_day = monthrange(year, month)
+        result = await self.session.execute(
+            _MONTH_ENTRIES_SQL,
+            {
+                "user_account_id": user_account_id.value,
+                "start_date": date(year, month, 1),
+                "end_date": date(year, month, last_day),
+                "solved": RecordType.SOLVED.value,
+                "will_solve": RecordType.WILL_SOLVE.value,
+            },
+        )
+        return [self._to_entry(row) for row in result.all()]
+
+    def _to_entry(self, row) -> MonthlyCalendarEntry:
+        (
+            marked_date, display_order, record_type,
+            problem_id, problem_title, tier_level, class_level,
+            tag_ids, rep_tag_id, rep_tag_code, rep_tag_display_name,
+        ) = row
+        return MonthlyCalendarEntry(
+            marked_date=marked_date,
+            display_order=display_order,
+            solved=record_type == RecordType.SOLVED.value,
+            problem_id=problem_id,
+            problem_title=problem_title,
+            problem_tier_level=tier_level,
+            problem_tier_name=self.tier_table.code(tier_level),
+            problem_class_level=class_level,
+            tag_ids=tuple(int(tag_id) for tag_id in tag_ids.split(",")) if tag_ids else (),
+            representative_tag_id=rep_tag_id,
+            representative_tag_code=rep_tag_code,
+            representative_tag_display_name=rep_tag_display_name,
+        )
@@ -4,9 +4,10 @@ from datetime import date
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from app.baekjoon.application.service.bj_account_tag_stat_service import BjAccountTagStatService
 from app.baekjoon.application.usecase.update_bj_account_usecase import UpdateBjAccountUsecase
 from app.common.domain.entity.system_log import SystemLog
-from app.common.domain.entity.system_log_data import WeeklyUpdateLogData
+from app.common.domain.entity.system_log_data import ProblemUpdateLogData
 from app.common.domain.enums import SystemLogType, SystemLogStatus
 from app.common.domain.repository.system_log_repository import SystemLogRepository
 from app.core.database import get_global_database, set_database_context, reset_database_context
@@ -15,6 +16,8 @@ from app.problem.application.service.problem_metadata_sync_service import Proble
 
 logger = logging.getLogger(__name__)
 
+_FULL_SYNC_WEEKDAY = 2  # 수요일 - 전체 재기록 + 전체 태그 재계산
+
 
 class BjAccountUpdateScheduler:
     """메트릭 수집 스케줄러"""
@@ -24,10 +27,12 @@ class BjAccountUpdateScheduler:
         update_bj_account_use_case: UpdateBjAccountUsecase,
         problem_metadata_sync_service: ProblemMetadataSyncService,
         system_log_repository: SystemLogRepository | None = None,
+        bj_account_tag_stat_service: BjAccountTagStatService | None = None,
     ):
         self.update_bj_account_use_case = update_bj_account_use_case
         self.problem_metadata_sync_service = problem_metadata_sync_service
         self.system_log_repository = system_log_repository
+        self.bj_account_tag_stat_service = bj_account_tag_stat_service
         self.scheduler = AsyncIOScheduler()
 
     def start(self):
@@ -43,12 +48,12 @@ class BjAccountUpdateScheduler:
                 max_instances=1  # 동시 실행 방지
             )
 
-            # 매주 수요일 16:29에 문제/태그 데이터 업데이트
+            # 매일 16:54에 문제/태그 데이터 업데이트 (변경분만, 수요일은 전체)
             self.scheduler.add_job(
-                self._weekly_problem_update_job,
-                trigger=CronTrigger(day_of_week='wed', hour=16, minute=54),
-                id='weekly_problem_update',
-                name='Weekly Problem/Tag Update',
+                self._problem_update_job,
+                trigger=CronTrigger(hour=16, minute=54),
+                id='daily_problem_update',
+                name='Daily Problem/Tag Update',
                 replace_existing=True,
                 max_instances=1
             )
@@ -72,8 +77,12 @@ class BjAccountUpdateScheduler:
         token = set_database_context(db)
         try:
             logger.info("Starting daily metric collection...")
-            await self.update_bj_account_use_case.execute_bulk()
-            logger.info("Daily metric collection completed")
+            result = await self.update_bj_account_use_case.execute_bulk()
+            logger.info(
+                f"Daily metric collection completed: "
+                f"succeeded={result.succeeded_count}, failed={result.failed_count}, "
+                f"resumed={result.resumed_count}, throughput={result.throughput:.2f} accounts/s"
+            )
 
         except APIException as e:
             logger.error(f"API exception during metric collection: {e}")
@@ -83,55 +92,74 @@ class BjAccountUpdateScheduler:
         finally:
             reset_database_context(token)
 
-    async def _weekly_problem_update_job(self):
+    async def _problem_update_job(self):
         """
-        주간 문제/태그 데이터 업데이트 작업
+        문제/태그 데이터 업데이트 작업
 
         ProblemMetadataSyncService.sync_all()을 호출해 앱 내부에서
         solved.ac 전체 태그·문제 데이터를 DB와 동기화한다.
-        결과는 system_log(WEEKLY_UPDATE)에 기록된다.
+        평일에는 내용이 바뀐 문제만 기록하는 delta 모드, 수요일에는 전체 재기록(full)으로 실행한다.
+        결과는 실행 모드와 함께 system_log(PROBLEM_UPDATE)에 기록된다.
+        문제 티어 / 태그 변경은 bj_account_tag_stat에 증분으로 반영되지 않으므로
+        동기화 후 영향받은 태그(full이면 전체)의 통계를 다시 집계한다.
         """
-        logger.info("Starting weekly problem/tag update...")
+        full = date.today().weekday() == _FULL_SYNC_WEEKDAY
+        mode = "full" if full else "delta"
+        logger.info(f"Starting problem/tag update (mode={mode})...")
         db = get_global_database()
         token = set_database_context(db)
 
         synced_tags = 0
         synced_problems = 0
+        changed_problems = 0
         error_msg: str | None = None
         overall_status = SystemLogStatus.FAILED
 
         try:
-            result = await self.problem_metadata_sync_service.sync_all()
+            result = await self.problem_metadata_sync_service.sync_all(full=full)
             synced_tags = result.tag_count
             synced_problems = result.problem_count
+            changed_problems = result.changed_problem_count
             overall_status = SystemLogStatus.SUCCESS
             logger.info(
-                f"Weekly problem/tag update completed: "
-                f"tags={synced_tags}, problems={synced_problems}"
+                f"Problem/tag update completed (mode={mode}): "
+                f"tags={synced_tags}, problems={synced_problems}, changed={changed_problems}"
             )
+            await self._rebuild_tag_stats(result.affected_tag_ids)
 
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"Unexpected error during weekly problem update: {e}")
+            logger.error(f"Unexpected error during problem update (mode={mode}): {e}")
 
         finally:
             try:
                 log = SystemLog.create(
-                    log_type=SystemLogType.WEEKLY_UPDATE,
+                    log_type=SystemLogType.PROBLEM_UPDATE,
                     status=overall_status,
-                    log_data=WeeklyUpdateLogData(
+                    log_data=ProblemUpdateLogData(
                         run_date=date.today().isoformat(),
+                        mode=mode,
                         synced_tag_count=synced_tags,
                         synced_problem_count=synced_problems,
+                        changed_problem_count=changed_problems,
                         error=error_msg,
                     ).to_dict(),
                     should_notify=(overall_status == SystemLogStatus.FAILED),
                 )
                 await self.problem_metadata_sync_service.save_sync_result_log(log)
             except Exception as log_err:
-                logger.error(f"Failed to save weekly update system_log: {log_err}")
+                logger.error(f"Failed to save problem update system_log: {log_err}")
             reset_database_context(token)
 
+    async def _rebuild_tag_stats(self, tag_ids: set[int] | None) -> None:
+        """메타데이터 동기화 후 태그별 통계 재집계 (실패해도 동기화 결과는 성공으로 남김)"""
+        if self.bj_account_tag_stat_service is None:
+            return
+        try:
+            await self.bj_account_tag_stat_service.rebuild_tags(tag_ids)
+        except Exception as e:
+            logger.error(f"Failed to rebuild tag stats after problem update: {e}")
+
     async def collect_metrics_now(self) -> None:
         """즉시 메트릭 수집 (테스트용)"""
         await self._collect_metrics_job()
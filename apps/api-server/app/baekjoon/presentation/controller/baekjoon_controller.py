@@ -1,3 +1,4 @@
+import json
 from datetime import date as date_type
 from fastapi import APIRouter, Depends, Query
 from dependency_injector.wiring import inject, Provide
@@ -12,6 +13,7 @@ from app.baekjoon.application.query.get_unrecorded_problems_query import GetUnre
 from app.baekjoon.application.usecase.get_scheduler_inactive_periods_usecase import GetSchedulerInactivePeriodsUsecase
 from app.baekjoon.application.usecase.get_unrecorded_problems_usecase import GetUnrecordedProblemsUsecase
 from app.baekjoon.application.usecase.link_bj_account_usecase import LinkBjAccountUsecase
+from app.baekjoon.application.usecase.link_bj_account_job_usecase import LinkBjAccountJobUsecase
 from app.baekjoon.application.usecase.get_baekjoon_me_usecase import GetBaekjoonMeUsecase
 from app.baekjoon.application.usecase.get_monthly_problems_usecase import GetMonthlyProblemsUsecase
 from app.baekjoon.application.usecase.get_streaks_usecase import GetStreaksUsecase
@@ -36,11 +38,15 @@ from app.baekjoon.presentation.schema.response.get_scheduler_inactive_periods_re
 from app.baekjoon.presentation.schema.response.get_unrecorded_problems_response import (
     GetUnrecordedProblemsResponse
 )
+from app.baekjoon.presentation.schema.response.link_job_response import LinkJobResponse
 from app.core.containers import Container
 from app.core.api_response import ApiResponse, ApiResponseSchema
+from app.core.sse_response import SseStreamingResponse
 
 router = APIRouter(prefix="/bj-accounts", tags=["bj-accounts"])
 
+_LINK_JOB_HEARTBEAT_SECONDS = 30
+
 
 @router.post("/link", response_model=ApiResponseSchema[dict])
 @inject
@@ -89,6 +95,84 @@ async def update_baekjoon_account_link(
     return ApiResponse(data={})
 
 
+@router.post("/link/jobs", response_model=ApiResponseSchema[LinkJobResponse])
+@inject
+async def create_baekjoon_account_link_job(
+    request: LinkBaekjoonAccountRequest,
+    current_user: CurrentUser = Depends(get_current_member),
+    link_bj_account_job_usecase: LinkBjAccountJobUsecase = Depends(Provide[Container.link_bj_account_job_usecase])
+):
+    """
+    백준 계정 비동기 연동 요청
+
+    연동 작업만 등록하고 바로 응답한다. 진행 상황은 작업 조회 / SSE 스트림으로 확인.
+    이미 진행 중인 연동 작업이 있으면 그 작업을 반환한다.
+
+    Args:
+        request: 백준 계정 ID
+
+    Returns:
+        작업 상태 (jobId 포함)
+    """
+    result = await link_bj_account_job_usecase.enqueue(LinkBjAccountCommand(
+        user_account_id=current_user.user_account_id,
+        bj_account_id=request.bj_account))
+
+    return ApiResponse(data=LinkJobResponse.from_query(result))
+
+
+@router.get("/link/jobs/{job_id}", response_model=ApiResponseSchema[LinkJobResponse])
+@inject
+async def get_baekjoon_account_link_job(
+    job_id: str,
+    current_user: CurrentUser = Depends(get_current_member),
+    link_bj_account_job_usecase: LinkBjAccountJobUsecase = Depends(Provide[Container.link_bj_account_job_usecase])
+):
+    """
+    백준 계정 비동기 연동 작업 상태 조회
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        작업 상태
+    """
+    result = await link_bj_account_job_usecase.get(job_id, current_user.user_account_id)
+
+    return ApiResponse(data=LinkJobResponse.from_query(result))
+
+
+@router.get("/link/jobs/{job_id}/stream")
+@inject
+async def stream_baekjoon_account_link_job(
+    job_id: str,
+    current_user: CurrentUser = Depends(get_current_member),
+    link_bj_account_job_usecase: LinkBjAccountJobUsecase = Depends(Provide[Container.link_bj_account_job_usecase])
+):
+    """
+    백준 계정 비동기 연동 진행 상황 SSE 스트림
+
+    현재 상태를 먼저 보내고, 상태가 바뀔 때마다 LINK_JOB_UPDATED 이벤트를 보낸다.
+    작업이 끝나면(SUCCEEDED / FAILED) 스트림을 닫는다.
+    """
+    updates = await link_bj_account_job_usecase.watch(
+        job_id, current_user.user_account_id, heartbeat=_LINK_JOB_HEARTBEAT_SECONDS
+    )
+
+    async def event_generator():
+        async for query in updates:
+            if query is None:
+                yield ": keepalive\n\n"
+                continue
+            data = {
+                "eventType": "LINK_JOB_UPDATED",
+                "data": LinkJobResponse.from_query(query).model_dump(by_alias=True),
+            }
+            yield f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    return SseStreamingResponse(event_generator())
+
+
 @router.get("/me", response_model=ApiResponseSchema[GetBaekjoonMeResponse])
 @inject
 async def get_baekjoon_me(
@@ -0,0 +1,33 @@
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+from app.baekjoon.application.query.link_job_query import LinkJobQuery
+
+
+class LinkJobResponse(BaseModel):
+    """비동기 백준 계정 연동 작업 상태 응답"""
+    job_id: str = Field(..., description="작업 ID")
+    bj_account_id: str = Field(..., description="백준 계정 ID")
+    status: str = Field(..., description="작업 상태 (QUEUED / RUNNING / SUCCEEDED / FAILED)")
+    stage: str | None = Field(None, description="진행 단계 (RUNNING일 때)")
+    error_code: str | None = Field(None, description="실패 에러 코드 (FAILED일 때)")
+    error_message: str | None = Field(None, description="실패 메시지 (FAILED일 때)")
+    updated_at: str = Field(..., description="마지막 상태 변경 시각")
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True
+    )
+
+    @classmethod
+    def from_query(cls, query: LinkJobQuery) -> "LinkJobResponse":
+        """Query 객체로부터 Response 생성"""
+        return cls(
+            job_id=query.job_id,
+            bj_account_id=query.bj_account_id,
+            status=query.status,
+            stage=query.stage,
+            error_code=query.error_code,
+            error_message=query.error_message,
+            updated_at=query.updated_at.isoformat(),
+        )
@@ -107,18 +107,22 @@ class MetadataUpdateLogData:
 
 
 @dataclass
-class WeeklyUpdateLogData:
-    """log_type=WEEKLY_UPDATE 의 log_data 구조 (주간 문제/태그 업데이트)"""
+class ProblemUpdateLogData:
+    """log_type=PROBLEM_UPDATE(이전 WEEKLY_UPDATE 포함) 의 log_data 구조 (일일 문제/태그 업데이트)"""
     run_date: str               # ISO date string (YYYY-MM-DD)
+    mode: str                   # "delta" (변경분만) | "full" (전체 재기록)
     synced_tag_count: int       # 처리된 태그 수
     synced_problem_count: int   # 처리된 문제 수
+    changed_problem_count: int  # 내용이 바뀌어 기록된 문제 수
     error: str | None
 
     def to_dict(self) -> dict:
         return {
             "run_date": self.run_date,
+            "mode": self.mode,
             "synced_tag_count": self.synced_tag_count,
             "synced_problem_count": self.synced_problem_count,
+            "changed_problem_count": self.changed_problem_count,
             "error": self.error,
         }
 
@@ -145,7 +149,7 @@ class SystemLogDataMapper:
     def parse(
         log_type: SystemLogType,
         log_data: dict[str, Any],
-    ) -> SchedulerLogData | RefreshLogData | BulkUpdateLogData | MetadataUpdateLogData | WeeklyUpdateLogData:
+    ) -> SchedulerLogData | RefreshLogData | BulkUpdateLogData | MetadataUpdateLogData | ProblemUpdateLogData:
         match log_type:
             case SystemLogType.SCHEDULER:
                 return SchedulerLogData(
@@ -190,11 +194,14 @@ class SystemLogDataMapper:
                     entity_id=log_data["entity_id"],
                     changes=changes,
                 )
-            case SystemLogType.WEEKLY_UPDATE:
-                return WeeklyUpdateLogData(
+            case SystemLogType.PROBLEM_UPDATE | SystemLogType.WEEKLY_UPDATE:
+                # 이전 WEEKLY_UPDATE 기록은 항상 전체 재기록이었으므로 mode 기본값은 full
+                return ProblemUpdateLogData(
                     run_date=log_data["run_date"],
+                    mode=log_data.get("mode", "full"),
                     synced_tag_count=log_data.get("synced_tag_count", 0),
                     synced_problem_count=log_data.get("synced_problem_count", 0),
+                    changed_problem_count=log_data.get("changed_problem_count", 0),
                     error=log_data.get("error"),
                 )
             case _:
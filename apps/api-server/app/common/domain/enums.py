@@ -46,7 +46,8 @@ class SystemLogType(str, Enum):
     REFRESH = "REFRESH"
     BULK_UPDATE = "BULK_UPDATE"
     PROBLEM_METADATA = "PROBLEM_METADATA"
-    WEEKLY_UPDATE = "WEEKLY_UPDATE"
+    WEEKLY_UPDATE = "WEEKLY_UPDATE"    # 이전 주간 업데이트 기록 (조회용, 신규 기록은 PROBLEM_UPDATE)
+    PROBLEM_UPDATE = "PROBLEM_UPDATE"
 
 
 class SystemLogStatus(str, Enum):
@@ -10,8 +10,14 @@ from app.config.settings import get_settings
 
 
 class OAuthClient(ABC):
-    def __init__(self, csrf_gateway: 'CsrfTokenGateway | None' = None):
-        self.client = httpx.AsyncClient()
+    def __init__(
+        self,
+        csrf_gateway: 'CsrfTokenGateway | None' = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
+        # 공유 클라이언트를 받으면 닫지 않는다 (앱 lifespan에서 Container가 닫음)
+        self._owns_client = http_client is None
+        self.client = http_client or httpx.AsyncClient()
         self.settings = get_settings()
         self.csrf_gateway = csrf_gateway
     
@@ -19,7 +25,8 @@ class OAuthClient(ABC):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
     
     @abstractmethod
     async def get_social_login_url(self, frontend_redirect_url: str | None, action: str = "login") -> str:
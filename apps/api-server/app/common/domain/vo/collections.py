@@ -1,7 +1,7 @@
 """Domain Value Objects for Collections"""
 
 from dataclasses import dataclass
-from typing import Iterator
+from typing import Iterable, Iterator
 
 from app.common.domain.vo.identifiers import ProblemId, TagId
 
@@ -101,3 +101,74 @@ class TagIdSet:
     def __bool__(self) -> bool:
         """bool 변환 (비어있지 않으면 True)"""
         return len(self._ids) > 0
+
+
+@dataclass(frozen=True)
+class ProblemIdBitmap:
+    """문제 ID 비트맵 VO
+
+    problem_id 하나당 1비트를 사용하는 고정 크기 집합 (문제 약 35k개 ≈ 4.4KB).
+    추천 제외 집합처럼 수천 개 단위 ID의 포함 여부를 반복 검사할 때 사용한다.
+    """
+    _bits: bytes
+
+    @staticmethod
+    def empty() -> 'ProblemIdBitmap':
+        """빈 비트맵 생성"""
+        return ProblemIdBitmap(b"")
+
+    @staticmethod
+    def from_values(values: Iterable[int]) -> 'ProblemIdBitmap':
+        """primitive int 목록으로부터 생성"""
+        return ProblemIdBitmap.empty().with_values(values)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'ProblemIdBitmap':
+        """직렬화된 바이트로부터 복원"""
+        return ProblemIdBitmap(bytes(data))
+
+    def to_bytes(self) -> bytes:
+        """직렬화 (캐시 저장용)"""
+        return self._bits
+
+    def with_values(self, values: Iterable[int]) -> 'ProblemIdBitmap':
+        """values를 추가한 새 비트맵 반환"""
+        values = list(values)
+        if not values:
+            return self
+        bits = bytearray(self._bits)
+        required = (max(values) >> 3) + 1
+        if required > len(bits):
+            bits.extend(bytes(required - len(bits)))
+        for value in values:
+            bits[value >> 3] |= 1 << (value & 7)
+        return ProblemIdBitmap(bytes(bits))
+
+    def union(self, other: 'ProblemIdBitmap') -> 'ProblemIdBitmap':
+        """두 비트맵의 합집합"""
+        longer, shorter = (self._bits, other._bits) if len(self._bits) >= len(other._bits) else (other._bits, self._bits)
+        merged = int.from_bytes(longer, "little") | int.from_bytes(shorter, "little")
+        return ProblemIdBitmap(merged.to_bytes(len(longer), "little"))
+
+    def __contains__(self, problem_id: int | ProblemId) -> bool:
+        """in 연산자 지원 (int 또는 ProblemId)"""
+        value = problem_id.value if isinstance(problem_id, ProblemId) else problem_id
+        index = value >> 3
+        return 0 <= index < len(self._bits) and bool(self._bits[index] >> (value & 7) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        """설정된 problem_id를 오름차순으로 순회"""
+        for index, byte in enumerate(self._bits):
+            if not byte:
+                continue
+            for offset in range(8):
+                if byte >> offset & 1:
+                    yield (index << 3) | offset
+
+    def __len__(self) -> int:
+        """크기 반환"""
+        return int.from_bytes(self._bits, "little").bit_count()
+
+    def __or__(self, other: 'ProblemIdBitmap') -> 'ProblemIdBitmap':
+        """| 연산자로 합집합"""
+        return self.union(other)
@@ -0,0 +1,177 @@
+"""
+ReferenceDataCache - 참조 데이터(태그 / 태그 숙련도 / 목표) 인메모리 캐시
+
+참조 데이터는 주간 메타데이터 동기화(ProblemMetadataSyncService.sync_all) 때만 바뀌므로
+프로세스 메모리에 불변 스냅샷으로 올려 두고, 각 Repository가 조회 시 스냅샷을 먼저 사용한다.
+(티어는 동기화로도 바뀌지 않는 고정 데이터라 여기서 다루지 않고 TierTable을 사용한다)
+
+- 앱 시작 시(Container.init_resources) 1회 적재
+- reload()는 새 스냅샷을 만든 뒤 참조만 교체(atomic swap)하므로 조회 중인 요청과 경합하지 않는다
+- 동기화를 수행한 워커가 broadcast_invalidation()으로 Redis 채널에 알리면
+  다른 워커들은 listen 태스크에서 받아 reload()와 등록된 reload hook(후보 인덱스 등)을 실행한다
+- 메시지에는 topic이 있어, 참조 데이터가 아닌 대상(난이도 필터 테이블 등)은 같은 채널로
+  자기 topic의 hook만 실행시킬 수 있다 (참조 데이터 재적재 / 후보 인덱스 재빌드 없이)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Awaitable, Callable, Mapping
+
+from app.core.database import Database
+
+if TYPE_CHECKING:
+    from app.common.infra.client.redis_client import AsyncRedisClient
+    from app.recommendation.domain.entity.tag_skill import TagSkill
+    from app.tag.domain.entity.tag import Tag
+    from app.target.domain.entity.target import Target
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "reference-data:invalidate"
+REFERENCE_DATA_TOPIC = "reference-data"  # 참조 데이터 스냅샷 자체 + 함께 재적재할 hook
+_LISTEN_RETRY_SECONDS = 5
+
+
+@dataclass(frozen=True)
+class ReferenceDataSnapshot:
+    """불변으로 취급되는 참조 데이터 스냅샷 (version은 프로세스 내 적재 순번)"""
+    version: int
+    loaded_at: datetime
+    tags: tuple[Tag, ...]
+    tags_by_id: Mapping[int, Tag]
+    tag_skills: tuple[TagSkill, ...]
+    targets_by_id: Mapping[int, Target]
+
+    @staticmethod
+    def build(
+        version: int,
+        tags: list[Tag],
+        tag_skills: list[TagSkill],
+        targets: list[Target],
+    ) -> 'ReferenceDataSnapshot':
+        return ReferenceDataSnapshot(
+            version=version,
+            loaded_at=datetime.now(),
+            tags=tuple(tags),
+            tags_by_id=MappingProxyType({tag.tag_id.value: tag for tag in tags if tag.tag_id}),
+            tag_skills=tuple(tag_skills),
+            targets_by_id=MappingProxyType({target.target_id.value: target for target in targets if target.target_id}),
+        )
+
+
+class ReferenceDataCache:
+    """참조 데이터 스냅샷 보관 + 워커 간 무효화 전파
+
+    스냅샷이 없으면(적재 전/실패) 각 Repository는 기존 SQL 경로로 폴백한다.
+    """
+
+    def __init__(self, db: Database, redis_client: AsyncRedisClient | None = None) -> None:
+        self.db = db
+        self.redis_client = redis_client
+        self._snapshot: ReferenceDataSnapshot | None = None
+        self._version = 0
+        self._instance_id = uuid.uuid4().hex  # 자신이 보낸 무효화 메시지 식별용
+        self._reload_hooks: dict[str, list[Callable[[], Awaitable[None]]]] = {}
+        self._listen_task: asyncio.Task | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def snapshot(self) -> ReferenceDataSnapshot | None:
+        return self._snapshot
+
+    def add_reload_hook(self, hook: Callable[[], Awaitable[None]], topic: str = REFERENCE_DATA_TOPIC) -> None:
+        """다른 워커가 topic의 무효화 메시지를 보냈을 때 다시 적재할 대상 등록"""
+        self._reload_hooks.setdefault(topic, []).append(hook)
+
+    async def reload(self) -> None:
+        """참조 데이터 전체를 읽어 새 스냅샷으로 교체"""
+        # SQL 전용 Repository로 적재 (캐시를 거치지 않도록 reference_data_cache 없이 생성)
+        from app.recommendation.infra.repository.tag_skill_repository_impl import TagSkillRepositoryImpl
+        from app.tag.infra.repository.tag_repository_impl import TagRepositoryImpl
+        from app.target.infra.repository.target_repository_impl import TargetRepositoryImpl
+
+        async with self.db.session():
+            tags = await TagRepositoryImpl(self.db).find_active_tags_with_relations()
+            tag_skills = await TagSkillRepositoryImpl(self.db).find_all_active()
+            targets = await TargetRepositoryImpl(self.db).find_all_active()
+
+        self.load(tags, tag_skills, targets)
+        logger.info(
+            f"[ReferenceDataCache] reloaded: version={self._version}, tags={len(tags)}, "
+            f"tag_skills={len(tag_skills)}, targets={len(targets)}"
+        )
+
+    def load(self, tags: list[Tag], tag_skills: list[TagSkill], targets: list[Target]) -> None:
+        """이미 조회된 데이터로 스냅샷 교체 (테스트/수동 적재용)"""
+        self._version += 1
+        self._snapshot = ReferenceDataSnapshot.build(self._version, tags, tag_skills, targets)
+
+    async def broadcast_invalidation(self, topic: str = REFERENCE_DATA_TOPIC) -> None:
+        """다른 워커들에게 topic의 데이터가 바뀌었음을 알림 (실패해도 자신의 스냅샷은 이미 최신)"""
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.publish(
+                INVALIDATION_CHANNEL,
+                {"origin": self._instance_id, "topic": topic, "version": self._version},
+            )
+        except Exception as e:
+            logger.error(f"[ReferenceDataCache] 무효화 전파 실패: {e}")
+
+    async def handle_invalidation(self, message: dict) -> None:
+        """무효화 메시지 처리 - 자신이 보낸 메시지는 무시, 참조 데이터 topic일 때만 스냅샷 재적재"""
+        if message.get("origin") == self._instance_id:
+            return
+        topic = message.get("topic", REFERENCE_DATA_TOPIC)
+        if topic == REFERENCE_DATA_TOPIC:
+            await self.reload()
+        for hook in self._reload_hooks.get(topic, []):
+            try:
+                await hook()
+            except Exception as e:
+                logger.error(f"[ReferenceDataCache] reload hook 실패: {e}")
+
+    def start_listening(self) -> None:
+        """무효화 채널 구독 태스크 시작"""
+        if self.redis_client is None or self._listen_task is not None:
+            return
+        self._listen_task = asyncio.create_task(self._listen())
+
+    async def stop_listening(self) -> None:
+        if self._listen_task is None:
+            return
+        self._listen_task.cancel()
+        try:
+            await self._listen_task
+        except asyncio.CancelledError:
+            pass
+        self._listen_task = None
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = await self.redis_client.subscribe(INVALIDATION_CHANNEL)
+                async for raw in pubsub.listen():
+                    if raw.get("type") != "message":
+                        continue
+                    try:
+                        await self.handle_invalidation(json.loads(raw["data"]))
+                    except Exception as e:
+                        logger.error(f"[ReferenceDataCache] 무효화 처리 실패: {e}")
+            except asyncio.CancelledError:
+                if pubsub is not None:
+                    await self.redis_client.unsubscribe(pubsub, INVALIDATION_CHANNEL)
+                raise
+            except Exception as e:
+                logger.error(f"[ReferenceDataCache] 무효화 채널 구독 실패, {_LISTEN_RETRY_SECONDS}초 후 재시도: {e}")
+                await asyncio.sleep(_LISTEN_RETRY_SECONDS)
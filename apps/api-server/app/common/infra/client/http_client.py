@@ -0,0 +1,268 @@
+"""
+외부 HTTP 호출용 공유 클라이언트
+
+solved.ac / OAuth 등 외부 API 호출이 요청마다 httpx.AsyncClient를 새로 만들면
+keep-alive가 무의미해지고 매번 TLS 핸드셰이크를 하게 된다.
+Container가 프로세스당 하나의 클라이언트를 만들어 주입하고, 앱 lifespan 종료 시 닫는다.
+
+- 연결 풀: httpcore가 origin(호스트)별로 연결을 재사용 (h2 패키지가 있으면 HTTP/2)
+- 호스트별 정책(HostPolicy): 토큰 버킷 속도 제한, 서킷 브레이커, GET 재시도
+- 호스트별 지연 시간 / 상태 코드 / 재시도 수를 Prometheus 지표로 기록 (/metrics)
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
+
+import httpx
+from prometheus_client import Counter, Histogram
+
+from app.common.infra.client.rate_limiter import AdaptiveTokenBucket
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
+OUTBOUND_REQUEST_LATENCY = Histogram(
+    "outbound_http_request_duration_seconds",
+    "외부 HTTP 요청 지연 시간",
+    ["host"],
+)
+OUTBOUND_RESPONSES = Counter(
+    "outbound_http_responses_total",
+    "외부 HTTP 응답 수 (status: 상태 코드 / error / circuit_open)",
+    ["host", "status"],
+)
+OUTBOUND_RETRIES = Counter(
+    "outbound_http_retries_total",
+    "외부 HTTP 재시도 수",
+    ["host"],
+)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """서킷이 열려 있어 요청을 보내지 않음 (호출부에서는 일반 네트워크 오류처럼 처리)"""
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold회 이어지면 reset_timeout 동안 요청을 차단
+
+    reset_timeout이 지나면 요청 1개를 시험적으로 통과시키고(half-open),
+    성공하면 닫고 실패하면 다시 연다. 시험 요청이 결과 없이 끝나면(취소 / 예외)
+    end_probe()로 half-open 상태만 풀어 다음 요청이 다시 시험하게 한다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    @property
+    def is_probing(self) -> bool:
+        return self._probing
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if self._probing or self._clock() - self._opened_at < self.reset_timeout:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or self._failures >= self.failure_threshold:
+            if self._opened_at is None or self._probing:
+                logger.warning(f"[CircuitBreaker] open: {self._failures} consecutive failures")
+            self._opened_at = self._clock()
+            self._probing = False
+
+    def end_probe(self) -> None:
+        self._probing = False
+
+
+@dataclass
+class HostPolicy:
+    """호스트별 호출 정책"""
+    rate_limiter: AdaptiveTokenBucket | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    max_retries: int = 0          # GET 요청 재시도 횟수 (429 / 502 / 503 / 504 / 네트워크 오류)
+    retry_backoff: float = 0.5    # 재시도 대기 기본값 (초, 시도마다 2배)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더 -> 대기 초 (초 단위 / HTTP-date 모두 허용, 해석 불가 시 None)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """실제 transport를 감싸 호스트 정책 적용 + 지표 기록"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policies: dict[str, HostPolicy] | None = None) -> None:
+        self._transport = transport
+        self._policies = policies or {}
+        self._default_policy = HostPolicy()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        policy = self._policies.get(host, self._default_policy)
+        retries = policy.max_retries if request.method == "GET" else 0
+
+        for attempt in range(retries + 1):
+            if attempt:
+                OUTBOUND_RETRIES.labels(host=host).inc()
+            try:
+                response = await self._send(request, host, policy)
+            except CircuitOpenError:
+                raise
+            except httpx.TransportError:
+                if attempt >= retries:
+                    raise
+                await asyncio.sleep(policy.retry_backoff * (2 ** attempt))
+                continue
+
+            if response.status_code not in _RETRYABLE_STATUS or attempt >= retries:
+                return response
+            await response.aclose()
+            if response.status_code != 429:  # 429는 rate_limiter가 Retry-After만큼 대기
+                await asyncio.sleep(policy.retry_backoff * (2 ** attempt))
+
+        raise AssertionError("unreachable")
+
+    async def _send(self, request: httpx.Request, host: str, policy: HostPolicy) -> httpx.Response:
+        breaker = policy.circuit_breaker
+        if breaker is not None and not breaker.allow():
+            OUTBOUND_RESPONSES.labels(host=host, status="circuit_open").inc()
+            raise CircuitOpenError(f"circuit open for {host}", request=request)
+        probing = breaker is not None and breaker.is_probing
+        try:
+            return await self._send_allowed(request, host, policy)
+        finally:
+            # 시험 요청이 취소 / 예외로 끝나도 half-open이 영구히 남지 않도록
+            if probing:
+                breaker.end_probe()
+
+    async def _send_allowed(self, request: httpx.Request, host: str, policy: HostPolicy) -> httpx.Response:
+        breaker = policy.circuit_breaker
+        if policy.rate_limiter is not None:
+            await policy.rate_limiter.acquire()
+
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            OUTBOUND_REQUEST_LATENCY.labels(host=host).observe(time.perf_counter() - started)
+            OUTBOUND_RESPONSES.labels(host=host, status="error").inc()
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+
+        OUTBOUND_REQUEST_LATENCY.labels(host=host).observe(time.perf_counter() - started)
+        OUTBOUND_RESPONSES.labels(host=host, status=str(response.status_code)).inc()
+
+        if response.status_code == 429:
+            if policy.rate_limiter is not None:
+                policy.rate_limiter.on_rate_limited(_parse_retry_after(response.headers.get("Retry-After")))
+            if breaker is not None and breaker.is_probing:
+                breaker.record_failure()
+        elif response.status_code >= 500:
+            if breaker is not None:
+                breaker.record_failure()
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            if policy.rate_limiter is not None:
+                policy.rate_limiter.on_success()
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@dataclass
+class HttpClientSettings:
+    timeout: float = 30.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    policies: dict[str, HostPolicy] = field(default_factory=dict)
+
+
+def create_http_client(
+    settings: HttpClientSettings | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """공유 외부 HTTP 클라이언트 생성 (transport는 테스트에서 MockTransport 주입용)"""
+    settings = settings or HttpClientSettings()
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+        )
+    return httpx.AsyncClient(
+        transport=InstrumentedTransport(transport, settings.policies),
+        timeout=settings.timeout,
+    )
+
+
+def create_default_http_client(solvedac_rate_limiter: AdaptiveTokenBucket | None = None) -> httpx.AsyncClient:
+    """Container용 - solved.ac에 속도 제한 / 서킷 브레이커 / 재시도 정책을 건 공유 클라이언트"""
+    return create_http_client(HttpClientSettings(
+        policies={
+            "solved.ac": HostPolicy(
+                rate_limiter=solvedac_rate_limiter,
+                circuit_breaker=CircuitBreaker(failure_threshold=5, reset_timeout=30.0),
+                max_retries=2,
+            ),
+        },
+    ))
+
+
+@asynccontextmanager
+async def borrow_client(shared: httpx.AsyncClient | None, **client_kwargs) -> AsyncIterator[httpx.AsyncClient]:
+    """공유 클라이언트가 있으면 그대로(닫지 않음), 없으면 임시 클라이언트를 만들어 사용 후 닫음"""
+    if shared is not None:
+        yield shared
+        return
+    async with httpx.AsyncClient(**client_kwargs) as client:
+        yield client
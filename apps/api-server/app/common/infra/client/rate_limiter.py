@@ -0,0 +1,67 @@
+"""외부 API 호출용 적응형 토큰 버킷"""
+import asyncio
+import time
+from typing import Callable
+
+
+class AdaptiveTokenBucket:
+    """요청 속도를 제한하는 토큰 버킷
+
+    여러 fetcher가 하나의 버킷을 공유하며 acquire()로 토큰을 얻은 뒤 요청한다.
+    - 429(Retry-After) 응답을 받으면 on_rate_limited()로 모든 요청을 해당 시간만큼 멈추고 속도를 절반으로 낮춘다
+    - 성공 응답마다 on_success()로 속도를 조금씩 회복한다 (max_rate 상한)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        max_rate: float | None = None,
+        min_rate: float = 0.1,
+        capacity: float = 1.0,
+        recovery_step: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self.recovery_step = recovery_step
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 대기 (대기 순서대로 처리)"""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """429 응답 반영 - retry_after 동안 전체 중지 + 속도 절반"""
+        now = self._clock()
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + retry_after)
+        self._refill(now)
+        self._tokens = 0.0
+        self.rate = max(self.min_rate, self.rate / 2)
+
+    def on_success(self) -> None:
+        """성공 응답 반영 - 속도를 조금씩 회복"""
+        self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+    def _refill(self, now: float) -> None:
+        # 중지 구간 동안은 토큰이 쌓이지 않도록 재개 시점부터 계산
+        start = max(self._updated_at, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated_at = now
@@ -0,0 +1,114 @@
+"""
+SingleFlight - 같은 키에 대한 동시 호출을 하나로 합치는 요청 병합기
+
+- 프로세스 내: 진행 중인 호출(asyncio.Task)을 키별로 공유해 동시에 들어온 호출자가 같은 결과를 받는다
+- 워커 간: Redis 락(SET NX EX)을 잡은 워커만 실제 호출을 하고 결과를 잠깐(result_ttl) Redis에 남긴다.
+  락을 못 잡은 워커는 결과가 올라올 때까지 기다렸다가 그 결과를 사용한다.
+  락 보유자가 결과 없이 끝나면(실패) 기다리던 워커가 락을 다시 잡고 직접 호출한다.
+- Redis 오류 시에는 프로세스 내 병합만 하고 직접 호출한다
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import TYPE_CHECKING, Awaitable, Callable, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from app.common.infra.client.redis_client import AsyncRedisClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """키별 진행 중 호출 공유
+
+    Redis에 남기는 결과는 JSON 직렬화 가능한 값이어야 한다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        redis_client: AsyncRedisClient | None = None,
+        lock_ttl: int = 120,
+        result_ttl: int = 30,
+        poll_interval: float = 0.2,
+    ) -> None:
+        self.namespace = namespace
+        self.redis_client = redis_client
+        self.lock_ttl = lock_ttl
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """key에 대해 진행 중인 호출이 있으면 그 결과를, 없으면 fn()을 실행한 결과를 반환"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(key, fn))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 한 호출자가 취소되어도 다른 호출자가 기다리는 작업은 계속 진행
+        return await asyncio.shield(task)
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        if self.redis_client is None:
+            return await fn()
+
+        lock_key = f"{self.namespace}:lock:{key}"
+        result_key = f"{self.namespace}:result:{key}"
+        token = f"owner-{uuid.uuid4().hex}"  # AsyncRedisClient.get이 JSON으로 해석하지 않도록 접두어
+        deadline = time.monotonic() + self.lock_ttl
+
+        while True:
+            try:
+                acquired = await self.redis_client.set(lock_key, token, ex=self.lock_ttl, nx=True)
+            except Exception as e:
+                logger.warning(f"[SingleFlight] Redis 락 실패, 직접 호출: key={key}, error={e}")
+                return await fn()
+
+            if acquired:
+                return await self._run_as_owner(fn, lock_key, result_key, token)
+
+            # 다른 워커가 호출 중 → 결과를 기다림
+            try:
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(self.poll_interval)
+                    shared = await self.redis_client.get(result_key)
+                    if isinstance(shared, dict) and "value" in shared:
+                        return shared["value"]
+                    if not await self.redis_client.exists(lock_key):
+                        break  # 결과 없이 락이 풀림 → 다시 락 시도
+                else:
+                    logger.warning(f"[SingleFlight] 대기 시간 초과, 직접 호출: key={key}")
+                    return await fn()
+            except Exception as e:
+                logger.warning(f"[SingleFlight] Redis 조회 실패, 직접 호출: key={key}, error={e}")
+                return await fn()
+
+    async def _run_as_owner(self, fn: Callable[[], Awaitable[T]], lock_key: str, result_key: str, token: str) -> T:
+        try:
+            # 이전 호출 결과가 남아 있으면 기다리는 워커가 오래된 값을 가져가지 않도록 먼저 지움
+            try:
+                await self.redis_client.delete(result_key)
+            except Exception as e:
+                logger.warning(f"[SingleFlight] 이전 결과 삭제 실패: key={result_key}, error={e}")
+            value = await fn()
+            try:
+                await self.redis_client.set(result_key, {"value": value}, ex=self.result_ttl)
+            except Exception as e:
+                logger.warning(f"[SingleFlight] 결과 공유 실패: key={result_key}, error={e}")
+            return value
+        finally:
+            await self._release(lock_key, token)
+
+    async def _release(self, lock_key: str, token: str) -> None:
+        """자신이 잡은 락만 해제 (TTL 만료 후 다른 워커가 잡은 락은 건드리지 않음)"""
+        try:
+            if await self.redis_client.get(lock_key) == token:
+                await self.redis_client.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"[SingleFlight] 락 해제 실패: key={lock_key}, error={e}")
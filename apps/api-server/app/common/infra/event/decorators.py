@@ -2,7 +2,7 @@
 
 import logging
 import inspect
-from typing import get_type_hints
+from typing import Any, get_type_hints
 from pydantic import BaseModel
 
 from app.common.infra.event.in_memory_event_bus import get_event_bus
@@ -16,6 +16,24 @@ def camel_to_snake(name: str) -> str:
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
 
 
+def _convert_payload(payload: Any, command_model: type[BaseModel] | None) -> Any:
+    """이벤트 payload를 핸들러 파라미터 타입으로 변환
+
+    - 같은 타입(또는 하위 타입) 객체: 복사 없이 그대로 전달
+    - dict / 다른 컨텍스트의 같은 모양 모델: command_model로 검증해 재조립
+    - command_model 없음: 모델이면 dict로 전달 (dict를 기대하는 핸들러 호환)
+    """
+    if command_model is None:
+        return payload.model_dump() if isinstance(payload, BaseModel) else payload
+    if isinstance(payload, command_model):
+        return payload
+    if isinstance(payload, dict):
+        return command_model.model_validate(payload)
+    if isinstance(payload, BaseModel):
+        return command_model.model_validate(payload.model_dump())
+    return payload
+
+
 def event_handler(event_types: str | list[str]):
     """
     메서드를 하나 이상의 이벤트 핸들러로 마킹
@@ -69,9 +87,9 @@ def event_register_handlers(service_name: str | None = None):
                     메서드를 감싸는 wrapper 생성
 
                     wrapper의 책임:
-                    1. dict → B_Command 변환 (타입 힌트 기반)
+                    1. payload → B_Command 변환 (타입 힌트 기반, 같은 타입이면 그대로 전달)
                     2. 실제 메서드 실행
-                    3. B_Query → dict 변환
+                    3. B_Query 반환 (A의 result_type 변환은 EventBus 담당)
                     """
                     # 타입 힌트 미리 분석 (정적 분석 - 한 번만 실행)
                     try:
@@ -89,7 +107,14 @@ def event_register_handlers(service_name: str | None = None):
                         second_param_name = param_names[1]
                         target_command_type = type_hints.get(second_param_name)
 
-                    async def wrapper(event_name: str, payload: dict):
+                    # Pydantic Command 타입이 아니면 (dict / Union / 힌트 없음) 기존과 같이 dict로 전달
+                    command_model = (
+                        target_command_type
+                        if inspect.isclass(target_command_type) and issubclass(target_command_type, BaseModel)
+                        else None
+                    )
+
+                    async def wrapper(event_name: str, payload: Any):
                         """
                         이벤트 핸들러 wrapper
                         """
@@ -99,28 +124,11 @@ def event_register_handlers(service_name: str | None = None):
                             container = app.container
                             service = getattr(container, bound_service_name)()
 
-                            # [2단계: dict → B_Command] wrapper의 책임
-                            converted_payload = payload
-
-                            if target_command_type is not None:
-                                try:
-                                    if isinstance(payload, dict):
-                                        if inspect.isclass(target_command_type) and issubclass(target_command_type, BaseModel):
-                                            converted_payload = target_command_type.model_validate(payload)
- 
-                                except TypeError:
-                                    # Union type 등으로 issubclass 실패 시 원본 사용
-                                    logger.debug(f"[wrapper] Type conversion skipped for {bound_method_name}")
-
-                            # 실제 도메인 로직 실행
-                            result = await bound_method(service, converted_payload)
-
-                            # [3단계: B_Query → dict] wrapper의 책임
-                            if hasattr(result, "model_dump"):
-                                dict_result = result.model_dump()
-                                return dict_result
+                            # [2단계: payload → B_Command] wrapper의 책임
+                            converted_payload = _convert_payload(payload, command_model)
 
-                            return result
+                            # 실제 도메인 로직 실행 (결과 객체는 그대로 반환)
+                            return await bound_method(service, converted_payload)
 
                         except Exception as e:
                             logger.error(
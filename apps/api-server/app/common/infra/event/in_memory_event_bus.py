@@ -1,6 +1,8 @@
 import logging
 import re
-from typing import Callable, Dict, List, Type, TypeVar
+from typing import Any, Callable, Dict, List
+
+from pydantic import BaseModel
 
 from app.common.domain.entity.domain_event import DomainEvent, TPayload, TResult
 from app.common.domain.service.event_publisher import DomainEventBus
@@ -19,13 +21,23 @@ class InMemoryEventBus(DomainEventBus):
     - 이벤트 발행 (publish)
     - 패턴 매칭
     - 결과 수집 및 타입 변환
+
+    디스패치 테이블:
+    - 패턴(COMMENT* 등)은 등록 시점에 정규식으로 한 번만 컴파일
+    - 이벤트명별 핸들러 목록(정확 일치 + 패턴)은 처음 조회할 때 튜플로 고정해 캐시
+    - 핸들러가 추가되면 캐시를 비움 (compile()로 시작 시점에 미리 채울 수 있음)
+
+    페이로드 / 결과는 같은 프로세스 안에서 객체 그대로 전달한다 (dict 왕복 없음).
+    타입이 다를 때만 핸들러 wrapper / 버스가 변환하므로, 핸들러는 받은 payload를 수정하지 않는다.
     """
 
     def __init__(self):
         # 이벤트명 → 핸들러 함수 매핑
-        self._handlers: Dict[str, List[Callable[[str, dict], any]]] = {}
-        # 패턴 → 핸들러 함수 매핑 (COMMENT* 같은 패턴)
-        self._pattern_handlers: List[tuple[str, Callable[[str, dict], any]]] = []
+        self._handlers: Dict[str, List[Callable[[str, Any], Any]]] = {}
+        # 패턴 → 핸들러 함수 매핑 (COMMENT* 같은 패턴, 정규식은 등록 시 컴파일)
+        self._pattern_handlers: List[tuple[re.Pattern[str], Callable[[str, Any], Any]]] = []
+        # 이벤트명 → 매칭 핸들러 (정확 일치 + 패턴) 캐시
+        self._dispatch_table: Dict[str, tuple[Callable[[str, Any], Any], ...]] = {}
 
     def subscribe(self, event_name: str):
         """
@@ -37,37 +49,44 @@ class InMemoryEventBus(DomainEventBus):
         Returns:
             데코레이터 함수
         """
-        def decorator(handler_func: Callable[[str, dict], any]):
+        def decorator(handler_func: Callable[[str, Any], Any]):
             # 패턴인지 확인 (* 포함)
             if '*' in event_name:
-                self._pattern_handlers.append((event_name, handler_func))
+                self._pattern_handlers.append((self._compile_pattern(event_name), handler_func))
             else:
-                if event_name not in self._handlers:
-                    self._handlers[event_name] = []
-
-                self._handlers[event_name].append(handler_func)
+                self._handlers.setdefault(event_name, []).append(handler_func)
 
+            self._dispatch_table.clear()
             return handler_func
 
         return decorator
 
-    def _match_pattern(self, event_name: str) -> List[Callable]:
-        """패턴 매칭 핸들러 찾기"""
-        matched_handlers = []
+    @staticmethod
+    def _compile_pattern(pattern: str) -> re.Pattern[str]:
+        """* 를 .* 로 바꾼 전체 일치 정규식 (기존과 같이 나머지 문자는 그대로 정규식으로 해석)"""
+        return re.compile(f'^{pattern.replace("*", ".*")}$')
 
-        for pattern, handler in self._pattern_handlers:
-            # * 를 정규식으로 변환
-            regex_pattern = pattern.replace('*', '.*')
-            if re.match(f'^{regex_pattern}$', event_name):
-                matched_handlers.append(handler)
+    def compile(self) -> int:
+        """등록된 이벤트명 전체의 디스패치 테이블을 미리 구성 (앱 시작 시 핸들러 등록 후 호출)
 
-        return matched_handlers
+        Returns:
+            테이블에 올라간 이벤트명 수
+        """
+        for event_name in self._handlers:
+            self._get_handlers(event_name)
+        return len(self._dispatch_table)
 
-    def _get_handlers(self, event_name: str) -> List[Callable]:
-        """이벤트에 매칭되는 모든 핸들러 조회 (패턴 포함)"""
-        handlers = self._handlers.get(event_name, []).copy()
-        pattern_handlers = self._match_pattern(event_name)
-        return handlers + pattern_handlers
+    def _match_pattern(self, event_name: str) -> List[Callable]:
+        """패턴 매칭 핸들러 찾기"""
+        return [handler for regex, handler in self._pattern_handlers if regex.match(event_name)]
+
+    def _get_handlers(self, event_name: str) -> tuple[Callable, ...]:
+        """이벤트에 매칭되는 모든 핸들러 조회 (패턴 포함, 이벤트명별 캐시)"""
+        handlers = self._dispatch_table.get(event_name)
+        if handlers is None:
+            handlers = (*self._handlers.get(event_name, ()), *self._match_pattern(event_name))
+            self._dispatch_table[event_name] = handlers
+        return handlers
 
     async def publish(
         self,
@@ -117,8 +136,8 @@ class InMemoryEventBus(DomainEventBus):
         event_name = event.event_type
         expects_result = event.expects_result()
 
-        # [1단계: REQUEST MAPPING] A의 Pydantic 객체 -> dict (도메인 경계 분리)
-        payload = event.data.model_dump() if hasattr(event.data, "model_dump") else event.data
+        # [1단계: REQUEST] payload 객체를 그대로 전달 (핸들러 타입과 다르면 wrapper가 변환)
+        payload = event.data
 
         # 핸들러 찾기
         matched_handlers = self._get_handlers(event_name)
@@ -127,7 +146,7 @@ class InMemoryEventBus(DomainEventBus):
             logger.warning(f"No handlers registered for event: {event_name}")
             return None
 
-        # [2단계: 핸들러 실행] wrapper가 dict ↔ B 변환 담당
+        # [2단계: 핸들러 실행] wrapper가 payload → B_Command 변환 담당
         results = []
         for handler in matched_handlers:
             try:
@@ -149,20 +168,27 @@ class InMemoryEventBus(DomainEventBus):
         if not expects_result:
             return None
 
-        # [3단계: RESPONSE MAPPING] dict -> A의 Result 객체
+        # [3단계: RESPONSE MAPPING] B의 결과 -> A의 Result 객체
         if event.result_type and results and results[0] is not None:
-            raw_result = results[0]
-
-            # wrapper가 dict로 반환했으므로 event.result_type으로 재조립
-            if isinstance(raw_result, dict):
-                return event.result_type.model_validate(raw_result)
-            elif hasattr(raw_result, "model_dump"):
-                return event.result_type.model_validate(raw_result.model_dump())
-            else:
-                return raw_result
+            return self._convert_result(results[0], event.result_type)
 
         return None
 
+    @staticmethod
+    def _convert_result(raw_result: Any, result_type: type) -> Any:
+        """핸들러 결과를 event.result_type으로 변환 (이미 같은 타입이면 그대로 반환)"""
+        if isinstance(raw_result, result_type):
+            return raw_result
+        if not (isinstance(result_type, type) and issubclass(result_type, BaseModel)):
+            return raw_result
+        if isinstance(raw_result, dict):
+            return result_type.model_validate(raw_result)
+        if isinstance(raw_result, BaseModel):
+            # 컨텍스트마다 따로 정의한 같은 모양의 모델 → dict를 거쳐 A의 타입으로 재조립
+            return result_type.model_validate(raw_result.model_dump())
+        return raw_result
+
+
 def get_event_bus() -> InMemoryEventBus:
     """
     전역 싱글톤 EventBus 인스턴스 반환
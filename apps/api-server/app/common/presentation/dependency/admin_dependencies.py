@@ -0,0 +1,20 @@
+import hmac
+from typing import Optional
+
+from fastapi import Depends, Header
+from dependency_injector.wiring import inject, Provide
+from app.core.containers import Container
+from app.core.error_codes import ErrorCode
+from app.core.exception import APIException
+
+
+def is_valid_admin_key(x_admin_key: Optional[str], admin_api_key: str) -> bool:
+    # 관리자 키가 설정되지 않은 환경에서는 관리자 API를 전부 막는다
+    return bool(admin_api_key and x_admin_key and hmac.compare_digest(x_admin_key, admin_api_key))
+
+
+@inject
+def require_admin_key(x_admin_key: Optional[str] = Header(None),
+                      admin_api_key: str = Depends(Provide[Container.admin_api_key])) -> None:
+    if not is_valid_admin_key(x_admin_key, admin_api_key):
+        raise APIException(ErrorCode.PERMISSION_DENIED)
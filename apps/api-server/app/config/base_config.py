@@ -47,6 +47,12 @@ class BaseConfig(BaseSettings):
         default="https://coffeebara-storage.duckdns.org",
         description="FE에서 접근 가능한 스토리지 공개 URL"
     )
+
+    # ADMIN
+    ADMIN_API_KEY: str = Field(default="", description="관리자 API 키 (비어 있으면 관리자 API 비활성화)")
+
+    # RECOMMENDATION
+    RECOMMENDATION_TRACE_SAMPLE_RATE: float = Field(default=0.0, description="추천 설명 트레이스 샘플링 비율 (0.0 ~ 1.0)")
     
     model_config = SettingsConfigDict(
         env_file=str(BASE_DIR / ".env"),
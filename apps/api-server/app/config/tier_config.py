@@ -0,0 +1,48 @@
+"""
+TIER_CONFIG: solved.ac 티어 레벨 → 티어 코드/레이팅 매핑 (tier 테이블 원본)
+
+db_initializer.py의 초기 마이그레이션과 TierTable(인메모리 티어 조회표) 모두에서 참조한다.
+tier_id와 tier_level은 solved.ac 레벨(0 = Unrated)과 동일하다.
+"""
+
+TIER_CONFIG = [
+    {"tier_id": 0, "tier_level": 0, "tier_code": "Unrated", "tier_rating": 0},
+    # Bronze 5 ~ 1
+    {"tier_id": 1, "tier_level": 1, "tier_code": "B5", "tier_rating": 30},
+    {"tier_id": 2, "tier_level": 2, "tier_code": "B4", "tier_rating": 60},
+    {"tier_id": 3, "tier_level": 3, "tier_code": "B3", "tier_rating": 90},
+    {"tier_id": 4, "tier_level": 4, "tier_code": "B2", "tier_rating": 120},
+    {"tier_id": 5, "tier_level": 5, "tier_code": "B1", "tier_rating": 150},
+    # Silver 5 ~ 1
+    {"tier_id": 6, "tier_level": 6, "tier_code": "S5", "tier_rating": 200},
+    {"tier_id": 7, "tier_level": 7, "tier_code": "S4", "tier_rating": 300},
+    {"tier_id": 8, "tier_level": 8, "tier_code": "S3", "tier_rating": 400},
+    {"tier_id": 9, "tier_level": 9, "tier_code": "S2", "tier_rating": 500},
+    {"tier_id": 10, "tier_level": 10, "tier_code": "S1", "tier_rating": 650},
+    # Gold 5 ~ 1
+    {"tier_id": 11, "tier_level": 11, "tier_code": "G5", "tier_rating": 800},
+    {"tier_id": 12, "tier_level": 12, "tier_code": "G4", "tier_rating": 950},
+    {"tier_id": 13, "tier_level": 13, "tier_code": "G3", "tier_rating": 1100},
+    {"tier_id": 14, "tier_level": 14, "tier_code": "G2", "tier_rating": 1250},
+    {"tier_id": 15, "tier_level": 15, "tier_code": "G1", "tier_rating": 1400},
+    # Platinum 5 ~ 1
+    {"tier_id": 16, "tier_level": 16, "tier_code": "P5", "tier_rating": 1600},
+    {"tier_id": 17, "tier_level": 17, "tier_code": "P4", "tier_rating": 1750},
+    {"tier_id": 18, "tier_level": 18, "tier_code": "P3", "tier_rating": 1900},
+    {"tier_id": 19, "tier_level": 19, "tier_code": "P2", "tier_rating": 2000},
+    {"tier_id": 20, "tier_level": 20, "tier_code": "P1", "tier_rating": 2100},
+    # Diamond 5 ~ 1
+    {"tier_id": 21, "tier_level": 21, "tier_code": "D5", "tier_rating": 2200},
+    {"tier_id": 22, "tier_level": 22, "tier_code": "D4", "tier_rating": 2300},
+    {"tier_id": 23, "tier_level": 23, "tier_code": "D3", "tier_rating": 2400},
+    {"tier_id": 24, "tier_level": 24, "tier_code": "D2", "tier_rating": 2500},
+    {"tier_id": 25, "tier_level": 25, "tier_code": "D1", "tier_rating": 2600},
+    # Ruby 5 ~ 1 (C1은 Ruby 5 수준 혹은 그 이상으로 매칭)
+    {"tier_id": 26, "tier_level": 26, "tier_code": "R5", "tier_rating": 2700},
+    {"tier_id": 27, "tier_level": 27, "tier_code": "R4", "tier_rating": 2750},
+    {"tier_id": 28, "tier_level": 28, "tier_code": "R3", "tier_rating": 2800},
+    {"tier_id": 29, "tier_level": 29, "tier_code": "R2", "tier_rating": 2900},
+    {"tier_id": 30, "tier_level": 30, "tier_code": "R1", "tier_rating": 2950},
+    # Master
+    {"tier_id": 31, "tier_level": 31, "tier_code": "M1", "tier_rating": 3000},
+]
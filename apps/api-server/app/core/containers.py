@@ -1,3 +1,4 @@
+import logging
 import os
 from dependency_injector import containers, providers
 
@@ -51,11 +52,16 @@ from app.activity.infra.repository.user_date_record_repository_impl import UserD
 from app.baekjoon.application.usecase.get_scheduler_inactive_periods_usecase import GetSchedulerInactivePeriodsUsecase
 from app.baekjoon.application.usecase.get_unrecorded_problems_usecase import GetUnrecordedProblemsUsecase
 from app.baekjoon.application.usecase.link_bj_account_usecase import LinkBjAccountUsecase
+from app.baekjoon.application.usecase.link_bj_account_job_usecase import LinkBjAccountJobUsecase
+from app.baekjoon.application.service.link_job_worker_pool import LinkJobWorkerPool
+from app.baekjoon.application.service.bj_account_tag_stat_service import BjAccountTagStatService
 from app.baekjoon.application.usecase.get_baekjoon_me_usecase import GetBaekjoonMeUsecase
 from app.baekjoon.application.usecase.get_monthly_problems_usecase import GetMonthlyProblemsUsecase
 from app.baekjoon.application.usecase.get_streaks_usecase import GetStreaksUsecase
 from app.baekjoon.application.usecase.update_bj_account_usecase import UpdateBjAccountUsecase
 from app.baekjoon.infra.repository.baekjoon_account_repository_impl import BaekjoonAccountRepositoryImpl
+from app.baekjoon.infra.repository.bj_account_tag_stat_repository_impl import BjAccountTagStatRepositoryImpl
+from app.baekjoon.infra.repository.monthly_calendar_repository_impl import MonthlyCalendarRepositoryImpl
 from app.baekjoon.infra.repository.problem_history_repository_impl import ProblemHistoryRepositoryImpl
 from app.common.infra.client.storage_client import S3Client
 from app.common.infra.repository.system_log_repository_impl import SystemLogRepositoryImpl
@@ -67,10 +73,15 @@ from app.recommendation.application.usecase.recommend_problems_usecase import Re
 from app.recommendation.application.usecase.get_recommendation_history_usecase import GetRecommendationHistoryUsecase
 from app.recommendation.application.usecase.get_study_recommendation_history_usecase import GetStudyRecommendationHistoryUsecase
 from app.recommendation.application.service.recommendation_history_service import RecommendationHistoryService
+from app.recommendation.application.service.exclusion_cache_service import ExclusionCacheService
+from app.recommendation.application.service.skill_profile_service import SkillProfileService
+from app.recommendation.application.usecase.get_recommendation_trace_usecase import GetRecommendationTraceUsecase
 from app.recommendation.infra.repository.level_filter_repository_impl import LevelFilterRepositoryImpl
+from app.recommendation.infra.cache.level_filter_table import LEVEL_FILTER_TOPIC, LevelFilterTable
 from app.recommendation.infra.repository.recommendation_history_repository_impl import RecommendationHistoryRepositoryImpl
 from app.tag.application.service.tag_application_service import TagApplicationService
 from app.target.application.service.target_application_service import TargetApplicationService
+from app.tier.domain.vo.tier_table import TierTable
 from app.tier.infra.repository.tier_repository_impl import TierRepositoryImpl
 
 # ============================================================================
@@ -81,6 +92,8 @@ from app.common.infra.client.kakao_oauth_client import KakaoOAuthClient
 from app.common.infra.client.naver_oauth_client import NaverOAuthClient
 from app.common.infra.client.google_oauth_client import GoogleOAuthClient
 from app.common.infra.client.github_oauth_client import GitHubOAuthClient
+from app.common.infra.client.rate_limiter import AdaptiveTokenBucket
+from app.common.infra.client.http_client import create_default_http_client
 
 # ============================================================================
 # Infrastructure - Security
@@ -96,6 +109,10 @@ from app.common.infra.gateway.storage_gateway_impl import S3StorageGatewayImpl
 from app.common.infra.gateway.csrf_token_gateway_impl import CsrfTokenGatewayImpl
 from app.common.infra.gateway.refresh_token_whitelist_gateway_impl import RefreshTokenWhitelistGatewayImpl
 from app.baekjoon.infra.gateway.solvedac_gateway_impl import SolvedacGatewayImpl
+from app.recommendation.infra.gateway.exclusion_bitmap_gateway_impl import ExclusionBitmapGatewayImpl
+from app.recommendation.infra.gateway.recommendation_trace_gateway_impl import RecommendationTraceGatewayImpl
+from app.baekjoon.infra.gateway.link_job_gateway_impl import LinkJobGatewayImpl
+from app.recommendation.infra.gateway.tag_stat_cache_gateway_impl import TagStatCacheGatewayImpl
 
 # ============================================================================
 # Infrastructure - Events
@@ -110,6 +127,8 @@ from app.common.application.service.auth_application_service import AuthApplicat
 from app.problem.application.service.problem_application_service import ProblemApplicationService
 from app.problem.application.service.problem_metadata_sync_service import ProblemMetadataSyncService
 from app.problem.application.service.problem_update_service import ProblemUpdateService
+from app.problem.infra.cache.problem_candidate_index import ProblemCandidateIndex
+from app.common.infra.cache.reference_data_cache import ReferenceDataCache
 from app.user.application.service.user_account_application_service import UserAccountApplicationService
 from app.user.infra.repository.user_account_repository_impl import UserAccountRepositoryImpl
 
@@ -124,6 +143,8 @@ from app.target.infra.repository.target_repository_impl import TargetRepositoryI
 from app.user.application.usecase.get_tag_problems_usecase import GetTagProblemsUsecase
 from app.user.application.usecase.get_user_tags_usecase import GetUserTagsUsecase
 
+logger = logging.getLogger(__name__)
+
 
 class Container(containers.DeclarativeContainer):
     """
@@ -187,6 +208,15 @@ class Container(containers.DeclarativeContainer):
     # ========================================================================
     storage_client = providers.Singleton(S3Client)
 
+    # ========================================================================
+    # Infrastructure - Reference Data Cache (태그/태그 숙련도/티어/목표 스냅샷)
+    # ========================================================================
+    reference_data_cache = providers.Singleton(
+        ReferenceDataCache,
+        db=database,
+        redis_client=redis_client,
+    )
+
     # ========================================================================
     # Infrastructure - Security Services (Singleton)
     # ========================================================================
@@ -205,6 +235,8 @@ class Container(containers.DeclarativeContainer):
         environment=providers.Callable(lambda: os.getenv("environment", "local")),
     )
 
+    admin_api_key = providers.Callable(lambda s: s.ADMIN_API_KEY, s=config)
+
     # ========================================================================
     # Infrastructure - Gateways (Singleton)
     # ========================================================================
@@ -218,15 +250,51 @@ class Container(containers.DeclarativeContainer):
         redis_client=redis_client,
     )
 
+    exclusion_bitmap_gateway = providers.Singleton(
+        ExclusionBitmapGatewayImpl,
+        redis_client=redis_client,
+    )
+
+    recommendation_trace_gateway = providers.Singleton(
+        RecommendationTraceGatewayImpl,
+        redis_client=redis_client,
+    )
+
+    tag_stat_cache_gateway = providers.Singleton(
+        TagStatCacheGatewayImpl,
+        redis_client=redis_client,
+    )
+
+    link_job_gateway = providers.Singleton(
+        LinkJobGatewayImpl,
+        redis_client=redis_client,
+    )
+
     storage_gateway = providers.Singleton(
         S3StorageGatewayImpl,
         storage_client=storage_client,
     )
 
+    # 프로세스 전체 solved.ac 요청 속도 제한 (http_client transport에서만 적용, 계정 갱신 / 메타데이터 동기화가 공유)
+    solvedac_rate_limiter = providers.Singleton(
+        AdaptiveTokenBucket,
+        rate=8.0,
+        max_rate=8.0,
+        capacity=5.0,
+    )
+
+    # 외부 HTTP 공유 클라이언트 (연결 재사용, solved.ac 속도 제한 / 서킷 브레이커는 transport에서 적용)
+    # 앱 lifespan 종료 시 aclose()
+    http_client = providers.Singleton(
+        create_default_http_client,
+        solvedac_rate_limiter=solvedac_rate_limiter,
+    )
+
     solvedac_gateway = providers.Singleton(
         SolvedacGatewayImpl,
-        request_delay=0.3,
         concurrent_requests=5,  # 동시에 5개 페이지씩 요청
+        http_client=http_client,
+        redis_client=redis_client,  # 같은 핸들 동시 수집 병합 (워커 간 락)
     )
 
     # ========================================================================
@@ -235,21 +303,25 @@ class Container(containers.DeclarativeContainer):
     kakao_oauth_client = providers.Singleton(
         KakaoOAuthClient,
         csrf_gateway=csrf_token_gateway,
+        http_client=http_client,
     )
 
     naver_oauth_client = providers.Singleton(
         NaverOAuthClient,
         csrf_gateway=csrf_token_gateway,
+        http_client=http_client,
     )
 
     google_oauth_client = providers.Singleton(
         GoogleOAuthClient,
         csrf_gateway=csrf_token_gateway,
+        http_client=http_client,
     )
 
     github_oauth_client = providers.Singleton(
         GitHubOAuthClient,
         csrf_gateway=csrf_token_gateway,
+        http_client=http_client,
     )
 
     # ========================================================================
@@ -290,6 +362,8 @@ class Container(containers.DeclarativeContainer):
         db=database,
     )
 
+    tier_table = providers.Singleton(TierTable.static)
+
     # ========================================================================
     # BaekjoonAccount (백준 계정 도메인)
     # ========================================================================
@@ -307,12 +381,24 @@ class Container(containers.DeclarativeContainer):
         db=database,
     )
 
+    bj_account_tag_stat_repository = providers.Singleton(
+        BjAccountTagStatRepositoryImpl,
+        db=database,
+    )
+
+    monthly_calendar_repository = providers.Singleton(
+        MonthlyCalendarRepositoryImpl,
+        db=database,
+        tier_table=tier_table,
+    )
+
     # ========================================================================
     # Activity domain - Repositories
     # ========================================================================
     user_activity_repository = providers.Singleton(
         UserActivityRepositoryImpl,
-        db=database
+        db=database,
+        bj_account_tag_stat_repository=bj_account_tag_stat_repository,
     )
 
     user_date_record_repository = providers.Singleton(
@@ -328,15 +414,24 @@ class Container(containers.DeclarativeContainer):
     # ========================================================================
     # Problem domain - Services (usecases below depend on these)
     # ========================================================================
+    problem_candidate_index = providers.Singleton(
+        ProblemCandidateIndex,
+        db=database,
+    )
+
     problem_update_service = providers.Singleton(
         ProblemUpdateService,
         db=database,
+        http_client=http_client,
     )
 
     problem_metadata_sync_service = providers.Singleton(
         ProblemMetadataSyncService,
         db=database,
         system_log_repository=system_log_repository,
+        candidate_index=problem_candidate_index,
+        reference_data_cache=reference_data_cache,
+        http_client=http_client,
     )
 
     # ========================================================================
@@ -361,16 +456,29 @@ class Container(containers.DeclarativeContainer):
         user_date_record_repository=user_date_record_repository,
         user_activity_repository=user_activity_repository,
         problem_update_service=problem_update_service,
+        bj_account_tag_stat_repository=bj_account_tag_stat_repository,
+    )
+
+    link_bj_account_job_usecase = providers.Singleton(
+        LinkBjAccountJobUsecase,
+        link_job_gateway=link_job_gateway,
+    )
+
+    link_job_worker_pool = providers.Singleton(
+        LinkJobWorkerPool,
+        link_job_gateway=link_job_gateway,
+        link_bj_account_usecase=link_bj_account_usecase,
+        worker_count=2,  # 프로세스당 동시 연동 수 (= 연동에 쓰는 DB 커넥션 수)
     )
 
     get_baekjoon_me_usecase = providers.Singleton(
         GetBaekjoonMeUsecase,
         baekjoon_account_repository=baekjoon_account_repository,
         user_date_record_repository=user_date_record_repository,
-        tier_repository=tier_repository,
         domain_event_bus=domain_event_bus,
         study_repository=study_repository,
         user_search_repository=user_search_repository,
+        tier_table=tier_table,
     )
 
     get_streaks_usecase = providers.Singleton(
@@ -389,6 +497,14 @@ class Container(containers.DeclarativeContainer):
         system_log_repository=system_log_repository,
         problem_update_service=problem_update_service,
         domain_event_bus=domain_event_bus,
+        redis_client=redis_client,
+        bj_account_tag_stat_repository=bj_account_tag_stat_repository,
+    )
+
+    bj_account_tag_stat_service = providers.Singleton(
+        BjAccountTagStatService,
+        baekjoon_account_repository=baekjoon_account_repository,
+        bj_account_tag_stat_repository=bj_account_tag_stat_repository,
     )
 
     get_unrecorded_problems_usecase = providers.Singleton(
@@ -439,7 +555,8 @@ class Container(containers.DeclarativeContainer):
     # ========================================================================
     tag_repository = providers.Singleton(
         TagRepositoryImpl,
-        db=database
+        db=database,
+        reference_data_cache=reference_data_cache,
     )
 
     tag_application_service = providers.Singleton(
@@ -452,12 +569,20 @@ class Container(containers.DeclarativeContainer):
     # ========================================================================
     tag_skill_repository = providers.Singleton(
         TagSkillRepositoryImpl,
-        db=database
+        db=database,
+        reference_data_cache=reference_data_cache,
+    )
+
+    level_filter_table = providers.Singleton(
+        LevelFilterTable,
+        db=database,
     )
 
     recommand_filter_repository = providers.Singleton(
         LevelFilterRepositoryImpl,
-        db=database
+        db=database,
+        level_filter_table=level_filter_table,
+        reference_data_cache=reference_data_cache,
     )
 
     recommendation_history_repository = providers.Singleton(
@@ -470,7 +595,8 @@ class Container(containers.DeclarativeContainer):
     # ========================================================================
     target_repository = providers.Singleton(
         TargetRepositoryImpl,
-        db=database
+        db=database,
+        reference_data_cache=reference_data_cache,
     )
 
     target_application_service = providers.Singleton(
@@ -485,6 +611,7 @@ class Container(containers.DeclarativeContainer):
         ProblemRepositoryImpl,
         db=database,
         system_log_repository=system_log_repository,
+        candidate_index=problem_candidate_index,
     )
 
     problem_application_service = providers.Singleton(
@@ -492,7 +619,7 @@ class Container(containers.DeclarativeContainer):
         problem_repository=problem_repository,
         tag_repository=tag_repository,
         target_repository=target_repository,
-        tier_repository=tier_repository
+        tier_table=tier_table,
     )
 
     # ========================================================================
@@ -501,20 +628,29 @@ class Container(containers.DeclarativeContainer):
     get_monthly_problems_usecase = providers.Singleton(
         GetMonthlyProblemsUsecase,
         baekjoon_account_repository=baekjoon_account_repository,
-        problem_history_repository=problem_history_repository,
-        domain_event_bus=domain_event_bus
+        monthly_calendar_repository=monthly_calendar_repository,
+        tag_repository=tag_repository,
+        target_repository=target_repository
     )
 
     # ========================================================================
     # User Tags Usecase
     # ========================================================================
+    skill_profile_service = providers.Singleton(
+        SkillProfileService,
+        baekjoon_account_repository=baekjoon_account_repository,
+        tag_skill_repository=tag_skill_repository,
+        tag_stat_cache_gateway=tag_stat_cache_gateway,
+    )
+
     get_user_tags_usecase = providers.Singleton(
         GetUserTagsUsecase,
         baekjoon_account_repository=baekjoon_account_repository,
         tag_repository=tag_repository,
         tag_skill_repository=tag_skill_repository,
-        tier_repository=tier_repository,
-        activity_repository=user_activity_repository
+        activity_repository=user_activity_repository,
+        skill_profile_service=skill_profile_service,
+        tier_table=tier_table,
     )
 
     # ========================================================================
@@ -526,8 +662,14 @@ class Container(containers.DeclarativeContainer):
         tag_repository=tag_repository,
         problem_repository=problem_repository,
         user_activity_repository=user_activity_repository,
-        tier_repository=tier_repository,
         target_repository=target_repository,
+        tier_table=tier_table,
+    )
+
+    exclusion_cache_service = providers.Singleton(
+        ExclusionCacheService,
+        problem_history_repository=problem_history_repository,
+        exclusion_bitmap_gateway=exclusion_bitmap_gateway,
     )
 
     recommand_problems_usecase = providers.Singleton(
@@ -539,10 +681,19 @@ class Container(containers.DeclarativeContainer):
         tag_skill_repository=tag_skill_repository,
         recommend_filter_repository=recommand_filter_repository,
         problem_repository=problem_repository,
-        tier_repository=tier_repository,
         problem_history_repository=problem_history_repository,
         target_repository=target_repository,
         domain_event_bus=domain_event_bus,
+        tier_table=tier_table,
+        exclusion_cache_service=exclusion_cache_service,
+        skill_profile_service=skill_profile_service,
+        recommendation_trace_gateway=recommendation_trace_gateway,
+        trace_sample_rate=providers.Callable(lambda s: s.RECOMMENDATION_TRACE_SAMPLE_RATE, s=config),
+    )
+
+    get_recommendation_trace_usecase = providers.Singleton(
+        GetRecommendationTraceUsecase,
+        recommendation_trace_gateway=recommendation_trace_gateway,
     )
 
     recommendation_history_service = providers.Singleton(
@@ -569,6 +720,7 @@ class Container(containers.DeclarativeContainer):
         update_bj_account_use_case=update_bj_account_usecase,
         problem_metadata_sync_service=problem_metadata_sync_service,
         system_log_repository=system_log_repository,
+        bj_account_tag_stat_service=bj_account_tag_stat_service,
     )
 
     # ========================================================================
@@ -792,6 +944,7 @@ class Container(containers.DeclarativeContainer):
         problem_history_repository=problem_history_repository,
         recommend_problems_usecase=recommand_problems_usecase,
         domain_event_bus=domain_event_bus,
+        exclusion_cache_service=exclusion_cache_service,
     )
 
     validate_study_member_usecase = providers.Singleton(
@@ -846,10 +999,36 @@ class Container(containers.DeclarativeContainer):
         self.study_withdrawal_service()
         self.notice_creation_service()
         self.recommendation_history_service()
+        self.exclusion_cache_service()
+        self.skill_profile_service()
         self.study_recommendation_sse_service()
         self.study_problem_sse_service()
-
-        # 3. 스케줄러 시작 (추가)
+        # 핸들러 등록이 끝났으므로 이벤트명별 디스패치 테이블을 미리 구성
+        self.domain_event_bus().compile()
+
+        # 3. 참조 데이터 / 추천 후보 인덱스 / 난이도 필터 테이블 적재 (실패 시 SQL 경로로 폴백)
+        reference_data_cache = self.reference_data_cache()
+        try:
+            await reference_data_cache.reload()
+        except Exception as e:
+            logger.warning(f"Reference data cache load skipped: {e}")
+        try:
+            await self.problem_candidate_index().rebuild()
+        except Exception as e:
+            logger.warning(f"Problem candidate index build skipped: {e}")
+        try:
+            await self.level_filter_table().reload()
+        except Exception as e:
+            logger.warning(f"Level filter table load skipped: {e}")
+        # 다른 워커가 무효화를 전파하면 재적재 (메타데이터 동기화: 참조 데이터 + 후보 인덱스 / 난이도 필터 저장: 필터 테이블만)
+        reference_data_cache.add_reload_hook(self.problem_candidate_index().rebuild)
+        reference_data_cache.add_reload_hook(self.level_filter_table().reload, topic=LEVEL_FILTER_TOPIC)
+        reference_data_cache.start_listening()
+
+        # 4. 비동기 백준 계정 연동 워커
+        self.link_job_worker_pool().start()
+
+        # 5. 스케줄러 시작 (추가)
         scheduler = self.bj_account_update_scheduler()
         scheduler.start()
         return self
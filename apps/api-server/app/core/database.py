@@ -3,7 +3,7 @@ from contextlib import asynccontextmanager
 import functools
 import logging
 import os
-from typing import Any, Awaitable, Callable, AsyncGenerator, Literal
+from typing import Any, Awaitable, Callable, AsyncGenerator, Hashable, Literal, TypeVar
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
@@ -36,12 +36,62 @@ def collect_after_commit(dispatch_fn: Callable[[], Awaitable]) -> None:
     pending.append(dispatch_fn)
 
 
+async def run_after_commit(dispatch_fn: Callable[[], Awaitable]) -> None:
+    """활성 트랜잭션이 있으면 commit 이후로 미루고, 없으면 바로 실행
+
+    캐시 무효화처럼 commit 전에 실행하면 동시 요청이 commit 전 데이터로 캐시를 다시 채울 수 있는 작업용
+    """
+    if _session_context.get() is not None:
+        collect_after_commit(dispatch_fn)
+        return
+    await dispatch_fn()
+
+
 def _pop_after_commit_events() -> list[Callable[[], Awaitable]]:
     """등록된 after_commit 함수 목록을 반환하고 초기화"""
     pending = _pending_after_commit.get()
     _pending_after_commit.set(None)
     return pending or []
 
+
+T = TypeVar('T')
+
+# 세션 범위 조회 캐시: {key: (의존 테이블 집합, 값)}
+# Database.session() / test_session()이 세션과 함께 만들고 세션이 닫힐 때 버림
+_request_cache: ContextVar[dict[Hashable, tuple[frozenset[str], Any]] | None] = ContextVar(
+    'request_cache', default=None
+)
+
+
+async def request_cached(key: Hashable, loader: Callable[[], Awaitable[T]], depends_on: tuple[str, ...]) -> T:
+    """현재 세션 안에서 같은 조회를 반복하지 않도록 loader 결과를 memoize
+
+    - 세션 밖(캐시 없음, 단위 테스트 등)에서는 매번 loader 호출
+    - depends_on 테이블에 쓰기가 있으면 invalidate_request_cache()로 해당 항목을 버려야 함
+    - 반환값은 여러 호출자가 공유하므로 변경 가능한 객체를 캐시할 때는 호출부에서 복사해서 쓸 것
+    """
+    cache = _request_cache.get()
+    if cache is None:
+        return await loader()
+    if key in cache:
+        return cache[key][1]
+    value = await loader()
+    cache[key] = (frozenset(depends_on), value)
+    return value
+
+
+def invalidate_request_cache(*tables: str) -> None:
+    """tables 중 하나라도 의존하는 캐시 항목 제거 (인자가 없으면 전체 제거)"""
+    cache = _request_cache.get()
+    if not cache:
+        return
+    if not tables:
+        cache.clear()
+        return
+    for key in [key for key, (depends_on, _) in cache.items() if depends_on.intersection(tables)]:
+        del cache[key]
+
+
 # ⭐ 전역 Database 인스턴스
 _global_database: 'Database | None' = None
 
@@ -88,6 +138,7 @@ class Database:
         """
         session: AsyncSession = self._session_factory()
         token = _session_context.set(session)
+        cache_token = _request_cache.set({})
         
         try:
             # 트랜잭션 시작
@@ -102,6 +153,7 @@ class Database:
             raise
         finally:
             # 세션 정리
+            _request_cache.reset(cache_token)
             _session_context.reset(token)
             await session.close()
             logger.debug("Session closed")
@@ -116,6 +168,7 @@ class Database:
         """
         session: AsyncSession = self._session_factory()
         token = _session_context.set(session)
+        cache_token = _request_cache.set({})
         
         try:
             # 트랜잭션 시작
@@ -135,6 +188,7 @@ class Database:
             raise
         finally:
             # 세션 정리
+            _request_cache.reset(cache_token)
             _session_context.reset(token)
             await session.close()
             logger.debug("Test session closed")
@@ -300,6 +354,10 @@ def transactional(
                     async with existing_session.begin_nested():
                         result = await func(*args, **kwargs)
                     return result
+                except Exception:
+                    # SAVEPOINT 롤백으로 되돌려진 상태를 캐시가 들고 있지 않도록 비움
+                    invalidate_request_cache()
+                    raise
                 finally:
                     _transaction_depth.set(depth)
 
@@ -12,6 +12,7 @@ from app.tier.infra.model.tier import TierModel
 from app.baekjoon.infra.model.bj_account import BjAccountModel
 from app.baekjoon.infra.model.tier_history import TierHistoryModel
 from app.baekjoon.infra.model.tag_skill_history import TagSkillHistoryModel
+from app.baekjoon.infra.model.bj_account_tag_stat import BjAccountTagStatModel
 
 # Activity Domain
 from app.activity.infra.model.problem_date_record import ProblemDateRecordModel
@@ -31,6 +32,7 @@ from app.target.infra.model.target_tag import TargetTagModel
 from app.problem.infra.model.problem import ProblemModel
 from app.baekjoon.infra.model.problem_history import ProblemHistoryModel
 from app.problem.infra.model.problem_tag import ProblemTagModel
+from app.problem.infra.model.tag_tier_percentile import TagTierPercentileModel
 
 # Recommendation Domain
 from app.recommendation.infra.model.problem_recommendation_level_filter import ProblemRecommendationLevelFilterModel
@@ -60,6 +62,7 @@ __all__ = [
     "BjAccountModel",
     "TierHistoryModel",
     "TagSkillHistoryModel",
+    "BjAccountTagStatModel",
     # Activity
     "TagCustomModel",
     "UserProblemStatusModel",
@@ -75,6 +78,7 @@ __all__ = [
     "ProblemModel",
     "ProblemHistoryModel",
     "ProblemTagModel",
+    "TagTierPercentileModel",
     # Recommendation
     "ProblemRecommendationLevelFilterModel",
     "TagSkillModel",
@@ -166,7 +166,25 @@ class ErrorCode(Enum):
         message="태그 정보를 찾을 수 없습니다.",
         status_code=400
     )
+
+    RECOMMENDATION_TRACE_NOT_FOUND = ErrorCodeInfo(
+        code="RECOMMENDATION_TRACE_NOT_FOUND",
+        message="추천 트레이스를 찾을 수 없습니다.",
+        status_code=404
+    )
     
+    LINK_JOB_NOT_FOUND = ErrorCodeInfo(
+        code="LINK_JOB_NOT_FOUND",
+        message="연동 작업을 찾을 수 없습니다.",
+        status_code=404
+    )
+
+    LINK_JOB_INTERRUPTED = ErrorCodeInfo(
+        code="LINK_JOB_INTERRUPTED",
+        message="서버 재시작으로 연동 작업이 중단되었습니다. 다시 시도해 주세요.",
+        status_code=503
+    )
+
     LINK_COOLDOWN_PERIOD = ErrorCodeInfo(
         code="LINK_COOLDOWN_PERIOD",
         message="마지막 계정 변경 이후 7일이 지나지 않았습니다.",
@@ -29,7 +29,7 @@ from app.target.presentation.controller.target_controller import (
 from app.activity.presentation.controller.activity_controller import router as activity_router
 from app.problem.presentation.controller.problem_controller import router as problem_router
 from app.tag.presentation.controller.tag_controller import router as tag_router, user_router as tag_user_router
-from app.recommendation.presentation.controller.recommendation_controller import router as recommendation_router
+from app.recommendation.presentation.controller.recommendation_controller import router as recommendation_router, admin_router as admin_recommendation_router
 from app.study.presentation.controller.study_controller import router as study_router
 from app.study.presentation.controller.member_controller import member_router as study_member_router
 from app.study.presentation.controller.invitation_controller import invitation_router as study_invitation_router
@@ -55,6 +55,9 @@ async def lifespan(app: AppWithContainer):
         yield
     finally:
         # Shutdown: 정리 작업
+        await injection_container.reference_data_cache().stop_listening()
+        await injection_container.link_job_worker_pool().stop()
+        await injection_container.http_client().aclose()
         db = injection_container.database()
 
 app = AppWithContainer(
@@ -108,6 +111,7 @@ app.include_router(tag_user_router, prefix=API_V1_PREFIX)
 
 # Recommendation router
 app.include_router(recommendation_router, prefix=API_V1_PREFIX)
+app.include_router(admin_recommendation_router, prefix=API_V1_PREFIX)
 
 # Study routers
 app.include_router(study_router, prefix=API_V1_PREFIX)
@@ -19,7 +19,7 @@ from app.tag.domain.entity.tag import Tag
 from app.tag.domain.repository.tag_repository import TagRepository
 from app.target.domain.entity.target import Target
 from app.target.domain.repository.target_repository import TargetRepository
-from app.tier.domain.repository.tier_repository import TierRepository
+from app.tier.domain.vo.tier_table import TierTable
 
 logger = logging.getLogger(__name__)
 
@@ -32,12 +32,12 @@ class ProblemApplicationService:
         problem_repository: ProblemRepository,
         tag_repository: TagRepository,
         target_repository: TargetRepository,
-        tier_repository: TierRepository
+        tier_table: TierTable | None = None,
     ):
         self.problem_repository = problem_repository
         self.tag_repository = tag_repository
         self.target_repository = target_repository
-        self.tier_repository = tier_repository
+        self.tier_table = tier_table or TierTable.static()
 
     @event_handler("GET_PROBLEM_INFOS_REQUESTED")
     @transactional(readonly=True)
@@ -80,7 +80,7 @@ class ProblemApplicationService:
         # 기존 쪼개놓은 하위 비동기 함수들 호출
         all_targets = await self.target_repository.find_all_active()
         tag_map = await self._get_tag_map(problems)
-        tier_map = await self._get_tier_map(problems)
+        tier_map = self.tier_table.codes(p.tier_level.value for p in problems)
         tag_targets_map = await self._create_tag_targets_map(all_targets)
 
         problems_dict = {}
@@ -105,15 +105,6 @@ class ProblemApplicationService:
         tags = await self.tag_repository.find_by_ids_and_active(tag_ids) if tag_ids else []
         return {tag.tag_id.value: tag for tag in tags}
 
-    async def _get_tier_map(self, problems: list[Problem]) -> dict[int, str]:
-        unique_levels = list({p.tier_level.value for p in problems})
-        if not unique_levels:
-            return {}
-        
-        # 루프 대신 IN 쿼리 하나로 해결 (리포지토리에 find_by_levels 구현 가정)
-        tiers = await self.tier_repository.find_by_levels(unique_levels) 
-        return {t.tier_level: t.tier_code for t in tiers}
-    
     async def _create_tag_targets_map(self, all_targets: list[Target]) -> dict[str, list[Target]]:
         """태그 ID별로 연관된 타겟 목록을 매핑합니다."""
         tag_targets_map = {}
@@ -161,7 +152,7 @@ class ProblemApplicationService:
             problem_id=problem.problem_id.value,
             problem_title=problem.title,
             problem_tier_level=problem.tier_level.value,
-            problem_tier_name=tier_map.get(problem.tier_level.value, "Unknown"),
+            problem_tier_name=tier_map[problem.tier_level.value],
             problem_class_level=problem.class_level,
             tags=tag_queries
         )
\ No newline at end of file
@@ -13,24 +13,57 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Iterator
 
 import httpx
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.domain.entity.system_log import SystemLog
 from app.common.domain.repository.system_log_repository import SystemLogRepository
+from app.common.infra.cache.reference_data_cache import ReferenceDataCache
+from app.common.infra.client.http_client import borrow_client
 from app.config.tag_config import TAG_CONFIG
 from app.core.database import Database, transactional
+from app.problem.domain.vo.problem_content_hash import ProblemContentHash
+from app.problem.domain.vo.tag_tier_histogram import TagTierHistogram
+from app.problem.domain.vo.tier_percentile import TierPercentile
+from app.problem.infra.cache.problem_candidate_index import ProblemCandidateIndex
 
 logger = logging.getLogger(__name__)
 
 _BATCH_SIZE = 500       # 문제 upsert 배치 크기
-_PAGE_DELAY = 1.0       # 페이지 요청 간 딜레이 (초)
-_MAX_RETRIES = 5        # 429 발생 시 최대 재시도 횟수
-_RETRY_BACKOFF = 2.0    # 재시도 기본 대기 시간 (초, 지수 증가)
+_FETCH_CONCURRENCY = 4  # 동시에 페이지를 가져오는 fetcher 수
+_WRITER_CONCURRENCY = 2 # 동시에 DB에 쓰는 writer 수
+_QUEUE_MAXSIZE = 20     # fetcher와 writer 사이에 쌓아 둘 최대 페이지 수
+
+
+@dataclass
+class _PipelineProgress:
+    """sync_problems 파이프라인 진행 상황 (로그용)"""
+    total: int
+    total_pages: int
+    fetched_pages: int = 0
+    written: int = 0
+    changed: int = 0
+    affected_tag_ids: set[int] = field(default_factory=set)
+
+
+@dataclass
+class TagSyncResult:
+    """sync_tags() 결과"""
+    tag_count: int                       # solved.ac에서 받은 태그 수
+    changed_tag_count: int               # 새로 추가되었거나 값이 바뀐 태그 수
+
+
+@dataclass
+class ProblemSyncResult:
+    """sync_problems() 결과"""
+    problem_count: int                   # solved.ac에서 받은 문제 수
+    changed_problem_count: int           # 내용 해시가 달라져 실제로 기록한 문제 수
+    affected_tag_ids: set[int]           # 변경된 문제에 (변경 전/후) 연결된 태그
 
 
 @dataclass
@@ -38,6 +71,8 @@ class SyncResult:
     """sync_all() 결과"""
     tag_count: int
     problem_count: int
+    changed_problem_count: int = 0
+    affected_tag_ids: set[int] | None = None  # 재계산한 태그 (full이면 None = 전체 태그)
 
 
 class ProblemMetadataSyncService:
@@ -51,9 +86,19 @@ class ProblemMetadataSyncService:
     SOLVED_AC_TAG_LIST_URL = "https://solved.ac/api/v3/tag/list"
     SOLVED_AC_PROBLEM_SEARCH_URL = "https://solved.ac/api/v3/search/problem"
 
-    def __init__(self, db: Database, system_log_repository: SystemLogRepository | None = None) -> None:
+    def __init__(
+        self,
+        db: Database,
+        system_log_repository: SystemLogRepository | None = None,
+        candidate_index: ProblemCandidateIndex | None = None,
+        reference_data_cache: ReferenceDataCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.db = db
+        self.http_client = http_client
         self.system_log_repository = system_log_repository
+        self.candidate_index = candidate_index
+        self.reference_data_cache = reference_data_cache
 
     @property
     def session(self) -> AsyncSession:
@@ -63,47 +108,79 @@ class ProblemMetadataSyncService:
     # Public API
     # ------------------------------------------------------------------
 
-    async def sync_all(self) -> SyncResult:
-        """전체 동기화 수행. 결과(처리된 태그·문제 수)를 반환."""
-        logger.info("[ProblemMetadataSyncService] sync_all: starting weekly sync")
+    async def sync_all(self, full: bool = False) -> SyncResult:
+        """
+        동기화 수행. 결과(처리된 태그·문제 수)를 반환.
+
+        기본은 delta 모드로, 내용 해시가 달라진 문제만 기록하고
+        그 문제들에 연결된 태그의 티어 범위 / tag_skill만 다시 계산한다.
+        full=True면 모든 문제를 다시 기록하고 전체 태그를 재계산한다.
+        """
+        logger.info(f"[ProblemMetadataSyncService] sync_all: starting sync (full={full})")
+
+        tag_result = await self.sync_tags()
+        logger.info(
+            f"[ProblemMetadataSyncService] sync_all: tags done "
+            f"({tag_result.changed_tag_count}/{tag_result.tag_count} changed)"
+        )
 
-        tag_count = await self.sync_tags()
-        logger.info(f"[ProblemMetadataSyncService] sync_all: tags done ({tag_count})")
+        problem_result = await self.sync_problems(full=full)
+        logger.info(
+            f"[ProblemMetadataSyncService] sync_all: problems done "
+            f"({problem_result.changed_problem_count}/{problem_result.problem_count} changed, "
+            f"{len(problem_result.affected_tag_ids)} tags affected)"
+        )
 
-        problem_count = await self.sync_problems()
-        logger.info(f"[ProblemMetadataSyncService] sync_all: problems done ({problem_count})")
+        tag_ids = None if full else problem_result.affected_tag_ids
+        if tag_ids is None or tag_ids:
+            await self.recalculate_tag_tier_ranges(tag_ids)
+            logger.info("[ProblemMetadataSyncService] sync_all: tag tier ranges recalculated")
 
-        await self.recalculate_tag_tier_ranges()
-        logger.info("[ProblemMetadataSyncService] sync_all: tag tier ranges recalculated")
+            await self.recalculate_tag_skills(tag_ids)
+            logger.info("[ProblemMetadataSyncService] sync_all: tag skills recalculated")
 
-        await self.recalculate_tag_skills()
-        logger.info("[ProblemMetadataSyncService] sync_all: tag skills recalculated")
+        if self.candidate_index is not None and (full or problem_result.changed_problem_count):
+            await self.candidate_index.rebuild()
+            logger.info("[ProblemMetadataSyncService] sync_all: candidate index rebuilt")
+
+        # 바뀐 것이 없으면 다른 워커의 재적재(후보 인덱스 재빌드 포함)도 일으키지 않는다
+        changed = full or tag_result.changed_tag_count or problem_result.changed_problem_count
+        if self.reference_data_cache is not None and changed:
+            await self.reference_data_cache.reload()
+            await self.reference_data_cache.broadcast_invalidation()
+            logger.info("[ProblemMetadataSyncService] sync_all: reference data reloaded and broadcast")
 
         logger.info("[ProblemMetadataSyncService] sync_all: completed successfully")
-        return SyncResult(tag_count=tag_count, problem_count=problem_count)
+        return SyncResult(
+            tag_count=tag_result.tag_count,
+            problem_count=problem_result.problem_count,
+            changed_problem_count=problem_result.changed_problem_count,
+            affected_tag_ids=tag_ids,
+        )
 
     # ------------------------------------------------------------------
     # 1. 태그 동기화
     # ------------------------------------------------------------------
 
     @transactional
-    async def sync_tags(self) -> int:
+    async def sync_tags(self) -> TagSyncResult:
         """
         solved.ac /api/v3/tag/list 에서 전체 태그를 가져와
-        tag 테이블에 upsert한다.
+        tag 테이블에 upsert한다. (값이 같은 태그는 updated_at도 바꾸지 않음 - MySQL은 SET 순서대로 평가)
 
         TAG_CONFIG에 있는 태그 → excluded_yn=False, 해당 level 적용
         TAG_CONFIG에 없는 태그 → excluded_yn=True, level="NEWBIE"
 
         Returns:
-            처리된 태그 수
+            처리된 태그 수 / 추가되거나 바뀐 태그 수
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with borrow_client(self.http_client, timeout=30.0) as client:
             response = await client.get(self.SOLVED_AC_TAG_LIST_URL)
             response.raise_for_status()
             tags_data: list[dict] = response.json().get("items", [])
 
-        now = datetime.now()
+        # DATETIME 컬럼은 초 단위로 저장되므로 바뀐 태그를 updated_at으로 셀 수 있게 초 단위로 맞춤
+        now = datetime.now().replace(microsecond=0)
 
         for item in tags_data:
             tag_code: str = item["key"]
@@ -136,10 +213,15 @@ class ProblemMetadataSyncService:
                         :now, :now
                     )
                     ON DUPLICATE KEY UPDATE
+                        updated_at          = IF(
+                            tag_problem_count <=> VALUES(tag_problem_count)
+                            AND tag_display_name <=> VALUES(tag_display_name)
+                            AND excluded_yn <=> VALUES(excluded_yn),
+                            updated_at, VALUES(updated_at)
+                        ),
                         tag_problem_count   = VALUES(tag_problem_count),
                         tag_display_name    = VALUES(tag_display_name),
-                        excluded_yn         = VALUES(excluded_yn),
-                        updated_at          = VALUES(updated_at)
+                        excluded_yn         = VALUES(excluded_yn)
                 """),
                 {
                     "code": tag_code,
@@ -152,274 +234,479 @@ class ProblemMetadataSyncService:
                 },
             )
 
-        logger.info(f"[ProblemMetadataSyncService] sync_tags: upserted {len(tags_data)} tags")
-        return len(tags_data)
+        result = await self.session.execute(
+            text("SELECT COUNT(*) FROM tag WHERE updated_at >= :now"),
+            {"now": now},
+        )
+        changed_tag_count = result.scalar_one()
+
+        logger.info(
+            f"[ProblemMetadataSyncService] sync_tags: upserted {len(tags_data)} tags ({changed_tag_count} changed)"
+        )
+        return TagSyncResult(tag_count=len(tags_data), changed_tag_count=changed_tag_count)
 
     # ------------------------------------------------------------------
     # 2. 문제 동기화
     # ------------------------------------------------------------------
 
-    async def sync_problems(self) -> int:
+    async def sync_problems(self, full: bool = False) -> ProblemSyncResult:
         """
         solved.ac /api/v3/search/problem?query=&page=N 에서 전체 문제를
-        페이지네이션으로 수집한 뒤 problem + problem_tag 테이블에 upsert한다.
+        페이지네이션으로 수집하면서 problem + problem_tag 테이블에 upsert한다.
 
-        - 페이지당 0.5초 딜레이 (rate limit 대응)
-        - _BATCH_SIZE(500)개 단위로 트랜잭션을 분리해 커밋한다
-        - problem_tag는 INSERT IGNORE (FK 안전)
+        fetcher → bounded Queue → writer 파이프라인으로 동작한다.
+        - fetcher(_FETCH_CONCURRENCY개)는 keep-alive 공유 클라이언트 하나를 사용하며,
+          solved.ac 속도 제한 / 429 재시도는 클라이언트 transport의 호스트 정책(HostPolicy)이 맡는다
+        - Queue는 최대 _QUEUE_MAXSIZE 페이지만 담으므로 메모리가 카탈로그 크기와 무관하게 유지된다
+        - writer(_WRITER_CONCURRENCY개)는 _BATCH_SIZE개씩 모아 배치마다 별도 세션으로 커밋한다
+        - full=False면 저장된 content_hash와 같은 문제는 건너뛴다
 
         Returns:
-            처리된 문제 수
+            받은 문제 수 / 기록한 문제 수 / 영향받은 태그
         """
         # 태그 코드 → tag_id 매핑 미리 로드
         async with self.db.session() as session:
             result = await session.execute(text("SELECT tag_id, tag_code FROM tag"))
             tag_code_to_id: dict[str, int] = {row[1]: row[0] for row in result.fetchall()}
 
+        limits = httpx.Limits(max_connections=_FETCH_CONCURRENCY, max_keepalive_connections=_FETCH_CONCURRENCY)
+        async with borrow_client(self.http_client, timeout=30.0, limits=limits) as client:
+            return await self._run_problem_pipeline(client, tag_code_to_id, full)
+
+    async def _run_problem_pipeline(
+        self,
+        client: httpx.AsyncClient,
+        tag_code_to_id: dict[str, int],
+        full: bool,
+    ) -> ProblemSyncResult:
         # 첫 페이지로 전체 개수 파악
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(
-                self.SOLVED_AC_PROBLEM_SEARCH_URL,
-                params={"query": "", "page": 1},
-            )
-            resp.raise_for_status()
-            first_page = resp.json()
+        first_page = await self._fetch_page(client, 1)
+        if first_page is None:
+            raise RuntimeError("solved.ac problem search first page fetch failed")
 
         total: int = first_page.get("count", 0)
         first_items: list[dict] = first_page.get("items", [])
         per_page = len(first_items) if first_items else 50
         total_pages = (total + per_page - 1) // per_page if per_page > 0 else 1
-
-        all_problems: list[dict] = list(first_items)
         logger.info(
             f"[ProblemMetadataSyncService] sync_problems: total={total}, pages={total_pages}"
         )
 
-        # 나머지 페이지 순차 수집
-        for page in range(2, total_pages + 1):
-            await asyncio.sleep(_PAGE_DELAY)
-            for attempt in range(_MAX_RETRIES):
-                try:
-                    async with httpx.AsyncClient(timeout=30.0) as client:
-                        page_resp = await client.get(
-                            self.SOLVED_AC_PROBLEM_SEARCH_URL,
-                            params={"query": "", "page": page},
-                        )
-                    if page_resp.status_code == 429:
-                        retry_after = float(page_resp.headers.get("Retry-After", _RETRY_BACKOFF * (2 ** attempt)))
-                        logger.warning(
-                            f"[ProblemMetadataSyncService] page {page} rate limited, "
-                            f"waiting {retry_after:.1f}s (attempt {attempt + 1}/{_MAX_RETRIES})"
-                        )
-                        await asyncio.sleep(retry_after)
-                        continue
-                    if page_resp.status_code != 200:
-                        logger.warning(
-                            f"[ProblemMetadataSyncService] page {page} returned "
-                            f"{page_resp.status_code}, skipping"
-                        )
-                        break
-                    all_problems.extend(page_resp.json().get("items", []))
-                    break
-                except Exception as exc:
-                    logger.error(f"[ProblemMetadataSyncService] page {page} attempt {attempt + 1} failed: {exc}")
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(_RETRY_BACKOFF * (2 ** attempt))
-                    else:
-                        logger.error(f"[ProblemMetadataSyncService] page {page} skipped after {_MAX_RETRIES} attempts")
-
-            if page % 100 == 0:
+        progress = _PipelineProgress(total=total, total_pages=total_pages, fetched_pages=1)
+        queue: asyncio.Queue[list[dict] | None] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        pages = iter(range(2, total_pages + 1))  # fetcher들이 공유하는 페이지 번호 이터레이터
+        now = datetime.now()
+
+        await queue.put(first_items)
+        async with asyncio.TaskGroup() as group:
+            writers = [
+                group.create_task(self._write_problems(queue, tag_code_to_id, now, progress, full))
+                for _ in range(_WRITER_CONCURRENCY)
+            ]
+            async with asyncio.TaskGroup() as fetch_group:
+                for _ in range(_FETCH_CONCURRENCY):
+                    fetch_group.create_task(self._fetch_pages(client, pages, queue, progress))
+            for _ in writers:
+                await queue.put(None)
+
+        return ProblemSyncResult(
+            problem_count=sum(writer.result() for writer in writers),
+            changed_problem_count=progress.changed,
+            affected_tag_ids=progress.affected_tag_ids,
+        )
+
+    async def _fetch_pages(
+        self,
+        client: httpx.AsyncClient,
+        pages: Iterator[int],
+        queue: asyncio.Queue[list[dict] | None],
+        progress: _PipelineProgress,
+    ) -> None:
+        """남은 페이지를 하나씩 가져와 Queue에 넣는다 (Queue가 가득 차면 writer를 기다림)"""
+        for page in pages:
+            data = await self._fetch_page(client, page)
+            progress.fetched_pages += 1
+            if data is not None and data.get("items"):
+                await queue.put(data["items"])
+
+            if progress.fetched_pages % 100 == 0:
                 logger.info(
                     f"[ProblemMetadataSyncService] sync_problems: "
-                    f"fetched {page}/{total_pages} pages"
+                    f"fetched {progress.fetched_pages}/{progress.total_pages} pages"
                 )
 
+    async def _fetch_page(self, client: httpx.AsyncClient, page: int) -> dict | None:
+        """검색 페이지 1개 조회 (재시도는 transport 정책에서 끝난 뒤이므로 실패 시 None)"""
+        try:
+            page_resp = await client.get(
+                self.SOLVED_AC_PROBLEM_SEARCH_URL,
+                params={"query": "", "page": page},
+            )
+        except httpx.HTTPError as exc:
+            logger.error(f"[ProblemMetadataSyncService] page {page} failed: {exc}")
+            return None
+        if page_resp.status_code != 200:
+            logger.warning(
+                f"[ProblemMetadataSyncService] page {page} returned "
+                f"{page_resp.status_code}, skipping"
+            )
+            return None
+        return page_resp.json()
+
+    async def _write_problems(
+        self,
+        queue: asyncio.Queue[list[dict] | None],
+        tag_code_to_id: dict[str, int],
+        now: datetime,
+        progress: _PipelineProgress,
+        full: bool,
+    ) -> int:
+        """Queue를 비우며 _BATCH_SIZE 단위로 upsert (None을 받으면 남은 문제까지 쓰고 종료)"""
+        written = 0
+        buffer: list[dict] = []
+        while True:
+            items = await queue.get()
+            if items is None:
+                break
+            buffer.extend(items)
+            while len(buffer) >= _BATCH_SIZE:
+                written += await self._write_batch(buffer[:_BATCH_SIZE], tag_code_to_id, now, progress, full)
+                del buffer[:_BATCH_SIZE]
+        if buffer:
+            written += await self._write_batch(buffer, tag_code_to_id, now, progress, full)
+        return written
+
+    async def _write_batch(
+        self,
+        batch: list[dict],
+        tag_code_to_id: dict[str, int],
+        now: datetime,
+        progress: _PipelineProgress,
+        full: bool,
+    ) -> int:
+        async with self.db.session() as session:
+            changed, affected_tag_ids = await self._upsert_problem_batch(session, batch, tag_code_to_id, now, full)
+
+        progress.written += len(batch)
+        progress.changed += changed
+        progress.affected_tag_ids |= affected_tag_ids
         logger.info(
             f"[ProblemMetadataSyncService] sync_problems: "
-            f"fetched {len(all_problems)} problems, starting DB upsert"
+            f"processed {progress.written}/{progress.total} problems ({progress.changed} changed)"
         )
+        return len(batch)
+
+    async def _upsert_problem_batch(
+        self,
+        session: AsyncSession,
+        batch: list[dict],
+        tag_code_to_id: dict[str, int],
+        now: datetime,
+        full: bool = False,
+    ) -> tuple[int, set[int]]:
+        """
+        문제 배치 1개를 반영한다.
 
-        # _BATCH_SIZE 단위로 배치 upsert
-        now = datetime.now()
-        processed = 0
-
-        for i in range(0, len(all_problems), _BATCH_SIZE):
-            batch = all_problems[i : i + _BATCH_SIZE]
-            async with self.db.session() as session:
-                for prob in batch:
-                    problem_id = prob["problemId"]
-
-                    await session.execute(
-                        text("""
-                            INSERT INTO problem (
-                                problem_id, problem_title,
-                                problem_tier_level, solved_user_count,
-                                created_at, updated_at
-                            )
-                            VALUES (
-                                :id, :title,
-                                :lvl, :solved_count,
-                                :now, :now
-                            )
-                            ON DUPLICATE KEY UPDATE
-                                problem_tier_level  = VALUES(problem_tier_level),
-                                solved_user_count   = VALUES(solved_user_count),
-                                updated_at          = VALUES(updated_at)
-                        """),
-                        {
-                            "id": problem_id,
-                            "title": prob.get("titleKo", ""),
-                            "lvl": prob.get("level", 0),
-                            "solved_count": prob.get("acceptedUserCount", 0),
-                            "now": now,
-                        },
-                    )
+        - 내용 해시(ProblemContentHash)가 저장된 값과 같은 문제는 건너뛴다 (full=True면 전부 기록)
+        - problem: 변경된 문제만 executemany 한 번으로 upsert
+          (aiomysql이 multi-row VALUES 한 문장으로 재작성)
+        - problem_tag: 변경된 문제들의 기존 매핑과 비교해 추가분만 INSERT, 사라진 매핑만 DELETE
+
+        Returns:
+            (기록한 문제 수, 변경 전/후로 해당 문제들에 연결된 태그 ID)
+        """
+        if not batch:
+            return 0, set()
+
+        tag_ids_by_problem: dict[int, set[int]] = {
+            prob["problemId"]: {
+                tag_id
+                for tag_obj in prob.get("tags", [])
+                if (tag_id := tag_code_to_id.get(tag_obj.get("key", "")))
+            }
+            for prob in batch
+        }
+        hashes: dict[int, str] = {
+            prob["problemId"]: ProblemContentHash.compute(
+                prob.get("titleKo", ""),
+                prob.get("level", 0),
+                prob.get("acceptedUserCount", 0),
+                tag_ids_by_problem[prob["problemId"]],
+            ).value
+            for prob in batch
+        }
+
+        changed = batch
+        if not full:
+            hash_result = await session.execute(
+                text("SELECT problem_id, content_hash FROM problem WHERE problem_id IN :pids")
+                .bindparams(bindparam("pids", expanding=True)),
+                {"pids": list(hashes)},
+            )
+            stored: dict[int, str | None] = {row[0]: row[1] for row in hash_result.fetchall()}
+            changed = [prob for prob in batch if stored.get(prob["problemId"]) != hashes[prob["problemId"]]]
+        if not changed:
+            return 0, set()
+
+        await session.execute(
+            text("""
+                INSERT INTO problem (
+                    problem_id, problem_title,
+                    problem_tier_level, solved_user_count,
+                    content_hash, created_at, updated_at
+                )
+                VALUES (
+                    :id, :title,
+                    :lvl, :solved_count,
+                    :hash, :now, :now
+                )
+                ON DUPLICATE KEY UPDATE
+                    problem_title       = VALUES(problem_title),
+                    problem_tier_level  = VALUES(problem_tier_level),
+                    solved_user_count   = VALUES(solved_user_count),
+                    content_hash        = VALUES(content_hash),
+                    updated_at          = VALUES(updated_at)
+            """),
+            [
+                {
+                    "id": prob["problemId"],
+                    "title": prob.get("titleKo", ""),
+                    "lvl": prob.get("level", 0),
+                    "solved_count": prob.get("acceptedUserCount", 0),
+                    "hash": hashes[prob["problemId"]],
+                    "now": now,
+                }
+                for prob in changed
+            ],
+        )
+
+        changed_ids = [prob["problemId"] for prob in changed]
+        desired: set[tuple[int, int]] = {
+            (problem_id, tag_id)
+            for problem_id in changed_ids
+            for tag_id in tag_ids_by_problem[problem_id]
+        }
+        existing_result = await session.execute(
+            text("SELECT problem_id, tag_id FROM problem_tag WHERE problem_id IN :pids")
+            .bindparams(bindparam("pids", expanding=True)),
+            {"pids": changed_ids},
+        )
+        existing: set[tuple[int, int]] = {(row[0], row[1]) for row in existing_result.fetchall()}
+
+        to_insert = desired - existing
+        to_delete = existing - desired
 
-                    for tag_obj in prob.get("tags", []):
-                        tag_id = tag_code_to_id.get(tag_obj.get("key", ""))
-                        if tag_id:
-                            await session.execute(
-                                text("""
-                                    INSERT IGNORE INTO problem_tag (problem_id, tag_id, created_at)
-                                    VALUES (:pid, :tid, :now)
-                                """),
-                                {"pid": problem_id, "tid": tag_id, "now": now},
-                            )
-
-            processed += len(batch)
-            logger.info(
-                f"[ProblemMetadataSyncService] sync_problems: "
-                f"upserted {processed}/{len(all_problems)} problems"
+        if to_insert:
+            await session.execute(
+                text("""
+                    INSERT IGNORE INTO problem_tag (problem_id, tag_id, created_at)
+                    VALUES (:pid, :tid, :now)
+                """),
+                [{"pid": pid, "tid": tid, "now": now} for pid, tid in sorted(to_insert)],
+            )
+        if to_delete:
+            await session.execute(
+                text("DELETE FROM problem_tag WHERE problem_id = :pid AND tag_id = :tid"),
+                [{"pid": pid, "tid": tid} for pid, tid in sorted(to_delete)],
             )
 
-        return len(all_problems)
+        return len(changed), {tag_id for _, tag_id in desired | existing}
 
     # ------------------------------------------------------------------
     # 3. 태그 티어 범위 재계산
     # ------------------------------------------------------------------
 
     @transactional
-    async def recalculate_tag_tier_ranges(self) -> None:
+    async def recalculate_tag_tier_ranges(self, tag_ids: set[int] | None = None) -> None:
         """
         각 태그별 문제 티어 분포(하위 10% · 상위 20% 절사)를 기반으로
-        tag 테이블의 min_problem_tier_id / max_problem_tier_id를 업데이트한다.
+        tag 테이블의 min_problem_tier_id / max_problem_tier_id를 업데이트하고,
+        추천 쿼리가 사용하는 tag_tier_percentile 테이블을 다시 채운다.
 
         db_initializer._update_tag_tier_range()와 동일한 로직.
+        태그별 티어 목록을 가져오는 대신 (태그, 티어)별 문제 수를 한 번의 GROUP BY로 읽고,
+        히스토그램 누적 개수로 절사 구간을 계산한다.
+
+        Args:
+            tag_ids: 재계산할 태그 (None이면 전체 태그)
         """
         logger.info("[ProblemMetadataSyncService] recalculate_tag_tier_ranges: starting")
 
-        tag_result = await self.session.execute(text("SELECT tag_id FROM tag"))
-        tag_ids: list[int] = [row[0] for row in tag_result.fetchall()]
+        tag_ids = await self._resolve_tag_ids(tag_ids)
+        if not tag_ids:
+            return
 
-        now = datetime.now()
+        # 전체 문제 수(티어 범위용)와 추천 모집단 문제 수(백분위용)를 함께 집계
+        count_result = await self.session.execute(
+            text("""
+                SELECT pt.tag_id, p.problem_tier_level,
+                       COUNT(*),
+                       SUM(p.deleted_at IS NULL AND p.solved_user_count >= t.min_solved_person_count)
+                FROM problem p
+                JOIN problem_tag pt ON p.problem_id = pt.problem_id
+                JOIN tag t ON t.tag_id = pt.tag_id
+                WHERE pt.tag_id IN :tag_ids
+                GROUP BY pt.tag_id, p.problem_tier_level
+            """).bindparams(bindparam("tag_ids", expanding=True)),
+            {"tag_ids": tag_ids},
+        )
+        all_counts: dict[int, list[tuple[int, int]]] = {}
+        candidate_counts: dict[int, list[tuple[int, int]]] = {}
+        for tag_id, tier, total_cnt, candidate_cnt in count_result.fetchall():
+            all_counts.setdefault(tag_id, []).append((tier, int(total_cnt)))
+            if candidate_cnt:
+                candidate_counts.setdefault(tag_id, []).append((tier, int(candidate_cnt)))
+
+        ranges: list[tuple[int, int, int]] = []
+        for tag_id, counts in all_counts.items():
+            tier_range = TagTierHistogram.from_counts(counts).tier_range()
+            if tier_range is not None:
+                ranges.append((tag_id, *tier_range))
 
-        for tag_id in tag_ids:
-            tiers_result = await self.session.execute(
-                text("""
-                    SELECT p.problem_tier_level
-                    FROM problem p
-                    JOIN problem_tag pt ON p.problem_id = pt.problem_id
-                    WHERE pt.tag_id = :tag_id
-                    ORDER BY p.problem_tier_level ASC
-                """),
-                {"tag_id": tag_id},
-            )
-            tier_list = [row[0] for row in tiers_result.fetchall()]
+        now = datetime.now()
+        await self._update_tag_tier_ranges(ranges, now)
+        await self._refresh_tag_tier_percentiles(now, tag_ids, candidate_counts)
 
-            if not tier_list:
-                continue
+        logger.info(
+            f"[ProblemMetadataSyncService] recalculate_tag_tier_ranges: done "
+            f"({len(ranges)} tags updated)"
+        )
 
-            total_count = len(tier_list)
-            lower_trim_idx = int(total_count * 0.1)   # 하위 10% 제거
-            upper_trim_idx = int(total_count * 0.8)   # 상위 20% 제거
+    async def _update_tag_tier_ranges(self, ranges: list[tuple[int, int, int]], now: datetime) -> None:
+        """(tag_id, min_tier, max_tier) 목록을 UPDATE ... JOIN 한 문장으로 반영한다."""
+        if not ranges:
+            return
 
-            if upper_trim_idx <= lower_trim_idx:
-                lower_trim_idx = 0
-                upper_trim_idx = total_count
+        params: dict = {"now": now}
+        selects = []
+        for i, (tag_id, min_tier, max_tier) in enumerate(ranges):
+            selects.append(f"SELECT :tag_id_{i} AS tag_id, :min_tier_{i} AS min_tier, :max_tier_{i} AS max_tier")
+            params[f"tag_id_{i}"] = tag_id
+            params[f"min_tier_{i}"] = min_tier
+            params[f"max_tier_{i}"] = max_tier
+
+        await self.session.execute(
+            text(f"""
+                UPDATE tag t
+                JOIN ({" UNION ALL ".join(selects)}) r ON r.tag_id = t.tag_id
+                SET t.min_problem_tier_id = r.min_tier,
+                    t.max_problem_tier_id = r.max_tier,
+                    t.updated_at          = :now
+            """),
+            params,
+        )
 
-            trimmed = tier_list[lower_trim_idx:upper_trim_idx]
-            trimmed_count = len(trimmed)
+    async def _refresh_tag_tier_percentiles(
+        self,
+        now: datetime,
+        tag_ids: list[int],
+        tier_counts: dict[int, list[tuple[int, int]]],
+    ) -> None:
+        """
+        태그별 티어 누적 백분위를 계산해 tag_tier_percentile 테이블의 해당 태그 행을 교체한다.
 
-            # 절사 목록에서 상위 90% 지점 → min_tier
-            min_tier_idx = min(int(trimmed_count * 0.9), trimmed_count - 1)
-            min_tier_id = trimmed[min_tier_idx]
-            max_tier_id = trimmed[-1]
+        tier_counts는 find_recommended_candidates와 같은 모집단(삭제되지 않았고
+        solved_user_count >= tag.min_solved_person_count 인 문제)의 (티어, 문제 수) 목록이다.
+        """
+        if not tag_ids:
+            return
 
+        rows = [
+            {
+                "tag_id": tag_id,
+                "tier": pct.tier,
+                "start": pct.percentile_start,
+                "end": pct.percentile_end,
+                "cnt": pct.problem_cnt,
+                "now": now,
+            }
+            for tag_id, counts in tier_counts.items()
+            for pct in TierPercentile.from_tier_counts(counts)
+        ]
+
+        await self.session.execute(
+            text("DELETE FROM tag_tier_percentile WHERE tag_id IN :tag_ids")
+            .bindparams(bindparam("tag_ids", expanding=True)),
+            {"tag_ids": tag_ids},
+        )
+        if rows:
             await self.session.execute(
                 text("""
-                    UPDATE tag
-                    SET min_problem_tier_id = :min_tier,
-                        max_problem_tier_id = :max_tier,
-                        updated_at          = :now
-                    WHERE tag_id = :tag_id
+                    INSERT INTO tag_tier_percentile (
+                        tag_id, tier, percentile_start, percentile_end, problem_cnt, updated_at
+                    )
+                    VALUES (:tag_id, :tier, :start, :end, :cnt, :now)
                 """),
-                {
-                    "min_tier": min_tier_id,
-                    "max_tier": max_tier_id,
-                    "tag_id": tag_id,
-                    "now": now,
-                },
+                rows,
             )
 
-        logger.info("[ProblemMetadataSyncService] recalculate_tag_tier_ranges: done")
+        logger.info(
+            f"[ProblemMetadataSyncService] tag_tier_percentile refreshed: "
+            f"{len(tier_counts)} tags, {len(rows)} rows"
+        )
 
     # ------------------------------------------------------------------
     # 4. tag_skill 재계산
     # ------------------------------------------------------------------
 
     @transactional
-    async def recalculate_tag_skills(self) -> None:
+    async def recalculate_tag_skills(self, tag_ids: set[int] | None = None) -> None:
         """
         태그별 문제 티어 백분위를 기반으로 tag_skill(IM/AD/MAS) 레코드를
         INSERT ON DUPLICATE KEY UPDATE로 갱신한다.
 
         db_initializer._setup_tag_skills()와 동일한 로직.
+        (태그, 티어)별 문제 수를 한 번에 집계하고, 모든 tag_skill 행을 한 번의 executemany로 쓴다.
         주의: problem_recommendation_level_filter는 건드리지 않는다 (정적 데이터).
+
+        Args:
+            tag_ids: 재계산할 태그 (None이면 전체 태그)
         """
         logger.info("[ProblemMetadataSyncService] recalculate_tag_skills: starting")
 
+        tag_ids = await self._resolve_tag_ids(tag_ids)
+        if not tag_ids:
+            return
         tag_result = await self.session.execute(
-            text("SELECT tag_id, tag_level, tag_code FROM tag")
+            text("SELECT tag_id, tag_level, tag_code FROM tag WHERE tag_id IN :tag_ids")
+            .bindparams(bindparam("tag_ids", expanding=True)),
+            {"tag_ids": tag_ids},
         )
         tags = tag_result.fetchall()
 
+        # solved_user_count >= 1000 인 문제의 (태그, 티어)별 분포
+        count_result = await self.session.execute(
+            text("""
+                SELECT pt.tag_id, p.problem_tier_level, COUNT(*)
+                FROM problem p
+                JOIN problem_tag pt ON p.problem_id = pt.problem_id
+                WHERE pt.tag_id IN :tag_ids AND p.solved_user_count >= 1000
+                GROUP BY pt.tag_id, p.problem_tier_level
+            """).bindparams(bindparam("tag_ids", expanding=True)),
+            {"tag_ids": tag_ids},
+        )
+        tier_counts: dict[int, list[tuple[int, int]]] = {}
+        for tag_id, tier, cnt in count_result.fetchall():
+            tier_counts.setdefault(tag_id, []).append((tier, int(cnt)))
+
         now = datetime.now()
+        im_period, ad_period, mas_period = 3, 7, 14
+        rows = []
 
         for tag_id_val, tag_level, tag_code in tags:
-            # solved_user_count >= 1000 인 문제의 티어 분포
-            tiers_result = await self.session.execute(
-                text("""
-                    SELECT p.problem_tier_level
-                    FROM problem p
-                    JOIN problem_tag pt ON p.problem_id = pt.problem_id
-                    WHERE pt.tag_id = :tag_id AND p.solved_user_count >= 1000
-                    ORDER BY p.problem_tier_level ASC
-                """),
-                {"tag_id": tag_id_val},
-            )
-            tier_list = [row[0] for row in tiers_result.fetchall()]
-
-            if not tier_list:
+            histogram = TagTierHistogram.from_counts(tier_counts.get(tag_id_val, []))
+            if histogram.total == 0:
                 logger.debug(
                     f"[ProblemMetadataSyncService] recalculate_tag_skills: "
                     f"no problems for tag {tag_code} (id={tag_id_val}), using default tier=1"
                 )
-                tier_list = [1]
-
-            trimmed_count = len(tier_list)
-
-            def get_percentile_tier(percentile: float) -> int:
-                """백분위수(0.0~1.0)에 해당하는 티어 반환"""
-                target = 1.0 - percentile
-                idx = min(trimmed_count - 1, int(trimmed_count * target))
-                return tier_list[idx]
 
-            master_user_tier     = get_percentile_tier(0.5)
-            master_highest_tier  = get_percentile_tier(0.1)
-            advanced_user_tier   = get_percentile_tier(0.7)
-            advanced_highest_tier = get_percentile_tier(0.4)
-            immediate_user_tier  = tier_list[0]
-            immediate_highest_tier = tier_list[0]
+            master_user_tier     = histogram.percentile_tier(0.5)
+            master_highest_tier  = histogram.percentile_tier(0.1)
+            advanced_user_tier   = histogram.percentile_tier(0.7)
+            advanced_highest_tier = histogram.percentile_tier(0.4)
+            immediate_user_tier  = histogram.lowest_tier()
+            immediate_highest_tier = histogram.lowest_tier()
 
             # 태그 레벨별 권장 문제 수
             if tag_level in ("NEWBIE", "BEGINNER"):
@@ -429,46 +716,57 @@ class ProblemMetadataSyncService:
             else:
                 m_cnt, a_cnt = 7, 5
 
-            im_period, ad_period, mas_period = 3, 7, 14
-
             for sc, mp, mut, mspt, period in [
                 ("IM",  0,     immediate_user_tier,  immediate_highest_tier,  im_period),
                 ("AD",  a_cnt, advanced_user_tier,   advanced_highest_tier,   ad_period),
                 ("MAS", m_cnt, master_user_tier,     master_highest_tier,     mas_period),
             ]:
-                await self.session.execute(
-                    text("""
-                        INSERT INTO tag_skill (
-                            tag_id, tag_level, tag_skill_code,
-                            min_solved_problem, min_user_tier, min_solved_problem_tier,
-                            recommendation_period, created_at, updated_at, active_yn
-                        )
-                        VALUES (
-                            :tag_id, :lvl, :sc,
-                            :mp, :mut, :mspt,
-                            :period, :now, :now, :yn
-                        )
-                        ON DUPLICATE KEY UPDATE
-                            min_solved_problem      = VALUES(min_solved_problem),
-                            min_user_tier           = VALUES(min_user_tier),
-                            min_solved_problem_tier = VALUES(min_solved_problem_tier),
-                            recommendation_period   = VALUES(recommendation_period),
-                            updated_at              = VALUES(updated_at)
-                    """),
-                    {
-                        "tag_id": tag_id_val,
-                        "lvl": tag_level,
-                        "sc": sc,
-                        "mp": mp,
-                        "mut": mut,
-                        "mspt": mspt,
-                        "period": period,
-                        "now": now,
-                        "yn": True,
-                    },
-                )
+                rows.append({
+                    "tag_id": tag_id_val,
+                    "lvl": tag_level,
+                    "sc": sc,
+                    "mp": mp,
+                    "mut": mut,
+                    "mspt": mspt,
+                    "period": period,
+                    "now": now,
+                    "yn": True,
+                })
 
-        logger.info("[ProblemMetadataSyncService] recalculate_tag_skills: done")
+        if rows:
+            # VALUES 절이 placeholder로만 이루어져 있어 드라이버가 multi-row INSERT 한 문장으로 보낸다
+            await self.session.execute(
+                text("""
+                    INSERT INTO tag_skill (
+                        tag_id, tag_level, tag_skill_code,
+                        min_solved_problem, min_user_tier, min_solved_problem_tier,
+                        recommendation_period, created_at, updated_at, active_yn
+                    )
+                    VALUES (
+                        :tag_id, :lvl, :sc,
+                        :mp, :mut, :mspt,
+                        :period, :now, :now, :yn
+                    )
+                    ON DUPLICATE KEY UPDATE
+                        min_solved_problem      = VALUES(min_solved_problem),
+                        min_user_tier           = VALUES(min_user_tier),
+                        min_solved_problem_tier = VALUES(min_solved_problem_tier),
+                        recommendation_period   = VALUES(recommendation_period),
+                        updated_at              = VALUES(updated_at)
+                """),
+                rows,
+            )
+
+        logger.info(
+            f"[ProblemMetadataSyncService] recalculate_tag_skills: done ({len(rows)} rows)"
+        )
+
+    async def _resolve_tag_ids(self, tag_ids: set[int] | None) -> list[int]:
+        """재계산 대상 태그 ID 목록 (None이면 전체 태그)"""
+        if tag_ids is not None:
+            return sorted(tag_ids)
+        tag_result = await self.session.execute(text("SELECT tag_id FROM tag"))
+        return [row[0] for row in tag_result.fetchall()]
 
     # ------------------------------------------------------------------
     # 5. system_log 저장 (트랜잭션 보장)
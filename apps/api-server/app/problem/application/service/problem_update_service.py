@@ -1,20 +1,23 @@
 """ProblemUpdateService - 신규 문제 점진적 업데이트 서비스"""
 
+import asyncio
 import logging
 from datetime import datetime
 
 import httpx
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.problem.infra.model.problem import ProblemModel
-from app.problem.infra.model.problem_tag import ProblemTagModel
-from app.tag.infra.repository.tag_repository_impl import TagRepositoryImpl
+from app.common.infra.client.http_client import borrow_client
 from app.core.database import Database
-from sqlalchemy import select, and_
-from sqlalchemy.ext.asyncio import AsyncSession
+from app.problem.domain.vo.problem_content_hash import ProblemContentHash
 
 logger = logging.getLogger(__name__)
 
-SOLVEDAC_PROBLEM_SHOW_URL = "https://solved.ac/api/v3/problem/show"
+SOLVEDAC_PROBLEM_LOOKUP_URL = "https://solved.ac/api/v3/problem/lookup"
+
+_LOOKUP_CHUNK_SIZE = 100     # solved.ac problem/lookup 1회 요청당 최대 문제 수
+_LOOKUP_CONCURRENCY = 4      # 동시에 보내는 lookup 요청 수
 
 
 class ProblemUpdateService:
@@ -23,10 +26,17 @@ class ProblemUpdateService:
 
     solved.ac에 존재하지만 DB에 없는 문제를 발견하면
     자동으로 DB에 추가하는 역할을 담당합니다.
+
+    - DB 존재 확인은 IN 쿼리 한 번
+    - 없는 문제는 solved.ac problem/lookup(최대 100개씩)으로 동시에(_LOOKUP_CONCURRENCY개) 조회
+    - 태그 코드 → tag_id 매핑은 인스턴스에 캐시 (모르는 코드가 나오면 한 번 다시 적재)
+    - problem / problem_tag는 multi-row INSERT로 저장
     """
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, http_client: httpx.AsyncClient | None = None):
         self.db = db
+        self.http_client = http_client
+        self._tag_code_to_id: dict[str, int] | None = None
 
     @property
     def session(self) -> AsyncSession:
@@ -43,92 +53,158 @@ class ProblemUpdateService:
             True: 문제가 DB에 있거나 INSERT 성공
             False: solved.ac에서도 찾을 수 없음 (skip 대상)
         """
-        # 1. DB에서 problem_id 확인
-        stmt = select(ProblemModel).where(ProblemModel.problem_id == problem_id)
-        result = await self.session.execute(stmt)
-        existing = result.scalar_one_or_none()
+        return bool(await self.ensure_problems_exist([problem_id]))
 
-        if existing:
-            return True
+    async def ensure_problems_exist(self, problem_ids: list[int]) -> list[int]:
+        """
+        여러 문제들을 확인하고 DB에 없는 것들을 INSERT합니다.
 
-        # 2. solved.ac API 호출
+        Returns:
+            실제로 존재하는 문제 ID 목록 (DB에 없고 solved.ac에서도 못 찾은 건 제외, 입력 순서 유지)
+        """
+        if not problem_ids:
+            return []
+
+        unique_ids = list(dict.fromkeys(problem_ids))
+
+        # 1. DB에 이미 있는 문제 확인 (IN 쿼리 1회)
+        result = await self.session.execute(
+            text("SELECT problem_id FROM problem WHERE problem_id IN :problem_ids")
+            .bindparams(bindparam("problem_ids", expanding=True)),
+            {"problem_ids": unique_ids},
+        )
+        valid_ids = {row[0] for row in result.fetchall()}
+        missing_ids = [pid for pid in unique_ids if pid not in valid_ids]
+
+        # 2. 없는 문제만 solved.ac에서 조회 후 INSERT
+        if missing_ids:
+            problems = await self._lookup_problems(missing_ids)
+            if problems:
+                try:
+                    await self._insert_problems(problems)
+                    valid_ids.update(problem["problemId"] for problem in problems)
+                except Exception as e:
+                    logger.error(f"[ProblemUpdateService] 문제 INSERT 실패: {e}, count={len(problems)}")
+
+            not_found = len(missing_ids) - len(problems)
+            if not_found:
+                logger.warning(f"[ProblemUpdateService] solved.ac에서 찾을 수 없는 문제 {not_found}개 skip")
+
+        return [pid for pid in problem_ids if pid in valid_ids]
+
+    async def _lookup_problems(self, problem_ids: list[int]) -> list[dict]:
+        """solved.ac problem/lookup으로 문제 정보를 조회 (찾지 못한 문제는 결과에서 빠짐)"""
+        chunks = [
+            problem_ids[i:i + _LOOKUP_CHUNK_SIZE]
+            for i in range(0, len(problem_ids), _LOOKUP_CHUNK_SIZE)
+        ]
+        async with borrow_client(self.http_client, timeout=10.0) as client:
+            results = await self._lookup_chunks(client, chunks)
+
+        requested = set(problem_ids)
+        return [
+            problem
+            for chunk_result in results
+            for problem in chunk_result
+            if problem.get("problemId") in requested
+        ]
+
+    async def _lookup_chunks(self, client: httpx.AsyncClient, chunks: list[list[int]]) -> list[list[dict]]:
+        semaphore = asyncio.Semaphore(_LOOKUP_CONCURRENCY)
+
+        async def lookup(chunk: list[int]) -> list[dict]:
+            async with semaphore:
+                return await self._lookup_chunk(client, chunk)
+
+        return await asyncio.gather(*(lookup(chunk) for chunk in chunks))
+
+    async def _lookup_chunk(self, client: httpx.AsyncClient, problem_ids: list[int]) -> list[dict]:
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    SOLVEDAC_PROBLEM_SHOW_URL,
-                    params={"problemId": problem_id}
+            response = await client.get(
+                SOLVEDAC_PROBLEM_LOOKUP_URL,
+                params={"problemIds": ",".join(str(pid) for pid in problem_ids)},
+            )
+            if response.status_code != 200:
+                logger.error(
+                    f"[ProblemUpdateService] solved.ac API 오류: status={response.status_code}, "
+                    f"problem_ids={problem_ids[0]}..{problem_ids[-1]} ({len(problem_ids)}개)"
                 )
-                if response.status_code == 404:
-                    logger.warning(f"[ProblemUpdateService] 문제를 solved.ac에서 찾을 수 없음: {problem_id}")
-                    return False
-                if response.status_code != 200:
-                    logger.error(f"[ProblemUpdateService] solved.ac API 오류: status={response.status_code}, problem_id={problem_id}")
-                    return False
-
-                data = response.json()
+                return []
+            return response.json()
         except Exception as e:
-            logger.error(f"[ProblemUpdateService] solved.ac API 호출 실패: {e}, problem_id={problem_id}")
-            return False
-
-        # 3. 문제 INSERT
-        try:
-            level = data.get("level", 0)
-            title = data.get("titleKo", "") or data.get("title", "")
-            solved_user_count = data.get("acceptedUserCount", 0)
-            now = datetime.now()
-
-            problem_model = ProblemModel(
-                problem_id=problem_id,
-                problem_title=title,
-                problem_tier_level=level if level > 0 else 1,
-                solved_user_count=solved_user_count,
-                created_at=now,
-                updated_at=now
+            logger.error(
+                f"[ProblemUpdateService] solved.ac API 호출 실패: {e}, "
+                f"problem_ids={problem_ids[0]}..{problem_ids[-1]} ({len(problem_ids)}개)"
             )
-            self.session.add(problem_model)
-            await self.session.flush()
-
-            # 4. 태그 INSERT
-            tags = data.get("tags", [])
-            for tag_data in tags:
-                tag_name = tag_data.get("key", "")
-                if not tag_name:
-                    continue
-
-                # tag 테이블에서 tag_code로 tag_id 조회
-                tag_stmt = select(
-                    __import__('app.tag.infra.model.tag', fromlist=['TagModel']).TagModel
-                ).where(
-                    __import__('app.tag.infra.model.tag', fromlist=['TagModel']).TagModel.tag_code == tag_name
-                )
-                tag_result = await self.session.execute(tag_stmt)
-                tag_model = tag_result.scalar_one_or_none()
+            return []
 
-                if tag_model:
-                    problem_tag = ProblemTagModel(
-                        problem_id=problem_id,
-                        tag_id=tag_model.tag_id,
-                        created_at=now
-                    )
-                    self.session.add(problem_tag)
+    async def _get_tag_code_to_id(self, tag_codes: set[str]) -> dict[str, int]:
+        """태그 코드 → tag_id 매핑 (캐시에 없는 코드가 있으면 다시 적재)"""
+        if self._tag_code_to_id is None or not tag_codes <= self._tag_code_to_id.keys():
+            result = await self.session.execute(text("SELECT tag_id, tag_code FROM tag"))
+            self._tag_code_to_id = {tag_code: tag_id for tag_id, tag_code in result.fetchall()}
+        return self._tag_code_to_id
 
-            await self.session.flush()
-            logger.info(f"[ProblemUpdateService] 문제 INSERT 완료: problem_id={problem_id}, title={title}")
-            return True
+    async def _insert_problems(self, problems: list[dict]) -> None:
+        """problem / problem_tag를 multi-row INSERT로 저장
 
-        except Exception as e:
-            logger.error(f"[ProblemUpdateService] 문제 INSERT 실패: {e}, problem_id={problem_id}")
-            return False
-
-    async def ensure_problems_exist(self, problem_ids: list[int]) -> list[int]:
+        VALUES 절이 placeholder로만 이루어져 있어 드라이버가 executemany를 한 문장으로 보낸다.
+        동시에 같은 문제를 넣는 다른 요청과 경합해도 실패하지 않도록 INSERT IGNORE를 사용한다.
         """
-        여러 문제들을 확인하고 DB에 없는 것들을 INSERT합니다.
+        tag_codes = {
+            tag.get("key", "")
+            for problem in problems
+            for tag in problem.get("tags", [])
+        } - {""}
+        tag_code_to_id = await self._get_tag_code_to_id(tag_codes)
+        now = datetime.now()
+
+        problem_rows = []
+        tag_rows = []
+        for problem in problems:
+            problem_id = problem["problemId"]
+            level = problem.get("level", 0) or 0
+            title = problem.get("titleKo", "") or problem.get("title", "")
+            solved_user_count = problem.get("acceptedUserCount", 0)
+            tag_ids = sorted({
+                tag_code_to_id[tag["key"]]
+                for tag in problem.get("tags", [])
+                if tag.get("key") in tag_code_to_id
+            })
+
+            problem_rows.append({
+                "id": problem_id,
+                "title": title,
+                "lvl": level if level > 0 else 1,
+                "solved_count": solved_user_count,
+                # 주간 동기화(ProblemMetadataSyncService)와 같은 입력으로 해시해 다음 동기화에서 다시 쓰지 않도록 함
+                "hash": ProblemContentHash.compute(
+                    problem.get("titleKo", ""), problem.get("level", 0), solved_user_count, tag_ids
+                ).value,
+                "now": now,
+            })
+            tag_rows.extend({"pid": problem_id, "tid": tag_id, "now": now} for tag_id in tag_ids)
+
+        await self.session.execute(
+            text("""
+                INSERT IGNORE INTO problem (
+                    problem_id, problem_title,
+                    problem_tier_level, solved_user_count,
+                    content_hash, created_at, updated_at
+                )
+                VALUES (:id, :title, :lvl, :solved_count, :hash, :now, :now)
+            """),
+            problem_rows,
+        )
+        if tag_rows:
+            await self.session.execute(
+                text("""
+                    INSERT IGNORE INTO problem_tag (problem_id, tag_id, created_at)
+                    VALUES (:pid, :tid, :now)
+                """),
+                tag_rows,
+            )
 
-        Returns:
-            실제로 존재하는 문제 ID 목록 (DB에 없고 solved.ac에서도 못 찾은 건 제외)
-        """
-        valid_ids = []
-        for pid in problem_ids:
-            if await self.ensure_problem_exists(pid):
-                valid_ids.append(pid)
-        return valid_ids
+        logger.info(
+            f"[ProblemUpdateService] 문제 INSERT 완료: {len(problem_rows)}개, problem_tag {len(tag_rows)}개"
+        )
@@ -3,12 +3,13 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from app.common.domain.vo.collections import ProblemIdBitmap
 from app.common.domain.vo.identifiers import ProblemId, TagId
 from app.common.domain.vo.primitives import TierRange
 from app.problem.domain.entity.problem import Problem, TierLevel
 
 if TYPE_CHECKING:
-    from app.recommendation.domain.vo.search_criteria import SearchCriteria
+    from app.recommendation.domain.vo.search_criteria import SearchCriteria, TagSearchCriteria
 
 class ProblemRepository(ABC):
     """Repository 인터페이스"""
@@ -54,24 +55,20 @@ class ProblemRepository(ABC):
         pass
 
     @abstractmethod
-    async def find_recommended_problem(
+    async def find_recommended_candidates(
         self,
-        tag_id: TagId,
-        criteria_list: list['SearchCriteria'],
-        min_solved_count: int,
-        exclude_ids: set[int],
-        priority_ids: set[int]
-    ) -> Problem | None:
-        """추천 문제 조회
+        tag_criteria_list: list['TagSearchCriteria'],
+        exclude_ids: set[int] | ProblemIdBitmap,
+        per_tag_limit: int
+    ) -> dict[int, list[Problem]]:
+        """여러 태그의 추천 후보를 한 번에 조회
 
         Args:
-            tag_id: 태그 ID
-            criteria_list: 검색 조건 리스트 (각 레벨 필터별 독립적인 tier_range + skill_rate)
-            min_solved_count: 최소 해결 수 (1000명 이상 푼 문제)
-            exclude_ids: 제외할 문제 ID 집합 (이미 푼 문제 + ban한 문제)
-            priority_ids: 우선순위 문제 ID 집합 (찜한 문제)
+            tag_criteria_list: 태그별 검색 조건 (태그당 1개)
+            exclude_ids: 제외할 문제 ID 집합 또는 비트맵 (모든 태그에 공통 적용)
+            per_tag_limit: 태그당 최대 후보 수
 
         Returns:
-            추천 문제 (없으면 None)
+            tag_id → 무작위 순서의 후보 문제 리스트 (후보가 없는 태그는 포함되지 않음)
         """
-        pass
\ No newline at end of file
+        pass
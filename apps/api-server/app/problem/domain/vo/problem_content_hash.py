@@ -0,0 +1,37 @@
+"""문제 메타데이터 내용 해시 Value Objects"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Iterable
+
+
+def solved_count_bucket(solved_user_count: int) -> int:
+    """맞은 사람 수를 유효숫자 2자리로 내림한 구간 값
+
+    매주 조금씩 늘어나는 맞은 사람 수 때문에 모든 문제가 변경으로 잡히지 않도록 하되,
+    추천 모집단 기준(1000명 등) 경계를 넘는 변화는 구분되도록 한다.
+    예) 57 → 57, 999 → 990, 1000 → 1000, 12345 → 12000
+    """
+    if solved_user_count < 100:
+        return solved_user_count
+    unit = 10 ** (len(str(solved_user_count)) - 2)
+    return solved_user_count // unit * unit
+
+
+@dataclass(frozen=True)
+class ProblemContentHash:
+    """동기화 대상 문제 내용(제목, 티어, 맞은 사람 수 구간, 태그 집합)의 해시
+
+    저장된 해시와 같으면 DB에 다시 쓰지 않는다.
+    """
+    value: str
+
+    @staticmethod
+    def compute(title: str, tier_level: int, solved_user_count: int, tag_ids: Iterable[int]) -> 'ProblemContentHash':
+        content = "\x1f".join((
+            title,
+            str(tier_level),
+            str(solved_count_bucket(solved_user_count)),
+            ",".join(str(tag_id) for tag_id in sorted(set(tag_ids))),
+        ))
+        return ProblemContentHash(hashlib.md5(content.encode("utf-8")).hexdigest())
@@ -0,0 +1,63 @@
+"""태그별 문제 티어 히스토그램 Value Objects"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+
+
+@dataclass(frozen=True)
+class TagTierHistogram:
+    """태그 하나의 (티어, 문제 수) 분포
+
+    정렬된 티어 목록을 만들지 않고 누적 개수로 "k번째로 낮은 티어"를 구해
+    태그 티어 범위 / tag_skill 백분위 계산에 사용한다.
+    """
+    tiers: tuple[int, ...]
+    cumulative: tuple[int, ...]  # cumulative[i] = tiers[0..i] 문제 수 합
+
+    @staticmethod
+    def from_counts(tier_counts: list[tuple[int, int]]) -> 'TagTierHistogram':
+        """(tier, problem_cnt) 목록으로 생성 (문제 수 0인 티어 제외)"""
+        counts = sorted((tier, cnt) for tier, cnt in tier_counts if cnt > 0)
+        return TagTierHistogram(
+            tiers=tuple(tier for tier, _ in counts),
+            cumulative=tuple(accumulate(cnt for _, cnt in counts)),
+        )
+
+    @property
+    def total(self) -> int:
+        return self.cumulative[-1] if self.cumulative else 0
+
+    def tier_at(self, index: int) -> int:
+        """티어 오름차순으로 나열했을 때 index번째(0부터) 문제의 티어"""
+        return self.tiers[bisect_right(self.cumulative, index)]
+
+    def tier_range(self) -> tuple[int, int] | None:
+        """하위 10% · 상위 20%를 절사한 구간의 (min_tier, max_tier)
+
+        min_tier는 절사 구간의 90% 지점, max_tier는 절사 구간의 마지막 티어.
+        문제가 없으면 None.
+        """
+        total = self.total
+        if total == 0:
+            return None
+
+        lower = int(total * 0.1)
+        upper = int(total * 0.8)
+        if upper <= lower:
+            lower, upper = 0, total
+
+        trimmed_count = upper - lower
+        min_index = min(int(trimmed_count * 0.9), trimmed_count - 1)
+        return self.tier_at(lower + min_index), self.tier_at(upper - 1)
+
+    def percentile_tier(self, percentile: float) -> int:
+        """상위 percentile(0.0~1.0) 지점의 티어 (문제가 없으면 1)"""
+        total = self.total
+        if total == 0:
+            return 1
+        return self.tier_at(min(total - 1, int(total * (1.0 - percentile))))
+
+    def lowest_tier(self) -> int:
+        """가장 낮은 티어 (문제가 없으면 1)"""
+        return self.tiers[0] if self.tiers else 1
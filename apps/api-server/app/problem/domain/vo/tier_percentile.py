@@ -0,0 +1,41 @@
+"""태그별 티어 백분위 Value Objects"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TierPercentile:
+    """태그 내 티어 하나가 차지하는 누적 백분위 구간
+
+    티어 오름차순 누적 비율 기준으로
+    - percentile_start = 1 - (이전 티어까지 누적 문제 수 / 전체)
+    - percentile_end   = 1 - (현재 티어까지 누적 문제 수 / 전체)
+
+    첫(가장 낮은) 티어의 percentile_start는 1.0이다.
+    예전 윈도 함수 쿼리(SUM() OVER (ROWS UNBOUNDED PRECEDING ~ 1 PRECEDING))는 첫 행의 프레임이 비어
+    NULL이 되었고, `percentile_start >= max_skill_rate` 조건이 항상 거짓이라 첫 티어가 후보에서 빠졌다.
+    여기서는 1.0으로 두어 max_skill_rate <= 100인 기준에서 첫 티어도 후보가 된다 (tag_tier_percentile 적재값도 동일).
+    """
+    tier: int
+    percentile_start: float
+    percentile_end: float
+    problem_cnt: int
+
+    @staticmethod
+    def from_tier_counts(tier_counts: list[tuple[int, int]]) -> tuple['TierPercentile', ...]:
+        """(tier, problem_cnt) 목록으로부터 누적 백분위 테이블 생성 (문제 수 0인 티어 제외)"""
+        counts = sorted((tier, cnt) for tier, cnt in tier_counts if cnt > 0)
+        total = sum(cnt for _, cnt in counts)
+
+        table: list[TierPercentile] = []
+        cumulative = 0
+        for tier, cnt in counts:
+            start = 1 - cumulative / total
+            cumulative += cnt
+            table.append(TierPercentile(
+                tier=tier,
+                percentile_start=start,
+                percentile_end=1 - cumulative / total,
+                problem_cnt=cnt,
+            ))
+        return tuple(table)
@@ -0,0 +1,291 @@
+"""
+ProblemCandidateIndex - 추천 후보 문제 인메모리 인덱스
+
+problem / problem_tag 테이블을 프로세스 메모리에 (tag_id, tier_level) 버킷으로
+적재해, 추천 루프가 매 시도마다 ORDER BY RAND() 쿼리를 날리지 않고
+메모리에서 바로 후보를 뽑을 수 있게 한다.
+
+- 앱 시작 시(Container.init_resources) 1회 빌드
+- 주간 메타데이터 동기화(ProblemMetadataSyncService.sync_all) 이후 재빌드
+- 재빌드는 새 스냅샷을 만든 뒤 참조만 교체하므로 조회 중인 요청과 경합하지 않는다
+"""
+from __future__ import annotations
+
+import logging
+import random
+from bisect import bisect_right
+from collections.abc import Container as IdContainer
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+from app.common.domain.vo.identifiers import ProblemId, TagId
+from app.common.domain.vo.primitives import TierLevel
+from app.core.database import Database
+from app.problem.domain.entity.problem import Problem
+from app.problem.domain.entity.problem_tag import ProblemTag
+from app.problem.domain.vo.tier_percentile import TierPercentile
+from app.problem.infra.model.problem import ProblemModel
+from app.problem.infra.model.problem_tag import ProblemTagModel
+
+if TYPE_CHECKING:
+    from app.recommendation.domain.vo.search_criteria import SearchCriteria
+
+logger = logging.getLogger(__name__)
+
+_RANDOM_PICK_ATTEMPTS = 32  # 제외 집합에 걸릴 때 무작위 재시도 횟수 (이후 전체 필터링)
+
+
+@dataclass(frozen=True)
+class IndexedProblem:
+    """인덱스에 적재된 문제 한 건 (Problem 엔티티 복원에 필요한 최소 정보)"""
+    problem_id: int
+    title: str
+    tier_level: int
+    class_level: int | None
+    solved_user_count: int
+    created_at: datetime
+    updated_at: datetime
+    tag_ids: tuple[int, ...]
+
+    def to_entity(self) -> Problem:
+        problem_id = ProblemId(self.problem_id)
+        return Problem(
+            problem_id=problem_id,
+            title=self.title,
+            tier_level=TierLevel(self.tier_level),
+            class_level=self.class_level,
+            solved_user_count=self.solved_user_count,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            deleted_at=None,
+            tags=[
+                ProblemTag(
+                    problem_tag_id=None,
+                    problem_id=problem_id,
+                    tag_id=TagId(tag_id),
+                    created_at=self.created_at,
+                )
+                for tag_id in self.tag_ids
+            ],
+            update_histories=[],
+        )
+
+
+@dataclass
+class CandidateIndexSnapshot:
+    """불변으로 취급되는 인덱스 스냅샷
+
+    buckets[tag_id][tier]는 solved_user_count 내림차순으로 정렬된 문제 ID 튜플이고,
+    solved_keys[tag_id][tier]는 bisect용 (-solved_user_count) 오름차순 키 튜플이다.
+    """
+    problems: dict[int, IndexedProblem]
+    buckets: dict[int, dict[int, tuple[int, ...]]]
+    solved_keys: dict[int, dict[int, tuple[int, ...]]]
+    built_at: datetime
+    _percentile_cache: dict[tuple[int, int], tuple[TierPercentile, ...]] = field(default_factory=dict)
+
+    @staticmethod
+    def build(problems: list[IndexedProblem]) -> 'CandidateIndexSnapshot':
+        grouped: dict[int, dict[int, list[IndexedProblem]]] = {}
+        for problem in problems:
+            for tag_id in problem.tag_ids:
+                grouped.setdefault(tag_id, {}).setdefault(problem.tier_level, []).append(problem)
+
+        buckets: dict[int, dict[int, tuple[int, ...]]] = {}
+        solved_keys: dict[int, dict[int, tuple[int, ...]]] = {}
+        for tag_id, tiers in grouped.items():
+            for tier, items in tiers.items():
+                items.sort(key=lambda p: p.solved_user_count, reverse=True)
+                buckets.setdefault(tag_id, {})[tier] = tuple(p.problem_id for p in items)
+                solved_keys.setdefault(tag_id, {})[tier] = tuple(-p.solved_user_count for p in items)
+
+        return CandidateIndexSnapshot(
+            problems={p.problem_id: p for p in problems},
+            buckets=buckets,
+            solved_keys=solved_keys,
+            built_at=datetime.now(),
+        )
+
+    def _eligible_count(self, tag_id: int, tier: int, min_solved_count: int) -> int:
+        """solved_user_count >= min_solved_count 인 문제 수 (버킷 앞쪽 prefix 길이)"""
+        return bisect_right(self.solved_keys[tag_id][tier], -min_solved_count)
+
+    def tier_percentiles(self, tag_id: int, min_solved_count: int) -> tuple[TierPercentile, ...]:
+        """태그의 티어별 누적 백분위 테이블 (min_solved_count별로 메모이즈)"""
+        key = (tag_id, min_solved_count)
+        cached = self._percentile_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = TierPercentile.from_tier_counts([
+            (tier, self._eligible_count(tag_id, tier, min_solved_count))
+            for tier in self.buckets.get(tag_id, {})
+        ])
+        self._percentile_cache[key] = result
+        return result
+
+
+class ProblemCandidateIndex:
+    """추천 후보 문제 인메모리 인덱스
+
+    ProblemRepositoryImpl.find_recommended_candidates가 is_ready일 때 이 인덱스를 사용하고,
+    아직 빌드되지 않았으면 기존 SQL 경로로 폴백한다.
+    """
+
+    def __init__(self, db: Database) -> None:
+        self.db = db
+        self._snapshot: CandidateIndexSnapshot | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def snapshot(self) -> CandidateIndexSnapshot | None:
+        return self._snapshot
+
+    async def rebuild(self) -> None:
+        """problem / problem_tag 전체를 읽어 새 스냅샷으로 교체"""
+        async with self.db.session() as session:
+            problem_rows = (await session.execute(
+                select(
+                    ProblemModel.problem_id,
+                    ProblemModel.problem_title,
+                    ProblemModel.problem_tier_level,
+                    ProblemModel.class_level,
+                    ProblemModel.solved_user_count,
+                    ProblemModel.created_at,
+                    ProblemModel.updated_at,
+                ).where(ProblemModel.deleted_at.is_(None))
+            )).all()
+            tag_rows = (await session.execute(
+                select(ProblemTagModel.problem_id, ProblemTagModel.tag_id)
+            )).all()
+
+        tags_by_problem: dict[int, list[int]] = {}
+        for problem_id, tag_id in tag_rows:
+            tags_by_problem.setdefault(problem_id, []).append(tag_id)
+
+        problems = [
+            IndexedProblem(
+                problem_id=row[0],
+                title=row[1],
+                tier_level=row[2],
+                class_level=row[3],
+                solved_user_count=row[4],
+                created_at=row[5],
+                updated_at=row[6],
+                tag_ids=tuple(tags_by_problem.get(row[0], ())),
+            )
+            for row in problem_rows
+        ]
+        self._snapshot = CandidateIndexSnapshot.build(problems)
+        logger.info(
+            f"[ProblemCandidateIndex] rebuilt: problems={len(problems)}, "
+            f"tags={len(self._snapshot.buckets)}"
+        )
+
+    def load(self, problems: list[IndexedProblem]) -> None:
+        """이미 조회된 문제 목록으로 스냅샷 교체 (테스트/수동 적재용)"""
+        self._snapshot = CandidateIndexSnapshot.build(problems)
+
+    def sample_many(
+        self,
+        tag_id: TagId,
+        criteria_list: list['SearchCriteria'],
+        min_solved_count: int,
+        exclude_ids: IdContainer[int],
+        limit: int,
+    ) -> list[Problem]:
+        """find_recommended_candidates용 - 조건을 만족하는 서로 다른 후보를 최대 limit개 무작위 추출
+
+        티어 백분위는 TierPercentile 기준이라 첫 티어의 percentile_start가 1.0이다
+        (예전 윈도 함수 쿼리는 NULL이라 첫 티어가 제외되었음 - TierPercentile 참고).
+        solved_user_count 조건은 백분위 계산과 후보 필터 양쪽에 min_solved_count로 적용된다.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or limit <= 0:
+            return []
+
+        segments, total = self._segments(snapshot, tag_id, criteria_list, min_solved_count)
+        if total == 0:
+            return []
+
+        picked: list[int] = []
+        seen: set[int] = set()
+        for _ in range(_RANDOM_PICK_ATTEMPTS + limit):
+            if len(picked) >= limit:
+                break
+            problem_id = self._pick(segments, random.randrange(total))
+            if problem_id in seen or problem_id in exclude_ids:
+                continue
+            seen.add(problem_id)
+            picked.append(problem_id)
+
+        if len(picked) < limit:
+            # 후보가 적거나 제외 비율이 높은 경우 - 전체 필터링 후 부족분 채움
+            remaining = [pid for pid in self._remaining(segments, exclude_ids) if pid not in seen]
+            picked.extend(random.sample(remaining, min(limit - len(picked), len(remaining))))
+
+        return [snapshot.problems[problem_id].to_entity() for problem_id in picked]
+
+    def _segments(
+        self,
+        snapshot: CandidateIndexSnapshot,
+        tag_id: TagId,
+        criteria_list: list['SearchCriteria'],
+        min_solved_count: int,
+    ) -> tuple[list[tuple[tuple[int, ...], int]], int]:
+        """조건을 만족하는 티어 버킷 prefix 목록과 전체 후보 수"""
+        tag_buckets = snapshot.buckets.get(tag_id.value)
+        if not tag_buckets:
+            return [], 0
+
+        # 1. 조건을 만족하는 티어 선별 (criteria 간 OR)
+        eligible_tiers = [
+            tier_pct.tier
+            for tier_pct in snapshot.tier_percentiles(tag_id.value, min_solved_count)
+            if any(self._matches(tier_pct, criteria) for criteria in criteria_list)
+        ]
+
+        # 2. 티어 버킷에서 solved_user_count 조건을 만족하는 prefix만 후보로 사용
+        segments: list[tuple[tuple[int, ...], int]] = []
+        total = 0
+        for tier in eligible_tiers:
+            size = snapshot._eligible_count(tag_id.value, tier, min_solved_count)
+            segments.append((tag_buckets[tier], size))
+            total += size
+        return segments, total
+
+    @staticmethod
+    def _remaining(segments: list[tuple[tuple[int, ...], int]], exclude_ids: IdContainer[int]) -> list[int]:
+        return [
+            problem_id
+            for bucket, size in segments
+            for problem_id in bucket[:size]
+            if problem_id not in exclude_ids
+        ]
+
+    @staticmethod
+    def _pick(segments: list[tuple[tuple[int, ...], int]], offset: int) -> int:
+        for bucket, size in segments:
+            if offset < size:
+                return bucket[offset]
+            offset -= size
+        raise IndexError(offset)
+
+    @staticmethod
+    def _matches(tier_pct: TierPercentile, criteria: 'SearchCriteria') -> bool:
+        if tier_pct.percentile_start < criteria.max_skill_rate / 100.0:
+            return False
+        if tier_pct.percentile_end > criteria.min_skill_rate / 100.0:
+            return False
+        tier_range = criteria.tier_range
+        if tier_range.min_tier_id is not None and tier_pct.tier < tier_range.min_tier_id.value:
+            return False
+        if tier_range.max_tier_id is not None and tier_pct.tier > tier_range.max_tier_id.value:
+            return False
+        return True
@@ -18,6 +18,7 @@ class ProblemModel(Base):
     problem_tier_level: Mapped[int] = mapped_column(Integer, ForeignKey('tier.tier_id'), nullable=False)
     class_level: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     solved_user_count: Mapped[int] =mapped_column(Integer, nullable=False)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True, comment='동기화 내용 해시')
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -0,0 +1,19 @@
+from datetime import datetime
+from sqlalchemy import DateTime, Float, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class TagTierPercentileModel(Base):
+    __tablename__ = "tag_tier_percentile"
+    __table_args__ = (
+        {'comment': '태그별 티어 누적 백분위 (추천 쿼리용 사전 계산 테이블)'},
+    )
+
+    tag_id: Mapped[int] = mapped_column(Integer, ForeignKey('tag.tag_id'), primary_key=True)
+    tier: Mapped[int] = mapped_column(Integer, ForeignKey('tier.tier_id'), primary_key=True)
+    percentile_start: Mapped[float] = mapped_column(Float, nullable=False)
+    percentile_end: Mapped[float] = mapped_column(Float, nullable=False)
+    problem_cnt: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
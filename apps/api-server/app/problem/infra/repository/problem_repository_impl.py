@@ -8,24 +8,38 @@ from app.common.domain.entity.system_log import SystemLog
 from app.common.domain.entity.system_log_data import MetadataUpdateLogData
 from app.common.domain.enums import SystemLogType, SystemLogStatus, MetadataEntityType
 from app.common.domain.repository.system_log_repository import SystemLogRepository
+from app.common.domain.vo.collections import ProblemIdBitmap
 from app.common.domain.vo.identifiers import ProblemId, TagId
 from app.common.domain.vo.primitives import TierLevel, TierRange
 from app.core.database import Database
 from app.problem.domain.entity.problem import Problem
 from app.problem.domain.repository.problem_repository import ProblemRepository
+from app.problem.infra.cache.problem_candidate_index import ProblemCandidateIndex
 from app.problem.infra.mapper.problem_mapper import ProblemMapper
 from app.problem.infra.mapper.problem_tag_mapper import ProblemTagMapper
 from app.problem.infra.model.problem import ProblemModel
 from app.problem.infra.model.problem_tag import ProblemTagModel
-from app.recommendation.domain.vo.search_criteria import SearchCriteria
+from app.problem.infra.model.tag_tier_percentile import TagTierPercentileModel
+from app.recommendation.domain.vo.search_criteria import SearchCriteria, TagSearchCriteria
+
+
+# 인덱스가 아직 없을 때의 SQL 폴백 - 제외 목록이 이보다 크면 NOT IN 대신 넉넉히 가져와 메모리에서 거른다
+_FALLBACK_INLINE_EXCLUDE_LIMIT = 200
+_FALLBACK_OVERFETCH_FACTOR = 4
 
 
 class ProblemRepositoryImpl(ProblemRepository):
     """Problem Repository 구현체"""
 
-    def __init__(self, db: Database, system_log_repository: SystemLogRepository | None = None):
+    def __init__(
+        self,
+        db: Database,
+        system_log_repository: SystemLogRepository | None = None,
+        candidate_index: ProblemCandidateIndex | None = None,
+    ):
         self.db = db
         self.system_log_repository = system_log_repository
+        self.candidate_index = candidate_index
 
     @property
     def session(self) -> AsyncSession:
@@ -179,76 +193,123 @@ class ProblemRepositoryImpl(ProblemRepository):
         return list(result.scalars().all())
 
     @override
-    async def find_recommended_problem(
+    async def find_recommended_candidates(
         self,
-        tag_id: TagId,
-        criteria_list: list[SearchCriteria],
-        min_solved_count: int,
-        exclude_ids: set[int],
-        priority_ids: set[int]
-    ) -> Problem | None:
-        tier_count = (
+        tag_criteria_list: list[TagSearchCriteria],
+        exclude_ids: set[int] | ProblemIdBitmap,
+        per_tag_limit: int
+    ) -> dict[int, list[Problem]]:
+        if not tag_criteria_list or per_tag_limit <= 0:
+            return {}
+
+        # 인메모리 후보 인덱스가 준비되어 있으면 DB 조회 없이 추출
+        if self.candidate_index is not None and self.candidate_index.is_ready:
+            candidates: dict[int, list[Problem]] = {}
+            for tag_criteria in tag_criteria_list:
+                problems = self.candidate_index.sample_many(
+                    tag_id=tag_criteria.tag_id,
+                    criteria_list=list(tag_criteria.criteria_list),
+                    min_solved_count=tag_criteria.min_solved_count,
+                    exclude_ids=exclude_ids,
+                    limit=per_tag_limit,
+                )
+                if problems:
+                    candidates[tag_criteria.tag_id.value] = problems
+            return candidates
+
+        # 태그별 조건을 OR로 묶고, 태그 파티션 안에서 무작위 순번을 매겨 상위 N개만 가져온다
+        # 제외 목록이 크면(풀이 수가 많은 유저) 수천 개짜리 NOT IN을 보내지 않고 더 많이 가져와 메모리에서 거른다
+        inline_exclude = len(exclude_ids) <= _FALLBACK_INLINE_EXCLUDE_LIMIT
+        rows_per_tag = per_tag_limit if inline_exclude else per_tag_limit * _FALLBACK_OVERFETCH_FACTOR
+
+        tag_conditions = [
+            and_(
+                ProblemTagModel.tag_id == tag_criteria.tag_id.value,
+                ProblemModel.solved_user_count >= tag_criteria.min_solved_count,
+                self._criteria_condition(
+                    tag_criteria.criteria_list,
+                    TagTierPercentileModel.percentile_start,
+                    TagTierPercentileModel.percentile_end,
+                ),
+            )
+            for tag_criteria in tag_criteria_list
+        ]
+
+        base_conditions = [
+            ProblemModel.deleted_at.is_(None),
+            ProblemTagModel.tag_id.in_([tc.tag_id.value for tc in tag_criteria_list]),
+            or_(*tag_conditions),
+        ]
+        if exclude_ids and inline_exclude:
+            base_conditions.append(ProblemModel.problem_id.notin_(list(exclude_ids)))
+
+        ranked_stmt = (
             select(
-                ProblemModel.problem_tier_level.label("tier"),
-                func.count().label("problem_cnt"),
+                ProblemModel.problem_id,
+                ProblemTagModel.tag_id.label("source_tag_id"),
+                func.row_number().over(
+                    partition_by=ProblemTagModel.tag_id,
+                    order_by=func.rand(),
+                ).label("rn"),
             )
             .join(
                 ProblemTagModel,
                 ProblemModel.problem_id == ProblemTagModel.problem_id,
             )
-            .where(
+            .join(
+                TagTierPercentileModel,
                 and_(
-                    ProblemTagModel.tag_id == tag_id.value,
-                    ProblemModel.deleted_at.is_(None),
-                    ProblemModel.solved_user_count >= min_solved_count,
-                )
-            )
-            .group_by(ProblemModel.problem_tier_level)
-        ).subquery()
-        total_cnt = func.sum(tier_count.c.problem_cnt).over()
-
-        tier_range_stmt = (
-            select(
-                tier_count.c.tier,
-                (
-                    1
-                    - (
-                        func.sum(tier_count.c.problem_cnt)
-                        .over(
-                            order_by=tier_count.c.tier,
-                            rows=(None, 0),  # UNBOUNDED PRECEDING ~ CURRENT
-                        )
-                        / total_cnt
-                    )
-                ).label("percentile_end"),
-                (
-                    1
-                    - (
-                        func.sum(tier_count.c.problem_cnt)
-                        .over(
-                            order_by=tier_count.c.tier,
-                            rows=(None, -1),  # UNBOUNDED PRECEDING ~ 1 PRECEDING
-                        )
-                        / total_cnt
-                    )
-                ).label("percentile_start"),
+                    TagTierPercentileModel.tag_id == ProblemTagModel.tag_id,
+                    TagTierPercentileModel.tier == ProblemModel.problem_tier_level,
+                ),
             )
+            .where(and_(*base_conditions))
         ).subquery()
 
-        result = await self.session.execute(select(
-            tier_range_stmt.c.tier,
-            tier_range_stmt.c.percentile_end,
-            tier_range_stmt.c.percentile_start,
-        ))
-        rows = result.mappings().all()
-        print(rows)
-
-        # 각 criteria를 OR 조건으로 결합
+        stmt = (
+            select(ProblemModel, ranked_stmt.c.source_tag_id)
+            .join(ranked_stmt, ProblemModel.problem_id == ranked_stmt.c.problem_id)
+            .where(ranked_stmt.c.rn <= rows_per_tag)
+            .order_by(ranked_stmt.c.source_tag_id, ranked_stmt.c.rn)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if not inline_exclude:
+            rows = self._drop_excluded(rows, exclude_ids, per_tag_limit)
+        if not rows:
+            return {}
+
+        # 같은 문제가 여러 태그에 걸릴 수 있으므로 엔티티 변환은 문제 단위로 한 번만 수행
+        unique_models = list({model.problem_id: model for model, _ in rows}.values())
+        problems_by_id = {
+            problem.problem_id.value: problem
+            for problem in await self._attach_tags_and_map_to_entities(unique_models)
+        }
+
+        candidates = {}
+        for model, source_tag_id in rows:
+            candidates.setdefault(source_tag_id, []).append(problems_by_id[model.problem_id])
+        return candidates
+
+    @staticmethod
+    def _drop_excluded(rows, exclude_ids, per_tag_limit: int) -> list:
+        """(ProblemModel, source_tag_id) 행에서 제외 대상을 빼고 태그당 per_tag_limit개까지만 남김"""
+        kept = []
+        kept_counts: dict[int, int] = {}
+        for model, source_tag_id in rows:
+            if model.problem_id in exclude_ids or kept_counts.get(source_tag_id, 0) >= per_tag_limit:
+                continue
+            kept_counts[source_tag_id] = kept_counts.get(source_tag_id, 0) + 1
+            kept.append((model, source_tag_id))
+        return kept
+
+    @staticmethod
+    def _criteria_condition(criteria_list, percentile_start, percentile_end):
+        """SearchCriteria 목록을 (백분위 구간 AND 티어 범위)의 OR 조건으로 변환"""
         criteria_or_conditions = []
         for criteria in criteria_list:
             criteria_conditions = [
-                tier_range_stmt.c.percentile_start >= criteria.max_skill_rate / 100.0,
-                tier_range_stmt.c.percentile_end <= criteria.min_skill_rate / 100.0,
+                percentile_start >= criteria.max_skill_rate / 100.0,
+                percentile_end <= criteria.min_skill_rate / 100.0,
             ]
             if criteria.tier_range.min_tier_id is not None:
                 criteria_conditions.append(
@@ -259,54 +320,4 @@ class ProblemRepositoryImpl(ProblemRepository):
                     ProblemModel.problem_tier_level <= criteria.tier_range.max_tier_id.value
                 )
             criteria_or_conditions.append(and_(*criteria_conditions))
-
-        base_conditions = [
-            ProblemTagModel.tag_id == tag_id.value,
-            ProblemModel.solved_user_count >= min_solved_count,
-        ]
-
-        if exclude_ids:
-            base_conditions.append(
-                ProblemModel.problem_id.notin_(exclude_ids)
-            )
-
-        # OR로 각 레벨 기준을 결합
-        base_conditions.append(or_(*criteria_or_conditions))
-
-        base_stmt = (
-            select(ProblemModel)
-            .join(
-                tier_range_stmt,
-                ProblemModel.problem_tier_level == tier_range_stmt.c.tier,
-            )
-            .join(
-                ProblemTagModel,
-                ProblemModel.problem_id == ProblemTagModel.problem_id,
-            )
-            .where(and_(*base_conditions))
-        )
-
-        # 우선순위 문제 먼저 시도
-        if priority_ids:
-            priority_stmt = (
-                base_stmt
-                .where(ProblemModel.problem_id.in_(priority_ids))
-                .limit(1)
-            )
-
-            priority_result = await self.session.execute(priority_stmt)
-            priority_problem = priority_result.scalar_one_or_none()
-
-            if priority_problem:
-                problems = await self._attach_tags_and_map_to_entities([priority_problem])
-                return problems[0] if problems else None
-
-        final_stmt = base_stmt.order_by(func.rand()).limit(1)
-        result = await self.session.execute(final_stmt)
-        problem_model = result.scalar_one_or_none()
-
-        if not problem_model:
-            return None
-
-        problems = await self._attach_tags_and_map_to_entities([problem_model])
-        return problems[0] if problems else None
\ No newline at end of file
+        return or_(*criteria_or_conditions)
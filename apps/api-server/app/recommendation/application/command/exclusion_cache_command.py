@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class InvalidateExclusionCacheCommand(BaseModel):
+    """추천 제외 비트맵 캐시 무효화 명령 (각 이벤트 페이로드의 공통 필드만 사용)"""
+    user_account_id: int = Field(..., description="유저 계정 ID")
+    bj_account_id: str | None = Field(None, description="백준 계정 ID")
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+
+class InvalidateSkillProfileCommand(BaseModel):
+    """유저 숙련도 프로필(태그 통계) 캐시 무효화 명령 (각 이벤트 페이로드의 공통 필드만 사용)"""
+    user_account_id: int = Field(..., description="유저 계정 ID")
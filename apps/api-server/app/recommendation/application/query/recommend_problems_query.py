@@ -44,3 +44,4 @@ class RecommendedProblemQuery(BaseModel):
 class RecommendProblemsQuery(BaseModel):
     """문제 추천 쿼리"""
     problems: list[RecommendedProblemQuery] = Field(..., description="추천 문제 목록")
+    trace_id: str | None = Field(None, description="추천 설명 트레이스 ID (트레이스가 기록된 요청만)")
@@ -0,0 +1,87 @@
+import logging
+
+from app.activity.domain.entity.user_activity import UserActivity
+from app.baekjoon.domain.repository.problem_history_repository import ProblemHistoryRepository
+from app.common.domain.vo.collections import ProblemIdBitmap
+from app.common.domain.vo.identifiers import BaekjoonAccountId, UserAccountId
+from app.common.infra.event.decorators import event_handler, event_register_handlers
+from app.core.database import run_after_commit
+from app.recommendation.application.command.exclusion_cache_command import InvalidateExclusionCacheCommand
+from app.recommendation.domain.event.cache_invalidation import SOLVED_DATA_CHANGED_EVENTS
+from app.recommendation.domain.gateway.exclusion_bitmap_gateway import ExclusionBitmapGateway
+
+logger = logging.getLogger(__name__)
+
+
+@event_register_handlers()
+class ExclusionCacheService:
+    """추천 제외 비트맵 조회/무효화 서비스
+
+    - 조회: 캐시 hit이면 그대로, miss면 DB에서 만들어 캐시에 저장 (gateway가 없으면 매번 생성)
+    - 무효화: 풀이/밴 기록이나 백준 풀이 이력이 바뀌는 이벤트를 구독해 해당 유저(및 백준 계정) 캐시 삭제
+    """
+
+    def __init__(
+        self,
+        problem_history_repository: ProblemHistoryRepository,
+        exclusion_bitmap_gateway: ExclusionBitmapGateway | None = None,
+    ):
+        self.problem_history_repository = problem_history_repository
+        self.exclusion_bitmap_gateway = exclusion_bitmap_gateway
+
+    async def load_user_exclusion(
+        self,
+        user_account_id: UserAccountId,
+        bj_account_id: BaekjoonAccountId,
+        user_activity: UserActivity,
+    ) -> ProblemIdBitmap:
+        """직접 기록한 풀이 ∪ 밴 문제 ∪ 백준 풀이 이력 비트맵"""
+        if self.exclusion_bitmap_gateway is not None:
+            cached = await self.exclusion_bitmap_gateway.get_user_exclusion(user_account_id.value)
+            if cached is not None:
+                return cached
+
+        history = await self.load_solved_history(bj_account_id)
+        recorded_ids = user_activity.solved_problem_ids | user_activity.banned_problem_ids
+        bitmap = history.with_values(pid.value for pid in recorded_ids)
+
+        if self.exclusion_bitmap_gateway is not None:
+            await self.exclusion_bitmap_gateway.store_user_exclusion(user_account_id.value, bitmap)
+        return bitmap
+
+    async def load_solved_history(self, bj_account_id: BaekjoonAccountId) -> ProblemIdBitmap:
+        """백준 계정 풀이 이력(problem_history) 비트맵"""
+        if self.exclusion_bitmap_gateway is not None:
+            cached = await self.exclusion_bitmap_gateway.get_solved_history(bj_account_id.value)
+            if cached is not None:
+                return cached
+
+        solved_ids = await self.problem_history_repository.find_solved_ids_by_bj_account_id(bj_account_id)
+        bitmap = ProblemIdBitmap.from_values(solved_ids or ())
+
+        if self.exclusion_bitmap_gateway is not None:
+            await self.exclusion_bitmap_gateway.store_solved_history(bj_account_id.value, bitmap)
+        return bitmap
+
+    @event_handler(SOLVED_DATA_CHANGED_EVENTS)
+    async def invalidate(self, command: InvalidateExclusionCacheCommand) -> None:
+        """발행 트랜잭션이 commit된 뒤에 삭제
+
+        BATCH_SYNC_COMPLETED / LINK_BAEKJOON_ACCOUNT_REQUESTED처럼 트랜잭션 안에서 동기 발행되는 이벤트에서
+        바로 지우면, 그 사이 다른 추천 요청이 commit 전 데이터로 비트맵을 다시 채울 수 있다.
+        """
+        gateway = self.exclusion_bitmap_gateway
+        if gateway is None:
+            return
+
+        async def _invalidate() -> None:
+            await gateway.invalidate(
+                user_account_id=command.user_account_id,
+                bj_account_id=command.bj_account_id,
+            )
+            logger.debug(
+                f"[ExclusionCacheService] 제외 비트맵 무효화: "
+                f"user={command.user_account_id}, bj={command.bj_account_id}"
+            )
+
+        await run_after_commit(_invalidate)
@@ -0,0 +1,70 @@
+import logging
+
+from app.baekjoon.domain.entity.baekjoon_account import BaekjoonAccount
+from app.baekjoon.domain.repository.baekjoon_account_repository import BaekjoonAccountRepository
+from app.common.domain.enums import SkillCode
+from app.common.domain.vo.identifiers import UserAccountId
+from app.common.infra.event.decorators import event_handler, event_register_handlers
+from app.core.database import run_after_commit
+from app.recommendation.application.command.skill_profile_command import InvalidateSkillProfileCommand
+from app.recommendation.domain.entity.tag_skill import TagSkill
+from app.recommendation.domain.event.cache_invalidation import SOLVED_DATA_CHANGED_EVENTS
+from app.recommendation.domain.gateway.tag_stat_cache_gateway import TagStatCacheGateway
+from app.recommendation.domain.repository.tag_skill_repository import TagSkillRepository
+from app.recommendation.domain.vo.user_skill_profile import UserSkillProfile
+
+logger = logging.getLogger(__name__)
+
+
+@event_register_handlers()
+class SkillProfileService:
+    """유저 숙련도 프로필 조회/무효화 서비스
+
+    - 조회: 유저 태그 통계(캐시 hit이면 그대로, miss면 get_tag_stats 결과 저장)와 활성 TagSkill로 프로필 생성
+    - 무효화: 태그 통계 캐시는 유저 단위 키 하나뿐이므로 백준 계정과 무관하게 user_account_id 키만 삭제
+    """
+
+    def __init__(
+        self,
+        baekjoon_account_repository: BaekjoonAccountRepository,
+        tag_skill_repository: TagSkillRepository,
+        tag_stat_cache_gateway: TagStatCacheGateway | None = None,
+    ):
+        self.baekjoon_account_repository = baekjoon_account_repository
+        self.tag_skill_repository = tag_skill_repository
+        self.tag_stat_cache_gateway = tag_stat_cache_gateway
+
+    async def load(self, user_account_id: UserAccountId, bj_account: BaekjoonAccount) -> UserSkillProfile:
+        """유저의 태그별 현재/다음 숙련도 프로필"""
+        stats = None
+        if self.tag_stat_cache_gateway is not None:
+            stats = await self.tag_stat_cache_gateway.get(user_account_id.value)
+
+        if stats is None:
+            # user_account_id를 전달하여 streak이 없을 때 problem_record 날짜 사용
+            stats = await self.baekjoon_account_repository.get_tag_stats(bj_account.bj_account_id, user_account_id)
+            if self.tag_stat_cache_gateway is not None:
+                await self.tag_stat_cache_gateway.store(user_account_id.value, stats)
+
+        all_tag_skills = await self.tag_skill_repository.find_all_active()
+        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill] = {
+            (ts.tag_id.value, ts.skill_code): ts for ts in all_tag_skills if ts.tag_id
+        }
+        return UserSkillProfile.build(stats, tag_skills_dict, bj_account.current_tier_id)
+
+    @event_handler(SOLVED_DATA_CHANGED_EVENTS)
+    async def invalidate(self, command: InvalidateSkillProfileCommand) -> None:
+        """태그 통계 캐시 삭제
+
+        캐시 원본인 bj_account_tag_stat 행은 연동/동기화 트랜잭션 안에서 다시 계산되므로,
+        commit 전에 지우면 이전 통계로 캐시가 다시 채워질 수 있어 commit 뒤에 삭제한다.
+        """
+        gateway = self.tag_stat_cache_gateway
+        if gateway is None:
+            return
+
+        async def _invalidate() -> None:
+            await gateway.invalidate(command.user_account_id)
+            logger.debug(f"[SkillProfileService] 태그 통계 캐시 무효화: user={command.user_account_id}")
+
+        await run_after_commit(_invalidate)
@@ -0,0 +1,20 @@
+from app.core.error_codes import ErrorCode
+from app.core.exception import APIException
+from app.recommendation.domain.gateway.recommendation_trace_gateway import RecommendationTraceGateway
+
+
+class GetRecommendationTraceUsecase:
+    """추천 설명 트레이스 조회 (ADMIN)"""
+
+    def __init__(self, recommendation_trace_gateway: RecommendationTraceGateway):
+        self.recommendation_trace_gateway = recommendation_trace_gateway
+
+    async def execute(self, trace_id: str) -> dict:
+        trace = await self.recommendation_trace_gateway.find_by_id(trace_id)
+        if trace is None:
+            raise APIException(ErrorCode.RECOMMENDATION_TRACE_NOT_FOUND)
+        return trace.to_dict()
+
+    async def find_recent(self, limit: int = 20) -> list[dict]:
+        traces = await self.recommendation_trace_gateway.find_recent(limit)
+        return [trace.to_dict() for trace in traces]
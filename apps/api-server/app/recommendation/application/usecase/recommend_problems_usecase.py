@@ -1,12 +1,12 @@
 from datetime import datetime
+import logging
 import random
 from app.activity.domain.entity.user_activity import UserActivity
 from app.activity.domain.repository.user_activity_repository import UserActivityRepository
 from app.baekjoon.domain.repository.baekjoon_account_repository import BaekjoonAccountRepository
 from app.baekjoon.domain.repository.problem_history_repository import ProblemHistoryRepository
-from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
-from app.common.domain.enums import FilterCode, SkillCode, TagLevel, ExclusionMode
-from app.common.domain.vo.collections import ProblemIdSet, TagIdSet
+from app.common.domain.enums import FilterCode, TagLevel, ExclusionMode
+from app.common.domain.vo.collections import ProblemIdBitmap, TagIdSet
 from app.common.domain.vo.identifiers import BaekjoonAccountId, TagId, TargetId, TierId, UserAccountId
 from app.common.domain.vo.primitives import TierRange
 from app.core.database import transactional
@@ -21,22 +21,32 @@ from app.recommendation.application.query.recommend_problems_query import (
 )
 from app.common.domain.entity.domain_event import DomainEvent
 from app.common.domain.service.event_publisher import DomainEventBus
+from app.recommendation.application.service.exclusion_cache_service import ExclusionCacheService
+from app.recommendation.application.service.skill_profile_service import SkillProfileService
 from app.recommendation.domain.entity.level_filter import LevelFilter
-from app.recommendation.domain.entity.tag_skill import TagSkill
+from app.recommendation.domain.entity.recommendation_trace import RecommendationTrace
 from app.recommendation.domain.event.payloads import RecommendationCompletedPayload
+from app.recommendation.domain.gateway.recommendation_trace_gateway import RecommendationTraceGateway
 from app.recommendation.domain.repository.level_filter_repository import LevelFilterRepository
 from app.recommendation.domain.repository.tag_skill_repository import TagSkillRepository
+from app.recommendation.domain.service.tag_scorer import TagScorer
 from app.recommendation.domain.vo.recommendation_candidate import RecommendationCandidate
-from app.recommendation.domain.vo.search_criteria import SearchCriteria
-from app.recommendation.domain.vo.tag_candidate import TagCandidate, TagCandidates, TagStatsMap
+from app.recommendation.domain.vo.search_criteria import SearchCriteria, TagSearchCriteria
+from app.recommendation.domain.vo.tag_candidate import TagCandidate, TagCandidates
+from app.recommendation.domain.vo.user_skill_profile import TagSkillLevel, UserSkillProfile
 from app.tag.domain.entity.tag import Tag
 from app.tag.domain.repository.tag_repository import TagRepository
 from app.target.domain.repository.target_repository import TargetRepository
-from app.tier.domain.repository.tier_repository import TierRepository
+from app.tier.domain.vo.tier_table import TierTable
 from app.user.domain.repository.user_account_repository import UserAccountRepository
 
+logger = logging.getLogger(__name__)
+
 
 class RecommendProblemsUsecase:
+    _TAG_OVERSAMPLE_FACTOR = 4  # 남은 추천 수 대비 미리 뽑아둘 태그 수 배율
+    _MAX_FETCH_ROUNDS = 2  # 후보 일괄 조회 최대 횟수 (DB 왕복 상한)
+
     def __init__(self,
                  user_account_repository: UserAccountRepository,
                  baekjoon_account_repository: BaekjoonAccountRepository,
@@ -45,10 +55,14 @@ class RecommendProblemsUsecase:
                  tag_skill_repository: TagSkillRepository,
                  recommend_filter_repository: LevelFilterRepository,
                  problem_repository: ProblemRepository,
-                 tier_repository: TierRepository,
                  problem_history_repository: ProblemHistoryRepository,
                  target_repository: TargetRepository,
                  domain_event_bus: DomainEventBus | None = None,
+                 tier_table: TierTable | None = None,
+                 exclusion_cache_service: ExclusionCacheService | None = None,
+                 skill_profile_service: SkillProfileService | None = None,
+                 recommendation_trace_gateway: RecommendationTraceGateway | None = None,
+                 trace_sample_rate: float = 0.0,
                 ):
         self.user_account_repository = user_account_repository
         self.baekjoon_account_repository = baekjoon_account_repository
@@ -57,10 +71,14 @@ class RecommendProblemsUsecase:
         self.tag_skill_repository = tag_skill_repository
         self.recommend_filter_repository = recommend_filter_repository
         self.problem_repository = problem_repository
-        self.tier_repository = tier_repository
         self.problem_history_repository = problem_history_repository
         self.target_repository = target_repository
         self.domain_event_bus = domain_event_bus
+        self.tier_table = tier_table or TierTable.static()
+        self.exclusion_cache_service = exclusion_cache_service or ExclusionCacheService(problem_history_repository)
+        self.skill_profile_service = skill_profile_service or SkillProfileService(baekjoon_account_repository, tag_skill_repository)
+        self.recommendation_trace_gateway = recommendation_trace_gateway
+        self.trace_sample_rate = trace_sample_rate
         self.skill_name_map = {
             "AD": "ADVANCED",
             "MAS": "MASTER",
@@ -75,28 +93,34 @@ class RecommendProblemsUsecase:
         tag_filter_codes: list[str] | None = None,
         count: int = 3,
         exclusion_mode: ExclusionMode = ExclusionMode.LENIENT,
-        additional_excluded_problem_ids: set[int] | None = None,
+        additional_excluded_problem_ids: set[int] | ProblemIdBitmap | None = None,
         study_id: int | None = None,
         target_user_account_id: int | None = None,
         recommend_all_unsolved: bool = False,
+        trace_requested: bool = False,
     ) -> RecommendProblemsQuery:
+        trace = self._start_trace(
+            user_account_id,
+            trace_requested,
+            {
+                "count": count,
+                "exclusion_mode": exclusion_mode.value,
+                "level_filter_codes": [c.value for c in level_filter_codes] if level_filter_codes else [],
+                "tag_filter_codes": tag_filter_codes or [],
+                "study_id": study_id,
+            },
+        )
+
         # 1. 초기 데이터 로딩
         bj_account = await self.baekjoon_account_repository.find_by_user_id(user_account_id)
         if bj_account is None:
             from app.core.error_codes import ErrorCode
             from app.core.exception import APIException
             raise APIException(ErrorCode.BAEKJOON_USER_NOT_FOUND)
-        # user_account_id를 전달하여 streak이 없을 때 problem_record 날짜 사용
-        raw_tag_stats = await self.baekjoon_account_repository.get_tag_stats(
-            bj_account.bj_account_id,
-            user_account_id
-        )
+        # 태그 통계 + 숙련도 요구사항으로 모든 태그의 현재/다음 숙련도를 한 번에 판별 (유저별 캐시)
+        skill_profile: UserSkillProfile = await self.skill_profile_service.load(user_account_id, bj_account)
         user_activity: UserActivity = await self.user_activity_repository.find_by_user_account_id(user_account_id)
         all_tags: list[Tag] = await self.tag_repository.find_active_tags_with_relations()
-        all_tag_skills = await self.tag_skill_repository.find_all_active()
-        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill] = {
-            (ts.tag_id.value, ts.skill_code): ts for ts in all_tag_skills if ts.tag_id
-        }
 
         # 1-1. Fetch user account to get active target (Requirement 4)
         user_account = await self.user_account_repository.find_by_id(user_account_id)
@@ -112,7 +136,6 @@ class RecommendProblemsUsecase:
                     active_target_name = target.display_name
 
         # 2. 데이터 구조화 (O(1) 조회를 위해)
-        stats_map: TagStatsMap = TagStatsMap.from_stats(raw_tag_stats)
         excluded_tag_ids: TagIdSet = user_activity.excluded_tag_ids
         
         all_tags_dict: dict[int, Tag] = {}
@@ -123,21 +146,18 @@ class RecommendProblemsUsecase:
                 if active_target_id and tag.targets and any(target.target_id.value == active_target_id.value for target in tag.targets):
                     target_tag_ids.add(tag.tag_id.value)
 
-        # DEBUG: 타겟 태그 정보 출력
-        if target_tag_ids:
-            target_tag_names = [all_tags_dict.get(tid).tag_display_name for tid in target_tag_ids if all_tags_dict.get(tid)]
-            print(f"[DEBUG TARGET] User has active target: {active_target_id}")
-            print(f"[DEBUG TARGET] Target tag count: {len(target_tag_ids)}")
-            print(f"[DEBUG TARGET] Target tags: {target_tag_names[:5]}...")  # 처음 5개만 표시
-
-        # DEBUG: Excluded 태그 출력
-        if excluded_tag_ids:
-            excluded_tag_names = [all_tags_dict.get(tid.value).tag_display_name for tid in excluded_tag_ids if all_tags_dict.get(tid.value)]
-            print(f"[DEBUG EXCLUDED] 제외된 태그 ({len(excluded_tag_ids)}개): {excluded_tag_names}")
-            print(f"[DEBUG EXCLUDED] Exclusion Mode: {exclusion_mode.value}\n")
+        if trace:
+            trace.record_target(
+                active_target_id.value,
+                [all_tags_dict[tid].tag_display_name for tid in target_tag_ids],
+            )
+            trace.record_excluded_tags(
+                [all_tags_dict[tid.value].tag_display_name for tid in excluded_tag_ids if tid.value in all_tags_dict]
+            )
 
         # 3. 태그 후보 필터링 및 스코어링
-        candidates_list: list[TagCandidate] = []
+        eligible_tags: list[Tag] = []
+        eligible_levels: list[TagSkillLevel] = []
         for tag in all_tags:
             # (1) BAN 및 유저 필터 제외
             # 제외된 태그는 메인 추천 태그로 사용하지 않음
@@ -146,143 +166,147 @@ class RecommendProblemsUsecase:
             if tag_filter_codes and tag.code not in tag_filter_codes: continue
 
             # (2) 선수 태그 조건 검사 (유저가 태그를 직접 선택한 경우 제외)
-            if not tag_filter_codes and not self._is_pre_requisite_satisfied(tag, stats_map, bj_account.current_tier_id, tag_skills_dict):
+            if not tag_filter_codes and not self._is_pre_requisite_satisfied(tag, skill_profile):
                 continue
 
-            # (3) 스코어 계산을 위한 Stat 보정 (기록 없는 태그 포함)
-            stat = stats_map.get_or_empty(tag.tag_id)
-            score = self._calculate_tag_score(stat, user_activity, tag_skills_dict, bj_account.current_tier_id, target_tag_ids)
+            # (3) 스코어 계산 대상 (기록 없는 태그는 빈 통계로 포함)
+            eligible_tags.append(tag)
+            eligible_levels.append(skill_profile.level(tag.tag_id))
 
-            # DEBUG: 타겟 가중치 확인
-            if target_tag_ids and stat.tag_id.value in target_tag_ids:
-                print(f"[DEBUG TARGET] Tag '{tag.tag_display_name}' (ID: {tag.tag_id.value}) matches target! Score: {score}")
+        # (4) 후보 태그 점수를 한 번에 계산
+        tag_scorer = TagScorer(target_tag_ids)
+        tag_scores = tag_scorer.score_all(eligible_levels)
+        candidates_list: list[TagCandidate] = []
+        for tag, level, tag_score in zip(eligible_tags, eligible_levels, tag_scores):
+            if trace:
+                trace.record_tag_score(
+                    tag.tag_display_name,
+                    tag_score.review,
+                    tag_score.level_up,
+                    tag_score.target,
+                    is_target=tag.tag_id.value in target_tag_ids,
+                )
+            candidates_list.append(TagCandidate.create(tag, level.stat, tag_score.total))
 
-            candidates_list.append(TagCandidate.create(tag, stat, score))
-        
         # 4. 가중치 랜덤 샘플링 (다양성 확보)
         # 점수가 높을수록 선택 확률이 높지만, 낮은 점수도 선택 가능
         all_candidates: TagCandidates = TagCandidates.from_list(candidates_list)
 
-        # DEBUG: 전체 후보 점수 출력 (상위 20개)
-        sorted_candidates = sorted(candidates_list, key=lambda c: c.score, reverse=True)
-        print("\n========== [DEBUG] 태그 점수 Top 20 ==========")
-        for i, candidate in enumerate(sorted_candidates[:20], 1):
-            target_marker = " 🎯 [TARGET]" if target_tag_ids and candidate.stat.tag_id.value in target_tag_ids else ""
-            print(f"{i}. {candidate.tag.tag_display_name:20s} | Score: {candidate.score:6.1f}{target_marker}")
-        print("=" * 50)
-
-        # DEBUG: 상위 5개 점수 구성 자세히 보기
-        print("\n========== [DEBUG] 점수 구성 (Top 5) ==========")
-        for i, candidate in enumerate(sorted_candidates[:5], 1):
-            # 점수 다시 계산해서 breakdown 얻기
-            stat = candidate.stat
-
-            # 복습 주기 점수
-            review_score = 0.0
-            if stat.last_solved_date:
-                days_diff = (datetime.now().date() - stat.last_solved_date).days
-                current_skill = self._match_tag_skill(stat, bj_account.current_tier_id, tag_skills_dict)
-                if current_skill and days_diff >= current_skill.recommendation_period:
-                    excess_days = days_diff - current_skill.recommendation_period
-                    review_score = min(excess_days * 2 + 10, 50)
-            else:
-                review_score = 40 if stat.solved_problem_count == 0 else 20 # 풀었는데 기록이 없는 경우 20
-
-            # 승급 임박
-            level_up_bonus = self._calculate_level_up_bonus(stat, bj_account.current_tier_id, tag_skills_dict)
-
-            # 타겟
-            target_score = 30 if (target_tag_ids and stat.tag_id.value in target_tag_ids) else 0
-
-            print(f"\n{i}. {candidate.tag.tag_display_name} (Total: {candidate.score:.1f})")
-            print(f"   ├─ 복습주기: {review_score:.1f}점")
-            print(f"   ├─ 승급임박: {level_up_bonus:.1f}점")
-            print(f"   └─ 타겟:     {target_score:.1f}점")
-        print("=" * 50 + "\n")
-
-        # 4-1. Fetch actual solved problems from Baekjoon (Requirement 2 - 한 번만 조회)
-        history_solved_ids_raw = await self.problem_history_repository.find_solved_ids_by_bj_account_id(
-            bj_account.bj_account_id
+        # 4-1. 제외 문제 비트맵 (직접 기록 풀이 ∪ 밴 ∪ 백준 풀이 이력, Requirement 2) - 유저별 캐시 사용
+        excluded_problem_bitmap = await self.exclusion_cache_service.load_user_exclusion(
+            user_account_id,
+            bj_account.bj_account_id,
+            user_activity,
         )
-        history_solved_ids = ProblemIdSet.from_values(history_solved_ids_raw) if history_solved_ids_raw else ProblemIdSet.empty()
+        if isinstance(additional_excluded_problem_ids, ProblemIdBitmap):
+            excluded_problem_bitmap = excluded_problem_bitmap | additional_excluded_problem_ids
+        elif additional_excluded_problem_ids:
+            excluded_problem_bitmap = excluded_problem_bitmap.with_values(additional_excluded_problem_ids)
 
-        # 5. 메인 추출 루프 - 가중치 랜덤 샘플링으로 count개 채우기
+        # 5. 메인 추출 루프 - 태그 시퀀스를 미리 넉넉히 샘플링하고 후보 문제를 태그별로 일괄 조회
         recommended_results: list[RecommendationCandidate] = []
         recommended_problem_ids: set[int] = set()  # 이미 추천한 문제 ID 추적
-        sampled_tags_log: list[tuple[str, bool]] = []  # 샘플링된 태그 로그 (태그명, 성공여부)
         failed_attempts = 0
         max_failed_attempts = count * 20  # 무한 루프 방지
 
         effective_filter_codes = level_filter_codes if len(level_filter_codes) != 0 else [FilterCode.NORMAL]
         display_filter_code = effective_filter_codes[0]  # 표시 목적용
 
-        while len(recommended_results) < count and failed_attempts < max_failed_attempts:
-            # 가중치 기반으로 태그 1개 랜덤 선택
-            sampled = all_candidates.weighted_random_sample(1)
-            if len(sampled) == 0:
-                break
+        rejected_problem_ids: set[int] = set()  # STRICT 모드에서 걸러진 문제 (다음 라운드 재조회 방지)
+        excluded_tag_ids_list = [TagId(tid.value) for tid in excluded_tag_ids]
 
-            tag_candidate = list(sampled)[0]
+        criteria_cache: dict[int, list[SearchCriteria]] = {}
 
-            criteria_list = await self._get_search_criteria_list(
-                user_tier=bj_account.current_tier_id,
-                tag_stat=tag_candidate.stat,
-                filter_codes=effective_filter_codes,
-                tag_skills_dict=tag_skills_dict
+        for _ in range(self._MAX_FETCH_ROUNDS):
+            remaining = count - len(recommended_results)
+            remaining_attempts = max_failed_attempts - failed_attempts
+            if remaining <= 0 or remaining_attempts <= 0:
+                break
+
+            # 가중치 기반으로 태그 시퀀스를 한 번에 샘플링 (중복 허용, 1개씩 뽑던 것과 같은 분포)
+            drawn = all_candidates.weighted_random_choices(
+                min(remaining * self._TAG_OVERSAMPLE_FACTOR, remaining + remaining_attempts)
             )
+            if not drawn:
+                break
 
-            if not criteria_list:
-                sampled_tags_log.append((tag_candidate.tag.tag_display_name, False))
-                failed_attempts += 1
-                continue
+            # 뽑힌 태그별 검색 조건을 미리 도출 (태그당 1회)
+            draw_counts: dict[int, int] = {}
+            tag_criteria_list: list[TagSearchCriteria] = []
+            for tag_candidate in drawn:
+                tag_id_value = tag_candidate.tag.tag_id.value
+                draw_counts[tag_id_value] = draw_counts.get(tag_id_value, 0) + 1
+                if draw_counts[tag_id_value] > 1:
+                    continue
 
-            # 태그 직접 지정 시 tier_range 무시 (skill rate만 사용)
-            if tag_filter_codes:
-                criteria_list = [
-                    SearchCriteria(
-                        tier_range=TierRange(min_tier_id=None, max_tier_id=None),
-                        min_skill_rate=c.min_skill_rate,
-                        max_skill_rate=c.max_skill_rate
+                if tag_id_value not in criteria_cache:
+                    criteria_list = await self._get_search_criteria_list(
+                        user_tier=bj_account.current_tier_id,
+                        level=skill_profile.level(tag_candidate.tag.tag_id),
+                        filter_codes=effective_filter_codes,
                     )
-                    for c in criteria_list
-                ]
-
-            # Merge all exclusion sources (Requirement 2: including problem_history)
-            excluded_problem_ids_vo = (
-                user_activity.solved_problem_ids |  # Manual tracking (ProblemRecord)
-                user_activity.banned_problem_ids |  # Banned problems
-                history_solved_ids                   # Actual Baekjoon solves
+                    # 태그 직접 지정 시 tier_range 무시 (skill rate만 사용)
+                    if tag_filter_codes:
+                        criteria_list = [
+                            SearchCriteria(
+                                tier_range=TierRange(min_tier_id=None, max_tier_id=None),
+                                min_skill_rate=c.min_skill_rate,
+                                max_skill_rate=c.max_skill_rate
+                            )
+                            for c in criteria_list
+                        ]
+                    criteria_cache[tag_id_value] = criteria_list
+
+                if criteria_cache[tag_id_value]:
+                    tag_criteria_list.append(TagSearchCriteria(
+                        tag_id=tag_candidate.tag.tag_id,
+                        criteria_list=tuple(criteria_cache[tag_id_value]),
+                        min_solved_count=tag_candidate.tag.min_solved_person_count,
+                    ))
+
+            # 태그별 후보를 한 번에 조회 (태그가 여러 번 뽑혔으면 그만큼 후보를 받아둔다)
+            candidate_pools = await self.problem_repository.find_recommended_candidates(
+                tag_criteria_list=tag_criteria_list,
+                exclude_ids=excluded_problem_bitmap.with_values(recommended_problem_ids | rejected_problem_ids),
+                per_tag_limit=min(max(draw_counts.values()), remaining + remaining_attempts),
             )
 
-            # Convert ProblemIdSet to set[int] for repository
-            excluded_problem_ids = {pid.value for pid in excluded_problem_ids_vo}
-            excluded_problem_ids |= recommended_problem_ids  # 이미 추천한 문제도 제외
-            if additional_excluded_problem_ids:
-                excluded_problem_ids |= additional_excluded_problem_ids
-
-            problem = await self.problem_repository.find_recommended_problem(
-                tag_id=tag_candidate.tag.tag_id,
-                criteria_list=criteria_list,
-                min_solved_count=tag_candidate.tag.min_solved_person_count,
-                exclude_ids=excluded_problem_ids,
-                priority_ids=set()
-            )
-            if problem:
+            # 뽑힌 순서대로 로컬 후보 풀에서 소비
+            for tag_candidate in drawn:
+                if len(recommended_results) >= count or failed_attempts >= max_failed_attempts:
+                    break
+
+                pool = candidate_pools.get(tag_candidate.tag.tag_id.value, [])
+                problem = None
+                while pool:
+                    pooled = pool.pop()
+                    if pooled.problem_id.value not in recommended_problem_ids:
+                        problem = pooled
+                        break
+
+                if problem is None:
+                    if trace:
+                        trace.record_attempt(tag_candidate.tag.tag_display_name, False, reason="NO_CANDIDATE")
+                    failed_attempts += 1
+                    continue
+
                 # Requirement 3: STRICT mode filtering
                 if exclusion_mode == ExclusionMode.STRICT:
-                    excluded_tag_ids_list = [TagId(tid.value) for tid in excluded_tag_ids]
                     if problem.has_any_tag(excluded_tag_ids_list):
-                        problem_tag_names = [all_tags_dict.get(tag.tag_id.value).tag_display_name for tag in problem.tags if all_tags_dict.get(tag.tag_id.value)]
-                        print(f"[DEBUG STRICT] ❌ 문제 {problem.problem_id.value} 제외됨 (excluded 태그 포함): {problem_tag_names}")
-                        sampled_tags_log.append((tag_candidate.tag.tag_display_name, False))
+                        rejected_problem_ids.add(problem.problem_id.value)
+                        if trace:
+                            trace.record_attempt(
+                                tag_candidate.tag.tag_display_name,
+                                False,
+                                problem_id=problem.problem_id.value,
+                                reason="STRICT_EXCLUDED_TAG",
+                            )
                         failed_attempts += 1
                         continue  # Skip this problem, try next candidate
 
                 reasons = self._generate_reasons(
-                    tag_candidate.stat,
+                    skill_profile.level(tag_candidate.tag.tag_id),
                     tag_candidate.tag.tag_display_name,
-                    tag_skills_dict,
-                    bj_account.current_tier_id,
                     display_filter_code,
                     target_tag_ids if isinstance(target_tag_ids, set) else set(),
                     active_target_name
@@ -295,36 +319,38 @@ class RecommendProblemsUsecase:
                 )
                 recommended_results.append(recommendation)
                 recommended_problem_ids.add(problem.problem_id.value)  # 중복 방지를 위해 추가
-                sampled_tags_log.append((tag_candidate.tag.tag_display_name, True))
-            else:
-                sampled_tags_log.append((tag_candidate.tag.tag_display_name, False))
-                failed_attempts += 1
-
-        # DEBUG: 샘플링된 태그 순서 출력
-        print("\n========== [DEBUG] 샘플링된 태그 순서 ==========")
-        success_count = sum(1 for _, success in sampled_tags_log if success)
-        print(f"총 샘플링 횟수: {len(sampled_tags_log)}회 (성공: {success_count}, 실패: {len(sampled_tags_log) - success_count})")
-        for i, (tag_name, success) in enumerate(sampled_tags_log, 1):
-            status = "✅" if success else "❌"
-            print(f"{i}. {status} {tag_name}")
-        print("=" * 50 + "\n")
-
-        # DEBUG: 최종 추천 결과 출력
-        print(f"\n========== [DEBUG] 최종 추천된 문제 (요청: {count}개, 실제: {len(recommended_results)}개) ==========")
-        for i, rec in enumerate(recommended_results, 1):
-            problem_tag_names = [all_tags_dict.get(tag.tag_id.value).tag_display_name for tag in rec.problem.tags if all_tags_dict.get(tag.tag_id.value)]
-            print(f"{i}. [{rec.problem.problem_id.value}] {rec.problem.title}")
-            print(f"   메인 태그: {rec.tag_name}")
-            print(f"   전체 태그: {problem_tag_names}")
-            print(f"   추천 이유: {rec.reasons[0] if rec.reasons else 'N/A'}")
-        print("=" * 50 + "\n")
-
-        # 6. Query 객체로 변환
+                if trace:
+                    trace.record_attempt(
+                        tag_candidate.tag.tag_display_name,
+                        True,
+                        problem_id=problem.problem_id.value,
+                    )
+
+        if trace:
+            for rec in recommended_results:
+                trace.record_result(
+                    problem_id=rec.problem.problem_id.value,
+                    title=rec.problem.title,
+                    tag_name=rec.tag_name,
+                    tag_names=[
+                        all_tags_dict[tag.tag_id.value].tag_display_name
+                        for tag in rec.problem.tags
+                        if tag.tag_id.value in all_tags_dict
+                    ],
+                    reasons=rec.reasons,
+                )
+            await self.recommendation_trace_gateway.save(trace)
+            logger.info(
+                f"추천 트레이스 저장 - trace_id: {trace.trace_id}, user: {user_account_id.value}, "
+                f"요청: {count}개, 실제: {len(recommended_results)}개"
+            )
+
+        # 6. Query 객체로 변환 (티어 이름은 인메모리 조회표에서 일괄 변환)
+        tier_map = self.tier_table.codes(c.problem.tier_level.value for c in recommended_results)
         problem_queries = []
         for candidate in recommended_results:
             # 6-1. Tier 정보 조회
-            tier = await self.tier_repository.find_by_level(candidate.problem.tier_level.value)
-            tier_name = tier.tier_code if tier else "Unknown"
+            tier_name = tier_map[candidate.problem.tier_level.value]
 
             # 6-2. Tag 정보 조회 및 정렬 (Requirement 1)
             tag_infos = []
@@ -379,7 +405,7 @@ class RecommendProblemsUsecase:
             )
             problem_queries.append(problem_query)
 
-        result = RecommendProblemsQuery(problems=problem_queries)
+        result = RecommendProblemsQuery(problems=problem_queries, trace_id=trace.trace_id if trace else None)
 
         if self.domain_event_bus:
             await self.domain_event_bus.publish(
@@ -402,16 +428,24 @@ class RecommendProblemsUsecase:
 
         return result
 
+    def _start_trace(self, user_account_id: UserAccountId, trace_requested: bool, params: dict) -> RecommendationTrace | None:
+        """명시적으로 요청되었거나 샘플링에 걸린 요청에 대해서만 트레이스를 생성"""
+        if self.recommendation_trace_gateway is None:
+            return None
+        if not trace_requested and random.random() >= self.trace_sample_rate:
+            return None
+        return RecommendationTrace.create(user_account_id.value, params)
+
     async def _get_search_criteria_list(
         self,
         user_tier: TierId,
-        tag_stat: TagAccountStat,
+        level: TagSkillLevel,
         filter_codes: list[FilterCode],
-        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill]
     ) -> list[SearchCriteria]:
         """숙련도 판별 및 필터 엔티티를 통한 검색 조건 도출 (복수 레벨 지원)"""
-        # 1. 숙련도 매칭
-        current_skill = self._match_tag_skill(tag_stat, user_tier, tag_skills_dict)
+        # 1. 숙련도 (프로필에서 판별 완료)
+        tag_stat = level.stat
+        current_skill = level.skill
         if not current_skill:
             return []
 
@@ -446,37 +480,17 @@ class RecommendProblemsUsecase:
 
         return criteria_list
 
-    def _match_tag_skill(self, tag_stat: TagAccountStat, user_tier: TierId, tag_skills_dict: dict[tuple[int, SkillCode], TagSkill]) -> TagSkill | None:
-        """요구사항 비교를 통한 숙련도 판별 (해당 태그의 skill만 검사)"""
-        tag_id_val = tag_stat.tag_id.value
-        highest_tier_val = tag_stat.highest_tier_id.value if tag_stat.highest_tier_id else 0
-
-        # 높은 숙련도부터 검사: MAS → AD → IM
-        for skill_code in [SkillCode.MAS, SkillCode.AD, SkillCode.IM]:
-            skill = tag_skills_dict.get((tag_id_val, skill_code))
-            if not skill:
-                continue
-            req = skill.requirements
-            if (tag_stat.solved_problem_count >= req.min_solved_problem and
-                user_tier.value >= req.min_user_tier.value and
-                highest_tier_val >= req.min_solved_problem_tier.value):
-                return skill
-
-        # 요구사항을 충족하지 못하면 IM 반환 (기본값)
-        return tag_skills_dict.get((tag_id_val, SkillCode.IM))
-
     def _generate_reasons(
         self,
-        tag_stat: TagAccountStat,
+        level: TagSkillLevel,
         tag_name: str,
-        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill],
-        user_tier: TierId,
         filter_code: FilterCode,
         target_tag_ids: set[int] = None,
         target_display_name: str = None
     ) -> list[str]:
         """추천 사유 생성기 (여러 개 반환)"""
         reasons = []
+        tag_stat = level.stat
 
         # 0. 타겟 태그 체크
         if target_tag_ids and tag_stat.tag_id.value in target_tag_ids:
@@ -498,7 +512,7 @@ class RecommendProblemsUsecase:
         # → 복습 주기 체크는 불가능하지만, 승급 임박은 확인 가능
         if not tag_stat.last_solved_date:
             # 승급 임박 체크만 수행
-            level_up_info = self._check_level_up_status(tag_stat, user_tier, tag_skills_dict, tag_name)
+            level_up_info = self._check_level_up_status(level, tag_name)
             if level_up_info:
                 reasons.append(level_up_info)
 
@@ -514,12 +528,12 @@ class RecommendProblemsUsecase:
         days_diff = (datetime.now().date() - tag_stat.last_solved_date).days
 
         # 현재 숙련도를 찾아서 해당 숙련도의 추천 주기를 가져옴
-        current_skill = self._match_tag_skill(tag_stat, user_tier, tag_skills_dict)
+        current_skill = level.skill
         if current_skill and days_diff >= current_skill.recommendation_period:
             reasons.append(f"'{tag_name}' 태그를 안 푼 지 {days_diff}일이 지났어요.")
 
         # 4. 승급 임박 체크
-        level_up_info = self._check_level_up_status(tag_stat, user_tier, tag_skills_dict, tag_name)
+        level_up_info = self._check_level_up_status(level, tag_name)
         if level_up_info:
             reasons.append(level_up_info)
 
@@ -531,134 +545,21 @@ class RecommendProblemsUsecase:
             random.shuffle(reasons)
         return reasons
 
-    _SKILL_CODE_ORDER = {SkillCode.IM: SkillCode.AD, SkillCode.AD: SkillCode.MAS}
-
-    def _check_level_up_status(
-        self,
-        tag_stat: TagAccountStat,
-        user_tier: TierId,
-        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill],
-        tag_name: str
-    ) -> str | None:
+    def _check_level_up_status(self, level: TagSkillLevel, tag_name: str) -> str | None:
         """승급 임박 상태 확인 및 메시지 생성"""
-        current_skill = self._match_tag_skill(tag_stat, user_tier, tag_skills_dict)
-        if not current_skill:
-            return None
-
-        # 같은 태그 내에서 다음 숙련도 결정 (IM→AD, AD→MAS)
-        next_skill_code = self._SKILL_CODE_ORDER.get(current_skill.skill_code)
-        if not next_skill_code:
-            return None
-
-        next_skill = tag_skills_dict.get((tag_stat.tag_id.value, next_skill_code))
-        if not next_skill:
-            return None
-
-        current_solved = tag_stat.solved_problem_count
-        required_solved = next_skill.requirements.min_solved_problem
-        problems_needed = required_solved - current_solved
-
-        if 0 < problems_needed < 5:
-            skill_code = next_skill.skill_code.value
+        # 같은 태그 내 다음 숙련도 (IM→AD, AD→MAS)는 프로필에서 판별 완료
+        problems_needed = level.problems_to_next_skill
+        if problems_needed is not None and 0 < problems_needed < 5:
+            skill_code = level.next_skill.skill_code.value
             return f"'{tag_name}' {problems_needed}문제만 더 풀면 {self.skill_name_map[skill_code]} 달성!"
 
         return None
-    
-    def _is_pre_requisite_satisfied(
-        self,
-        tag: Tag,
-        stats_map: TagStatsMap,
-        user_tier: TierId,
-        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill]
-    ) -> bool:
+
+    def _is_pre_requisite_satisfied(self, tag: Tag, skill_profile: UserSkillProfile) -> bool:
         """선수 태그 조건을 만족하는지 확인 (parent tag 숙련도가 ADVANCED 이상이어야 함)"""
         if not tag.parent_tag_relations:
             return True
-        for relation in tag.parent_tag_relations:
-            parent_stat = stats_map.get(relation.leading_tag_id)
-            if not parent_stat:
-                return False
-            parent_skill = self._match_tag_skill(parent_stat, user_tier, tag_skills_dict)
-            if not parent_skill or parent_skill.skill_code == SkillCode.IM:
-                return False
-        return True
-    
-    def _calculate_tag_score(
-        self,
-        tag_stat: TagAccountStat,
-        user_activity: UserActivity,
-        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill],
-        user_tier: TierId,
-        target_tag_ids: set[int]
-    ) -> float:
-        """태그별 추천 우선순위 점수 계산"""
-        score = 0.0
-
-        # 1. 복습 주기 점수 (오래될수록 가중치, 최대 50점)
-        review_score = 0.0
-        if tag_stat.last_solved_date:
-            days_diff = (datetime.now().date() - tag_stat.last_solved_date).days
-
-            # 현재 숙련도를 찾아서 해당 숙련도의 추천 주기를 기준으로 점수 계산
-            current_skill = self._match_tag_skill(tag_stat, user_tier, tag_skills_dict)
-            if current_skill:
-                # recommendation_period를 넘긴 시점부터 점수 급증
-                # 넘긴 일수에 비례하여 점수 추가 (최대 50점)
-                if days_diff >= current_skill.recommendation_period:
-                    excess_days = days_diff - current_skill.recommendation_period
-                    review_score = min(excess_days * 2 + 10, 50)  # 기본 10점 + 초과일 * 2
-            else:
-                # 숙련도를 찾을 수 없는 경우 기본 로직
-                review_score = min(days_diff * 2, 50)
-        else:
-            # 아예 처음 푸는 태그 또는 서비스 가입 전 기록
-            if tag_stat.solved_problem_count == 0:
-                # 처음 푸는 태그는 높은 우선순위 부여
-                review_score = 40
-            else:
-                # 서비스 가입 전 기록은 중간 우선순위
-                review_score = 20
-        score += review_score
-
-        # 2. 승급 임박 가중치 (다음 레벨까지 5문제 미만일 때, +30점)
-        level_up_bonus = self._calculate_level_up_bonus(tag_stat, user_tier, tag_skills_dict)
-        score += level_up_bonus
-
-        # 3. 타겟 정렬 가중치 (Requirement 4: 타겟 태그와 일치하면 +30점)
-        target_score = 30 if (target_tag_ids and tag_stat.tag_id.value in target_tag_ids) else 0
-        score += target_score
-
-        return score
-
-    def _calculate_level_up_bonus(
-        self,
-        tag_stat: TagAccountStat,
-        user_tier: TierId,
-        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill]
-    ) -> float:
-        """승급 임박 보너스 점수 계산"""
-        # 현재 숙련도 찾기
-        current_skill = self._match_tag_skill(tag_stat, user_tier, tag_skills_dict)
-        if not current_skill:
-            return 0.0
-
-        # 같은 태그 내에서 다음 숙련도 결정 (IM→AD, AD→MAS)
-        next_skill_code = self._SKILL_CODE_ORDER.get(current_skill.skill_code)
-        if not next_skill_code:
-            # 마지막 숙련도(MASTER)이면 보너스 없음
-            return 0.0
-
-        next_skill = tag_skills_dict.get((tag_stat.tag_id.value, next_skill_code))
-        if not next_skill:
-            return 0.0
-
-        # 다음 레벨까지 필요한 문제 수
-        current_solved = tag_stat.solved_problem_count
-        required_solved = next_skill.requirements.min_solved_problem
-        problems_needed = required_solved - current_solved
-
-        # 5문제 미만 남았으면 30점 부여
-        if 0 < problems_needed < 5:
-            return 30.0
-
-        return 0.0
\ No newline at end of file
+        return all(
+            skill_profile.is_above_intermediate(relation.leading_tag_id)
+            for relation in tag.parent_tag_relations
+        )
@@ -0,0 +1,123 @@
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+_TOP_SCORE_LIMIT = 20  # 트레이스에 남길 상위 태그 점수 개수
+
+
+@dataclass
+class RecommendationTrace:
+    """Entity - 문제 추천 요청 1건의 설명 트레이스
+
+    샘플링되었거나 명시적으로 요청된 추천에 대해서만 생성되며,
+    태그 점수 구성 / 태그 시도 순서 / 최종 추천 문제를 구조화해서 기록한다.
+    """
+    trace_id: str
+    user_account_id: int
+    params: dict
+    created_at: datetime
+    target: dict | None = None
+    excluded_tags: list[str] = field(default_factory=list)
+    tag_scores: list[dict] = field(default_factory=list)
+    attempts: list[dict] = field(default_factory=list)
+    results: list[dict] = field(default_factory=list)
+
+    @staticmethod
+    def create(user_account_id: int, params: dict) -> "RecommendationTrace":
+        return RecommendationTrace(
+            trace_id=uuid.uuid4().hex,
+            user_account_id=user_account_id,
+            params=params,
+            created_at=datetime.now(),
+        )
+
+    def record_target(self, target_id: int, target_tag_names: list[str]) -> None:
+        """활성 목표와 목표에 속한 태그 기록"""
+        self.target = {"target_id": target_id, "tag_names": target_tag_names}
+
+    def record_excluded_tags(self, tag_names: list[str]) -> None:
+        """유저가 제외한 태그 기록"""
+        self.excluded_tags = tag_names
+
+    def record_tag_score(
+        self,
+        tag_name: str,
+        review: float,
+        level_up: float,
+        target: float,
+        is_target: bool,
+    ) -> None:
+        """태그 점수와 구성 요소 기록 (점수 내림차순 상위 N개만 유지)"""
+        self.tag_scores.append({
+            "tag_name": tag_name,
+            "total": review + level_up + target,
+            "review": review,
+            "level_up": level_up,
+            "target": target,
+            "is_target": is_target,
+        })
+        if len(self.tag_scores) > _TOP_SCORE_LIMIT * 2:
+            self._trim_tag_scores()
+
+    def record_attempt(
+        self,
+        tag_name: str,
+        success: bool,
+        problem_id: int | None = None,
+        reason: str | None = None,
+    ) -> None:
+        """샘플링된 태그로 문제를 뽑은 시도 1회 기록"""
+        self.attempts.append({
+            "tag_name": tag_name,
+            "success": success,
+            "problem_id": problem_id,
+            "reason": reason,
+        })
+
+    def record_result(self, problem_id: int, title: str, tag_name: str, tag_names: list[str], reasons: list[str]) -> None:
+        """최종 추천 문제 기록"""
+        self.results.append({
+            "problem_id": problem_id,
+            "title": title,
+            "tag_name": tag_name,
+            "tag_names": tag_names,
+            "reasons": reasons,
+        })
+
+    def to_dict(self) -> dict:
+        self._trim_tag_scores()
+        success_count = sum(1 for attempt in self.attempts if attempt["success"])
+        return {
+            "trace_id": self.trace_id,
+            "user_account_id": self.user_account_id,
+            "params": self.params,
+            "created_at": self.created_at.isoformat(),
+            "target": self.target,
+            "excluded_tags": self.excluded_tags,
+            "tag_scores": self.tag_scores,
+            "attempts": self.attempts,
+            "attempt_summary": {
+                "total": len(self.attempts),
+                "success": success_count,
+                "failed": len(self.attempts) - success_count,
+            },
+            "results": self.results,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "RecommendationTrace":
+        return RecommendationTrace(
+            trace_id=data["trace_id"],
+            user_account_id=data["user_account_id"],
+            params=data.get("params", {}),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            target=data.get("target"),
+            excluded_tags=data.get("excluded_tags", []),
+            tag_scores=data.get("tag_scores", []),
+            attempts=data.get("attempts", []),
+            results=data.get("results", []),
+        )
+
+    def _trim_tag_scores(self) -> None:
+        self.tag_scores.sort(key=lambda s: s["total"], reverse=True)
+        del self.tag_scores[_TOP_SCORE_LIMIT:]
@@ -0,0 +1,10 @@
+# 유저의 풀이 데이터(직접 기록한 풀이/밴, 백준 풀이 이력, 계정 연동)가 바뀌는 이벤트
+# - 풀이 데이터에서 파생된 추천용 캐시(제외 비트맵, 태그 통계)는 모두 이 이벤트로 무효화한다
+# - 각 이벤트 페이로드는 user_account_id를 공통으로 가진다
+SOLVED_DATA_CHANGED_EVENTS: list[str] = [
+    "PROBLEM_STATUS_CHANGED",
+    "BJ_ACCOUNT_SYNCED",
+    "BATCH_SYNC_COMPLETED",
+    "LINK_BAEKJOON_ACCOUNT_REQUESTED",
+    "USER_ACCOUNT_WITHDRAWAL_REQUESTED",
+]
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+
+from app.common.domain.vo.collections import ProblemIdBitmap
+
+
+class ExclusionBitmapGateway(ABC):
+    """추천 제외 문제 비트맵 캐시 Gateway 인터페이스
+
+    - 유저별 제외 집합: 직접 기록한 풀이(solved) ∪ 밴 문제 ∪ 백준 풀이 이력(problem_history)
+    - 백준 계정별 풀이 이력: 스터디 추천(recommend_all_unsolved)에서 멤버별로 사용
+    """
+
+    @abstractmethod
+    async def get_user_exclusion(self, user_account_id: int) -> ProblemIdBitmap | None:
+        """유저 제외 비트맵 조회 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    async def store_user_exclusion(self, user_account_id: int, bitmap: ProblemIdBitmap) -> None:
+        """유저 제외 비트맵 저장"""
+        pass
+
+    @abstractmethod
+    async def get_solved_history(self, bj_account_id: str) -> ProblemIdBitmap | None:
+        """백준 계정 풀이 이력 비트맵 조회 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    async def store_solved_history(self, bj_account_id: str, bitmap: ProblemIdBitmap) -> None:
+        """백준 계정 풀이 이력 비트맵 저장"""
+        pass
+
+    @abstractmethod
+    async def invalidate(self, user_account_id: int | None = None, bj_account_id: str | None = None) -> None:
+        """지정된 유저 / 백준 계정의 캐시 무효화"""
+        pass
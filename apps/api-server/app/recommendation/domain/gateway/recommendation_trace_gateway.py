@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+from app.recommendation.domain.entity.recommendation_trace import RecommendationTrace
+
+
+class RecommendationTraceGateway(ABC):
+    """추천 설명 트레이스 저장소 Gateway 인터페이스
+
+    트레이스는 디버깅용 단기 데이터이므로 일정 시간이 지나면 사라져도 된다.
+    """
+
+    @abstractmethod
+    async def save(self, trace: RecommendationTrace) -> None:
+        """트레이스 저장"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, trace_id: str) -> RecommendationTrace | None:
+        """트레이스 ID로 조회 (없거나 만료되었으면 None)"""
+        pass
+
+    @abstractmethod
+    async def find_recent(self, limit: int) -> list[RecommendationTrace]:
+        """최근 저장된 트레이스 목록 조회 (최신순)"""
+        pass
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+
+
+class TagStatCacheGateway(ABC):
+    """유저 태그 통계 캐시 Gateway 인터페이스
+
+    태그 통계는 숙련도 프로필(UserSkillProfile)의 입력이며,
+    풀이 기록이 바뀌기 전까지는 같은 값이므로 유저별로 캐시한다.
+    """
+
+    @abstractmethod
+    async def get(self, user_account_id: int) -> list[TagAccountStat] | None:
+        """유저 태그 통계 조회 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    async def store(self, user_account_id: int, stats: list[TagAccountStat]) -> None:
+        """유저 태그 통계 저장"""
+        pass
+
+    @abstractmethod
+    async def invalidate(self, user_account_id: int) -> None:
+        """유저 태그 통계 캐시 삭제"""
+        pass
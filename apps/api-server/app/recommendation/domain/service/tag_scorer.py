@@ -0,0 +1,83 @@
+"""태그 추천 점수 일괄 계산 Domain Service"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from app.recommendation.domain.vo.user_skill_profile import TagSkillLevel
+
+_REVIEW_SCORE_MAX = 50
+_REVIEW_SCORE_BASE = 10
+_REVIEW_SCORE_PER_DAY = 2
+_NEW_TAG_SCORE = 40  # 아예 처음 푸는 태그
+_UNDATED_SCORE = 20  # 서비스 가입 전 기록 (풀었지만 날짜 없음)
+_LEVEL_UP_BONUS = 30.0  # 다음 숙련도까지 5문제 미만
+_LEVEL_UP_WINDOW = 5
+_TARGET_BONUS = 30
+
+
+@dataclass(frozen=True)
+class TagScore:
+    """태그 추천 점수와 구성 요소"""
+    review: float
+    level_up: float
+    target: float
+
+    @property
+    def total(self) -> float:
+        return self.review + self.level_up + self.target
+
+
+class TagScorer:
+    """태그 추천 우선순위 점수 계산기
+
+    요청마다 한 번 생성해 모든 태그 점수를 한 번의 순회로 계산한다.
+    숙련도 판별은 UserSkillProfile에서 미리 끝내 두므로 여기서는 점수 산식만 적용한다.
+    """
+
+    def __init__(
+        self,
+        target_tag_ids: set[int] | None = None,
+        today: date | None = None,
+    ):
+        self.target_tag_ids = target_tag_ids or set()
+        self.today = today or date.today()
+
+    def score(self, level: TagSkillLevel) -> TagScore:
+        """태그 하나의 점수"""
+        return self.score_all([level])[0]
+
+    def score_all(self, levels: list[TagSkillLevel]) -> list[TagScore]:
+        """태그 점수 일괄 계산 (입력 순서 유지)"""
+        today = self.today
+        target_tag_ids = self.target_tag_ids
+
+        scores: list[TagScore] = []
+        for level in levels:
+            stat = level.stat
+            solved = stat.solved_problem_count
+            skill = level.skill
+
+            # 1. 복습 주기 점수 (오래될수록 가중치, 최대 50점)
+            if stat.last_solved_date:
+                days_diff = (today - stat.last_solved_date).days
+                if skill is None:
+                    review = min(days_diff * _REVIEW_SCORE_PER_DAY, _REVIEW_SCORE_MAX)
+                elif days_diff >= skill.recommendation_period:
+                    excess_days = days_diff - skill.recommendation_period
+                    review = min(excess_days * _REVIEW_SCORE_PER_DAY + _REVIEW_SCORE_BASE, _REVIEW_SCORE_MAX)
+                else:
+                    review = 0
+            else:
+                review = _NEW_TAG_SCORE if solved == 0 else _UNDATED_SCORE
+
+            # 2. 승급 임박 가중치 (다음 숙련도까지 5문제 미만)
+            level_up = 0.0
+            problems_needed = level.problems_to_next_skill
+            if problems_needed is not None and 0 < problems_needed < _LEVEL_UP_WINDOW:
+                level_up = _LEVEL_UP_BONUS
+
+            # 3. 타겟 정렬 가중치 (Requirement 4)
+            target = _TARGET_BONUS if stat.tag_id.value in target_tag_ids else 0
+
+            scores.append(TagScore(review=float(review), level_up=level_up, target=float(target)))
+        return scores
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from app.common.domain.vo.identifiers import TagId
 from app.common.domain.vo.primitives import TierRange
 
 
@@ -9,3 +10,11 @@ class SearchCriteria:
     tier_range: TierRange
     min_skill_rate: int
     max_skill_rate: int
+
+
+@dataclass(frozen=True)
+class TagSearchCriteria:
+    """태그 단위 추천 후보 검색 조건 (일괄 조회용)"""
+    tag_id: TagId
+    criteria_list: tuple[SearchCriteria, ...]
+    min_solved_count: int
@@ -1,6 +1,10 @@
 """태그 후보 Value Objects"""
 
+import random
+from bisect import bisect_left
 from dataclasses import dataclass
+from functools import cached_property
+from itertools import accumulate
 from typing import Iterator
 
 from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
@@ -41,56 +45,64 @@ class TagCandidates:
         sorted_candidates = sorted(self._candidates, key=lambda x: x.score, reverse=True)
         return TagCandidates(tuple(sorted_candidates))
 
+    @cached_property
+    def _cumulative_weights(self) -> tuple[float, ...]:
+        """점수 기반 누적 가중치 (최소값 0.1 보장) - 컬렉션당 1회만 계산"""
+        return tuple(accumulate(max(c.score, 0.1) for c in self._candidates))
+
     def weighted_random_sample(self, k: int) -> 'TagCandidates':
         """점수 기반 가중치 랜덤 샘플링 (중복 없음)
 
+        누적 가중치에 대한 이분 탐색으로 한 번의 추출을 O(log n)에 수행하고,
+        이미 뽑힌 후보에 걸리면 다시 뽑는다.
+
         Args:
             k: 샘플링할 개수
 
         Returns:
             샘플링된 태그 후보 컬렉션
         """
-        import random
-
-        # k가 전체 개수보다 크거나 같으면 전체 반환
+        # k가 전체 개수보다 크거나 같으면 전체 반환 (빈 경우 포함)
         if len(self._candidates) <= k:
             return self
+        if k <= 0:
+            return TagCandidates.empty()
 
-        # 빈 경우 처리
-        if len(self._candidates) == 0:
-            return self
-
-        # 점수를 가중치로 변환 (최소값 0.1 보장)
-        candidates_list = list(self._candidates)
-        weights = [max(c.score, 0.1) for c in candidates_list]
-
-        total_weight = sum(weights)
+        cumulative_weights = self._cumulative_weights
+        total_weight = cumulative_weights[-1]
+        last_index = len(cumulative_weights) - 1
 
-        # 누적 가중치 계산
-        cumulative_weights = []
-        cum_sum = 0
-        for w in weights:
-            cum_sum += w
-            cumulative_weights.append(cum_sum)
-
-        # k개 샘플링 (중복 없음)
-        sampled_indices = set()
-        sampled = []
+        sampled_indices: set[int] = set()
+        sampled: list[TagCandidate] = []
         attempts = 0
         max_attempts = k * 100  # 무한 루프 방지
 
         while len(sampled) < k and attempts < max_attempts:
             attempts += 1
-            r = random.uniform(0, total_weight)
-
-            for i, cum_w in enumerate(cumulative_weights):
-                if r <= cum_w and i not in sampled_indices:
-                    sampled_indices.add(i)
-                    sampled.append(candidates_list[i])
-                    break
+            i = min(bisect_left(cumulative_weights, random.uniform(0, total_weight)), last_index)
+            if i in sampled_indices:
+                continue
+            sampled_indices.add(i)
+            sampled.append(self._candidates[i])
 
         return TagCandidates(tuple(sampled))
 
+    def weighted_random_choices(self, n: int) -> list[TagCandidate]:
+        """점수 기반 가중치 랜덤 샘플링 (중복 허용)
+
+        weighted_random_sample(1)을 n번 반복한 것과 같은 분포의 태그 시퀀스를 한 번에 뽑는다.
+
+        Args:
+            n: 샘플링할 개수
+
+        Returns:
+            샘플링된 태그 후보 리스트 (뽑힌 순서 유지)
+        """
+        if n <= 0 or len(self._candidates) == 0:
+            return []
+
+        return random.choices(self._candidates, cum_weights=self._cumulative_weights, k=n)
+
     def __iter__(self) -> Iterator[TagCandidate]:
         """반복 가능"""
         return iter(self._candidates)
@@ -0,0 +1,136 @@
+"""유저 태그 숙련도 프로필 Value Objects"""
+
+from dataclasses import dataclass
+
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.common.domain.enums import SkillCode
+from app.common.domain.vo.identifiers import TagId, TierId
+from app.recommendation.domain.entity.tag_skill import TagSkill
+
+_SKILL_MATCH_ORDER = (SkillCode.MAS, SkillCode.AD, SkillCode.IM)  # 높은 숙련도부터 검사
+_NEXT_SKILL_CODE = {SkillCode.IM: SkillCode.AD, SkillCode.AD: SkillCode.MAS}
+
+
+@dataclass(frozen=True)
+class TagSkillLevel:
+    """태그 하나에 대한 유저의 현재/다음 숙련도
+
+    - skill: 추천 기준 숙련도 (풀이 수 + 유저 티어 + 최고 문제 티어 요구사항, 미충족 시 IM)
+    - achieved_level: 풀이 기록만으로 달성한 레벨 (유저 티어 무관, 태그 목록 화면 표시 기준)
+    """
+    stat: TagAccountStat
+    has_record: bool
+    skill: TagSkill | None
+    next_skill: TagSkill | None
+    achieved_level: SkillCode
+
+    @property
+    def skill_code(self) -> SkillCode | None:
+        return self.skill.skill_code if self.skill else None
+
+    @property
+    def problems_to_next_skill(self) -> int | None:
+        """다음 숙련도까지 남은 풀이 수 (다음 숙련도가 없으면 None)"""
+        if self.next_skill is None:
+            return None
+        return self.next_skill.requirements.min_solved_problem - self.stat.solved_problem_count
+
+
+@dataclass(frozen=True)
+class UserSkillProfile:
+    """유저의 태그별 숙련도 프로필
+
+    태그 통계(TagAccountStat)와 태그 숙련도 요구사항(TagSkill)으로부터
+    모든 태그의 현재/다음 숙련도를 한 번에 판별해 둔다.
+    통계와 유저 티어가 바뀌지 않는 한 같은 결과이므로 요청 내에서 재사용한다.
+    """
+    user_tier: TierId
+    _levels: dict[int, TagSkillLevel]
+    _tag_skills: dict[tuple[int, SkillCode], TagSkill]
+
+    @staticmethod
+    def build(
+        stats: list[TagAccountStat],
+        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill],
+        user_tier: TierId,
+    ) -> 'UserSkillProfile':
+        """통계 + 숙련도 요구사항으로 전체 태그 숙련도 판별"""
+        stats_dict = {stat.tag_id.value: stat for stat in stats}
+        grouped: dict[int, dict[SkillCode, TagSkill]] = {}
+        for (tag_id, skill_code), skill in tag_skills_dict.items():
+            grouped.setdefault(tag_id, {})[skill_code] = skill
+
+        levels: dict[int, TagSkillLevel] = {}
+        for tag_id in grouped.keys() | stats_dict.keys():
+            stat = stats_dict.get(tag_id)
+            levels[tag_id] = UserSkillProfile._resolve(
+                stat or TagAccountStat.empty(TagId(tag_id)),
+                stat is not None,
+                grouped.get(tag_id, {}),
+                user_tier.value,
+            )
+        return UserSkillProfile(user_tier=user_tier, _levels=levels, _tag_skills=tag_skills_dict)
+
+    @staticmethod
+    def _resolve(stat: TagAccountStat, has_record: bool, skills: dict[SkillCode, TagSkill], user_tier: int) -> TagSkillLevel:
+        solved = stat.solved_problem_count
+        highest = stat.highest_tier_id.value if stat.highest_tier_id else 0
+
+        # 추천 기준: MAS → AD → IM 순으로 모든 요구사항을 만족하는 첫 숙련도, 없으면 IM
+        skill = skills.get(SkillCode.IM)
+        for code in _SKILL_MATCH_ORDER:
+            candidate = skills.get(code)
+            if candidate is None:
+                continue
+            req = candidate.requirements
+            if solved >= req.min_solved_problem and user_tier >= req.min_user_tier.value and highest >= req.min_solved_problem_tier.value:
+                skill = candidate
+                break
+        next_code = _NEXT_SKILL_CODE.get(skill.skill_code) if skill else None
+
+        # 표시 기준: 풀이 수와 최고 문제 티어만 확인 (최고 티어 정보가 없으면 티어 조건은 통과)
+        achieved_level = SkillCode.IM
+        if solved > 0:
+            for code in (SkillCode.MAS, SkillCode.AD):
+                candidate = skills.get(code)
+                if candidate is None:
+                    continue
+                req = candidate.requirements
+                if solved >= req.min_solved_problem and (stat.highest_tier_id is None or highest >= req.min_solved_problem_tier.value):
+                    achieved_level = code
+                    break
+
+        return TagSkillLevel(
+            stat=stat,
+            has_record=has_record,
+            skill=skill,
+            next_skill=skills.get(next_code) if next_code else None,
+            achieved_level=achieved_level,
+        )
+
+    def level(self, tag_id: TagId) -> TagSkillLevel:
+        """태그 숙련도 조회 (통계도 요구사항도 없는 태그는 빈 숙련도)"""
+        level = self._levels.get(tag_id.value)
+        if level is None:
+            level = TagSkillLevel(
+                stat=TagAccountStat.empty(tag_id),
+                has_record=False,
+                skill=None,
+                next_skill=None,
+                achieved_level=SkillCode.IM,
+            )
+        return level
+
+    def stat(self, tag_id: TagId) -> TagAccountStat | None:
+        """태그 통계 조회 (풀이 기록이 없으면 None)"""
+        level = self._levels.get(tag_id.value)
+        return level.stat if level and level.has_record else None
+
+    def tag_skill(self, tag_id: TagId, skill_code: SkillCode) -> TagSkill | None:
+        """태그의 특정 숙련도 요구사항 조회"""
+        return self._tag_skills.get((tag_id.value, skill_code))
+
+    def is_above_intermediate(self, tag_id: TagId) -> bool:
+        """풀이 기록이 있고 추천 기준 숙련도가 IM보다 높은지 (선수 태그 조건)"""
+        level = self._levels.get(tag_id.value)
+        return bool(level and level.has_record and level.skill and level.skill.skill_code != SkillCode.IM)
@@ -0,0 +1,95 @@
+"""
+LevelFilterTable - 추천 난이도 필터 인메모리 테이블
+
+problem_recommendation_level_filter 테이블은 운영 중 바뀌지 않는 정적 데이터라
+(메타데이터 동기화도 건드리지 않음) 프로세스 메모리에 (skill_code, filter_code) 키로 적재해 두고,
+추천 루프의 필터 조회가 매번 DB를 왕복하지 않게 한다.
+
+- 앱 시작 시(Container.init_resources) 1회 적재
+- LevelFilterRepositoryImpl.save() 시 commit 후 재적재하고 ReferenceDataCache 무효화 채널에
+  LEVEL_FILTER_TOPIC으로 전파, 다른 워커는 이 topic의 reload hook으로 등록된 reload()만 실행
+  (참조 데이터 / 후보 인덱스는 다시 적재하지 않음)
+- 재적재는 새 스냅샷을 만든 뒤 참조만 교체하므로 조회 중인 요청과 경합하지 않는다
+"""
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from sqlalchemy import and_, select
+
+from app.core.database import Database
+from app.recommendation.domain.entity.level_filter import LevelFilter
+from app.recommendation.infra.mapper.level_filter_mapper import LevelFilterMapper
+from app.recommendation.infra.model.problem_recommendation_level_filter import ProblemRecommendationLevelFilterModel
+
+logger = logging.getLogger(__name__)
+
+LEVEL_FILTER_TOPIC = "level-filter"  # ReferenceDataCache 무효화 채널에서 이 테이블만 재적재하는 topic
+
+
+@dataclass(frozen=True)
+class LevelFilterSnapshot:
+    """불변 필터 스냅샷 (skill_code별 필터는 filter_id 순서 유지)"""
+    by_key: Mapping[tuple[str, str], LevelFilter]
+    by_skill: Mapping[str, tuple[LevelFilter, ...]]
+
+    @staticmethod
+    def build(filters: list[LevelFilter]) -> 'LevelFilterSnapshot':
+        ordered = sorted(filters, key=lambda f: f.filter_id.value if f.filter_id else 0)
+        by_skill: dict[str, list[LevelFilter]] = {}
+        for level_filter in ordered:
+            by_skill.setdefault(level_filter.tag_skill_code, []).append(level_filter)
+        return LevelFilterSnapshot(
+            by_key=MappingProxyType({(f.tag_skill_code, f.filter_code.value): f for f in ordered}),
+            by_skill=MappingProxyType({skill: tuple(items) for skill, items in by_skill.items()}),
+        )
+
+
+class LevelFilterTable:
+    """활성 LevelFilter 인메모리 테이블
+
+    LevelFilterRepositoryImpl이 is_ready일 때 (skill, code) 조회에 사용하고,
+    아직 적재되지 않았거나 무효화된 경우에는 기존 SQL 경로로 폴백한다.
+    """
+
+    def __init__(self, db: Database) -> None:
+        self.db = db
+        self._snapshot: LevelFilterSnapshot | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._snapshot is not None
+
+    async def reload(self) -> None:
+        """활성 필터 전체를 읽어 새 스냅샷으로 교체"""
+        async with self.db.session() as session:
+            models = (await session.execute(
+                select(ProblemRecommendationLevelFilterModel).where(
+                    and_(
+                        ProblemRecommendationLevelFilterModel.active_yn == True,
+                        ProblemRecommendationLevelFilterModel.deleted_at.is_(None)
+                    )
+                )
+            )).scalars().all()
+        self.load([LevelFilterMapper.to_entity(model) for model in models])
+        logger.info(f"[LevelFilterTable] reloaded: filters={len(models)}")
+
+    def load(self, filters: list[LevelFilter]) -> None:
+        """이미 조회된 필터 목록으로 스냅샷 교체 (테스트/수동 적재용)"""
+        self._snapshot = LevelFilterSnapshot.build(filters)
+
+    def invalidate(self) -> None:
+        """스냅샷 폐기 (다음 reload() 전까지 SQL 경로 사용)"""
+        self._snapshot = None
+
+    def find(self, tag_skill_code: str, filter_code: str) -> LevelFilter | None:
+        return self._snapshot.by_key.get((tag_skill_code, filter_code))
+
+    def find_many(self, tag_skill_code: str, filter_codes: list[str]) -> list[LevelFilter]:
+        codes = set(filter_codes)
+        return [
+            level_filter
+            for level_filter in self._snapshot.by_skill.get(tag_skill_code, ())
+            if level_filter.filter_code.value in codes
+        ]
@@ -0,0 +1,68 @@
+import base64
+import logging
+from datetime import timedelta
+
+from app.common.domain.vo.collections import ProblemIdBitmap
+from app.common.infra.client.redis_client import AsyncRedisClient
+from app.recommendation.domain.gateway.exclusion_bitmap_gateway import ExclusionBitmapGateway
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 무효화가 누락되는 경로(관리자 수동 수정 등)를 대비한 안전 만료 시간
+_CACHE_TTL = timedelta(hours=1)
+
+
+class ExclusionBitmapGatewayImpl(ExclusionBitmapGateway):
+    """Redis를 사용한 추천 제외 비트맵 캐시 Gateway 구현
+
+    redis 클라이언트가 decode_responses=True로 동작하므로 비트맵은 base64 문자열로 저장한다.
+    캐시 장애 시 조회는 None, 저장/삭제는 무시하여 호출측이 DB 경로로 동작하게 한다.
+    """
+
+    def __init__(self, redis_client: AsyncRedisClient):
+        self.redis_client = redis_client
+
+    async def get_user_exclusion(self, user_account_id: int) -> ProblemIdBitmap | None:
+        return await self._get(f"rec:excl:user:{user_account_id}")
+
+    async def store_user_exclusion(self, user_account_id: int, bitmap: ProblemIdBitmap) -> None:
+        await self._store(f"rec:excl:user:{user_account_id}", bitmap)
+
+    async def get_solved_history(self, bj_account_id: str) -> ProblemIdBitmap | None:
+        return await self._get(f"rec:excl:bj:{bj_account_id}")
+
+    async def store_solved_history(self, bj_account_id: str, bitmap: ProblemIdBitmap) -> None:
+        await self._store(f"rec:excl:bj:{bj_account_id}", bitmap)
+
+    async def invalidate(self, user_account_id: int | None = None, bj_account_id: str | None = None) -> None:
+        keys = []
+        if user_account_id is not None:
+            keys.append(f"rec:excl:user:{user_account_id}")
+        if bj_account_id is not None:
+            keys.append(f"rec:excl:bj:{bj_account_id}")
+        if not keys:
+            return
+        try:
+            await self.redis_client.delete(*keys)
+        except Exception as e:
+            logger.error(f"제외 비트맵 무효화 실패: {e}")
+
+    async def _get(self, redis_key: str) -> ProblemIdBitmap | None:
+        try:
+            value = await self.redis_client.get(redis_key)
+            if not isinstance(value, dict) or "bits" not in value:
+                return None
+            return ProblemIdBitmap.from_bytes(base64.b64decode(value["bits"]))
+        except Exception as e:
+            logger.error(f"제외 비트맵 조회 실패: {e}")
+            return None
+
+    async def _store(self, redis_key: str, bitmap: ProblemIdBitmap) -> None:
+        try:
+            await self.redis_client.set(
+                redis_key,
+                {"bits": base64.b64encode(bitmap.to_bytes()).decode("ascii")},
+                ex=_CACHE_TTL,
+            )
+        except Exception as e:
+            logger.error(f"제외 비트맵 저장 실패: {e}")
@@ -0,0 +1,59 @@
+import logging
+from datetime import timedelta
+
+from app.common.infra.client.redis_client import AsyncRedisClient
+from app.recommendation.domain.entity.recommendation_trace import RecommendationTrace
+from app.recommendation.domain.gateway.recommendation_trace_gateway import RecommendationTraceGateway
+
+logger = logging.getLogger(__name__)
+
+_TRACE_TTL = timedelta(days=1)
+_RECENT_KEY = "rec:trace:recent"
+_RECENT_MAX = 200  # 최근 목록에 유지할 트레이스 ID 수
+
+
+class RecommendationTraceGatewayImpl(RecommendationTraceGateway):
+    """Redis를 사용한 추천 설명 트레이스 Gateway 구현
+
+    트레이스 본문은 rec:trace:{trace_id} 키에 TTL과 함께 저장하고,
+    최근 트레이스 ID는 길이가 제한된 리스트로 관리한다.
+    트레이스 저장 실패가 추천 응답을 막지 않도록 모든 오류는 로그만 남긴다.
+    """
+
+    def __init__(self, redis_client: AsyncRedisClient):
+        self.redis_client = redis_client
+
+    async def save(self, trace: RecommendationTrace) -> None:
+        try:
+            await self.redis_client.set(f"rec:trace:{trace.trace_id}", trace.to_dict(), ex=_TRACE_TTL)
+            client = await self.redis_client.get_client()
+            await client.lpush(_RECENT_KEY, trace.trace_id)
+            await client.ltrim(_RECENT_KEY, 0, _RECENT_MAX - 1)
+            await client.expire(_RECENT_KEY, _TRACE_TTL)
+        except Exception as e:
+            logger.error(f"추천 트레이스 저장 실패: {e}")
+
+    async def find_by_id(self, trace_id: str) -> RecommendationTrace | None:
+        try:
+            value = await self.redis_client.get(f"rec:trace:{trace_id}")
+            if not isinstance(value, dict):
+                return None
+            return RecommendationTrace.from_dict(value)
+        except Exception as e:
+            logger.error(f"추천 트레이스 조회 실패: {e}")
+            return None
+
+    async def find_recent(self, limit: int) -> list[RecommendationTrace]:
+        try:
+            client = await self.redis_client.get_client()
+            trace_ids = await client.lrange(_RECENT_KEY, 0, limit - 1)
+        except Exception as e:
+            logger.error(f"최근 추천 트레이스 목록 조회 실패: {e}")
+            return []
+
+        traces = []
+        for trace_id in trace_ids:
+            trace = await self.find_by_id(trace_id)
+            if trace is not None:  # TTL 만료된 ID는 건너뜀
+                traces.append(trace)
+        return traces
@@ -0,0 +1,67 @@
+import logging
+from datetime import date, timedelta
+
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.common.domain.vo.identifiers import TagId, TierId
+from app.common.infra.client.redis_client import AsyncRedisClient
+from app.recommendation.domain.gateway.tag_stat_cache_gateway import TagStatCacheGateway
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 무효화가 누락되는 경로를 대비한 안전 만료 시간
+_CACHE_TTL = timedelta(hours=1)
+
+
+class TagStatCacheGatewayImpl(TagStatCacheGateway):
+    """Redis를 사용한 유저 태그 통계 캐시 Gateway 구현
+
+    통계는 [tag_id, 풀이 수, 최고 티어, 마지막 풀이일] 배열의 리스트로 저장한다.
+    캐시 장애 시 조회는 None, 저장/삭제는 무시하여 호출측이 DB 경로로 동작하게 한다.
+    """
+
+    def __init__(self, redis_client: AsyncRedisClient):
+        self.redis_client = redis_client
+
+    async def get(self, user_account_id: int) -> list[TagAccountStat] | None:
+        try:
+            value = await self.redis_client.get(f"rec:tagstat:user:{user_account_id}")
+            if not isinstance(value, dict) or "stats" not in value:
+                return None
+            return [
+                TagAccountStat(
+                    tag_id=TagId(tag_id),
+                    solved_problem_count=solved,
+                    highest_tier_id=TierId(highest) if highest is not None else None,
+                    last_solved_date=date.fromisoformat(last_solved) if last_solved else None,
+                )
+                for tag_id, solved, highest, last_solved in value["stats"]
+            ]
+        except Exception as e:
+            logger.error(f"태그 통계 캐시 조회 실패: {e}")
+            return None
+
+    async def store(self, user_account_id: int, stats: list[TagAccountStat]) -> None:
+        try:
+            await self.redis_client.set(
+                f"rec:tagstat:user:{user_account_id}",
+                {
+                    "stats": [
+                        [
+                            stat.tag_id.value,
+                            stat.solved_problem_count,
+                            stat.highest_tier_id.value if stat.highest_tier_id else None,
+                            stat.last_solved_date.isoformat() if stat.last_solved_date else None,
+                        ]
+                        for stat in stats
+                    ]
+                },
+                ex=_CACHE_TTL,
+            )
+        except Exception as e:
+            logger.error(f"태그 통계 캐시 저장 실패: {e}")
+
+    async def invalidate(self, user_account_id: int) -> None:
+        try:
+            await self.redis_client.delete(f"rec:tagstat:user:{user_account_id}")
+        except Exception as e:
+            logger.error(f"태그 통계 캐시 무효화 실패: {e}")
@@ -6,10 +6,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.domain.enums import FilterCode, SkillCode, TagLevel
 from app.common.domain.vo.identifiers import LevelFilterId, TagSkillId
-from app.core.database import Database
+from app.common.infra.cache.reference_data_cache import ReferenceDataCache
+from app.core.database import Database, run_after_commit
 from app.recommendation.domain.entity.level_filter import LevelFilter
 from app.recommendation.domain.entity.tag_skill import TagSkill
 from app.recommendation.domain.repository.level_filter_repository import LevelFilterRepository
+from app.recommendation.infra.cache.level_filter_table import LEVEL_FILTER_TOPIC, LevelFilterTable
 from app.recommendation.infra.mapper.level_filter_mapper import LevelFilterMapper
 from app.recommendation.infra.model.problem_recommendation_level_filter import ProblemRecommendationLevelFilterModel
 
@@ -17,8 +19,15 @@ from app.recommendation.infra.model.problem_recommendation_level_filter import P
 class LevelFilterRepositoryImpl(LevelFilterRepository):
     """LevelFilter Repository 구현체"""
 
-    def __init__(self, db: Database):
+    def __init__(
+        self,
+        db: Database,
+        level_filter_table: LevelFilterTable | None = None,
+        reference_data_cache: ReferenceDataCache | None = None,
+    ):
         self.db = db
+        self.level_filter_table = level_filter_table
+        self.reference_data_cache = reference_data_cache
 
     @property
     def session(self) -> AsyncSession:
@@ -30,8 +39,18 @@ class LevelFilterRepositoryImpl(LevelFilterRepository):
         model = LevelFilterMapper.to_model(filter)
         self.session.add(model)
         await self.session.flush()
+        if self.level_filter_table is not None:
+            # commit 전까지는 SQL 경로로 대체하고, commit 후 재적재 + 다른 워커에 무효화 전파
+            self.level_filter_table.invalidate()
+            await run_after_commit(self._reload_level_filter_table)
         return LevelFilterMapper.to_entity(model)
 
+    async def _reload_level_filter_table(self) -> None:
+        await self.level_filter_table.reload()
+        # 다른 워커는 LEVEL_FILTER_TOPIC hook으로 등록된 LevelFilterTable.reload()만 실행
+        if self.reference_data_cache is not None:
+            await self.reference_data_cache.broadcast_invalidation(topic=LEVEL_FILTER_TOPIC)
+
     @override
     async def find_by_id(self, filter_id: LevelFilterId) -> LevelFilter | None:
         """ID로 LevelFilter 조회"""
@@ -79,6 +98,9 @@ class LevelFilterRepositoryImpl(LevelFilterRepository):
         filter_code: str
     ) -> LevelFilter | None:
         """태그 스킬 ID와 필터 코드로 조회"""
+        if self.level_filter_table is not None and self.level_filter_table.is_ready:
+            return self.level_filter_table.find(tag_skill_level, filter_code)
+
         stmt = select(ProblemRecommendationLevelFilterModel).where(
             and_(
                 ProblemRecommendationLevelFilterModel.tag_skill_code == tag_skill_level,
@@ -98,6 +120,9 @@ class LevelFilterRepositoryImpl(LevelFilterRepository):
         filter_codes: list[str]
     ) -> list[LevelFilter]:
         """태그 스킬 레벨과 복수 필터 코드로 조회"""
+        if self.level_filter_table is not None and self.level_filter_table.is_ready:
+            return self.level_filter_table.find_many(tag_skill_level, filter_codes)
+
         stmt = select(ProblemRecommendationLevelFilterModel).where(
             and_(
                 ProblemRecommendationLevelFilterModel.tag_skill_code == tag_skill_level,
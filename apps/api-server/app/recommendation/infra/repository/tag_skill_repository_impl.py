@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.domain.enums import SkillCode, TagLevel
 from app.common.domain.vo.identifiers import TagSkillId, TagId
+from app.common.infra.cache.reference_data_cache import ReferenceDataCache
 from app.core.database import Database
 from app.recommendation.domain.entity.tag_skill import TagSkill
 from app.recommendation.domain.repository.tag_skill_repository import TagSkillRepository
@@ -16,8 +17,9 @@ from app.recommendation.infra.model.tag_skill import TagSkillModel
 class TagSkillRepositoryImpl(TagSkillRepository):
     """TagSkill Repository 구현체"""
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, reference_data_cache: ReferenceDataCache | None = None):
         self.db = db
+        self.reference_data_cache = reference_data_cache
 
     @property
     def session(self) -> AsyncSession:
@@ -80,6 +82,9 @@ class TagSkillRepositoryImpl(TagSkillRepository):
     @override
     async def find_all_active(self) -> list[TagSkill]:
         """모든 활성 TagSkill 조회"""
+        if self.reference_data_cache is not None and self.reference_data_cache.is_ready:
+            return list(self.reference_data_cache.snapshot.tag_skills)
+
         stmt = select(TagSkillModel).where(
             and_(
                 TagSkillModel.active_yn == True,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from dependency_injector.wiring import inject, Provide
 from typing import List, Optional
 import json
@@ -6,8 +6,10 @@ import json
 from app.common.domain.enums import FilterCode, ExclusionMode
 from app.common.domain.vo.current_user import CurrentUser
 from app.common.domain.vo.identifiers import TagId, UserAccountId
+from app.common.presentation.dependency.admin_dependencies import is_valid_admin_key, require_admin_key
 from app.common.presentation.dependency.auth_dependencies import get_current_member
 from app.recommendation.application.usecase.get_recommendation_history_usecase import GetRecommendationHistoryUsecase
+from app.recommendation.application.usecase.get_recommendation_trace_usecase import GetRecommendationTraceUsecase
 from app.recommendation.application.usecase.recommend_problems_usecase import RecommendProblemsUsecase
 from app.recommendation.presentation.schema.response.recommendation_history_response import RecommendationHistoryResponse
 from app.recommendation.presentation.schema.response.recommendation_response import (
@@ -17,6 +19,11 @@ from app.core.containers import Container
 from app.core.api_response import ApiResponse, ApiResponseSchema
 
 router = APIRouter(prefix="/user-accounts/me", tags=["recommendation"])
+admin_router = APIRouter(
+    prefix="/admin/recommendation-traces",
+    tags=["admin-recommendation"],
+    dependencies=[Depends(require_admin_key)],
+)
 
 
 @router.get("/problems", response_model=ApiResponseSchema[RecommendationResponse])
@@ -26,8 +33,13 @@ async def get_recommended_problems(
     tags: Optional[str] = Query("[]", description="태그 필터 (예: [1, 2, 3])"),
     count: Optional[int] = Query(3, description="문제 개수"),
     exclusion_mode: Optional[str] = Query("LENIENT", description="제외 모드 (LENIENT|STRICT)"),
+    x_recommendation_trace: Optional[str] = Header(
+        None, description="값이 있으면 추천 설명 트레이스를 기록 (유효한 X-Admin-Key가 함께 있을 때만)"
+    ),
+    x_admin_key: Optional[str] = Header(None),
     current_user: CurrentUser = Depends(get_current_member),
     recommendation_usecase: RecommendProblemsUsecase = Depends(Provide[Container.recommand_problems_usecase]),
+    admin_api_key: str = Depends(Provide[Container.admin_api_key]),
 ):
     level_filter_codes: list[FilterCode] | None = None
     if level:
@@ -40,15 +52,20 @@ async def get_recommended_problems(
 
     exclusion_mode_enum = ExclusionMode(exclusion_mode) if exclusion_mode else ExclusionMode.LENIENT
 
+    # 강제 트레이스는 관리자만 - 일반 회원은 RECOMMENDATION_TRACE_SAMPLE_RATE 샘플링만 적용
+    trace_requested = bool(x_recommendation_trace) and is_valid_admin_key(x_admin_key, admin_api_key)
+
     query = await recommendation_usecase.execute(
         user_account_id=UserAccountId(current_user.user_account_id),
         level_filter_codes=level_filter_codes,
         tag_filter_codes=tag_filter_codes,
         count=count,
         exclusion_mode=exclusion_mode_enum,
+        trace_requested=trace_requested,
     )
+    headers = {"X-Recommendation-Trace-Id": query.trace_id} if query.trace_id else None
 
-    return ApiResponse(data=RecommendationResponse.from_query(query))
+    return ApiResponse(data=RecommendationResponse.from_query(query), headers=headers)
 
 
 @router.get("/recommend-history", response_model=ApiResponseSchema[RecommendationHistoryResponse])
@@ -61,3 +78,25 @@ async def get_recommendation_history(
 ):
     query = await usecase.execute(user_account_id=current_user.user_account_id, page=page, size=size)
     return ApiResponse(data=RecommendationHistoryResponse.from_query(query).model_dump(by_alias=True))
+
+
+@admin_router.get("", response_model=ApiResponseSchema[list[dict]])
+@inject
+async def get_recent_recommendation_traces(
+    limit: int = Query(default=20, ge=1, le=200, description="조회할 트레이스 수"),
+    usecase: GetRecommendationTraceUsecase = Depends(Provide[Container.get_recommendation_trace_usecase]),
+):
+    """최근 추천 설명 트레이스 목록 조회 (ADMIN)"""
+    traces = await usecase.find_recent(limit)
+    return ApiResponse(data=traces)
+
+
+@admin_router.get("/{trace_id}", response_model=ApiResponseSchema[dict])
+@inject
+async def get_recommendation_trace(
+    trace_id: str,
+    usecase: GetRecommendationTraceUsecase = Depends(Provide[Container.get_recommendation_trace_usecase]),
+):
+    """추천 설명 트레이스 단건 조회 (ADMIN)"""
+    trace = await usecase.execute(trace_id)
+    return ApiResponse(data=trace)
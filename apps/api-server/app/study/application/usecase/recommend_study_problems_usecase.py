@@ -2,10 +2,12 @@ from app.baekjoon.domain.repository.problem_history_repository import ProblemHis
 from app.common.domain.entity.domain_event import DomainEvent
 from app.common.domain.enums import ExclusionMode
 from app.common.domain.service.event_publisher import DomainEventBus
+from app.common.domain.vo.collections import ProblemIdBitmap
 from app.common.domain.vo.identifiers import BaekjoonAccountId, StudyId, UserAccountId
 from app.core.database import transactional
 from app.core.error_codes import ErrorCode
 from app.core.exception import APIException
+from app.recommendation.application.service.exclusion_cache_service import ExclusionCacheService
 from app.recommendation.application.usecase.recommend_problems_usecase import RecommendProblemsUsecase
 from app.study.application.command.study_command import RecommendStudyProblemsCommand
 from app.study.application.query.study_recommend_query import (
@@ -26,12 +28,14 @@ class RecommendStudyProblemsUsecase:
         problem_history_repository: ProblemHistoryRepository,
         recommend_problems_usecase: RecommendProblemsUsecase,
         domain_event_bus: DomainEventBus,
+        exclusion_cache_service: ExclusionCacheService | None = None,
     ):
         self.study_repository = study_repository
         self.user_search_repository = user_search_repository
         self.problem_history_repository = problem_history_repository
         self.recommend_problems_usecase = recommend_problems_usecase
         self.domain_event_bus = domain_event_bus
+        self.exclusion_cache_service = exclusion_cache_service or ExclusionCacheService(problem_history_repository)
 
     @transactional(readonly=True)
     async def execute(self, command: RecommendStudyProblemsCommand) -> StudyRecommendProblemsQuery:
@@ -51,20 +55,19 @@ class RecommendStudyProblemsUsecase:
         user_infos = await self.user_search_repository.find_by_user_account_ids(active_member_ids)
         user_map = {u.user_account_id: u for u in user_infos}
 
-        # bj_account_id → 풀이한 problem_id set 조회
-        solved_map: dict[str, set[int]] = {}
+        # bj_account_id → 풀이한 problem_id 비트맵 조회 (백준 계정별 캐시 사용)
+        solved_map: dict[str, ProblemIdBitmap] = {}
         for u in user_infos:
-            solved_ids = await self.problem_history_repository.find_solved_ids_by_bj_account_id(
+            solved_map[u.bj_account_id] = await self.exclusion_cache_service.load_solved_history(
                 BaekjoonAccountId(u.bj_account_id)
             )
-            solved_map[u.bj_account_id] = set(solved_ids)
 
         exclusion_mode = command.exclusion_mode if isinstance(command.exclusion_mode, ExclusionMode) else ExclusionMode(command.exclusion_mode)
 
         # recommend_all_unsolved: 스터디 멤버 중 한 명이라도 푼 문제 ID를 미리 계산하여 추천 도메인에 전달
-        additional_excluded: set[int] | None = None
+        additional_excluded: ProblemIdBitmap | None = None
         if command.recommend_all_unsolved:
-            any_member_solved: set[int] = set()
+            any_member_solved = ProblemIdBitmap.empty()
             for s_ids in solved_map.values():
                 any_member_solved |= s_ids
             additional_excluded = any_member_solved if any_member_solved else None
@@ -96,7 +99,7 @@ class RecommendStudyProblemsUsecase:
                     StudyMemberSolveInfoQuery(
                         user_account_id=uid,
                         bj_account_id=user_map[uid].bj_account_id,
-                        solved=problem_query.problem_id in solved_map.get(user_map[uid].bj_account_id, set()),
+                        solved=problem_query.problem_id in solved_map.get(user_map[uid].bj_account_id, ProblemIdBitmap.empty()),
                     )
                     for uid in active_member_ids
                     if uid in user_map
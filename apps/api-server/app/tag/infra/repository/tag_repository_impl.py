@@ -7,6 +7,7 @@ from sqlalchemy.orm import joinedload, selectinload
 
 from app.common.domain.enums import TagLevel
 from app.common.domain.vo.identifiers import TagId
+from app.common.infra.cache.reference_data_cache import ReferenceDataCache
 from app.core.database import Database
 from app.tag.domain.entity.tag import Tag
 from app.tag.domain.repository.tag_repository import TagRepository
@@ -17,8 +18,9 @@ from app.tag.infra.model.tag import TagModel
 class TagRepositoryImpl(TagRepository):
     """Tag Repository 구현체"""
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, reference_data_cache: ReferenceDataCache | None = None):
         self.db = db
+        self.reference_data_cache = reference_data_cache
 
     @property
     def session(self) -> AsyncSession:
@@ -79,6 +81,15 @@ class TagRepositoryImpl(TagRepository):
             return []
 
         tag_id_values = [tid.value for tid in tag_ids]
+        cached: list[Tag] = []
+        if self.reference_data_cache is not None and self.reference_data_cache.is_ready:
+            # 캐시에는 제외(excluded) 태그가 없으므로 miss만 SQL로 조회
+            tags_by_id = self.reference_data_cache.snapshot.tags_by_id
+            cached = [tags_by_id[tid] for tid in tag_id_values if tid in tags_by_id]
+            tag_id_values = [tid for tid in tag_id_values if tid not in tags_by_id]
+            if not tag_id_values:
+                return cached
+
         stmt = (
             select(TagModel)
             .options(joinedload(TagModel.parent_tag_relations))
@@ -93,7 +104,7 @@ class TagRepositoryImpl(TagRepository):
         result = await self.session.execute(stmt)
         models = result.unique().scalars().fetchall()
 
-        return [TagMapper.to_entity(model) for model in models]
+        return cached + [TagMapper.to_entity(model) for model in models]
     
     @override
     async def find_by_code(self, code: str) -> Tag | None:
@@ -151,6 +162,9 @@ class TagRepositoryImpl(TagRepository):
     @override
     async def find_active_tags_with_relations(self) -> list[Tag]:
         """활성 태그를 선수 태그 관계 및 연관 목표와 함께 조회"""
+        if self.reference_data_cache is not None and self.reference_data_cache.is_ready:
+            return list(self.reference_data_cache.snapshot.tags)
+
         stmt = (
             select(TagModel)
             .options(
@@ -5,6 +5,7 @@ from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.domain.vo.identifiers import TargetId
+from app.common.infra.cache.reference_data_cache import ReferenceDataCache
 from app.core.database import Database
 from app.target.domain.entity.target import Target
 from app.target.domain.repository.target_repository import TargetRepository
@@ -17,8 +18,9 @@ from app.target.infra.model.target_tag import TargetTagModel
 class TargetRepositoryImpl(TargetRepository):
     """Target Repository 구현체"""
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, reference_data_cache: ReferenceDataCache | None = None):
         self.db = db
+        self.reference_data_cache = reference_data_cache
 
     @property
     def session(self) -> AsyncSession:
@@ -32,6 +34,12 @@ class TargetRepositoryImpl(TargetRepository):
     @override
     async def find_by_id(self, target_id: TargetId) -> Target | None:
         """ID로 목표 조회 (구현 필요)"""
+        # 캐시에는 활성 목표만 있으므로 miss면 SQL로 조회 (비활성 목표 포함)
+        if self.reference_data_cache is not None and self.reference_data_cache.is_ready:
+            target = self.reference_data_cache.snapshot.targets_by_id.get(target_id.value)
+            if target is not None:
+                return target
+
         stmt = select(TargetModel).where(
             and_(
                 TargetModel.target_id == target_id.value,
@@ -60,6 +68,9 @@ class TargetRepositoryImpl(TargetRepository):
     @override
     async def find_all_active(self) -> list[Target]:
         """모든 활성화된 목표 조회"""
+        if self.reference_data_cache is not None and self.reference_data_cache.is_ready:
+            return list(self.reference_data_cache.snapshot.targets_by_id.values())
+
         # 1. 활성 타겟 조회
         target_stmt = (
             select(TargetModel)
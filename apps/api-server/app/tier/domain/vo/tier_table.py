@@ -0,0 +1,60 @@
+"""티어 조회표 Value Object"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from app.common.domain.vo.identifiers import TierId
+from app.config.tier_config import TIER_CONFIG
+from app.tier.domain.entity.tier import Tier
+
+UNKNOWN_TIER_CODE = "Unknown"
+
+
+@dataclass(frozen=True)
+class TierTable:
+    """티어 레벨 → 티어 조회표
+
+    티어는 solved.ac 기준 고정 데이터(32행)라 프로세스 메모리에 한 번 올려 두고,
+    Query 조립 시 티어 이름을 await 없이 일괄 변환하는 데 사용한다.
+    애플리케이션의 티어 조회는 모두 이 표를 사용한다 (tier 테이블 JOIN / TierRepository 조회 대신).
+    """
+    _tiers_by_level: Mapping[int, Tier]
+
+    @staticmethod
+    def from_tiers(tiers: Iterable[Tier]) -> 'TierTable':
+        """티어 목록으로 생성"""
+        return TierTable(MappingProxyType({tier.tier_level: tier for tier in tiers}))
+
+    @staticmethod
+    def static() -> 'TierTable':
+        """TIER_CONFIG(tier 테이블 원본)로 생성"""
+        return TierTable.from_tiers(
+            Tier.create(
+                tier_id=TierId(row["tier_id"]),
+                tier_level=row["tier_level"],
+                tier_code=row["tier_code"],
+                tier_rating=row["tier_rating"],
+            )
+            for row in TIER_CONFIG
+        )
+
+    def get(self, tier_level: int) -> Tier | None:
+        """티어 레벨로 조회"""
+        return self._tiers_by_level.get(tier_level)
+
+    def code(self, tier_level: int) -> str:
+        """티어 레벨 → 티어 코드 (없으면 Unknown)"""
+        tier = self._tiers_by_level.get(tier_level)
+        return tier.tier_code if tier else UNKNOWN_TIER_CODE
+
+    def codes(self, tier_levels: Iterable[int]) -> dict[int, str]:
+        """여러 티어 레벨을 한 번에 티어 코드로 변환 {tier_level: tier_code}"""
+        return {level: self.code(level) for level in set(tier_levels)}
+
+    def all(self) -> list[Tier]:
+        """전체 티어 (티어 레벨 오름차순)"""
+        return [self._tiers_by_level[level] for level in sorted(self._tiers_by_level)]
+
+    def __len__(self) -> int:
+        return len(self._tiers_by_level)
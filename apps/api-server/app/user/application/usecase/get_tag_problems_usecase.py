@@ -13,7 +13,7 @@ from app.problem.application.query.problems_info_query import TagAliasQuery, Tag
 from app.problem.domain.repository.problem_repository import ProblemRepository
 from app.tag.domain.repository.tag_repository import TagRepository
 from app.target.domain.repository.target_repository import TargetRepository
-from app.tier.domain.repository.tier_repository import TierRepository
+from app.tier.domain.vo.tier_table import TierTable
 from app.user.application.command.get_tag_problems_command import GetTagProblemsCommand
 from app.user.application.query.tag_problems_query import TagProblemQuery, TagProblemsQuery
 
@@ -29,15 +29,15 @@ class GetTagProblemsUsecase:
         tag_repository: TagRepository,
         problem_repository: ProblemRepository,
         user_activity_repository: UserActivityRepository,
-        tier_repository: TierRepository,
         target_repository: TargetRepository,
+        tier_table: TierTable | None = None,
     ):
         self.baekjoon_account_repository = baekjoon_account_repository
         self.tag_repository = tag_repository
         self.problem_repository = problem_repository
         self.user_activity_repository = user_activity_repository
-        self.tier_repository = tier_repository
         self.target_repository = target_repository
+        self.tier_table = tier_table or TierTable.static()
 
     @transactional(readonly=True)
     async def execute(self, command: GetTagProblemsCommand) -> TagProblemsQuery:
@@ -96,9 +96,7 @@ class GetTagProblemsUsecase:
             return TagProblemsQuery(total_problem_count=0, problems=[])
 
         # 7. tier_map, tag_map, tag_targets_map 구성
-        unique_tier_levels = list({p.tier_level.value for p in problems})
-        tiers = await self.tier_repository.find_by_levels(unique_tier_levels) if unique_tier_levels else []
-        tier_map: dict[int, str] = {t.tier_level: t.tier_code for t in tiers}
+        tier_map = self.tier_table.codes(p.tier_level.value for p in problems)
 
         tag_ids_set = {pt.tag_id for p in problems for pt in p.tags}
         tag_entities = await self.tag_repository.find_by_ids_and_active(list(tag_ids_set)) if tag_ids_set else []
@@ -144,7 +142,7 @@ class GetTagProblemsUsecase:
                 problem_id=pid,
                 problem_title=problem.title,
                 problem_tier_level=problem.tier_level.value,
-                problem_tier_name=tier_map.get(problem.tier_level.value, "Unknown"),
+                problem_tier_name=tier_map[problem.tier_level.value],
                 problem_class_level=problem.class_level,
                 tags=tag_queries,
                 solved_date=solved_date_map.get(pid),
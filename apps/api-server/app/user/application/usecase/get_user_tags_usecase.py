@@ -12,12 +12,13 @@ from app.common.domain.vo.identifiers import UserAccountId
 from app.core.database import transactional
 from app.core.error_codes import ErrorCode
 from app.core.exception import APIException
-from app.recommendation.domain.entity.tag_skill import TagSkill
+from app.recommendation.application.service.skill_profile_service import SkillProfileService
 from app.recommendation.domain.repository.tag_skill_repository import TagSkillRepository
+from app.recommendation.domain.vo.user_skill_profile import UserSkillProfile
 from app.tag.domain.entity.tag import Tag
 from app.tag.domain.repository.tag_repository import TagRepository
 from app.tier.domain.entity.tier import Tier
-from app.tier.domain.repository.tier_repository import TierRepository
+from app.tier.domain.vo.tier_table import TierTable
 from app.user.application.command.get_user_tags_command import GetUserTagsCommand
 from app.user.application.query.user_tags_query import (
     AccountStatQuery,
@@ -48,14 +49,16 @@ class GetUserTagsUsecase:
         baekjoon_account_repository: BaekjoonAccountRepository,
         tag_repository: TagRepository,
         tag_skill_repository: TagSkillRepository,
-        tier_repository: TierRepository,
-        activity_repository: UserActivityRepository
+        activity_repository: UserActivityRepository,
+        skill_profile_service: SkillProfileService | None = None,
+        tier_table: TierTable | None = None,
     ):
         self.baekjoon_account_repository = baekjoon_account_repository
         self.tag_repository = tag_repository
         self.tag_skill_repository = tag_skill_repository
-        self.tier_repository = tier_repository
         self.activity_repository = activity_repository
+        self.skill_profile_service = skill_profile_service or SkillProfileService(baekjoon_account_repository, tag_skill_repository)
+        self.tier_table = tier_table or TierTable.static()
 
     @transactional
     async def execute(self, command: GetUserTagsCommand) -> UserTagsQuery:
@@ -76,24 +79,14 @@ class GetUserTagsUsecase:
             logger.error(f"[GetUserTagsUsecase] 백준 계정 연동 정보를 찾을 수 없음: {command.user_account_id}")
             raise APIException(ErrorCode.UNLINKED_USER)
 
-        # 2. 모든 데이터 미리 조회
-        # user_account_id를 전달하여 streak이 없을 때 problem_record 날짜 사용
-        tag_stats = await self.baekjoon_account_repository.get_tag_stats(
-            bj_account.bj_account_id,
-            user_account_id
-        )
+        # 2. 모든 데이터 미리 조회 (태그별 숙련도는 프로필에서 한 번에 판별, 유저별 캐시)
+        skill_profile: UserSkillProfile = await self.skill_profile_service.load(user_account_id, bj_account)
         all_tags = await self.tag_repository.find_active_tags_with_relations()
-        all_tag_skills = await self.tag_skill_repository.find_all_active()
-        all_tiers = await self.tier_repository.find_all()
         activity: UserActivity = await self.activity_repository.find_only_tag_custom_by_user_account_id(user_account_id)
 
         # 3. 데이터 가공 및 매핑 생성
-        tag_stats_dict: dict[int, TagAccountStat] = {stat.tag_id.value: stat for stat in tag_stats}
         all_tags_dict: dict[int, Tag] = {tag.tag_id.value: tag for tag in all_tags if tag.tag_id}
-        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill] = {
-            (ts.tag_id.value, ts.skill_code): ts for ts in all_tag_skills if ts.tag_id
-        }
-        tiers_dict: dict[int, Tier] = {tier.tier_id.value: tier for tier in all_tiers if tier.tier_id}
+        tiers_dict: dict[int, Tier] = {tier.tier_id.value: tier for tier in self.tier_table.all() if tier.tier_id}
 
         # 4. 태그별 상세 정보 생성
         tag_details: list[UserTagDetailQuery] = []
@@ -101,8 +94,8 @@ class GetUserTagsUsecase:
             if not tag.tag_id:
                 continue
 
-            stat: TagAccountStat | None = tag_stats_dict.get(tag.tag_id.value)
-            current_level = self._calculate_current_level(stat, tag, tag_skills_dict)
+            stat: TagAccountStat | None = skill_profile.stat(tag.tag_id)
+            current_level = skill_profile.level(tag.tag_id).achieved_level
             
             # 선수 태그 및 locked_yn 계산 (parent_tag_relations 사용)
             locked_yn = False
@@ -114,8 +107,7 @@ class GetUserTagsUsecase:
                     if not parent_tag or not parent_tag.tag_id:
                         continue
                     
-                    parent_tag_stat = tag_stats_dict.get(parent_tag.tag_id.value)
-                    parent_current_level = self._calculate_current_level(parent_tag_stat, parent_tag, tag_skills_dict)
+                    parent_current_level = skill_profile.level(parent_tag.tag_id).achieved_level
                     satisfied_yn = parent_current_level != SkillCode.IM
 
                     if not satisfied_yn:
@@ -132,7 +124,7 @@ class GetUserTagsUsecase:
             
             # required_stat 생성 (선수 태그 유무와 상관없이 항상 생성)
             # tag_skill의 IM(INTERMEDIATE) 레벨에서 min_user_tier 기준을 가져옴
-            im_skill = tag_skills_dict.get((tag.tag_id.value, SkillCode.IM))
+            im_skill = skill_profile.tag_skill(tag.tag_id, SkillCode.IM)
             min_tier_value = None
             if im_skill and im_skill.requirements.min_user_tier:
                 min_tier_value = im_skill.requirements.min_user_tier.value
@@ -151,7 +143,7 @@ class GetUserTagsUsecase:
 
             # DTO 생성
             account_stat = self._create_account_stat(stat, current_level, tiers_dict, bj_account.current_tier_id.value)
-            next_level_stat = self._create_next_level_stat(current_level, tag, tag_skills_dict, tiers_dict)
+            next_level_stat = self._create_next_level_stat(current_level, tag, skill_profile, tiers_dict)
             
             # Fix alias query: tag.aliases is list[str], not list[dict]
             alias_queries = [TagAliasQuery(alias=alias['alias']) for alias in tag.aliases]
@@ -186,41 +178,6 @@ class GetUserTagsUsecase:
 
         return UserTagsQuery(categories=categories, tags=tag_details)
 
-    def _calculate_current_level(
-        self,
-        stat: TagAccountStat | None,
-        tag: Tag,
-        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill],
-    ) -> SkillCode:
-        """현재 레벨 계산"""
-        if not stat or stat.solved_problem_count == 0:
-            return SkillCode.IM
-
-        tag_id_val = tag.tag_id.value
-
-        # MASTER 체크
-        master_skill = tag_skills_dict.get((tag_id_val, SkillCode.MAS))
-        if master_skill and self._meets_requirements(stat, master_skill):
-            return SkillCode.MAS
-
-        # ADVANCED 체크
-        advanced_skill = tag_skills_dict.get((tag_id_val, SkillCode.AD))
-        if advanced_skill and self._meets_requirements(stat, advanced_skill):
-            return SkillCode.AD
-
-        return SkillCode.IM
-
-    def _meets_requirements(self, stat: TagAccountStat, tag_skill: TagSkill) -> bool:
-        """TagSkill 요구사항 만족 여부"""
-        if stat.solved_problem_count < tag_skill.requirements.min_solved_problem:
-            return False
-
-        min_tier = tag_skill.requirements.min_solved_problem_tier
-        if stat.highest_tier_id and stat.highest_tier_id.value < min_tier.value:
-            return False
-
-        return True
-
     def _create_account_stat(
         self,
         stat: TagAccountStat | None,
@@ -253,7 +210,7 @@ class GetUserTagsUsecase:
         self,
         current_level: SkillCode,
         tag: Tag,
-        tag_skills_dict: dict[tuple[int, SkillCode], TagSkill],
+        skill_profile: UserSkillProfile,
         tiers_dict: dict[int, Tier],
     ) -> NextLevelStatQuery | None:
         """다음 레벨 요구사항 생성"""
@@ -267,7 +224,7 @@ class GetUserTagsUsecase:
         else:
             return None # Should not happen unless SkillCode has more levels
 
-        next_skill = tag_skills_dict.get((tag.tag_id.value, next_level_code))
+        next_skill = skill_profile.tag_skill(tag.tag_id, next_level_code)
         if not next_skill:
             return None
         
@@ -17,6 +17,8 @@ class AccountLinkModel(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     is_synced: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default="0")
+    # bj_account_tag_stat 전체 적재 시각 (NULL이면 미적재 - 통계 행이 0개인 계정과 구분)
+    tag_stat_built_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     __table_args__ = (
         Index('idx_user_account_id', 'user_account_id'),
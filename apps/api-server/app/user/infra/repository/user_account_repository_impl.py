@@ -6,7 +6,7 @@ from sqlalchemy.orm import joinedload
 
 from app.common.domain.vo.identifiers import UserAccountId
 from app.common.domain.enums import Provider
-from app.core.database import Database
+from app.core.database import Database, invalidate_request_cache
 from app.core.error_codes import ErrorCode
 from app.core.exception import APIException
 from app.user.domain.entity.user_account import UserAccount
@@ -123,6 +123,9 @@ class UserAccountRepositoryImpl(UserAccountRepository):
         # 3. 변경사항 확정
         await self.session.flush()
 
+        # account_links가 바뀌었을 수 있으므로 연동 계정 조회 캐시 무효화
+        invalidate_request_cache("account_link")
+
     async def delete(self, user_account: UserAccount) -> None:
         """
         사용자 계정 삭제 (Hard Delete)
@@ -131,18 +134,23 @@ class UserAccountRepositoryImpl(UserAccountRepository):
         from sqlalchemy import delete
         from app.user.infra.model.user_target import UserTargetModel
         from app.user.infra.model.account_link import AccountLinkModel
+        from app.baekjoon.infra.model.bj_account_tag_stat import BjAccountTagStatModel
 
         user_id_value = user_account.user_account_id.value
 
-        # 1. user_target 삭제
+        # 1. user_target / 태그별 통계 삭제
         await self.session.execute(
             delete(UserTargetModel).where(UserTargetModel.user_account_id == user_id_value)
         )
+        await self.session.execute(
+            delete(BjAccountTagStatModel).where(BjAccountTagStatModel.user_account_id == user_id_value)
+        )
 
         # 2. account_link 삭제
         await self.session.execute(
             delete(AccountLinkModel).where(AccountLinkModel.user_account_id == user_id_value)
         )
+        invalidate_request_cache("account_link")
 
         # 3. user_account 삭제
         await self.session.execute(
@@ -154,7 +162,7 @@ class UserAccountRepositoryImpl(UserAccountRepository):
         특정 Provider의 모든 유저 삭제 (Hard Delete)
 
         CASCADE 삭제 순서:
-        1. bj_account 관련 (problem_history, tag_skill_history, scheduler_log)
+        1. bj_account 관련 (problem_history, tag_skill_history, bj_account_tag_stat, scheduler_log)
         2. activity 관련 (user_date_record, problem_record, will_solve_problem, problem_banned_record, tag_customization)
         3. account_link
         4. user_target
@@ -167,6 +175,7 @@ class UserAccountRepositoryImpl(UserAccountRepository):
         from app.baekjoon.infra.model.problem_history import ProblemHistoryModel
         from app.baekjoon.infra.model.scheduler_log import SchedulerLogModel
         from app.baekjoon.infra.model.tag_skill_history import TagSkillHistoryModel
+        from app.baekjoon.infra.model.bj_account_tag_stat import BjAccountTagStatModel
         from app.activity.infra.model.user_problem_status import UserProblemStatusModel
         from app.activity.infra.model.tag_custom import TagCustomModel
         from app.activity.infra.model.user_date_record import UserDateRecordModel
@@ -196,6 +205,9 @@ class UserAccountRepositoryImpl(UserAccountRepository):
             await self.session.execute(
                 delete(TagSkillHistoryModel).where(TagSkillHistoryModel.bj_account_id.in_(bj_account_ids))
             )
+            await self.session.execute(
+                delete(BjAccountTagStatModel).where(BjAccountTagStatModel.bj_account_id.in_(bj_account_ids))
+            )
             await self.session.execute(
                 delete(SchedulerLogModel).where(SchedulerLogModel.bj_account_id.in_(bj_account_ids))
             )
@@ -218,6 +230,7 @@ class UserAccountRepositoryImpl(UserAccountRepository):
         await self.session.execute(
             delete(AccountLinkModel).where(AccountLinkModel.user_account_id.in_(user_ids))
         )
+        invalidate_request_cache("account_link", "bj_account")
 
         # 6. user_target 삭제
         await self.session.execute(
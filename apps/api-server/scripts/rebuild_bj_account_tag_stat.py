@@ -0,0 +1,81 @@
+"""
+bj_account_tag_stat(백준 계정 태그별 통계) 재적재 / 정합성 확인 스크립트
+
+평소에는 연동 / 갱신 / 날짜 기록 저장 시 증분 갱신되지만,
+문제 메타데이터 동기화로 문제 티어 / 태그가 바뀌면 저장된 값과 달라질 수 있으므로
+주기적으로 --check로 확인하고 필요하면 재적재한다.
+
+사용법:
+  python scripts/rebuild_bj_account_tag_stat.py                      # 전체 재적재 (연동 끊긴 행 정리 포함)
+  python scripts/rebuild_bj_account_tag_stat.py --bj-account-id foo  # 특정 백준 계정만 재적재
+  python scripts/rebuild_bj_account_tag_stat.py --check              # 정합성 확인만 (불일치 시 exit 1)
+  python scripts/rebuild_bj_account_tag_stat.py --check --fix        # 불일치한 연동만 재적재
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# db_initializer.py와 동일한 방식으로 프로젝트 루트를 경로에 추가
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from app.core.containers import Container
+from app.core.database import reset_database_context, set_database_context, set_global_database
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+
+async def run(args: argparse.Namespace) -> int:
+    container = Container()
+    db = container.database()
+    set_global_database(db)
+    # 요청 미들웨어 밖이므로 @transactional이 쓸 Database 컨텍스트를 직접 설정
+    token = set_database_context(db)
+    service = container.bj_account_tag_stat_service()
+
+    try:
+        if not args.check:
+            result = await service.rebuild_all(args.bj_account_id)
+            logger.info(
+                f"재적재: {result.rebuilt_count}개 연동, {result.row_count}행 "
+                f"(연동 끊긴 행 {result.deleted_unlinked_count}건 삭제)"
+            )
+            return 0
+
+        result = await service.check_all(args.bj_account_id, fix=args.fix)
+        for mismatch in result.mismatches:
+            logger.warning(
+                f"불일치 {mismatch.bj_account_id} / user {mismatch.user_account_id}: "
+                f"누락 {mismatch.missing_tag_ids}, 초과 {mismatch.unexpected_tag_ids}, 값 차이 {mismatch.changed_tag_ids}"
+            )
+        logger.info(
+            f"확인: {result.checked_count}개 연동, 불일치 {len(result.mismatches)}건, 재적재 {result.fixed_count}건"
+        )
+        return 0 if result.consistent or args.fix else 1
+    finally:
+        reset_database_context(token)
+        await db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bj_account_tag_stat 재적재 / 정합성 확인")
+    parser.add_argument("--check", action="store_true", help="재적재 없이 problem_history 집계와 비교만 수행")
+    parser.add_argument("--fix", action="store_true", help="--check와 함께 사용: 불일치한 연동만 재적재")
+    parser.add_argument("--bj-account-id", default=None, help="특정 백준 계정만 처리")
+    args = parser.parse_args()
+
+    if args.fix and not args.check:
+        parser.error("--fix는 --check와 함께 사용해야 합니다.")
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+solved.ac 문제 검색 API를 흉내 내는 오프라인 가짜 서버
+
+httpx.MockTransport로 /api/v3/search/problem 페이지 응답을 만들어
+ProblemMetadataSyncService.sync_problems 파이프라인을 네트워크 없이 실행/벤치마크할 수 있게 한다.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+import httpx
+
+from app.common.infra.client.http_client import HostPolicy, HttpClientSettings, create_http_client
+from app.common.infra.client.rate_limiter import AdaptiveTokenBucket
+
+
+@dataclass
+class FakeSolvedAcServer:
+    """페이지당 per_page개 문제를 돌려주는 가짜 검색 API
+
+    - latency: 응답마다 지연 (초)
+    - rate_limit_every: N번째 요청마다 429 + Retry-After 응답 (0이면 비활성)
+    """
+    total: int = 1000
+    per_page: int = 50
+    tag_keys: tuple[str, ...] = ("math", "dp", "graphs")
+    latency: float = 0.0
+    rate_limit_every: int = 0
+    retry_after: float = 0.01
+    requests: list[int] = field(default_factory=list)
+    rate_limited: int = 0
+
+    @property
+    def total_pages(self) -> int:
+        return (self.total + self.per_page - 1) // self.per_page
+
+    def problem(self, problem_id: int) -> dict:
+        return {
+            "problemId": problem_id,
+            "titleKo": f"문제 {problem_id}",
+            "level": problem_id % 31,
+            "acceptedUserCount": problem_id * 7 % 5000,
+            "tags": [{"key": self.tag_keys[problem_id % len(self.tag_keys)]}],
+        }
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        self.requests.append(page)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self.rate_limit_every and len(self.requests) % self.rate_limit_every == 0:
+            self.rate_limited += 1
+            return httpx.Response(429, headers={"Retry-After": str(self.retry_after)})
+
+        start = (page - 1) * self.per_page + 1
+        end = min(start + self.per_page, self.total + 1)
+        items = [self.problem(problem_id) for problem_id in range(start, end)]
+        return httpx.Response(200, json={"count": self.total, "items": items})
+
+    def client(self, rate: float = 1000.0, max_retries: int = 3) -> httpx.AsyncClient:
+        """운영 공유 클라이언트처럼 solved.ac 호스트 정책(토큰 버킷 + 재시도)을 건 클라이언트"""
+        settings = HttpClientSettings(policies={
+            "solved.ac": HostPolicy(
+                rate_limiter=AdaptiveTokenBucket(rate=rate, max_rate=rate),
+                max_retries=max_retries,
+                retry_backoff=0,
+            ),
+        })
+        return create_http_client(settings, transport=httpx.MockTransport(self.handle))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+월간 문제 캘린더(GET /bj-accounts/problems/monthly) 조회 오프라인 벤치마크
+
+MonthlyCalendarRepositoryImpl이 받는 결과 행을 가짜 세션으로 돌려주고
+(DB 왕복 지연은 --query-latency로 흉내), 참조 데이터 캐시를 적재한 Tag / Target Repository와 함께
+GetMonthlyProblemsUsecase → GetMonthlyProblemsResponse 변환까지 실행해 요청당 지연 시간을 출력한다.
+
+사용법:
+    poetry run python tests/scripts/benchmark_monthly_problems.py
+    poetry run python tests/scripts/benchmark_monthly_problems.py --problems 300 --will-solve 60 --query-latency 0.003
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+os.environ.setdefault("DB_SESSION", "unit")  # @transactional 우회 (세션은 아래 가짜 세션 사용)
+
+from app.baekjoon.application.command.get_monthly_problems_command import GetMonthlyProblemsCommand  # noqa: E402
+from app.baekjoon.application.usecase.get_monthly_problems_usecase import GetMonthlyProblemsUsecase  # noqa: E402
+from app.baekjoon.infra.repository.monthly_calendar_repository_impl import MonthlyCalendarRepositoryImpl  # noqa: E402
+from app.baekjoon.presentation.schema.response.get_monthly_problems_response import (  # noqa: E402
+    GetMonthlyProblemsResponse,
+)
+from app.common.domain.vo.identifiers import TagId, TargetId  # noqa: E402
+from app.common.infra.cache.reference_data_cache import ReferenceDataCache  # noqa: E402
+from app.tag.infra.repository.tag_repository_impl import TagRepositoryImpl  # noqa: E402
+from app.target.infra.repository.target_repository_impl import TargetRepositoryImpl  # noqa: E402
+
+YEAR, MONTH, DAYS = 2026, 3, 31
+TAG_COUNT = 200
+
+
+def build_rows(problems: int, will_solve: int, seed: int) -> list[tuple]:
+    """월간 쿼리 결과 행 (marked_date, display_order 정렬)"""
+    rng = random.Random(seed)
+    rows = []
+    for index in range(problems + will_solve):
+        tag_ids = rng.sample(range(1, TAG_COUNT + 1), k=rng.randint(1, 5))
+        rows.append((
+            date(YEAR, MONTH, rng.randint(1, DAYS)), index,
+            "SOLVED" if index < problems else "WILL_SOLVE",
+            1000 + index, f"문제 {1000 + index}", rng.randint(1, 25), "G5", None,
+            ",".join(map(str, tag_ids)),
+            tag_ids[0], f"tag{tag_ids[0]}", f"태그 {tag_ids[0]}",
+        ))
+    rows.sort(key=lambda row: (row[0], row[1]))
+    return rows
+
+
+def build_reference_cache() -> ReferenceDataCache:
+    tags = [
+        SimpleNamespace(tag_id=TagId(i), code=f"tag{i}", tag_display_name=f"태그 {i}", aliases=[{"alias": f"t{i}"}])
+        for i in range(1, TAG_COUNT + 1)
+    ]
+    targets = [
+        SimpleNamespace(
+            target_id=TargetId(t), code=f"TARGET_{t}", display_name=f"목표 {t}",
+            required_tags=[SimpleNamespace(tag_id=TagId(i)) for i in range(t, TAG_COUNT + 1, 7)],
+        )
+        for t in range(1, 6)
+    ]
+    cache = ReferenceDataCache(db=MagicMock())
+    cache.load(tags=tags, tag_skills=[], targets=targets)
+    return cache
+
+
+async def run(args: argparse.Namespace) -> None:
+    rows = build_rows(args.problems, args.will_solve, args.seed)
+    query_count = 0
+
+    async def execute(*_args, **_kwargs):
+        nonlocal query_count
+        query_count += 1
+        await asyncio.sleep(args.query_latency)
+        result = MagicMock()
+        result.all.return_value = rows
+        return result
+
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=execute)
+    db = MagicMock()
+    db.get_current_session.return_value = session
+
+    cache = build_reference_cache()
+    usecase = GetMonthlyProblemsUsecase(
+        baekjoon_account_repository=MagicMock(),
+        monthly_calendar_repository=MonthlyCalendarRepositoryImpl(db=db),
+        tag_repository=TagRepositoryImpl(db=db, reference_data_cache=cache),
+        target_repository=TargetRepositoryImpl(db=db, reference_data_cache=cache),
+    )
+    command = GetMonthlyProblemsCommand(user_account_id=1, year=YEAR, month=MONTH)
+
+    for _ in range(args.warmup):
+        GetMonthlyProblemsResponse.from_query(await usecase.execute(command))
+
+    query_count = 0
+    latencies = []
+    for _ in range(args.iterations):
+        started = time.perf_counter()
+        result = await usecase.execute(command)
+        GetMonthlyProblemsResponse.from_query(result).model_dump(by_alias=True)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"problems={result.total_problem_count} rows={len(rows)} iterations={args.iterations}")
+    print(f"queries/request={query_count / args.iterations:.1f} (simulated latency {args.query_latency * 1000:.1f}ms)")
+    print(f"latency p50={statistics.median(latencies):.2f}ms p95={p95:.2f}ms max={latencies[-1]:.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--problems", type=int, default=300, help="한 달 동안 푼 문제 수")
+    parser.add_argument("--will-solve", type=int, default=60, help="한 달 동안 풀 예정 문제 수")
+    parser.add_argument("--query-latency", type=float, default=0.002, help="월간 쿼리 1회 DB 왕복 지연 (초)")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
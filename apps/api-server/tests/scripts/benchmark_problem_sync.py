@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+주간 문제 동기화(sync_problems) 파이프라인 오프라인 벤치마크
+
+가짜 solved.ac 서버(tests/fixtures/solvedac_fake_server.py)와 지연만 흉내 내는 DB writer로
+fetch/write 파이프라인 전체를 네트워크·DB 없이 실행하고 처리량을 출력한다.
+
+사용법:
+    poetry run python tests/scripts/benchmark_problem_sync.py
+    poetry run python tests/scripts/benchmark_problem_sync.py --total 35000 --latency 0.05 --write-delay 0.2
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.problem.application.service.problem_metadata_sync_service import ProblemMetadataSyncService  # noqa: E402
+from tests.fixtures.solvedac_fake_server import FakeSolvedAcServer  # noqa: E402
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = FakeSolvedAcServer(
+        total=args.total,
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every,
+    )
+    tag_result = MagicMock()
+    tag_result.fetchall.return_value = [(i + 1, key) for i, key in enumerate(server.tag_keys)]
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=tag_result)
+
+    @asynccontextmanager
+    async def fake_session():
+        yield session
+
+    db = MagicMock()
+    db.session = fake_session
+    service = ProblemMetadataSyncService(db=db, http_client=server.client(rate=args.rate))
+
+    async def fake_upsert(session, batch, tag_code_to_id, now, full):
+        await asyncio.sleep(args.write_delay)
+        return len(batch), set()
+
+    service._upsert_problem_batch = fake_upsert
+
+    started = time.perf_counter()
+    count = (await service.sync_problems()).problem_count
+    elapsed = time.perf_counter() - started
+
+    print(f"problems={count} pages={server.total_pages} requests={len(server.requests)} 429={server.rate_limited}")
+    print(f"elapsed={elapsed:.2f}s throughput={count / elapsed:.0f} problems/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--total", type=int, default=5000, help="가짜 카탈로그 문제 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="페이지 응답 지연 (초)")
+    parser.add_argument("--rate", type=float, default=50.0, help="초당 페이지 요청 수")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="N번째 요청마다 429")
+    parser.add_argument("--write-delay", type=float, default=0.05, help="배치 upsert 1회 지연 (초)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -193,6 +193,9 @@ class TestBanProblem:
         await service.ban_problem(command)
 
         service.user_activity_repository.save_problem_banned_record.assert_called_once()
+        event = service.domain_event_bus.publish.call_args[0][0]
+        assert event.event_type == "PROBLEM_STATUS_CHANGED"
+        assert event.data.user_account_id == 1
 
     async def test_unban_problem(self, mock_database_context):
         service = _make_service()
@@ -42,3 +42,134 @@ class TestUserActivityRepository:
         )
 
         assert result == []
+
+
+class _RecordingSession:
+    """실행된 SQL을 기록하고 SELECT 결과를 미리 정해둔 순서대로 돌려주는 세션"""
+
+    def __init__(self, status_rows: list[list], solved_rows: list | None = None):
+        self.status_rows = status_rows
+        self.solved_rows = solved_rows or []
+        self.statements: list[tuple[str, object]] = []
+        self.identity_map: dict = {}
+
+    async def flush(self):
+        pass
+
+    def expire(self, obj):
+        pass
+
+    async def execute(self, stmt, params=None):
+        sql = " ".join(str(stmt).split())
+        self.statements.append((sql, params))
+        result = MagicMock()
+        if sql.startswith("SELECT") and "FROM user_problem_status" in sql:
+            result.all.return_value = self.status_rows.pop(0)
+        elif sql.startswith("SELECT") and "FROM problem_date_record" in sql:
+            result.all.return_value = self.solved_rows
+        return result
+
+
+def _status_row(status_id: int, problem_id: int, solved_yn: bool, bj: str = "bj"):
+    from types import SimpleNamespace
+    return SimpleNamespace(
+        user_problem_status_id=status_id, user_account_id=1,
+        bj_account_id=bj, problem_id=problem_id, solved_yn=solved_yn,
+    )
+
+
+def _bulk_repo(session: _RecordingSession) -> UserActivityRepositoryImpl:
+    db = MagicMock()
+    db.get_current_session.return_value = session
+    return UserActivityRepositoryImpl(db=db)
+
+
+class TestSaveAllProblemRecordsBulk:
+    """save_all_problem_records 집합 단위 저장 테스트"""
+
+    async def test_new_account_link_uses_constant_statements(self):
+        from app.activity.domain.entity.user_problem_status import UserProblemStatus
+        from app.common.domain.vo.identifiers import ProblemId
+
+        problem_ids = list(range(1000, 4000))
+        session = _RecordingSession(status_rows=[
+            [],                                                            # 기존 status 없음
+            [_status_row(10_000 + pid, pid, True) for pid in problem_ids],  # INSERT 후 ID 조회
+        ])
+        statuses = [
+            UserProblemStatus.create_solved(UserAccountId(1), ProblemId(pid), date(2025, 1, 1), bj_account_id="bj")
+            for pid in problem_ids
+        ]
+
+        await _bulk_repo(session).save_all_problem_records(statuses)
+
+        sqls = [sql for sql, _ in session.statements]
+        assert len(sqls) == 4
+        assert sqls[1].startswith("INSERT INTO user_problem_status")
+        assert sqls[3].startswith("INSERT INTO problem_date_record")
+        status_params = session.statements[1][1]
+        date_params = session.statements[3][1]
+        assert len(status_params) == 3000 and all(row["id"] is None for row in status_params)
+        assert len(date_params) == 3000
+        assert date_params[0]["status_id"] == 11_000
+        assert date_params[0]["record_type"] == "SOLVED"
+
+    async def test_will_solve_to_solved_soft_deletes_and_skips_duplicate_solved(self):
+        from app.activity.domain.entity.user_problem_status import UserProblemStatus
+        from app.common.domain.vo.identifiers import ProblemId
+        from types import SimpleNamespace
+
+        session = _RecordingSession(
+            status_rows=[[_status_row(1, 100, False), _status_row(2, 200, True)]],
+            solved_rows=[SimpleNamespace(problem_date_record_id=50, user_problem_status_id=2)],
+        )
+        statuses = [
+            UserProblemStatus.create_solved(UserAccountId(1), ProblemId(100), date(2025, 1, 1), bj_account_id="bj"),
+            UserProblemStatus.create_solved(UserAccountId(1), ProblemId(200), date(2025, 1, 1), bj_account_id="bj"),
+        ]
+
+        await _bulk_repo(session).save_all_problem_records(statuses)
+
+        sqls = [sql for sql, _ in session.statements]
+        assert any(sql.startswith("UPDATE problem_date_record") for sql in sqls)
+        status_params = next(p for sql, p in session.statements if sql.startswith("INSERT INTO user_problem_status"))
+        assert [row["id"] for row in status_params] == [1, 2]
+        # 200번은 이미 활성 SOLVED가 있으므로 새 SOLVED를 만들지 않음
+        date_params = next(p for sql, p in session.statements if sql.startswith("INSERT INTO problem_date_record"))
+        assert [row["status_id"] for row in date_params] == [1]
+
+    async def test_existing_date_record_is_upserted_by_id(self):
+        from app.activity.domain.entity.user_problem_status import UserProblemStatus
+        from app.common.domain.vo.identifiers import ProblemId
+
+        status = UserProblemStatus.create_solved(UserAccountId(1), ProblemId(100), date(2025, 1, 1), bj_account_id="bj")
+        status.date_records[0].problem_date_record_id = 77
+        status.delete()
+        session = _RecordingSession(status_rows=[[_status_row(1, 100, True)]])
+
+        await _bulk_repo(session).save_all_problem_records([status])
+
+        date_params = next(p for sql, p in session.statements if sql.startswith("INSERT INTO problem_date_record"))
+        assert date_params[0]["id"] == 77
+        assert date_params[0]["deleted_at"] is not None
+
+    async def test_refreshes_tag_stat_dates_per_user(self):
+        from app.activity.domain.entity.user_problem_status import UserProblemStatus
+        from app.common.domain.vo.identifiers import ProblemId
+
+        session = _RecordingSession(status_rows=[
+            [],
+            [_status_row(1, 200, True), _status_row(2, 100, True)],
+        ])
+        tag_stat_repository = MagicMock()
+        tag_stat_repository.refresh_last_solved_dates = AsyncMock()
+        db = MagicMock()
+        db.get_current_session.return_value = session
+        repo = UserActivityRepositoryImpl(db=db, bj_account_tag_stat_repository=tag_stat_repository)
+
+        await repo.save_all_problem_records([
+            UserProblemStatus.create_solved(UserAccountId(1), ProblemId(200), date(2025, 1, 1), bj_account_id="bj"),
+            UserProblemStatus.create_solved(UserAccountId(1), ProblemId(100), date(2025, 1, 1), bj_account_id="bj"),
+        ])
+
+        tag_stat_repository.refresh_last_solved_dates.assert_awaited_once_with(UserAccountId(1), [100, 200])
@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+import json
 from datetime import date, timedelta
 from unittest.mock import AsyncMock, MagicMock
 import httpx
@@ -803,3 +804,180 @@ class TestUpdateBjAccountUsecase:
 
         # 검증: 두 번 모두 업데이트됨
         assert usecase.baekjoon_account_repository.update_stat.call_count == 2
+
+
+class TestUpdateBjAccountBulk:
+    """UpdateBjAccountUsecase.execute_bulk() 테스트"""
+
+    def _make_usecase(self, handles: list[str], monkeypatch, redis_store: dict | None = None):
+        from app.baekjoon.application.usecase import update_bj_account_usecase as module
+
+        monkeypatch.setattr(module, "_BULK_RETRY_BACKOFF", 0)
+        redis_client = None
+        if redis_store is not None:
+            redis_client = AsyncMock()
+            redis_client.get.side_effect = lambda key: redis_store.get(key)
+            redis_client.set.side_effect = lambda key, value, ex=None: redis_store.__setitem__(key, value)
+            redis_client.delete.side_effect = lambda key: redis_store.pop(key, None)
+
+        usecase = module.UpdateBjAccountUsecase(
+            baekjoon_account_repository=AsyncMock(),
+            problem_history_repository=AsyncMock(),
+            solvedac_gateway=AsyncMock(),
+            user_date_record_repository=AsyncMock(),
+            user_activity_repository=AsyncMock(),
+            system_log_repository=AsyncMock(),
+            problem_update_service=AsyncMock(),
+            domain_event_bus=AsyncMock(),
+            redis_client=redis_client,
+        )
+        accounts = []
+        for handle in handles:
+            account = MagicMock()
+            account.bj_account_id = BaekjoonAccountId(handle)
+            accounts.append(account)
+        usecase.baekjoon_account_repository.find_all.return_value = accounts
+        return usecase
+
+    async def test_retries_then_records_failure(self, monkeypatch):
+        usecase = self._make_usecase(["a", "b", "c"], monkeypatch)
+        attempts: dict[str, int] = {}
+
+        async def refresh(bj_account):
+            handle = bj_account.bj_account_id.value
+            attempts[handle] = attempts.get(handle, 0) + 1
+            if handle == "b" and attempts[handle] < 2:
+                raise RuntimeError("temporary")
+            if handle == "c":
+                raise RuntimeError("always")
+
+        usecase._refresh_account = refresh
+
+        result = await usecase.execute_bulk()
+
+        assert attempts == {"a": 1, "b": 2, "c": 3}
+        assert (result.succeeded_count, result.failed_count, result.retried_count) == (2, 1, 3)
+        usecase.system_log_repository.save.assert_awaited_once()
+
+    async def test_runs_accounts_concurrently(self, monkeypatch):
+        usecase = self._make_usecase([f"user{i}" for i in range(8)], monkeypatch)
+        running = 0
+        peak = 0
+
+        async def refresh(bj_account):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        usecase._refresh_account = refresh
+
+        result = await usecase.execute_bulk()
+
+        assert result.succeeded_count == 8
+        assert peak > 1
+
+    async def test_resumes_after_checkpoint(self, monkeypatch):
+        store: dict = {}
+        usecase = self._make_usecase(["a", "b", "c", "d"], monkeypatch, redis_store=store)
+        key = f"bj-account:bulk-refresh:checkpoint:{date.today().isoformat()}"
+        store[key] = {"last": "b"}
+        refreshed = []
+
+        async def refresh(bj_account):
+            refreshed.append(bj_account.bj_account_id.value)
+
+        usecase._refresh_account = refresh
+
+        result = await usecase.execute_bulk()
+
+        assert sorted(refreshed) == ["c", "d"]
+        assert result.resumed_count == 2
+        assert key not in store  # 정상 종료 시 체크포인트 삭제
+
+    async def test_checkpoint_advances_only_over_contiguous_prefix(self, monkeypatch):
+        store: dict = {}
+        usecase = self._make_usecase(["a", "b", "c"], monkeypatch, redis_store=store)
+        saved = []
+        usecase.redis_client.set.side_effect = lambda key, value, ex=None: saved.append(value)
+        release_a = asyncio.Event()
+
+        async def refresh(bj_account):
+            if bj_account.bj_account_id.value == "a":
+                await release_a.wait()
+            else:
+                await asyncio.sleep(0)
+                if bj_account.bj_account_id.value == "c":
+                    release_a.set()
+
+        usecase._refresh_account = refresh
+
+        await usecase.execute_bulk()
+
+        # b, c가 먼저 끝나도 a가 끝나기 전에는 체크포인트가 전진하지 않음
+        assert saved == [{"last": "c"}]
+
+    async def test_checkpoint_does_not_advance_past_failed_account(self, monkeypatch):
+        store: dict = {}
+        usecase = self._make_usecase(["a", "b", "c"], monkeypatch, redis_store=store)
+        saved = []
+        usecase.redis_client.set.side_effect = lambda key, value, ex=None: saved.append(value)
+
+        async def refresh(bj_account):
+            if bj_account.bj_account_id.value == "b":
+                raise RuntimeError("always")
+
+        usecase._refresh_account = refresh
+
+        await usecase.execute_bulk()
+
+        assert saved == [{"last": "a"}]
+
+    async def test_checkpoint_keeps_json_like_handle(self, monkeypatch):
+        # 실제 Redis 클라이언트처럼 저장 시 JSON 직렬화, 조회 시 JSON 파싱
+        store: dict = {}
+        usecase = self._make_usecase(["a"], monkeypatch, redis_store=store)
+        usecase.redis_client.set.side_effect = lambda key, value, ex=None: store.__setitem__(
+            key, value if isinstance(value, str) else json.dumps(value)
+        )
+        usecase.redis_client.get.side_effect = lambda key: json.loads(store[key]) if key in store else None
+
+        await usecase._save_checkpoint(date.today(), "true")
+
+        assert await usecase._load_checkpoint(date.today()) == "true"
+
+    async def test_unchanged_account_is_skipped_by_scheduler(self, monkeypatch):
+        from app.common.domain.enums import SystemLogType
+
+        usecase = self._make_usecase(["a"], monkeypatch)
+        bj_account = usecase.baekjoon_account_repository.find_all.return_value[0]
+        usecase.problem_history_repository.find_solved_ids_by_bj_account_id.return_value = {1000}
+        usecase.solvedac_gateway.fetch_user_data.return_value = MagicMock(changed=False)
+
+        await usecase._sync_solved_ac(bj_account, log_type=SystemLogType.SCHEDULER)
+
+        usecase.solvedac_gateway.fetch_user_data.assert_awaited_once_with("a", bj_account.solvedac_fingerprint, {1000})
+        usecase.baekjoon_account_repository.update_stat.assert_not_called()
+        usecase.solvedac_gateway.fetch_user_data_first.assert_not_called()
+
+    @pytest.mark.parametrize("saved_ids, fingerprint_updated", [([2000, 3000], True), ([2000], False)])
+    async def test_fingerprint_updated_only_when_all_new_problems_saved(
+        self, monkeypatch, saved_ids, fingerprint_updated
+    ):
+        from app.common.domain.enums import SystemLogType
+
+        usecase = self._make_usecase(["a"], monkeypatch)
+        bj_account = usecase.baekjoon_account_repository.find_all.return_value[0]
+        usecase.problem_history_repository.find_solved_ids_by_bj_account_id.return_value = {1000}
+        user_data = MagicMock(changed=True, fingerprint="new")
+        user_data.user_info.tier = TIER_GOLD_V
+        user_data.problems = [MagicMock(problem_id=1000), MagicMock(problem_id=2000), MagicMock(problem_id=3000)]
+        usecase.solvedac_gateway.fetch_user_data.return_value = user_data
+        usecase.problem_update_service.ensure_problems_exist.return_value = saved_ids
+        usecase._find_linked_user_account_ids = AsyncMock(return_value=[])
+
+        await usecase._sync_solved_ac(bj_account, log_type=SystemLogType.SCHEDULER)
+
+        assert bj_account.update_solvedac_fingerprint.called is fingerprint_updated
+        usecase.baekjoon_account_repository.update_stat.assert_awaited_once()
@@ -0,0 +1,109 @@
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+from app.baekjoon.application.service.bj_account_tag_stat_service import BjAccountTagStatService
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.common.domain.vo.identifiers import BaekjoonAccountId, TagId, TierId, UserAccountId
+
+PAIR = (BaekjoonAccountId("bj"), UserAccountId(1))
+
+
+def _stat(tag_id: int, count: int = 3, day: int | None = 1) -> TagAccountStat:
+    return TagAccountStat(
+        tag_id=TagId(tag_id),
+        solved_problem_count=count,
+        highest_tier_id=TierId(10),
+        last_solved_date=date(2026, 1, day) if day else None,
+    )
+
+
+def _make_service(stored: list[TagAccountStat], expected: list[TagAccountStat]) -> BjAccountTagStatService:
+    tag_stat_repository = MagicMock()
+    tag_stat_repository.find_linked_pairs = AsyncMock(return_value=[PAIR])
+    tag_stat_repository.find_by_account = AsyncMock(return_value=stored)
+    tag_stat_repository.rebuild = AsyncMock(return_value=len(expected))
+    tag_stat_repository.delete_unlinked = AsyncMock(return_value=2)
+    baekjoon_account_repository = MagicMock()
+    baekjoon_account_repository.aggregate_tag_stats = AsyncMock(return_value=expected)
+    return BjAccountTagStatService(
+        baekjoon_account_repository=baekjoon_account_repository,
+        bj_account_tag_stat_repository=tag_stat_repository,
+    )
+
+
+class TestBjAccountTagStatService:
+    """BjAccountTagStatService 테스트"""
+
+    async def test_check_consistent(self):
+        service = _make_service([_stat(1), _stat(2)], [_stat(2), _stat(1)])
+
+        result = await service.check_all()
+
+        assert result.checked_count == 1
+        assert result.consistent
+
+    async def test_check_reports_missing_unexpected_and_changed_tags(self):
+        service = _make_service(
+            stored=[_stat(1), _stat(2, count=3), _stat(9)],
+            expected=[_stat(1), _stat(2, count=4), _stat(3)],
+        )
+
+        result = await service.check_all()
+
+        mismatch = result.mismatches[0]
+        assert (mismatch.bj_account_id, mismatch.user_account_id) == ("bj", 1)
+        assert mismatch.missing_tag_ids == [3]
+        assert mismatch.unexpected_tag_ids == [9]
+        assert mismatch.changed_tag_ids == [2]
+        service.bj_account_tag_stat_repository.rebuild.assert_not_called()
+
+    async def test_check_with_fix_rebuilds_mismatched_pairs(self):
+        service = _make_service(stored=[_stat(1, day=None)], expected=[_stat(1, day=5)])
+
+        result = await service.check_all(fix=True)
+
+        assert result.fixed_count == 1
+        service.bj_account_tag_stat_repository.rebuild.assert_awaited_once_with(*PAIR, None)
+
+    async def test_rebuild_all_cleans_unlinked_rows(self):
+        service = _make_service(stored=[], expected=[_stat(1), _stat(2)])
+
+        result = await service.rebuild_all()
+
+        assert (result.rebuilt_count, result.row_count, result.deleted_unlinked_count) == (1, 2, 2)
+
+    async def test_rebuild_single_account_skips_cleanup(self):
+        service = _make_service(stored=[], expected=[_stat(1)])
+
+        result = await service.rebuild_all("bj")
+
+        service.bj_account_tag_stat_repository.find_linked_pairs.assert_awaited_once_with(BaekjoonAccountId("bj"), None)
+        service.bj_account_tag_stat_repository.delete_unlinked.assert_not_called()
+        assert result.deleted_unlinked_count == 0
+
+    async def test_rebuild_tags_reaggregates_only_affected_tags(self):
+        service = _make_service(stored=[], expected=[_stat(1), _stat(2)])
+
+        result = await service.rebuild_tags({1, 2})
+
+        repository = service.bj_account_tag_stat_repository
+        repository.find_linked_pairs.assert_awaited_once_with(None, {1, 2})
+        repository.rebuild.assert_awaited_once_with(*PAIR, {1, 2})
+        repository.delete_unlinked.assert_not_called()
+        assert (result.rebuilt_count, result.row_count) == (1, 2)
+
+    async def test_rebuild_tags_without_affected_tags_is_noop(self):
+        service = _make_service(stored=[], expected=[])
+
+        result = await service.rebuild_tags(set())
+
+        service.bj_account_tag_stat_repository.find_linked_pairs.assert_not_called()
+        assert result.rebuilt_count == 0
+
+    async def test_rebuild_tags_after_full_sync_rebuilds_all(self):
+        service = _make_service(stored=[], expected=[_stat(1)])
+
+        result = await service.rebuild_tags(None)
+
+        service.bj_account_tag_stat_repository.rebuild.assert_awaited_once_with(*PAIR, None)
+        assert result.deleted_unlinked_count == 2
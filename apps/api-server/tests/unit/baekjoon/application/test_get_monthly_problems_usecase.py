@@ -0,0 +1,156 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.baekjoon.application.command.get_monthly_problems_command import GetMonthlyProblemsCommand
+from app.baekjoon.application.usecase.get_monthly_problems_usecase import GetMonthlyProblemsUsecase
+from app.baekjoon.domain.vo.monthly_calendar_entry import MonthlyCalendarEntry
+from app.baekjoon.presentation.schema.response.get_monthly_problems_response import GetMonthlyProblemsResponse
+from app.common.domain.vo.identifiers import TagId, TargetId
+from app.core.exception import APIException
+
+
+def _entry(problem_id: int, day: int, solved: bool, order: int = 0, tag_ids=(), rep_tag_id=None) -> MonthlyCalendarEntry:
+    return MonthlyCalendarEntry(
+        marked_date=date(2026, 2, day),
+        display_order=order,
+        solved=solved,
+        problem_id=problem_id,
+        problem_title=f"P{problem_id}",
+        problem_tier_level=5,
+        problem_tier_name="B1",
+        problem_class_level=None,
+        tag_ids=tuple(tag_ids),
+        representative_tag_id=rep_tag_id,
+        representative_tag_code=f"tag{rep_tag_id}" if rep_tag_id else None,
+        representative_tag_display_name=f"Tag {rep_tag_id}" if rep_tag_id else None,
+    )
+
+
+def _tag(tag_id: int):
+    return SimpleNamespace(
+        tag_id=TagId(tag_id),
+        code=f"tag{tag_id}",
+        tag_display_name=f"Tag {tag_id}",
+        aliases=[{"alias": f"alias{tag_id}"}],
+    )
+
+
+def _make_usecase(entries: list[MonthlyCalendarEntry], bj_account=None) -> GetMonthlyProblemsUsecase:
+    calendar_repository = MagicMock()
+    calendar_repository.find_month_entries = AsyncMock(return_value=entries)
+    baekjoon_account_repository = MagicMock()
+    baekjoon_account_repository.find_by_user_id = AsyncMock(return_value=bj_account)
+    tag_repository = MagicMock()
+    tag_repository.find_by_ids_and_active = AsyncMock(
+        side_effect=lambda tag_ids: [_tag(tid.value) for tid in tag_ids if tid.value != 99]
+    )
+    target_repository = MagicMock()
+    target_repository.find_all_active = AsyncMock(return_value=[SimpleNamespace(
+        target_id=TargetId(7),
+        code="CODING_TEST",
+        display_name="코딩 테스트",
+        required_tags=[SimpleNamespace(tag_id=TagId(1))],
+    )])
+    return GetMonthlyProblemsUsecase(
+        baekjoon_account_repository=baekjoon_account_repository,
+        monthly_calendar_repository=calendar_repository,
+        tag_repository=tag_repository,
+        target_repository=target_repository,
+    )
+
+
+def _command() -> GetMonthlyProblemsCommand:
+    return GetMonthlyProblemsCommand(user_account_id=1, year=2026, month=2)
+
+
+class TestGetMonthlyProblemsUsecase:
+    """GetMonthlyProblemsUsecase 테스트"""
+
+    async def test_builds_every_day_of_month_in_order(self):
+        usecase = _make_usecase([
+            _entry(1000, 3, solved=True, order=0),
+            _entry(1001, 3, solved=True, order=1),
+            _entry(2000, 5, solved=False, order=0),
+        ])
+
+        result = await usecase.execute(_command())
+
+        assert len(result.monthly_data) == 28
+        day3 = result.monthly_data[2]
+        assert day3.target_date == "2026-02-03"
+        assert [p.problem_id for p in day3.solved_problems] == [1000, 1001]
+        assert day3.solved_problem_count == 2
+        assert day3.solved_problems[0].real_solved_yn is False
+        assert [p.problem_id for p in result.monthly_data[4].will_solve_problems] == [2000]
+        assert result.total_problem_count == 3
+
+    async def test_solved_problem_shown_on_earliest_day_only(self):
+        usecase = _make_usecase([
+            _entry(1000, 3, solved=True),
+            _entry(1000, 10, solved=True),
+        ])
+
+        result = await usecase.execute(_command())
+
+        assert [p.problem_id for p in result.monthly_data[2].solved_problems] == [1000]
+        assert result.monthly_data[9].solved_problems == []
+        assert result.total_problem_count == 1
+
+    async def test_will_solve_hidden_when_solved_and_kept_per_day(self):
+        usecase = _make_usecase([
+            _entry(2000, 1, solved=False),
+            _entry(3000, 2, solved=False),
+            _entry(3000, 4, solved=False),
+            _entry(2000, 6, solved=True),
+        ])
+
+        result = await usecase.execute(_command())
+
+        assert result.monthly_data[0].will_solve_problems == []
+        assert [p.problem_id for p in result.monthly_data[1].will_solve_problems] == [3000]
+        assert [p.problem_id for p in result.monthly_data[3].will_solve_problems] == [3000]
+        assert result.total_problem_count == 2
+
+    async def test_tags_and_representative_tag(self):
+        usecase = _make_usecase([_entry(1000, 1, solved=True, tag_ids=(2, 1, 99), rep_tag_id=2)])
+
+        result = await usecase.execute(_command())
+
+        problem = result.monthly_data[0].solved_problems[0]
+        assert [t.tag_id for t in problem.tags] == [2, 1]  # 삭제된 태그(99) 제외, 등록 순 유지
+        assert [t.target_code for t in problem.tags[1].tag_targets] == ["CODING_TEST"]
+        assert problem.tags[0].tag_aliases[0].alias == "alias2"
+        assert problem.representative_tag.tag_code == "tag2"
+        usecase.tag_repository.find_by_ids_and_active.assert_awaited_once()
+
+    async def test_result_serializes_to_response(self):
+        usecase = _make_usecase([
+            _entry(1000, 1, solved=True, tag_ids=(1,), rep_tag_id=1),
+            _entry(2000, 1, solved=False),
+        ])
+
+        result = await usecase.execute(_command())
+        body = GetMonthlyProblemsResponse.from_query(result).model_dump(by_alias=True)
+
+        day = body["monthlyData"][0]
+        assert day["solvedProblems"][0]["representativeTag"]["tagCode"] == "tag1"
+        assert day["solvedProblems"][0]["tags"][0]["tagTargets"][0]["targetId"] == 7
+        assert day["willSolveProblems"][0]["representativeTag"] is None
+
+    async def test_empty_month_with_linked_account(self):
+        usecase = _make_usecase([], bj_account=MagicMock())
+
+        result = await usecase.execute(_command())
+
+        assert result.total_problem_count == 0
+        assert all(d.solved_problem_count == 0 for d in result.monthly_data)
+        usecase.tag_repository.find_by_ids_and_active.assert_not_called()
+
+    async def test_empty_month_without_account_raises(self):
+        usecase = _make_usecase([], bj_account=None)
+
+        with pytest.raises(APIException):
+            await usecase.execute(_command())
@@ -0,0 +1,274 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.baekjoon.application.command.link_bj_account_command import LinkBjAccountCommand
+from app.baekjoon.application.service.link_job_worker_pool import LinkJobWorkerPool
+from app.baekjoon.application.usecase.link_bj_account_job_usecase import LinkBjAccountJobUsecase
+from app.baekjoon.application.usecase.link_bj_account_usecase import LinkBjAccountUsecase
+from app.baekjoon.domain.entity.link_job import LinkJob, LinkJobStage, LinkJobStatus
+from app.core.error_codes import ErrorCode
+from app.core.exception import APIException
+
+
+def _job(user_account_id: int = 1, status: LinkJobStatus = LinkJobStatus.QUEUED) -> LinkJob:
+    job = LinkJob.create(user_account_id=user_account_id, bj_account_id="bj")
+    job.status = status
+    return job
+
+
+class TestLinkBjAccountJobUsecase:
+    """LinkBjAccountJobUsecase 테스트"""
+
+    async def test_enqueue_creates_job(self):
+        gateway = AsyncMock()
+        gateway.enqueue.side_effect = lambda job: job.job_id
+        usecase = LinkBjAccountJobUsecase(link_job_gateway=gateway)
+
+        result = await usecase.enqueue(LinkBjAccountCommand(user_account_id=1, bj_account_id="bj"))
+
+        enqueued: LinkJob = gateway.enqueue.call_args.args[0]
+        assert result.job_id == enqueued.job_id
+        assert result.status == "QUEUED"
+        assert enqueued.user_account_id == 1
+
+    async def test_enqueue_returns_active_job(self):
+        active = _job(status=LinkJobStatus.RUNNING)
+        gateway = AsyncMock()
+        gateway.enqueue.return_value = active.job_id
+        gateway.find_by_id.return_value = active
+        usecase = LinkBjAccountJobUsecase(link_job_gateway=gateway)
+
+        result = await usecase.enqueue(LinkBjAccountCommand(user_account_id=1, bj_account_id="bj"))
+
+        assert result.job_id == active.job_id
+        gateway.release_active_job.assert_not_called()
+
+    async def test_enqueue_releases_slot_left_by_finished_job(self):
+        finished = _job(status=LinkJobStatus.SUCCEEDED)
+        gateway = AsyncMock()
+        gateway.enqueue.side_effect = lambda job, ids=iter([finished.job_id]): next(ids, job.job_id)
+        gateway.find_by_id.return_value = finished
+        usecase = LinkBjAccountJobUsecase(link_job_gateway=gateway)
+
+        result = await usecase.enqueue(LinkBjAccountCommand(user_account_id=1, bj_account_id="bj"))
+
+        assert result.job_id != finished.job_id
+        assert gateway.enqueue.await_count == 2
+        gateway.release_active_job.assert_awaited_once_with(1, finished.job_id)
+
+    async def test_get_other_users_job_raises_not_found(self):
+        gateway = AsyncMock()
+        gateway.find_by_id.return_value = _job(user_account_id=2)
+        usecase = LinkBjAccountJobUsecase(link_job_gateway=gateway)
+
+        with pytest.raises(APIException) as exc_info:
+            await usecase.get("job", user_account_id=1)
+
+        assert exc_info.value.error_code == ErrorCode.LINK_JOB_NOT_FOUND.value.code
+
+    async def test_watch_converts_updates(self):
+        job = _job()
+        finished = _job()
+        finished.job_id = job.job_id
+        finished.succeed()
+
+        async def watch(job_id, heartbeat):
+            yield job
+            yield None
+            yield finished
+
+        gateway = AsyncMock()
+        gateway.find_by_id.return_value = job
+        gateway.watch = watch
+        usecase = LinkBjAccountJobUsecase(link_job_gateway=gateway)
+
+        updates = await usecase.watch(job.job_id, user_account_id=1, heartbeat=30)
+        results = [q async for q in updates]
+
+        assert [q.status if q else None for q in results] == ["QUEUED", None, "SUCCEEDED"]
+
+
+@pytest.fixture
+def global_database(monkeypatch):
+    """워커 풀은 요청 미들웨어 없이 전역 Database로 컨텍스트를 설정하므로 전역 값을 채운다"""
+    import app.core.database as database_module
+
+    db = MagicMock()
+    monkeypatch.setattr(database_module, "_global_database", db)
+    return db
+
+
+@pytest.mark.usefixtures("global_database")
+class TestLinkJobWorkerPool:
+    """LinkJobWorkerPool.process() 테스트"""
+
+    async def test_success_records_stages(self):
+        saved: list[tuple[str, str | None]] = []
+        gateway = AsyncMock()
+        gateway.save.side_effect = lambda j: saved.append((j.status.value, j.stage.value if j.stage else None))
+
+        async def execute(command, on_progress):
+            await on_progress(LinkJobStage.FETCHING_SOLVEDAC)
+            await on_progress(LinkJobStage.CREATING_STATUSES)
+
+        link_usecase = MagicMock()
+        link_usecase.execute = execute
+        pool = LinkJobWorkerPool(link_job_gateway=gateway, link_bj_account_usecase=link_usecase)
+
+        await pool.process(_job())
+
+        assert saved == [
+            ("RUNNING", None),
+            ("RUNNING", "FETCHING_SOLVEDAC"),
+            ("RUNNING", "CREATING_STATUSES"),
+            ("SUCCEEDED", None),
+        ]
+
+    async def test_api_exception_marks_failed(self):
+        gateway = AsyncMock()
+        link_usecase = AsyncMock()
+        link_usecase.execute.side_effect = APIException(ErrorCode.BAEKJOON_USER_NOT_FOUND)
+        pool = LinkJobWorkerPool(link_job_gateway=gateway, link_bj_account_usecase=link_usecase)
+        job = _job()
+
+        await pool.process(job)
+
+        assert job.status == LinkJobStatus.FAILED
+        assert job.error_code == "BAEKJOON_USER_NOT_FOUND"
+
+    async def test_unexpected_error_marks_failed_without_raising(self):
+        gateway = AsyncMock()
+        link_usecase = AsyncMock()
+        link_usecase.execute.side_effect = RuntimeError("db down")
+        pool = LinkJobWorkerPool(link_job_gateway=gateway, link_bj_account_usecase=link_usecase)
+        job = _job()
+
+        await pool.process(job)
+
+        assert job.status == LinkJobStatus.FAILED
+        assert job.error_code == ErrorCode.INTERNAL_SERVER_ERROR.value.code
+
+    async def test_cancelled_job_is_marked_failed_and_cancellation_propagates(self):
+        import asyncio
+
+        gateway = AsyncMock()
+        link_usecase = AsyncMock()
+        link_usecase.execute.side_effect = asyncio.CancelledError()
+        pool = LinkJobWorkerPool(link_job_gateway=gateway, link_bj_account_usecase=link_usecase)
+        job = _job()
+
+        with pytest.raises(asyncio.CancelledError):
+            await pool.process(job)
+
+        assert job.status == LinkJobStatus.FAILED
+        assert job.error_code == ErrorCode.LINK_JOB_INTERRUPTED.value.code
+        assert gateway.save.call_args.args[0].is_finished
+
+    async def test_transactional_usecase_runs_outside_request_context(self, global_database, monkeypatch):
+        from contextlib import asynccontextmanager
+
+        from app.core.database import get_database_instance, transactional
+
+        # 운영과 같은 @transactional 경로 (DB_SESSION=unit 우회 없음)
+        monkeypatch.delenv("DB_SESSION", raising=False)
+
+        @asynccontextmanager
+        async def session():
+            yield AsyncMock()
+
+        global_database.session = session
+
+        class _Usecase:
+            @transactional
+            async def execute(self, command, on_progress):
+                assert get_database_instance() is global_database
+
+        pool = LinkJobWorkerPool(link_job_gateway=AsyncMock(), link_bj_account_usecase=_Usecase())
+        job = _job()
+
+        await pool.process(job)
+
+        assert job.status == LinkJobStatus.SUCCEEDED
+
+
+class TestLinkBjAccountUsecaseProgress:
+    """LinkBjAccountUsecase.execute(on_progress) 테스트"""
+
+    def _make_usecase(self) -> LinkBjAccountUsecase:
+        return LinkBjAccountUsecase(
+            baekjoon_account_repository=AsyncMock(),
+            solvedac_gateway=AsyncMock(),
+            domain_event_bus=AsyncMock(),
+            user_date_record_repository=AsyncMock(),
+            user_activity_repository=AsyncMock(),
+            problem_update_service=AsyncMock(),
+        )
+
+    async def test_new_account_reports_stages_in_order(self):
+        usecase = self._make_usecase()
+        usecase.baekjoon_account_repository.find_by_id.return_value = None
+        user_data = MagicMock()
+        user_data.user_info = MagicMock(tier=10, rating=1500, class_level=3, max_streak=5)
+        user_data.problems = [MagicMock(problem_id=1000)]
+        user_data.history = []
+        usecase.solvedac_gateway.fetch_user_data_first.return_value = user_data
+        usecase.problem_update_service.ensure_problems_exist.return_value = [1000]
+        stages: list[LinkJobStage] = []
+
+        async def on_progress(stage):
+            stages.append(stage)
+
+        await usecase.execute(LinkBjAccountCommand(user_account_id=1, bj_account_id="bj"), on_progress=on_progress)
+
+        assert stages == [
+            LinkJobStage.FETCHING_SOLVEDAC,
+            LinkJobStage.ENSURING_PROBLEMS,
+            LinkJobStage.SAVING_HISTORY,
+            LinkJobStage.CREATING_STATUSES,
+        ]
+        usecase.baekjoon_account_repository.save.assert_called_once()
+        usecase.domain_event_bus.publish.assert_called_once()
+
+    async def test_unknown_user_raises_before_db_access(self):
+        usecase = self._make_usecase()
+        usecase.solvedac_gateway.fetch_user_data_first.return_value = None
+
+        with pytest.raises(APIException):
+            await usecase.execute(LinkBjAccountCommand(user_account_id=1, bj_account_id="ghost"))
+
+        usecase.baekjoon_account_repository.find_by_id.assert_not_called()
+
+
+class TestLinkBjAccountUsecaseTagStats:
+    """LinkBjAccountUsecase 태그별 통계(bj_account_tag_stat) 처리 테스트"""
+
+    async def test_relink_deletes_previous_link_rows_after_link_event(self):
+        from app.common.domain.vo.identifiers import BaekjoonAccountId, UserAccountId
+
+        usecase = LinkBjAccountUsecase(
+            baekjoon_account_repository=AsyncMock(),
+            solvedac_gateway=AsyncMock(),
+            domain_event_bus=AsyncMock(),
+            user_date_record_repository=AsyncMock(),
+            user_activity_repository=AsyncMock(),
+            problem_update_service=AsyncMock(),
+            bj_account_tag_stat_repository=AsyncMock(),
+        )
+        usecase.baekjoon_account_repository.find_by_id.return_value = MagicMock()
+        usecase.solvedac_gateway.fetch_user_data_first.return_value = MagicMock(problems=[], history=[])
+        usecase.problem_update_service.ensure_problems_exist.return_value = []
+        calls: list[str] = []
+        usecase.domain_event_bus.publish.side_effect = lambda event: calls.append("publish")
+        usecase.bj_account_tag_stat_repository.delete_unlinked.side_effect = (
+            lambda user_account_id: calls.append("delete_unlinked")
+        )
+
+        await usecase.execute(LinkBjAccountCommand(user_account_id=1, bj_account_id="new_bj"))
+
+        # 이전 연동은 LINK_BAEKJOON_ACCOUNT_REQUESTED 처리 중 soft delete되므로 그 뒤에 정리해야 함
+        assert calls == ["publish", "delete_unlinked"]
+        usecase.bj_account_tag_stat_repository.rebuild.assert_awaited_once_with(
+            BaekjoonAccountId("new_bj"), UserAccountId(1)
+        )
+        usecase.bj_account_tag_stat_repository.delete_unlinked.assert_awaited_once_with(UserAccountId(1))
@@ -11,6 +11,8 @@ from app.baekjoon.presentation.controller.baekjoon_controller import (
     get_baekjoon_streak,
     refresh_problem_data,
     get_unrecorded_problems_me,
+    create_baekjoon_account_link_job,
+    stream_baekjoon_account_link_job,
 )
 
 
@@ -27,6 +29,7 @@ def mock_usecases():
         "streaks": AsyncMock(),
         "update": AsyncMock(),
         "unrecorded": AsyncMock(),
+        "link_job": AsyncMock(),
     }
 
 
@@ -63,6 +66,54 @@ class TestBaekjoonController:
         mock_usecases["link"].execute.assert_called_once()
         assert isinstance(result, ApiResponse)
 
+    async def test_create_link_job_returns_job(self, mock_current_user, mock_usecases):
+        from datetime import datetime
+        from app.baekjoon.application.query.link_job_query import LinkJobQuery
+        from app.baekjoon.presentation.schema.request.baekjoon_request import LinkBaekjoonAccountRequest
+        now = datetime(2026, 1, 1)
+        mock_usecases["link_job"].enqueue.return_value = LinkJobQuery(
+            job_id="job-1", bj_account_id="test_bj", status="QUEUED", stage=None,
+            error_code=None, error_message=None, created_at=now, updated_at=now,
+        )
+
+        result = await create_baekjoon_account_link_job(
+            request=LinkBaekjoonAccountRequest(bjAccount="test_bj"),
+            current_user=mock_current_user,
+            link_bj_account_job_usecase=mock_usecases["link_job"],
+        )
+
+        command = mock_usecases["link_job"].enqueue.call_args.args[0]
+        assert command.user_account_id == 1
+        assert command.bj_account_id == "test_bj"
+        assert isinstance(result, ApiResponse)
+        assert b'"jobId":"job-1"' in result.body
+
+    async def test_stream_link_job_emits_sse_events(self, mock_current_user, mock_usecases):
+        from datetime import datetime
+        from app.baekjoon.application.query.link_job_query import LinkJobQuery
+        now = datetime(2026, 1, 1)
+
+        async def updates():
+            yield None
+            yield LinkJobQuery(
+                job_id="job-1", bj_account_id="test_bj", status="SUCCEEDED", stage=None,
+                error_code=None, error_message=None, created_at=now, updated_at=now,
+            )
+
+        mock_usecases["link_job"].watch.return_value = updates()
+
+        response = await stream_baekjoon_account_link_job(
+            job_id="job-1",
+            current_user=mock_current_user,
+            link_bj_account_job_usecase=mock_usecases["link_job"],
+        )
+        chunks = [chunk async for chunk in response.body_iterator]
+
+        assert response.media_type == "text/event-stream"
+        assert chunks[0] == ": keepalive\n\n"
+        assert '"eventType": "LINK_JOB_UPDATED"' in chunks[1]
+        assert '"status": "SUCCEEDED"' in chunks[1]
+
     async def test_get_me_calls_usecase(self, mock_current_user, mock_usecases):
         mock_query = MagicMock()
         mock_usecases["me"].execute.return_value = mock_query
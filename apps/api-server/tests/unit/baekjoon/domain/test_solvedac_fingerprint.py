@@ -0,0 +1,23 @@
+from app.baekjoon.domain.vo.solvedac_fingerprint import SolvedacFingerprint
+
+
+class TestSolvedacFingerprint:
+    """SolvedacFingerprint 테스트"""
+
+    def test_round_trips_through_dict(self):
+        fingerprint = SolvedacFingerprint.of(120, 1500, {5: 100, 11: 20, 12: 0})
+
+        assert SolvedacFingerprint.from_dict(fingerprint.to_dict()) == fingerprint
+        assert fingerprint.level_counts == ((5, 100), (11, 20))
+
+    def test_grown_levels(self):
+        before = SolvedacFingerprint.of(120, 1500, {5: 100, 11: 20})
+        after = SolvedacFingerprint.of(123, 1510, {5: 100, 11: 22, 14: 1})
+
+        assert after.grown_levels(before) == {11: 2, 14: 1}
+
+    def test_decrease_requires_full_fetch(self):
+        before = SolvedacFingerprint.of(120, 1500, {5: 100, 11: 20})
+
+        assert SolvedacFingerprint.of(119, 1500, {5: 99, 11: 20}).grown_levels(before) is None
+        assert SolvedacFingerprint.of(100, 1500, {5: 100}).grown_levels(before) is None
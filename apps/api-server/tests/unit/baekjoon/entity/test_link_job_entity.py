@@ -0,0 +1,44 @@
+from app.baekjoon.domain.entity.link_job import LinkJob, LinkJobStage, LinkJobStatus
+
+
+class TestLinkJob:
+    """LinkJob 엔티티 테스트"""
+
+    def test_create_is_queued(self):
+        job = LinkJob.create(user_account_id=1, bj_account_id="bj")
+
+        assert job.status == LinkJobStatus.QUEUED
+        assert job.stage is None
+        assert not job.is_finished
+        assert len(job.job_id) == 32
+
+    def test_lifecycle(self):
+        job = LinkJob.create(user_account_id=1, bj_account_id="bj")
+
+        job.start()
+        job.advance(LinkJobStage.ENSURING_PROBLEMS)
+        assert job.status == LinkJobStatus.RUNNING
+        assert job.stage == LinkJobStage.ENSURING_PROBLEMS
+
+        job.succeed()
+        assert job.is_finished
+        assert job.stage is None
+
+    def test_fail_keeps_last_stage_and_error(self):
+        job = LinkJob.create(user_account_id=1, bj_account_id="bj")
+        job.start()
+        job.advance(LinkJobStage.FETCHING_SOLVEDAC)
+
+        job.fail("BAEKJOON_USER_NOT_FOUND", "백준 유저를 찾을 수 없습니다.")
+
+        assert job.status == LinkJobStatus.FAILED
+        assert job.stage == LinkJobStage.FETCHING_SOLVEDAC
+        assert job.error_code == "BAEKJOON_USER_NOT_FOUND"
+        assert job.is_finished
+
+    def test_dict_round_trip(self):
+        job = LinkJob.create(user_account_id=7, bj_account_id="bj")
+        job.start()
+        job.advance(LinkJobStage.SAVING_HISTORY)
+
+        assert LinkJob.from_dict(job.to_dict()) == job
@@ -0,0 +1,121 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from app.baekjoon.application.command.link_bj_account_command import LinkBjAccountCommand
+from app.baekjoon.application.usecase.link_bj_account_job_usecase import LinkBjAccountJobUsecase
+from app.baekjoon.domain.entity.link_job import LinkJob
+from app.baekjoon.infra.gateway.link_job_gateway_impl import LinkJobGatewayImpl
+
+
+def _gateway(*stored: LinkJob | None) -> LinkJobGatewayImpl:
+    """find_by_id가 stored 순서대로 저장된 상태를 돌려주고, 발행 메시지는 없는(heartbeat만 도는) gateway"""
+    redis = AsyncMock()
+    redis.get.side_effect = [job.to_dict() if job else None for job in stored]
+    pubsub = AsyncMock()
+    pubsub.get_message.return_value = None
+    redis.subscribe.return_value = pubsub
+    return LinkJobGatewayImpl(redis_client=redis)
+
+
+class FakeRedis:
+    """enqueue 경로에 필요한 SET NX / GET / DELETE / LPUSH만 흉내 내는 메모리 Redis
+
+    각 호출마다 이벤트 루프에 제어를 넘겨 동시 요청이 서로 끼어들 수 있게 한다.
+    """
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+        self.queue: list[str] = []
+
+    async def set(self, key, value, ex=None, nx=False):
+        await asyncio.sleep(0)
+        if nx and key in self.store:
+            return False
+        self.store[key] = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+        return True
+
+    async def get(self, key):
+        await asyncio.sleep(0)
+        value = self.store.get(key)
+        return json.loads(value) if value is not None else None
+
+    async def delete(self, key):
+        await asyncio.sleep(0)
+        return 1 if self.store.pop(key, None) is not None else 0
+
+    async def get_client(self):
+        return self
+
+    async def lpush(self, key, value):
+        await asyncio.sleep(0)
+        self.queue.append(value)
+
+    async def eval(self, script, numkeys, key, expected):
+        await asyncio.sleep(0)
+        if self.store.get(key) == expected:
+            del self.store[key]
+            return 1
+        return 0
+
+
+class TestLinkJobGatewayEnqueue:
+    """LinkJobGatewayImpl.enqueue() 진행 중 작업 슬롯 선점 테스트"""
+
+    async def test_concurrent_enqueues_push_only_one_job(self):
+        redis = FakeRedis()
+        usecase = LinkBjAccountJobUsecase(link_job_gateway=LinkJobGatewayImpl(redis_client=redis))
+        command = LinkBjAccountCommand(user_account_id=1, bj_account_id="bj")
+
+        first, second = await asyncio.gather(usecase.enqueue(command), usecase.enqueue(command))
+
+        assert len(redis.queue) == 1
+        assert first.job_id == second.job_id == redis.queue[0]
+        # 선점에 진 요청이 저장한 작업 상태는 남지 않음
+        assert set(redis.store) == {f"bj-link-job:{first.job_id}", "bj-link-job:active:1"}
+
+    async def test_release_keeps_slot_claimed_by_other_job(self):
+        redis = FakeRedis()
+        gateway = LinkJobGatewayImpl(redis_client=redis)
+        job = LinkJob.create(user_account_id=1, bj_account_id="bj")
+        await gateway.enqueue(job)
+
+        await gateway.release_active_job(1, "stale-job")
+        assert await gateway.find_active_job_id(1) == job.job_id
+
+        await gateway.release_active_job(1, job.job_id)
+        assert await gateway.find_active_job_id(1) is None
+
+
+class TestLinkJobGatewayWatch:
+    """LinkJobGatewayImpl.watch() 종료 조건 테스트"""
+
+    async def test_stops_when_job_key_expires(self):
+        job = LinkJob.create(user_account_id=1, bj_account_id="bj")
+        gateway = _gateway(job, job, None)
+
+        updates = [update async for update in gateway.watch(job.job_id, heartbeat=0)]
+
+        assert updates == [job, None]
+
+    async def test_stops_when_running_job_stalls(self):
+        job = LinkJob.create(user_account_id=1, bj_account_id="bj")
+        job.start()
+        job.updated_at = datetime.now() - timedelta(hours=1)
+        gateway = _gateway(job, job)
+
+        updates = [update async for update in gateway.watch(job.job_id, heartbeat=0)]
+
+        assert updates == [job]
+
+    async def test_catches_up_on_missed_finish(self):
+        job = LinkJob.create(user_account_id=1, bj_account_id="bj")
+        finished = LinkJob.from_dict(job.to_dict())
+        finished.succeed()
+        finished.updated_at = job.updated_at + timedelta(seconds=1)
+        gateway = _gateway(job, finished)
+
+        updates = [update async for update in gateway.watch(job.job_id, heartbeat=0)]
+
+        assert [u.status.value for u in updates] == ["QUEUED", "SUCCEEDED"]
@@ -0,0 +1,86 @@
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.baekjoon.domain.vo.solvedac_fingerprint import SolvedacFingerprint
+from app.baekjoon.infra.gateway import solvedac_gateway_impl as gateway_module
+from app.baekjoon.infra.gateway.solvedac_gateway_impl import SolvedacGatewayImpl
+
+_ORIGINAL_CLIENT = httpx.AsyncClient
+
+
+class FakeSolvedac:
+    """user/show, user/problem_stats, search/problem만 흉내 내는 가짜 API"""
+
+    def __init__(self, solved: dict[int, int]):
+        self.solved = solved  # problem_id -> level
+        self.paths: list[str] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        if request.url.path.endswith("/user/show"):
+            return httpx.Response(200, json={"handle": "user", "solvedCount": len(self.solved), "rating": 1500, "tier": 11})
+        if request.url.path.endswith("/user/problem_stats"):
+            counts: dict[int, int] = {}
+            for level in self.solved.values():
+                counts[level] = counts.get(level, 0) + 1
+            return httpx.Response(200, json=[{"level": level, "solved": cnt} for level, cnt in counts.items()])
+        if request.url.path.endswith("/search/problem"):
+            token = request.url.params["query"].split()[-1]
+            level = next(lvl for lvl, tok in gateway_module._LEVEL_QUERY_TOKENS.items() if tok == token)
+            ids = sorted((pid for pid, lvl in self.solved.items() if lvl == level), reverse=True)
+            page = int(request.url.params["page"])
+            items = [{"problemId": pid, "titleKo": str(pid), "level": level, "tags": []} for pid in ids[(page - 1) * 50:page * 50]]
+            return httpx.Response(200, json={"count": len(ids), "items": items})
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    api = FakeSolvedac({pid: 5 for pid in range(1000, 1120)})
+    monkeypatch.setattr(
+        gateway_module.httpx, "AsyncClient",
+        lambda **kwargs: _ORIGINAL_CLIENT(transport=httpx.MockTransport(api.handle)),
+    )
+    return api
+
+
+def _fingerprint(api: FakeSolvedac) -> SolvedacFingerprint:
+    counts: dict[int, int] = {}
+    for level in api.solved.values():
+        counts[level] = counts.get(level, 0) + 1
+    return SolvedacFingerprint.of(len(api.solved), 1500, counts)
+
+
+class TestFetchUserDataIncremental:
+    """SolvedacGatewayImpl.fetch_user_data 증분 수집 테스트"""
+
+    async def test_unchanged_account_costs_two_requests(self, fake_api):
+        gateway = SolvedacGatewayImpl()
+
+        delta = await gateway.fetch_user_data("user", _fingerprint(fake_api), set(fake_api.solved))
+
+        assert delta.changed is False
+        assert delta.problems == []
+        assert len(fake_api.paths) == 2
+
+    async def test_grown_level_pages_only_that_level(self, fake_api):
+        gateway = SolvedacGatewayImpl()
+        previous = _fingerprint(fake_api)
+        known = set(fake_api.solved)
+        fake_api.solved[5000] = 11
+
+        delta = await gateway.fetch_user_data("user", previous, known)
+
+        assert delta.changed is True and delta.is_full is False
+        assert [p.problem_id for p in delta.problems] == [5000]
+        assert delta.fingerprint == _fingerprint(fake_api)
+        assert fake_api.paths.count("/api/v3/search/problem") == 1
+
+    async def test_missing_snapshot_falls_back_to_full_fetch(self, fake_api):
+        gateway = SolvedacGatewayImpl()
+        gateway.fetch_user_data_first = AsyncMock(return_value=None)
+
+        assert await gateway.fetch_user_data("user", None, set()) is None
+        gateway.fetch_user_data_first.assert_awaited_once_with("user")
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, AsyncMock
 
 from app.common.domain.vo.identifiers import BaekjoonAccountId, UserAccountId, TierId
 from app.baekjoon.infra.repository.baekjoon_account_repository_impl import BaekjoonAccountRepositoryImpl
+import app.core.database_models  # noqa: F401 - AccountLinkModel 관계 매퍼 초기화 (전체 모델 등록)
 
 
 def _make_bj_model(bj_account_id="test_bj"):
@@ -69,3 +70,94 @@ class TestBaekjoonAccountRepository:
         accounts = await repo.find_all()
 
         assert len(accounts) == 2
+
+
+def _stat_model(user_account_id: int, tag_id: int, solved_count=3, highest_tier_id=12, last_solved_date=None):
+    from types import SimpleNamespace
+    return SimpleNamespace(
+        bj_account_id="test_bj", user_account_id=user_account_id, tag_id=tag_id,
+        solved_count=solved_count, highest_tier_id=highest_tier_id, last_solved_date=last_solved_date,
+    )
+
+
+def _link_rows_result(rows: list):
+    """(user_account_id, tag_stat_built_at, BjAccountTagStatModel | None) 행 결과"""
+    result_mock = MagicMock()
+    result_mock.all.return_value = rows
+    return result_mock
+
+
+_BUILT_AT = datetime(2026, 10, 1)
+
+
+class TestGetTagStats:
+    """get_tag_stats (bj_account_tag_stat 조회) 테스트"""
+
+    async def test_reads_materialized_rows_for_user(self, mock_database_context):
+        from datetime import date
+        repo = _make_repo(mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(return_value=_link_rows_result([
+            (1, _BUILT_AT, _stat_model(1, 5, last_solved_date=date(2026, 3, 1))),
+            (1, _BUILT_AT, _stat_model(1, 7, highest_tier_id=None)),
+        ]))
+
+        stats = await repo.get_tag_stats(BaekjoonAccountId("test_bj"), UserAccountId(1))
+
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.call_args.args[0])
+        assert "bj_account_tag_stat" in sql
+        assert "problem_history" not in sql
+        assert [s.tag_id.value for s in stats] == [5, 7]
+        assert stats[0].highest_tier_id == TierId(12)
+        assert stats[0].last_solved_date == date(2026, 3, 1)
+        assert stats[1].highest_tier_id is None
+
+    async def test_without_user_uses_first_built_user_rows_without_dates(self, mock_database_context):
+        from datetime import date
+        repo = _make_repo(mock_database_context)
+        mock_database_context.get_current_session().execute = AsyncMock(return_value=_link_rows_result([
+            (1, None, None),
+            (2, _BUILT_AT, _stat_model(2, 5, last_solved_date=date(2026, 3, 1))),
+            (2, _BUILT_AT, _stat_model(2, 7)),
+            (3, _BUILT_AT, _stat_model(3, 5, last_solved_date=date(2026, 3, 2))),
+        ]))
+
+        stats = await repo.get_tag_stats(BaekjoonAccountId("test_bj"))
+
+        assert [s.tag_id.value for s in stats] == [5, 7]
+        assert all(s.last_solved_date is None for s in stats)
+
+    async def test_reads_only_active_link_rows(self, mock_database_context):
+        repo = _make_repo(mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(return_value=_link_rows_result([(2, _BUILT_AT, _stat_model(2, 5))]))
+
+        await repo.get_tag_stats(BaekjoonAccountId("test_bj"))
+
+        sql = " ".join(str(session.execute.call_args.args[0]).split())
+        assert "FROM account_link LEFT OUTER JOIN bj_account_tag_stat" in sql
+        assert "account_link.deleted_at IS NULL" in sql
+
+    async def test_built_account_without_rows_returns_empty(self, mock_database_context):
+        repo = _make_repo(mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(return_value=_link_rows_result([(1, _BUILT_AT, None)]))
+
+        assert await repo.get_tag_stats(BaekjoonAccountId("test_bj"), UserAccountId(1)) == []
+        session.execute.assert_awaited_once()
+
+    async def test_falls_back_to_aggregate_when_not_materialized(self, mock_database_context):
+        repo = _make_repo(mock_database_context)
+        aggregate_row = MagicMock(tag_id=5, solved_problem_count=2, highest_tier_level=9, last_solved_date=None)
+        aggregate_result = MagicMock()
+        aggregate_result.all.return_value = [aggregate_row]
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(side_effect=[_link_rows_result([(1, None, None)]), aggregate_result])
+
+        stats = await repo.get_tag_stats(BaekjoonAccountId("test_bj"), UserAccountId(1))
+
+        assert session.execute.await_count == 2
+        assert "problem_history" in str(session.execute.call_args.args[0])
+        assert stats[0].solved_problem_count == 2
+        assert stats[0].highest_tier_id == TierId(9)
@@ -0,0 +1,116 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from app.baekjoon.infra.repository.bj_account_tag_stat_repository_impl import BjAccountTagStatRepositoryImpl
+from app.common.domain.vo.identifiers import BaekjoonAccountId, UserAccountId
+
+
+def _result(rows=None, rowcount=0):
+    result = MagicMock()
+    result.all.return_value = rows or []
+    result.rowcount = rowcount
+    return result
+
+
+def _sql(call) -> str:
+    return " ".join(str(call.args[0]).split())
+
+
+class TestBjAccountTagStatRepository:
+    """BjAccountTagStatRepositoryImpl 테스트"""
+
+    async def test_apply_new_history_adds_delta_for_built_users_and_rebuilds_others(self, mock_database_context):
+        repo = BjAccountTagStatRepositoryImpl(db=mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(side_effect=[
+            _result([(1, 1), (2, 0)]),  # 연동 유저: 1은 적재됨, 2는 미적재
+            _result(),                  # user 2 DELETE
+            _result(rowcount=4),        # user 2 전체 집계 INSERT
+            _result(),                  # user 2 적재 완료 표시
+            _result(),                  # user 1 증분 INSERT
+        ])
+
+        await repo.apply_new_history(BaekjoonAccountId("bj"), [1000, 1001])
+
+        calls = session.execute.call_args_list
+        assert _sql(calls[1]).startswith("DELETE FROM bj_account_tag_stat")
+        assert calls[2].args[1] == {"bj_account_id": "bj", "user_account_id": 2}
+        assert "tag_stat_built_at IS NOT NULL" in _sql(calls[0])
+        assert _sql(calls[3]).startswith("UPDATE account_link SET tag_stat_built_at")
+        assert "solved_count = solved_count + VALUES(solved_count)" in _sql(calls[4])
+        assert calls[4].args[1] == {"bj_account_id": "bj", "problem_ids": [1000, 1001], "user_account_ids": [1]}
+
+    async def test_apply_new_history_without_problems_is_noop(self, mock_database_context):
+        repo = BjAccountTagStatRepositoryImpl(db=mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock()
+
+        await repo.apply_new_history(BaekjoonAccountId("bj"), [])
+        await repo.refresh_last_solved_dates(UserAccountId(1), [])
+
+        session.execute.assert_not_awaited()
+
+    async def test_refresh_last_solved_dates_targets_user_and_problem_tags(self, mock_database_context):
+        repo = BjAccountTagStatRepositoryImpl(db=mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(return_value=_result())
+
+        await repo.refresh_last_solved_dates(UserAccountId(3), [1000])
+
+        call = session.execute.call_args
+        assert _sql(call).startswith("UPDATE bj_account_tag_stat")
+        assert call.args[1] == {"user_account_id": 3, "problem_ids": [1000]}
+
+    async def test_rebuild_returns_inserted_rows(self, mock_database_context):
+        repo = BjAccountTagStatRepositoryImpl(db=mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(side_effect=[_result(), _result(rowcount=12), _result()])
+
+        assert await repo.rebuild(BaekjoonAccountId("bj"), UserAccountId(1)) == 12
+        session.flush.assert_awaited()
+
+    async def test_full_rebuild_marks_link_built_even_without_rows(self, mock_database_context):
+        repo = BjAccountTagStatRepositoryImpl(db=mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(side_effect=[_result(), _result(rowcount=0), _result()])
+
+        assert await repo.rebuild(BaekjoonAccountId("bj"), UserAccountId(1)) == 0
+
+        mark_call = session.execute.call_args_list[2]
+        assert _sql(mark_call).startswith("UPDATE account_link SET tag_stat_built_at = NOW()")
+        assert mark_call.args[1] == {"bj_account_id": "bj", "user_account_id": 1}
+
+    async def test_rebuild_with_tags_limits_delete_and_insert_to_tags(self, mock_database_context):
+        repo = BjAccountTagStatRepositoryImpl(db=mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(side_effect=[_result(), _result(rowcount=2)])
+
+        assert await repo.rebuild(BaekjoonAccountId("bj"), UserAccountId(1), {7, 3}) == 2
+
+        delete_call, insert_call = session.execute.call_args_list
+        assert "bj_account_tag_stat.tag_id IN" in _sql(delete_call)
+        assert "pt.tag_id IN" in _sql(insert_call)
+        assert insert_call.args[1] == {"bj_account_id": "bj", "user_account_id": 1, "tag_ids": [3, 7]}
+
+    async def test_find_linked_pairs_with_tags_filters_by_stat_rows_and_history(self, mock_database_context):
+        repo = BjAccountTagStatRepositoryImpl(db=mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(return_value=_result([("bj", 1)]))
+
+        pairs = await repo.find_linked_pairs(tag_ids={5})
+
+        call = session.execute.call_args
+        assert "s.tag_id IN" in _sql(call) and "pt.tag_id IN" in _sql(call)
+        assert call.args[1] == {"tag_ids": [5]}
+        assert pairs == [(BaekjoonAccountId("bj"), UserAccountId(1))]
+
+    async def test_delete_unlinked_for_user(self, mock_database_context):
+        repo = BjAccountTagStatRepositoryImpl(db=mock_database_context)
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(return_value=_result(rowcount=4))
+
+        assert await repo.delete_unlinked(UserAccountId(3)) == 4
+
+        call = session.execute.call_args
+        assert _sql(call).endswith("AND s.user_account_id = :user_account_id")
+        assert call.args[1] == {"user_account_id": 3}
+        session.flush.assert_awaited()
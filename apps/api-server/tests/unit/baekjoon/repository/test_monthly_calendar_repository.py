@@ -0,0 +1,48 @@
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+from app.baekjoon.infra.repository.monthly_calendar_repository_impl import MonthlyCalendarRepositoryImpl
+from app.common.domain.vo.identifiers import UserAccountId
+
+
+def _row(problem_id: int, record_type: str, tier_level=5, tag_ids="3,1", rep_tag=(3, "dp", "다이나믹 프로그래밍")):
+    return (
+        date(2026, 2, 3), 0, record_type,
+        problem_id, f"P{problem_id}", tier_level, None,
+        tag_ids, *rep_tag,
+    )
+
+
+class TestMonthlyCalendarRepository:
+    """MonthlyCalendarRepositoryImpl 테스트"""
+
+    async def test_single_query_for_month(self, mock_database_context):
+        repo = MonthlyCalendarRepositoryImpl(db=mock_database_context)
+        result_mock = MagicMock()
+        result_mock.all.return_value = [_row(1000, "SOLVED"), _row(2000, "WILL_SOLVE")]
+        session = mock_database_context.get_current_session()
+        session.execute = AsyncMock(return_value=result_mock)
+
+        entries = await repo.find_month_entries(UserAccountId(1), 2026, 2)
+
+        session.execute.assert_awaited_once()
+        params = session.execute.call_args.args[1]
+        assert params["start_date"] == date(2026, 2, 1)
+        assert params["end_date"] == date(2026, 2, 28)
+        assert params["user_account_id"] == 1
+        assert [e.solved for e in entries] == [True, False]
+        assert entries[0].tag_ids == (3, 1)
+        assert entries[0].representative_tag_code == "dp"
+        assert entries[0].problem_tier_name == "B1"
+
+    async def test_missing_tier_tags_and_representative_tag(self, mock_database_context):
+        repo = MonthlyCalendarRepositoryImpl(db=mock_database_context)
+        result_mock = MagicMock()
+        result_mock.all.return_value = [_row(1000, "SOLVED", tier_level=99, tag_ids=None, rep_tag=(None, None, None))]
+        mock_database_context.get_current_session().execute = AsyncMock(return_value=result_mock)
+
+        entry = (await repo.find_month_entries(UserAccountId(1), 2026, 2))[0]
+
+        assert entry.problem_tier_name == "Unknown"
+        assert entry.tag_ids == ()
+        assert entry.representative_tag_id is None
@@ -0,0 +1,73 @@
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import app.baekjoon.infra.scheduler.metric_scheduler as metric_scheduler_module
+import app.core.database as database_module
+from app.baekjoon.infra.scheduler.metric_scheduler import BjAccountUpdateScheduler
+from app.common.domain.enums import SystemLogStatus, SystemLogType
+
+
+def _fixed_date(today: date):
+    class _FixedDate(date):
+        @classmethod
+        def today(cls):
+            return today
+    return _FixedDate
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(database_module, "_global_database", MagicMock())
+    sync_service = AsyncMock()
+    sync_service.sync_all.return_value = MagicMock(
+        tag_count=10, problem_count=100, changed_problem_count=3, affected_tag_ids={4, 5}
+    )
+    sync_service.save_sync_result_log = AsyncMock()
+    return BjAccountUpdateScheduler(
+        update_bj_account_use_case=AsyncMock(),
+        problem_metadata_sync_service=sync_service,
+        bj_account_tag_stat_service=AsyncMock(),
+    )
+
+
+class TestProblemUpdateJob:
+    """BjAccountUpdateScheduler._problem_update_job 테스트"""
+
+    async def test_weekday_runs_delta_and_logs_mode(self, scheduler, monkeypatch):
+        monkeypatch.setattr(metric_scheduler_module, "date", _fixed_date(date(2026, 10, 19)))  # 월요일
+
+        await scheduler._problem_update_job()
+
+        scheduler.problem_metadata_sync_service.sync_all.assert_awaited_once_with(full=False)
+        log = scheduler.problem_metadata_sync_service.save_sync_result_log.call_args.args[0]
+        assert log.log_type == SystemLogType.PROBLEM_UPDATE
+        assert log.status == SystemLogStatus.SUCCESS
+        assert log.log_data["mode"] == "delta"
+        assert log.log_data["changed_problem_count"] == 3
+
+    async def test_wednesday_runs_full(self, scheduler, monkeypatch):
+        monkeypatch.setattr(metric_scheduler_module, "date", _fixed_date(date(2026, 10, 21)))  # 수요일
+
+        await scheduler._problem_update_job()
+
+        scheduler.problem_metadata_sync_service.sync_all.assert_awaited_once_with(full=True)
+        log = scheduler.problem_metadata_sync_service.save_sync_result_log.call_args.args[0]
+        assert log.log_data["mode"] == "full"
+
+    async def test_rebuilds_tag_stats_for_affected_tags(self, scheduler, monkeypatch):
+        monkeypatch.setattr(metric_scheduler_module, "date", _fixed_date(date(2026, 10, 19)))
+
+        await scheduler._problem_update_job()
+
+        scheduler.bj_account_tag_stat_service.rebuild_tags.assert_awaited_once_with({4, 5})
+
+    async def test_tag_stat_rebuild_failure_keeps_sync_success(self, scheduler, monkeypatch):
+        monkeypatch.setattr(metric_scheduler_module, "date", _fixed_date(date(2026, 10, 19)))
+        scheduler.bj_account_tag_stat_service.rebuild_tags.side_effect = RuntimeError("db down")
+
+        await scheduler._problem_update_job()
+
+        log = scheduler.problem_metadata_sync_service.save_sync_result_log.call_args.args[0]
+        assert log.status == SystemLogStatus.SUCCESS
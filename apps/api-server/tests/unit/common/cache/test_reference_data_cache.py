@@ -0,0 +1,156 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.common.domain.vo.identifiers import TagId, TargetId
+from app.common.infra.cache.reference_data_cache import INVALIDATION_CHANNEL, ReferenceDataCache
+from app.recommendation.infra.repository.tag_skill_repository_impl import TagSkillRepositoryImpl
+from app.tag.infra.repository.tag_repository_impl import TagRepositoryImpl
+from app.target.infra.repository.target_repository_impl import TargetRepositoryImpl
+
+
+def _target(target_id: int):
+    target = MagicMock()
+    target.target_id = TargetId(target_id)
+    return target
+
+
+def _make_cache(redis_client=None) -> ReferenceDataCache:
+    cache = ReferenceDataCache(db=MagicMock(), redis_client=redis_client)
+    cache.load(
+        tags=[MagicMock(), MagicMock()],
+        tag_skills=[MagicMock()],
+        targets=[_target(3)],
+    )
+    return cache
+
+
+class TestSnapshot:
+    """ReferenceDataCache 스냅샷 테스트"""
+
+    def test_not_ready_before_load(self):
+        cache = ReferenceDataCache(db=MagicMock())
+
+        assert cache.is_ready is False
+        assert cache.snapshot is None
+
+    def test_load_swaps_snapshot_and_bumps_version(self):
+        cache = _make_cache()
+        first = cache.snapshot
+
+        cache.load(tags=[], tag_skills=[], targets=[])
+
+        assert first.version == 1
+        assert cache.snapshot.version == 2
+        assert len(first.tags) == 2  # 이전 스냅샷은 그대로 유지
+        assert cache.snapshot.tags == ()
+
+    def test_lookup_maps_are_read_only(self):
+        cache = _make_cache()
+
+        with pytest.raises(TypeError):
+            cache.snapshot.targets_by_id[99] = _target(99)
+
+
+class TestRepositoriesUseSnapshot:
+    """Repository가 스냅샷이 있으면 DB를 조회하지 않는지 테스트"""
+
+    async def test_tag_and_tag_skill_lookups(self, mock_database_context):
+        cache = _make_cache()
+        mock_database_context.get_current_session().execute = AsyncMock()
+
+        tags = await TagRepositoryImpl(db=mock_database_context, reference_data_cache=cache).find_active_tags_with_relations()
+        skills = await TagSkillRepositoryImpl(db=mock_database_context, reference_data_cache=cache).find_all_active()
+
+        assert len(tags) == 2
+        assert len(skills) == 1
+        mock_database_context.get_current_session().execute.assert_not_called()
+
+    async def test_target_miss_falls_back_to_sql(self, mock_database_context):
+        cache = _make_cache()
+        repo = TargetRepositoryImpl(db=mock_database_context, reference_data_cache=cache)
+        result_mock = MagicMock()
+        result_mock.scalar_one_or_none.return_value = None
+        mock_database_context.get_current_session().execute = AsyncMock(return_value=result_mock)
+
+        assert await repo.find_by_id(TargetId(3)) is cache.snapshot.targets_by_id[3]
+        mock_database_context.get_current_session().execute.assert_not_called()
+
+        assert await repo.find_by_id(TargetId(4)) is None
+        mock_database_context.get_current_session().execute.assert_called_once()
+
+    async def test_tag_ids_lookup_queries_only_misses(self, mock_database_context):
+        cache = ReferenceDataCache(db=MagicMock())
+        cached_tag = MagicMock()
+        cached_tag.tag_id = TagId(1)
+        cache.load(tags=[cached_tag], tag_skills=[], targets=[_target(3)])
+        repo = TagRepositoryImpl(db=mock_database_context, reference_data_cache=cache)
+        result_mock = MagicMock()
+        result_mock.unique.return_value.scalars.return_value.fetchall.return_value = []
+        mock_database_context.get_current_session().execute = AsyncMock(return_value=result_mock)
+
+        assert await repo.find_by_ids_and_active([TagId(1)]) == [cached_tag]
+        mock_database_context.get_current_session().execute.assert_not_called()
+
+        assert await repo.find_by_ids_and_active([TagId(1), TagId(2)]) == [cached_tag]
+        mock_database_context.get_current_session().execute.assert_called_once()
+
+    async def test_all_active_targets(self, mock_database_context):
+        cache = _make_cache()
+        mock_database_context.get_current_session().execute = AsyncMock()
+
+        targets = await TargetRepositoryImpl(db=mock_database_context, reference_data_cache=cache).find_all_active()
+
+        assert targets == [cache.snapshot.targets_by_id[3]]
+        mock_database_context.get_current_session().execute.assert_not_called()
+
+
+class TestInvalidation:
+    """워커 간 무효화 전파 테스트"""
+
+    async def test_broadcast_publishes_origin_and_version(self):
+        redis_client = MagicMock()
+        redis_client.publish = AsyncMock()
+        cache = _make_cache(redis_client)
+
+        await cache.broadcast_invalidation()
+
+        channel, message = redis_client.publish.call_args.args
+        assert channel == INVALIDATION_CHANNEL
+        assert message["version"] == 1
+        assert message["origin"] == cache._instance_id
+        assert message["topic"] == "reference-data"
+
+    async def test_own_message_is_ignored(self):
+        cache = _make_cache()
+        cache.reload = AsyncMock()
+
+        await cache.handle_invalidation({"origin": cache._instance_id, "version": 1})
+
+        cache.reload.assert_not_called()
+
+    async def test_other_worker_message_reloads_and_runs_hooks(self):
+        cache = _make_cache()
+        cache.reload = AsyncMock()
+        failing_hook = AsyncMock(side_effect=RuntimeError("boom"))
+        hook = AsyncMock()
+        cache.add_reload_hook(failing_hook)
+        cache.add_reload_hook(hook)
+
+        await cache.handle_invalidation({"origin": "other-worker", "version": 7})
+
+        cache.reload.assert_awaited_once()
+        hook.assert_awaited_once()  # 앞선 hook이 실패해도 나머지는 실행
+
+    async def test_other_topic_runs_only_its_hooks(self):
+        cache = _make_cache()
+        cache.reload = AsyncMock()
+        reference_hook = AsyncMock()
+        level_filter_hook = AsyncMock()
+        cache.add_reload_hook(reference_hook)
+        cache.add_reload_hook(level_filter_hook, topic="level-filter")
+
+        await cache.handle_invalidation({"origin": "other-worker", "topic": "level-filter", "version": 7})
+
+        cache.reload.assert_not_called()
+        reference_hook.assert_not_called()
+        level_filter_hook.assert_awaited_once()
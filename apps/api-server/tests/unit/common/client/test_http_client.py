@@ -0,0 +1,154 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from app.common.infra.client.http_client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HostPolicy,
+    HttpClientSettings,
+    borrow_client,
+    create_http_client,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(handler, **policy_kwargs) -> httpx.AsyncClient:
+    settings = HttpClientSettings(policies={"api.test": HostPolicy(retry_backoff=0, **policy_kwargs)})
+    return create_http_client(settings, transport=httpx.MockTransport(handler))
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestSharedHttpClient:
+    """공유 HTTP 클라이언트 transport 정책 테스트"""
+
+    async def test_get_is_retried_on_503_and_counted(self):
+        statuses = iter([503, 200])
+        retries_before = _sample("outbound_http_retries_total", host="api.test")
+
+        async with _client(lambda request: httpx.Response(next(statuses)), max_retries=2) as client:
+            response = await client.get("https://api.test/items")
+
+        assert response.status_code == 200
+        assert _sample("outbound_http_retries_total", host="api.test") == retries_before + 1
+
+    async def test_post_is_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        async with _client(handler, max_retries=2) as client:
+            response = await client.post("https://api.test/token")
+
+        assert response.status_code == 503
+        assert len(calls) == 1
+
+    async def test_429_is_reported_to_rate_limiter(self):
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+
+        async with _client(lambda request: httpx.Response(429, headers={"Retry-After": "2"}), rate_limiter=limiter) as client:
+            response = await client.get("https://api.test/items")
+
+        assert response.status_code == 429
+        limiter.on_rate_limited.assert_called_once_with(2.0)
+
+    async def test_circuit_opens_after_consecutive_failures(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=clock)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500)
+
+        async with _client(handler, circuit_breaker=breaker) as client:
+            await client.get("https://api.test/a")
+            await client.get("https://api.test/b")
+            with pytest.raises(CircuitOpenError):
+                await client.get("https://api.test/c")
+
+            # reset_timeout 이후 시험 요청 1개는 통과
+            clock.now = 11.0
+            await client.get("https://api.test/d")
+
+        assert len(calls) == 3
+
+    async def test_429_with_http_date_retry_after_is_parsed(self):
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+        headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+
+        async with _client(lambda request: httpx.Response(429, headers=headers), rate_limiter=limiter) as client:
+            response = await client.get("https://api.test/items")
+
+        assert response.status_code == 429
+        limiter.on_rate_limited.assert_called_once_with(0.0)
+
+    async def test_unparsable_retry_after_is_ignored(self):
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+
+        async with _client(lambda request: httpx.Response(429, headers={"Retry-After": "soon"}), rate_limiter=limiter) as client:
+            await client.get("https://api.test/items")
+
+        limiter.on_rate_limited.assert_called_once_with(None)
+
+    async def test_probe_answered_with_429_reopens_circuit(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+        statuses = iter([500, 429, 200])
+
+        async with _client(lambda request: httpx.Response(next(statuses)), circuit_breaker=breaker) as client:
+            await client.get("https://api.test/a")
+            clock.now = 11.0
+            assert (await client.get("https://api.test/b")).status_code == 429
+            with pytest.raises(CircuitOpenError):
+                await client.get("https://api.test/c")
+
+            clock.now = 22.0
+            assert (await client.get("https://api.test/d")).status_code == 200
+
+        assert not breaker.is_open
+
+    async def test_cancelled_probe_releases_half_open_state(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock(side_effect=[None, asyncio.CancelledError(), None])
+        statuses = iter([500, 200])
+
+        async with _client(
+            lambda request: httpx.Response(next(statuses)), circuit_breaker=breaker, rate_limiter=limiter,
+        ) as client:
+            await client.get("https://api.test/a")
+            clock.now = 11.0
+            with pytest.raises(asyncio.CancelledError):
+                await client.get("https://api.test/b")
+
+            assert not breaker.is_probing
+            assert (await client.get("https://api.test/c")).status_code == 200
+
+    async def test_borrow_client_keeps_shared_client_open(self):
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+
+        async with borrow_client(shared) as client:
+            assert client is shared
+
+        assert not shared.is_closed
+        await shared.aclose()
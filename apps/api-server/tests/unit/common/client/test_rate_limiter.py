@@ -0,0 +1,57 @@
+import pytest
+
+from app.common.infra.client.rate_limiter import AdaptiveTokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """asyncio.sleep이 가짜 시계를 앞으로 돌리도록 패치"""
+    fake = FakeClock()
+
+    async def fake_sleep(seconds):
+        fake.now += seconds
+
+    monkeypatch.setattr("app.common.infra.client.rate_limiter.asyncio.sleep", fake_sleep)
+    return fake
+
+
+class TestAdaptiveTokenBucket:
+    """AdaptiveTokenBucket 테스트"""
+
+    async def test_acquire_paces_requests_at_rate(self, clock):
+        bucket = AdaptiveTokenBucket(rate=2.0, clock=clock)
+
+        for _ in range(5):
+            await bucket.acquire()
+
+        # 첫 토큰은 즉시, 이후 0.5초 간격
+        assert clock.now == pytest.approx(2.0)
+
+    async def test_rate_limited_pauses_and_halves_rate(self, clock):
+        bucket = AdaptiveTokenBucket(rate=2.0, clock=clock)
+        await bucket.acquire()
+
+        bucket.on_rate_limited(retry_after=3.0)
+        await bucket.acquire()
+
+        assert bucket.rate == pytest.approx(1.0)
+        assert clock.now == pytest.approx(4.0)  # 3초 중지 + 새 속도로 토큰 1개
+
+    async def test_rate_never_drops_below_min_and_recovers_to_max(self, clock):
+        bucket = AdaptiveTokenBucket(rate=1.0, max_rate=1.0, min_rate=0.5, recovery_step=0.25, clock=clock)
+
+        bucket.on_rate_limited()
+        bucket.on_rate_limited()
+        assert bucket.rate == pytest.approx(0.5)
+
+        for _ in range(5):
+            bucket.on_success()
+        assert bucket.rate == pytest.approx(1.0)
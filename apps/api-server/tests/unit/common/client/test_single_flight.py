@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+from app.common.infra.client.single_flight import SingleFlight
+
+
+class FakeRedis:
+    """AsyncRedisClient의 set/get/delete/exists 동작만 흉내 (값은 그대로 저장)"""
+
+    def __init__(self):
+        self.store: dict = {}
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def delete(self, key):
+        return 1 if self.store.pop(key, None) is not None else 0
+
+    async def exists(self, key):
+        return 1 if key in self.store else 0
+
+
+class TestSingleFlight:
+    """SingleFlight 요청 병합 테스트"""
+
+    async def test_concurrent_callers_share_one_call_in_process(self):
+        flight = SingleFlight("test")
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"count": 3}
+
+        results = await asyncio.gather(*(flight.do("alice", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert results == [{"count": 3}] * 5
+        assert flight._inflight == {}
+
+    async def test_different_keys_are_not_merged(self):
+        flight = SingleFlight("test")
+        calls: list[str] = []
+
+        def fetcher(key):
+            async def fetch():
+                calls.append(key)
+                await asyncio.sleep(0)
+                return key
+            return fetch
+
+        results = await asyncio.gather(flight.do("a", fetcher("a")), flight.do("b", fetcher("b")))
+
+        assert results == ["a", "b"]
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_failure_propagates_to_all_callers_and_is_not_cached(self):
+        flight = SingleFlight("test")
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(flight.do("k", fetch), flight.do("k", fetch), return_exceptions=True)
+
+        assert calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        with pytest.raises(RuntimeError):
+            await flight.do("k", fetch)
+        assert calls == 2
+
+    async def test_waiter_on_other_worker_receives_owner_result(self):
+        redis = FakeRedis()
+        owner = SingleFlight("test", redis_client=redis, poll_interval=0.005)
+        waiter = SingleFlight("test", redis_client=redis, poll_interval=0.005)  # 다른 워커 프로세스 역할
+        started = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.sleep(0.03)
+            return {"count": 7}
+
+        owner_task = asyncio.create_task(owner.do("bob", fetch))
+        await started.wait()
+        waiter_result = await waiter.do("bob", fetch)
+
+        assert await owner_task == {"count": 7}
+        assert waiter_result == {"count": 7}
+        assert calls == 1
+        assert "test:lock:bob" not in redis.store
+
+    async def test_waiter_takes_over_when_owner_fails(self):
+        redis = FakeRedis()
+        owner = SingleFlight("test", redis_client=redis, poll_interval=0.005)
+        waiter = SingleFlight("test", redis_client=redis, poll_interval=0.005)
+        started = asyncio.Event()
+
+        async def failing():
+            started.set()
+            await asyncio.sleep(0.02)
+            raise RuntimeError("boom")
+
+        async def succeeding():
+            return "fresh"
+
+        owner_task = asyncio.create_task(owner.do("k", failing))
+        await started.wait()
+
+        assert await waiter.do("k", succeeding) == "fresh"
+        with pytest.raises(RuntimeError):
+            await owner_task
+
+    async def test_stale_result_is_cleared_before_new_call(self):
+        redis = FakeRedis()
+        redis.store["test:result:k"] = {"value": "stale"}
+        flight = SingleFlight("test", redis_client=redis)
+
+        async def fetch():
+            assert "test:result:k" not in redis.store
+            return "new"
+
+        assert await flight.do("k", fetch) == "new"
+        assert redis.store["test:result:k"] == {"value": "new"}
+
+    async def test_redis_error_falls_back_to_direct_call(self):
+        class BrokenRedis(FakeRedis):
+            async def set(self, key, value, ex=None, nx=False):
+                raise ConnectionError("down")
+
+        flight = SingleFlight("test", redis_client=BrokenRedis())
+
+        async def fetch():
+            return 1
+
+        assert await flight.do("k", fetch) == 1
@@ -0,0 +1,117 @@
+from pydantic import BaseModel
+
+from app.common.domain.entity.domain_event import DomainEvent
+from app.common.infra.event.decorators import _convert_payload
+from app.common.infra.event.in_memory_event_bus import InMemoryEventBus
+
+
+class _Payload(BaseModel):
+    problem_ids: list[int]
+
+
+class _OtherPayload(BaseModel):
+    problem_ids: list[int]
+
+
+class _Result(BaseModel):
+    names: dict[int, str]
+
+
+class _OtherResult(BaseModel):
+    names: dict[int, str]
+
+
+class TestInMemoryEventBus:
+    """InMemoryEventBus 디스패치 테이블 / payload 전달 테스트"""
+
+    async def test_exact_and_pattern_handlers_cached_per_event(self):
+        bus = InMemoryEventBus()
+        calls = []
+
+        @bus.subscribe("PROBLEM_SOLVED")
+        async def exact(event_name, payload):
+            calls.append(("exact", event_name))
+
+        @bus.subscribe("PROBLEM_*")
+        async def pattern(event_name, payload):
+            calls.append(("pattern", event_name))
+
+        assert bus.compile() == 1
+        await bus.publish(DomainEvent(event_type="PROBLEM_SOLVED", data=_Payload(problem_ids=[1])))
+        await bus.publish(DomainEvent(event_type="PROBLEM_BANNED", data=_Payload(problem_ids=[1])))
+        await bus.publish(DomainEvent(event_type="TAG_CHANGED", data=_Payload(problem_ids=[1])))
+
+        assert calls == [("exact", "PROBLEM_SOLVED"), ("pattern", "PROBLEM_SOLVED"), ("pattern", "PROBLEM_BANNED")]
+        assert bus._get_handlers("PROBLEM_SOLVED") is bus._get_handlers("PROBLEM_SOLVED")
+        assert bus._get_handlers("TAG_CHANGED") == ()
+
+    async def test_subscribe_invalidates_dispatch_table(self):
+        bus = InMemoryEventBus()
+
+        @bus.subscribe("A")
+        async def first(event_name, payload):
+            pass
+
+        assert len(bus._get_handlers("A")) == 1
+
+        @bus.subscribe("A*")
+        async def second(event_name, payload):
+            pass
+
+        assert len(bus._get_handlers("A")) == 2
+
+    async def test_same_typed_payload_and_result_are_passed_without_copy(self):
+        bus = InMemoryEventBus()
+        payload = _Payload(problem_ids=[1, 2])
+        result = _Result(names={1: "A"})
+        received = []
+
+        @bus.subscribe("GET")
+        async def handler(event_name, data):
+            received.append(data)
+            return result
+
+        returned = await bus.publish(DomainEvent(event_type="GET", data=payload, result_type=_Result))
+
+        assert received[0] is payload
+        assert returned is result
+
+    async def test_result_of_other_context_type_is_revalidated(self):
+        bus = InMemoryEventBus()
+
+        @bus.subscribe("GET")
+        async def handler(event_name, data):
+            return _OtherResult(names={1: "A"})
+
+        returned = await bus.publish(DomainEvent(event_type="GET", data=_Payload(problem_ids=[1]), result_type=_Result))
+
+        assert isinstance(returned, _Result)
+        assert returned.names == {1: "A"}
+
+    async def test_dict_result_with_non_model_result_type_is_returned_as_is(self):
+        bus = InMemoryEventBus()
+
+        @bus.subscribe("CLEANUP")
+        async def handler(event_name, data):
+            return {"deleted_count": 3}
+
+        returned = await bus.publish(DomainEvent(event_type="CLEANUP", data={"provider": "NONE"}, result_type=dict))
+
+        assert returned == {"deleted_count": 3}
+
+
+class TestConvertPayload:
+    """event_register_handlers wrapper의 payload 변환 테스트"""
+
+    def test_same_type_is_passed_through(self):
+        payload = _Payload(problem_ids=[1])
+        assert _convert_payload(payload, _Payload) is payload
+
+    def test_other_context_model_and_dict_are_validated(self):
+        converted = _convert_payload(_OtherPayload(problem_ids=[1]), _Payload)
+        assert isinstance(converted, _Payload) and converted.problem_ids == [1]
+        assert _convert_payload({"problem_ids": [2]}, _Payload).problem_ids == [2]
+
+    def test_untyped_handler_receives_dict(self):
+        assert _convert_payload(_Payload(problem_ids=[1]), None) == {"problem_ids": [1]}
+        assert _convert_payload({"x": 1}, None) == {"x": 1}
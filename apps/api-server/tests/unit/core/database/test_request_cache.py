@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.database import _request_cache, invalidate_request_cache, request_cached
+
+
+@pytest.fixture
+def request_cache():
+    """Database.session()이 세션과 함께 여는 캐시를 흉내"""
+    token = _request_cache.set({})
+    yield
+    _request_cache.reset(token)
+
+
+class TestRequestCache:
+    """세션 범위 조회 캐시 테스트"""
+
+    async def test_without_session_loader_runs_every_time(self):
+        loader = AsyncMock(return_value="bj")
+
+        await request_cached("k", loader, depends_on=("account_link",))
+        await request_cached("k", loader, depends_on=("account_link",))
+
+        assert loader.await_count == 2
+
+    async def test_memoizes_within_session(self, request_cache):
+        loader = AsyncMock(return_value=None)  # None(연동 없음)도 캐시됨
+
+        first = await request_cached(("active_bj_account_id", 1), loader, depends_on=("account_link",))
+        second = await request_cached(("active_bj_account_id", 1), loader, depends_on=("account_link",))
+
+        assert first is None and second is None
+        loader.assert_awaited_once()
+
+    async def test_invalidate_drops_only_dependent_entries(self, request_cache):
+        link_loader = AsyncMock(return_value="bj")
+        other_loader = AsyncMock(return_value=3)
+        await request_cached("link", link_loader, depends_on=("account_link",))
+        await request_cached("other", other_loader, depends_on=("bj_account",))
+
+        invalidate_request_cache("account_link")
+        await request_cached("link", link_loader, depends_on=("account_link",))
+        await request_cached("other", other_loader, depends_on=("bj_account",))
+
+        assert link_loader.await_count == 2
+        assert other_loader.await_count == 1
+
+    async def test_invalidate_without_tables_clears_all(self, request_cache):
+        loader = AsyncMock(return_value=1)
+        await request_cached("k", loader, depends_on=("bj_account",))
+
+        invalidate_request_cache()
+        await request_cached("k", loader, depends_on=("bj_account",))
+
+        assert loader.await_count == 2
+
+
+class TestActiveBjAccountLookupMemoization:
+    """UserActivityRepositoryImpl / BaekjoonAccountRepositoryImpl 연동 계정 조회 memoize 테스트"""
+
+    def _db(self, session) -> MagicMock:
+        db = MagicMock()
+        db.get_current_session.return_value = session
+        return db
+
+    async def test_active_bj_account_id_is_queried_once_per_session(self, request_cache):
+        from app.activity.infra.repository.user_activity_repository_impl import UserActivityRepositoryImpl
+
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = "bj"
+        session = AsyncMock()
+        session.execute.return_value = result
+        repo = UserActivityRepositoryImpl(db=self._db(session))
+
+        assert await repo._get_active_bj_account_id(1) == "bj"
+        assert await repo._get_active_bj_account_id(1) == "bj"
+        assert await repo._get_active_bj_account_id(2) == "bj"
+
+        assert session.execute.await_count == 2
+
+    async def test_find_by_user_id_returns_independent_copies(self, request_cache):
+        from app.baekjoon.infra.repository.baekjoon_account_repository_impl import BaekjoonAccountRepositoryImpl
+        from app.baekjoon.domain.entity.baekjoon_account import BaekjoonAccount
+        from app.common.domain.vo.identifiers import BaekjoonAccountId, TierId, UserAccountId
+
+        account = BaekjoonAccount.create(bj_account_id=BaekjoonAccountId("bj"), tier_id=TierId(10))
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        repo = BaekjoonAccountRepositoryImpl(db=self._db(session))
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr(
+                "app.baekjoon.infra.repository.baekjoon_account_repository_impl.BaekjoonAccountMapper.to_entity",
+                lambda model: account,
+            )
+            first = await repo.find_by_user_id(UserAccountId(1))
+            first.update_rating(2000)
+            second = await repo.find_by_user_id(UserAccountId(1))
+
+        assert session.execute.await_count == 1
+        assert second is not first
+        assert second.rating.value == account.rating.value
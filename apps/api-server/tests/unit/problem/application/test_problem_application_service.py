@@ -16,7 +16,6 @@ def _make_service() -> ProblemApplicationService:
         problem_repository=AsyncMock(),
         tag_repository=AsyncMock(),
         target_repository=AsyncMock(),
-        tier_repository=AsyncMock(),
     )
 
 
@@ -83,7 +82,6 @@ class TestSearchProblemByKeyword:
         service.problem_repository.find_by_title_keyword.return_value = []
         service.target_repository.find_all_active.return_value = []
         service.tag_repository.find_by_ids_and_active.return_value = []
-        service.tier_repository.find_by_levels.return_value = []
 
         result = await service.search_problem_by_keyword("1000")
 
@@ -98,7 +96,6 @@ class TestSearchProblemByKeyword:
         service.problem_repository.find_by_title_keyword.return_value = [problem]
         service.target_repository.find_all_active.return_value = []
         service.tag_repository.find_by_ids_and_active.return_value = []
-        service.tier_repository.find_by_levels.return_value = []
 
         result = await service.search_problem_by_keyword("A+B")
 
@@ -127,11 +124,6 @@ class TestGetProblemsInfo:
         service.target_repository.find_all_active.return_value = []
         service.tag_repository.find_by_ids_and_active.return_value = []
 
-        tier_mock = MagicMock()
-        tier_mock.tier_level = 5
-        tier_mock.tier_code = "Silver V"
-        service.tier_repository.find_by_levels.return_value = [tier_mock]
-
         from app.baekjoon.domain.event.get_problems_info_payload import GetProblemsInfoPayload
         payload = GetProblemsInfoPayload(problem_ids=[1000])
 
@@ -139,7 +131,7 @@ class TestGetProblemsInfo:
 
         assert 1000 in result.problems
         assert result.problems[1000].problem_title == "A+B"
-        assert result.problems[1000].problem_tier_name == "Silver V"
+        assert result.problems[1000].problem_tier_name == "B1"
 
 
 class TestGetProblemsInfoLogic:
@@ -170,11 +162,6 @@ class TestGetProblemsInfoLogic:
         target.required_tags = [target_tag]
         service.target_repository.find_all_active.return_value = [target]
 
-        tier_mock = MagicMock()
-        tier_mock.tier_level = 5
-        tier_mock.tier_code = "Silver V"
-        service.tier_repository.find_by_levels.return_value = [tier_mock]
-
         result = await service._get_problems_info_logic([problem])
 
         assert 1000 in result.problems
@@ -0,0 +1,327 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.problem.application.service import problem_metadata_sync_service as sync_module
+from app.problem.application.service.problem_metadata_sync_service import ProblemMetadataSyncService
+from app.problem.domain.vo.problem_content_hash import ProblemContentHash
+from tests.fixtures.solvedac_fake_server import FakeSolvedAcServer
+
+
+def _problem(problem_id: int, tag_keys: list[str], level: int = 5) -> dict:
+    return {
+        "problemId": problem_id,
+        "titleKo": f"P{problem_id}",
+        "level": level,
+        "acceptedUserCount": 1000,
+        "tags": [{"key": key} for key in tag_keys],
+    }
+
+
+def _make_session(existing_pairs: list[tuple[int, int]], stored_hashes: dict[int, str] | None = None) -> MagicMock:
+    session = MagicMock()
+    hash_result = MagicMock()
+    hash_result.fetchall.return_value = list((stored_hashes or {}).items())
+    pair_result = MagicMock()
+    pair_result.fetchall.return_value = existing_pairs
+
+    async def execute(stmt, params=None):
+        sql = str(stmt)
+        if "content_hash FROM problem" in sql:
+            return hash_result
+        if sql.lstrip().startswith("SELECT"):
+            return pair_result
+        return MagicMock()
+
+    session.execute = AsyncMock(side_effect=execute)
+    return session
+
+
+def _statements(session: MagicMock) -> dict[str, list]:
+    """실행된 문장 종류별 파라미터"""
+    kinds = (
+        "INSERT INTO problem ", "INSERT IGNORE INTO problem_tag",
+        "SELECT problem_id, content_hash", "SELECT problem_id, tag_id", "DELETE",
+    )
+    result = {}
+    for call in session.execute.call_args_list:
+        sql = " ".join(str(call.args[0]).split())
+        kind = next(k for k in kinds if k in sql)
+        result[kind] = call.args[1]
+    return result
+
+
+def _hash(problem: dict, tag_ids: list[int]) -> str:
+    return ProblemContentHash.compute(
+        problem["titleKo"], problem["level"], problem["acceptedUserCount"], tag_ids
+    ).value
+
+
+class TestUpsertProblemBatch:
+    """ProblemMetadataSyncService._upsert_problem_batch() 테스트"""
+
+    async def test_problems_upserted_in_one_executemany(self):
+        service = ProblemMetadataSyncService(db=MagicMock())
+        session = _make_session([])
+
+        changed, affected = await service._upsert_problem_batch(
+            session, [_problem(1, ["dp"]), _problem(2, [])], {"dp": 10}, datetime.now()
+        )
+
+        statements = _statements(session)
+        assert changed == 2
+        assert affected == {10}
+        assert [row["id"] for row in statements["INSERT INTO problem "]] == [1, 2]
+        assert all(row["hash"] for row in statements["INSERT INTO problem "])
+        assert statements["SELECT problem_id, tag_id"] == {"pids": [1, 2]}
+        assert [(row["pid"], row["tid"]) for row in statements["INSERT IGNORE INTO problem_tag"]] == [(1, 10)]
+        assert "DELETE" not in statements
+
+    async def test_problem_tags_applied_as_diff(self):
+        service = ProblemMetadataSyncService(db=MagicMock())
+        # 기존: (1,10), (1,11) / 새 데이터: (1,10), (1,12)
+        session = _make_session([(1, 10), (1, 11)])
+
+        _, affected = await service._upsert_problem_batch(
+            session, [_problem(1, ["dp", "graph", "unknown"])], {"dp": 10, "graph": 12}, datetime.now()
+        )
+
+        statements = _statements(session)
+        assert [(row["pid"], row["tid"]) for row in statements["INSERT IGNORE INTO problem_tag"]] == [(1, 12)]
+        assert statements["DELETE"] == [{"pid": 1, "tid": 11}]
+        assert affected == {10, 11, 12}
+
+    async def test_unchanged_hash_skips_problem(self):
+        service = ProblemMetadataSyncService(db=MagicMock())
+        unchanged, changed = _problem(1, ["dp"]), _problem(2, ["dp"], level=7)
+        session = _make_session([(2, 10)], stored_hashes={1: _hash(unchanged, [10]), 2: _hash(_problem(2, ["dp"]), [10])})
+
+        count, affected = await service._upsert_problem_batch(session, [unchanged, changed], {"dp": 10}, datetime.now())
+
+        statements = _statements(session)
+        assert count == 1
+        assert affected == {10}
+        assert [row["id"] for row in statements["INSERT INTO problem "]] == [2]
+        assert statements["SELECT problem_id, tag_id"] == {"pids": [2]}
+
+    async def test_all_unchanged_issues_no_writes(self):
+        service = ProblemMetadataSyncService(db=MagicMock())
+        problem = _problem(1, ["dp"])
+        session = _make_session([(1, 10)], stored_hashes={1: _hash(problem, [10])})
+
+        result = await service._upsert_problem_batch(session, [problem], {"dp": 10}, datetime.now())
+
+        assert result == (0, set())
+        assert session.execute.await_count == 1
+
+    async def test_full_mode_rewrites_unchanged_problems(self):
+        service = ProblemMetadataSyncService(db=MagicMock())
+        problem = _problem(1, ["dp"])
+        session = _make_session([(1, 10)], stored_hashes={1: _hash(problem, [10])})
+
+        count, _ = await service._upsert_problem_batch(session, [problem], {"dp": 10}, datetime.now(), full=True)
+
+        statements = _statements(session)
+        assert count == 1
+        assert "SELECT problem_id, content_hash" not in statements
+        assert "INSERT IGNORE INTO problem_tag" not in statements
+
+
+def _make_pipeline_service(server: FakeSolvedAcServer, write_delay: float = 0.0):
+    """가짜 서버 + 기록용 writer로 구성된 서비스 (반환: 서비스, 기록된 배치, 이벤트 순서)"""
+    tag_result = MagicMock()
+    tag_result.fetchall.return_value = [(i + 1, key) for i, key in enumerate(server.tag_keys)]
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=tag_result)
+
+    @asynccontextmanager
+    async def fake_session():
+        yield session
+
+    batches: list[list[int]] = []
+    events: list[str] = []
+    original_handle = server.handle
+
+    async def handle(request):
+        events.append("fetch")
+        return await original_handle(request)
+
+    server.handle = handle
+    db = MagicMock()
+    db.session = fake_session
+    service = ProblemMetadataSyncService(db=db, http_client=server.client())
+
+    async def record_batch(session, batch, tag_code_to_id, now, full):
+        events.append("write")
+        await asyncio.sleep(write_delay)
+        batches.append([prob["problemId"] for prob in batch])
+        return len(batch), {1}
+
+    service._upsert_problem_batch = record_batch
+    return service, batches, events
+
+
+@pytest.fixture
+def fast_pipeline(monkeypatch):
+    monkeypatch.setattr(sync_module, "_BATCH_SIZE", 100)
+    monkeypatch.setattr(sync_module, "_QUEUE_MAXSIZE", 3)
+
+
+class TestSyncProblemsPipeline:
+    """sync_problems fetch → Queue → write 파이프라인 테스트 (가짜 solved.ac 서버)"""
+
+    async def test_every_problem_written_exactly_once(self, fast_pipeline):
+        server = FakeSolvedAcServer(total=1234, per_page=50)
+        service, batches, _ = _make_pipeline_service(server)
+
+        result = await service.sync_problems()
+
+        written = sorted(pid for batch in batches for pid in batch)
+        assert result.problem_count == 1234
+        assert result.changed_problem_count == 1234
+        assert result.affected_tag_ids == {1}
+        assert written == list(range(1, 1235))
+        assert all(len(batch) <= 100 for batch in batches)
+
+    async def test_rate_limited_pages_are_retried(self, fast_pipeline):
+        server = FakeSolvedAcServer(total=500, per_page=50, rate_limit_every=4)
+        service, batches, _ = _make_pipeline_service(server)
+
+        result = await service.sync_problems()
+
+        assert server.rate_limited > 0
+        assert result.problem_count == 500
+        assert len({pid for batch in batches for pid in batch}) == 500
+
+    async def test_writes_overlap_with_fetches(self, fast_pipeline):
+        server = FakeSolvedAcServer(total=2000, per_page=50, latency=0.002)
+        service, _, events = _make_pipeline_service(server, write_delay=0.005)
+
+        started = time.perf_counter()
+        await service.sync_problems()
+        elapsed = time.perf_counter() - started
+
+        # 마지막 fetch 전에 이미 write가 시작되어야 함 (전체 수집 후 일괄 쓰기가 아님)
+        last_fetch = len(events) - 1 - events[::-1].index("fetch")
+        assert events.index("write") < last_fetch
+        assert elapsed < 5
+
+
+class TestSyncAllDelta:
+    """sync_all() delta / full 모드 테스트"""
+
+    def _make_service(self, problem_result, changed_tag_count=0):
+        service = ProblemMetadataSyncService(
+            db=MagicMock(), candidate_index=MagicMock(), reference_data_cache=AsyncMock(),
+        )
+        service.candidate_index.rebuild = AsyncMock()
+        service.sync_tags = AsyncMock(return_value=sync_module.TagSyncResult(10, changed_tag_count))
+        service.sync_problems = AsyncMock(return_value=problem_result)
+        service.recalculate_tag_tier_ranges = AsyncMock()
+        service.recalculate_tag_skills = AsyncMock()
+        return service
+
+    async def test_delta_recalculates_only_affected_tags(self):
+        service = self._make_service(sync_module.ProblemSyncResult(100, 3, {4, 5}))
+
+        result = await service.sync_all()
+
+        service.recalculate_tag_tier_ranges.assert_awaited_once_with({4, 5})
+        service.recalculate_tag_skills.assert_awaited_once_with({4, 5})
+        service.candidate_index.rebuild.assert_awaited_once()
+        assert result.changed_problem_count == 3
+        assert result.affected_tag_ids == {4, 5}
+
+    async def test_delta_without_changes_skips_recalculation(self):
+        service = self._make_service(sync_module.ProblemSyncResult(100, 0, set()))
+
+        await service.sync_all()
+
+        service.recalculate_tag_tier_ranges.assert_not_called()
+        service.recalculate_tag_skills.assert_not_called()
+        service.candidate_index.rebuild.assert_not_called()
+        service.reference_data_cache.reload.assert_not_called()
+        service.reference_data_cache.broadcast_invalidation.assert_not_called()
+
+    async def test_changed_problems_reload_and_broadcast_reference_data(self):
+        service = self._make_service(sync_module.ProblemSyncResult(100, 3, {4}))
+
+        await service.sync_all()
+
+        service.reference_data_cache.reload.assert_awaited_once()
+        service.reference_data_cache.broadcast_invalidation.assert_awaited_once()
+
+    async def test_changed_tags_alone_broadcast_reference_data(self):
+        service = self._make_service(sync_module.ProblemSyncResult(100, 0, set()), changed_tag_count=1)
+
+        await service.sync_all()
+
+        service.candidate_index.rebuild.assert_not_called()
+        service.reference_data_cache.broadcast_invalidation.assert_awaited_once()
+
+    async def test_full_recalculates_every_tag(self):
+        service = self._make_service(sync_module.ProblemSyncResult(100, 100, {4}))
+
+        result = await service.sync_all(full=True)
+
+        service.sync_problems.assert_awaited_once_with(full=True)
+        service.recalculate_tag_tier_ranges.assert_awaited_once_with(None)
+        assert result.affected_tag_ids is None
+
+
+class TestRecalculateTagMetadata:
+    """태그 티어 범위 / tag_skill 집합 기반 재계산 테스트"""
+
+    def _make_service(self, rows_by_prefix: dict[str, list]):
+        session = MagicMock()
+
+        async def execute(stmt, params=None):
+            sql = " ".join(str(stmt).split())
+            result = MagicMock()
+            result.fetchall.return_value = next(
+                (rows for prefix, rows in rows_by_prefix.items() if sql.startswith(prefix)), []
+            )
+            return result
+
+        session.execute = AsyncMock(side_effect=execute)
+        db = MagicMock()
+        db.get_current_session.return_value = session
+        return ProblemMetadataSyncService(db=db), session
+
+    async def test_tier_ranges_use_one_grouped_query_and_one_update(self):
+        # 태그 1: 티어 [1, 2×8, 3] (10문제), 그중 모집단은 티어 2 5문제 / 태그 2: 문제 없음
+        service, session = self._make_service({
+            "SELECT pt.tag_id, p.problem_tier_level, COUNT(*), SUM(": [(1, 1, 1, 0), (1, 2, 8, 5), (1, 3, 1, 0)],
+        })
+
+        await service.recalculate_tag_tier_ranges({1, 2})
+
+        sqls = [" ".join(str(call.args[0]).split()) for call in session.execute.call_args_list]
+        assert len(sqls) == 4  # 집계 SELECT, UPDATE JOIN, 백분위 DELETE, 백분위 INSERT
+        update_params = session.execute.call_args_list[1].args[1]
+        assert sqls[1].startswith("UPDATE tag t JOIN")
+        assert (update_params["tag_id_0"], update_params["min_tier_0"], update_params["max_tier_0"]) == (1, 2, 2)
+        assert "tag_id_1" not in update_params
+        percentile_rows = session.execute.call_args_list[3].args[1]
+        assert [(row["tag_id"], row["tier"], row["cnt"]) for row in percentile_rows] == [(1, 2, 5)]
+
+    async def test_tag_skills_written_with_single_bulk_statement(self):
+        service, session = self._make_service({
+            "SELECT tag_id, tag_level, tag_code FROM tag": [(1, "NEWBIE", "math"), (2, "ADVANCED", "dp")],
+            "SELECT pt.tag_id, p.problem_tier_level, COUNT(*) FROM": [(1, 3, 5), (1, 8, 5)],
+        })
+
+        await service.recalculate_tag_skills({1, 2})
+
+        assert session.execute.await_count == 3
+        rows = session.execute.call_args_list[2].args[1]
+        skills = {(row["tag_id"], row["sc"]): (row["mp"], row["mut"], row["mspt"]) for row in rows}
+        assert skills[(1, "IM")] == (0, 3, 3)
+        assert skills[(1, "AD")] == (10, 3, 8)
+        assert skills[(1, "MAS")] == (15, 8, 8)
+        # 문제가 없는 태그는 기본 티어 1
+        assert skills[(2, "MAS")] == (7, 1, 1)
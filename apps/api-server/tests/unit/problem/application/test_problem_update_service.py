@@ -0,0 +1,92 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+
+from app.problem.application.service import problem_update_service as update_module
+from app.problem.application.service.problem_update_service import ProblemUpdateService
+
+
+def _make_service(existing_ids: list[int], tags: list[tuple[int, str]], handler):
+    session = MagicMock()
+
+    async def execute(stmt, params=None):
+        sql = str(stmt)
+        result = MagicMock()
+        if "SELECT problem_id FROM problem" in sql:
+            result.fetchall.return_value = [(pid,) for pid in existing_ids if pid in params["problem_ids"]]
+        elif "SELECT tag_id, tag_code FROM tag" in sql:
+            result.fetchall.return_value = tags
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    db = MagicMock()
+    db.get_current_session.return_value = session
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return ProblemUpdateService(db=db, http_client=client), session
+
+
+def _lookup_handler(known_ids: set[int], requests: list[list[int]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = [int(pid) for pid in request.url.params["problemIds"].split(",")]
+        requests.append(ids)
+        return httpx.Response(200, json=[
+            {"problemId": pid, "titleKo": f"문제 {pid}", "level": 5, "acceptedUserCount": 10, "tags": [{"key": "math"}]}
+            for pid in ids if pid in known_ids
+        ])
+    return handler
+
+
+def _executed(session: MagicMock, prefix: str) -> list:
+    return [
+        call.args[1] if len(call.args) > 1 else None
+        for call in session.execute.call_args_list
+        if " ".join(str(call.args[0]).split()).startswith(prefix)
+    ]
+
+
+class TestEnsureProblemsExist:
+    """ensure_problems_exist 일괄 처리 테스트"""
+
+    async def test_existing_problems_skip_api(self):
+        requests = []
+        service, session = _make_service([1000, 1001], [], _lookup_handler(set(), requests))
+
+        result = await service.ensure_problems_exist([1001, 1000])
+
+        assert result == [1001, 1000]
+        assert requests == []
+        assert session.execute.await_count == 1
+
+    async def test_missing_problems_are_looked_up_in_chunks_and_bulk_inserted(self, monkeypatch):
+        monkeypatch.setattr(update_module, "_LOOKUP_CHUNK_SIZE", 2)
+        requests = []
+        service, session = _make_service(
+            [1], [(7, "math")], _lookup_handler({2, 3, 4}, requests),
+        )
+
+        result = await service.ensure_problems_exist([1, 2, 3, 4, 5, 2])
+
+        assert result == [1, 2, 3, 4, 2]  # 5는 solved.ac에도 없음, 입력 순서/중복 유지
+        assert sorted(requests) == [[2, 3], [4, 5]]
+        problem_rows = _executed(session, "INSERT IGNORE INTO problem (")
+        tag_rows = _executed(session, "INSERT IGNORE INTO problem_tag")
+        assert len(problem_rows) == 1 and [row["id"] for row in problem_rows[0]] == [2, 3, 4]
+        assert len(tag_rows) == 1 and {(row["pid"], row["tid"]) for row in tag_rows[0]} == {(2, 7), (3, 7), (4, 7)}
+
+    async def test_tag_map_is_cached_between_calls(self):
+        requests = []
+        service, session = _make_service([], [(7, "math")], _lookup_handler({2, 3}, requests))
+
+        await service.ensure_problems_exist([2])
+        await service.ensure_problems_exist([3])
+
+        assert len(_executed(session, "SELECT tag_id, tag_code FROM tag")) == 1
+
+    async def test_api_error_drops_only_failed_ids(self):
+        def handler(request):
+            return httpx.Response(500)
+
+        service, _ = _make_service([1], [], handler)
+
+        assert await service.ensure_problems_exist([1, 2]) == [1]
+        assert await service.ensure_problem_exists(2) is False
@@ -0,0 +1,116 @@
+import pytest
+from datetime import datetime
+
+from app.common.domain.vo.identifiers import TagId, TierId
+from app.common.domain.vo.primitives import TierRange
+from app.problem.infra.cache.problem_candidate_index import IndexedProblem, ProblemCandidateIndex
+from app.recommendation.domain.vo.search_criteria import SearchCriteria
+
+
+def _problem(problem_id: int, tier: int, solved: int = 2000, tag_ids=(1,)) -> IndexedProblem:
+    now = datetime.now()
+    return IndexedProblem(
+        problem_id=problem_id,
+        title=f"P{problem_id}",
+        tier_level=tier,
+        class_level=None,
+        solved_user_count=solved,
+        created_at=now,
+        updated_at=now,
+        tag_ids=tuple(tag_ids),
+    )
+
+
+def _criteria(min_rate=100, max_rate=0, min_tier=None, max_tier=None) -> SearchCriteria:
+    return SearchCriteria(
+        tier_range=TierRange(
+            min_tier_id=TierId(min_tier) if min_tier else None,
+            max_tier_id=TierId(max_tier) if max_tier else None,
+        ),
+        min_skill_rate=min_rate,
+        max_skill_rate=max_rate,
+    )
+
+
+def _make_index(problems: list[IndexedProblem]) -> ProblemCandidateIndex:
+    index = ProblemCandidateIndex(db=None)
+    index.load(problems)
+    return index
+
+
+class TestTierPercentiles:
+    """태그별 누적 백분위 테이블 테스트"""
+
+    def test_percentiles_follow_cumulative_counts(self):
+        index = _make_index([_problem(1, 5), _problem(2, 5), _problem(3, 10), _problem(4, 15)])
+
+        table = index.snapshot.tier_percentiles(1, 1000)
+
+        assert [t.tier for t in table] == [5, 10, 15]
+        assert [t.problem_cnt for t in table] == [2, 1, 1]
+        assert table[0].percentile_start == 1.0
+        assert table[0].percentile_end == pytest.approx(0.5)
+        assert table[2].percentile_end == pytest.approx(0.0)
+
+    def test_percentiles_ignore_problems_below_min_solved(self):
+        index = _make_index([_problem(1, 5, solved=10), _problem(2, 10)])
+
+        table = index.snapshot.tier_percentiles(1, 1000)
+
+        assert [t.tier for t in table] == [10]
+
+
+class TestSampleMany:
+    """ProblemCandidateIndex.sample_many() 테스트"""
+
+    def test_returns_distinct_candidates_up_to_limit(self):
+        index = _make_index([_problem(i, 5) for i in range(1, 11)])
+
+        problems = index.sample_many(TagId(1), [_criteria()], 1000, {1, 2}, 5)
+        ids = [p.problem_id.value for p in problems]
+
+        assert len(ids) == 5
+        assert len(set(ids)) == 5
+        assert not {1, 2} & set(ids)
+
+    def test_returns_all_remaining_when_fewer_than_limit(self):
+        index = _make_index([_problem(1, 5), _problem(2, 5), _problem(3, 5)])
+
+        problems = index.sample_many(TagId(1), [_criteria()], 1000, {1}, 10)
+
+        assert sorted(p.problem_id.value for p in problems) == [2, 3]
+
+    def test_not_ready_returns_empty(self):
+        index = ProblemCandidateIndex(db=None)
+
+        assert index.is_ready is False
+        assert index.sample_many(TagId(1), [_criteria()], 1000, set(), 3) == []
+
+    def test_returns_empty_when_everything_excluded(self):
+        index = _make_index([_problem(1, 5), _problem(2, 5)])
+
+        assert index.sample_many(TagId(1), [_criteria()], 1000, {1, 2}, 3) == []
+
+    def test_respects_tier_range_and_min_solved(self):
+        index = _make_index([
+            _problem(1, 5),
+            _problem(2, 12),
+            _problem(3, 12, solved=10),
+            _problem(4, 20),
+        ])
+
+        problems = index.sample_many(TagId(1), [_criteria(min_tier=10, max_tier=15)], 1000, set(), 5)
+
+        assert [p.problem_id.value for p in problems] == [2]
+
+    def test_returns_entities_with_tags(self):
+        index = _make_index([_problem(1, 5, tag_ids=(1, 7))])
+
+        problems = index.sample_many(TagId(1), [_criteria()], 1000, set(), 1)
+
+        assert {t.tag_id.value for t in problems[0].tags} == {1, 7}
+
+    def test_unknown_tag_returns_empty(self):
+        index = _make_index([_problem(1, 5)])
+
+        assert index.sample_many(TagId(99), [_criteria()], 1000, set(), 3) == []
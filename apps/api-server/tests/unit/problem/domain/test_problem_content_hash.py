@@ -0,0 +1,29 @@
+from app.problem.domain.vo.problem_content_hash import ProblemContentHash, solved_count_bucket
+
+
+class TestSolvedCountBucket:
+    """맞은 사람 수 구간 테스트"""
+
+    def test_buckets_keep_two_significant_digits(self):
+        assert solved_count_bucket(57) == 57
+        assert solved_count_bucket(999) == 990
+        assert solved_count_bucket(1000) == 1000
+        assert solved_count_bucket(12345) == 12000
+
+
+class TestProblemContentHash:
+    """ProblemContentHash 테스트"""
+
+    def test_same_content_same_hash_regardless_of_tag_order(self):
+        a = ProblemContentHash.compute("A+B", 1, 12345, [3, 1, 2])
+        b = ProblemContentHash.compute("A+B", 1, 12001, [1, 2, 3])
+
+        assert a == b
+
+    def test_changes_are_detected(self):
+        base = ProblemContentHash.compute("A+B", 1, 990, [1])
+
+        assert base != ProblemContentHash.compute("A+B!", 1, 990, [1])
+        assert base != ProblemContentHash.compute("A+B", 2, 990, [1])
+        assert base != ProblemContentHash.compute("A+B", 1, 1000, [1])
+        assert base != ProblemContentHash.compute("A+B", 1, 990, [1, 2])
@@ -0,0 +1,48 @@
+import random
+
+from app.problem.domain.vo.tag_tier_histogram import TagTierHistogram
+
+
+def _histogram(tier_list: list[int]) -> TagTierHistogram:
+    counts: dict[int, int] = {}
+    for tier in tier_list:
+        counts[tier] = counts.get(tier, 0) + 1
+    return TagTierHistogram.from_counts(list(counts.items()))
+
+
+class TestTagTierHistogram:
+    """TagTierHistogram 테스트"""
+
+    def test_tier_at_matches_sorted_list(self):
+        tier_list = sorted([5, 1, 5, 3, 3, 3, 12])
+        histogram = _histogram(tier_list)
+
+        assert [histogram.tier_at(i) for i in range(len(tier_list))] == tier_list
+
+    def test_tier_range_matches_trimmed_list_logic(self):
+        rng = random.Random(0)
+        for size in range(1, 60):
+            tier_list = sorted(rng.randint(1, 30) for _ in range(size))
+
+            lower, upper = int(size * 0.1), int(size * 0.8)
+            if upper <= lower:
+                lower, upper = 0, size
+            trimmed = tier_list[lower:upper]
+            expected = (trimmed[min(int(len(trimmed) * 0.9), len(trimmed) - 1)], trimmed[-1])
+
+            assert _histogram(tier_list).tier_range() == expected
+
+    def test_percentile_tier(self):
+        histogram = _histogram([3] * 5 + [8] * 5)
+
+        assert histogram.percentile_tier(0.5) == 8
+        assert histogram.percentile_tier(0.7) == 3
+        assert histogram.lowest_tier() == 3
+
+    def test_empty_histogram_defaults(self):
+        histogram = TagTierHistogram.from_counts([(4, 0)])
+
+        assert histogram.total == 0
+        assert histogram.tier_range() is None
+        assert histogram.percentile_tier(0.5) == 1
+        assert histogram.lowest_tier() == 1
@@ -2,8 +2,11 @@ import pytest
 from datetime import datetime
 from unittest.mock import MagicMock, AsyncMock
 
-from app.common.domain.vo.identifiers import ProblemId
+from app.common.domain.vo.collections import ProblemIdBitmap
+from app.common.domain.vo.identifiers import ProblemId, TagId
+from app.common.domain.vo.primitives import TierRange
 from app.problem.infra.repository.problem_repository_impl import ProblemRepositoryImpl
+from app.recommendation.domain.vo.search_criteria import SearchCriteria, TagSearchCriteria
 
 
 def _make_problem_model(problem_id=1000, title="A+B"):
@@ -48,3 +51,31 @@ class TestProblemRepository:
         result = await repo.find_by_title_keyword("nonexistent")
 
         assert result == []
+
+
+class TestFindRecommendedCandidatesFallback:
+    """인덱스가 없을 때 find_recommended_candidates SQL 폴백 테스트"""
+
+    def _tag_criteria(self, tag_id: int) -> TagSearchCriteria:
+        criteria = SearchCriteria(
+            tier_range=TierRange(min_tier_id=None, max_tier_id=None),
+            min_skill_rate=100,
+            max_skill_rate=0,
+        )
+        return TagSearchCriteria(tag_id=TagId(tag_id), criteria_list=(criteria,), min_solved_count=1000)
+
+    async def test_large_exclusion_is_filtered_in_memory(self, mock_database_context):
+        repo = _make_repo(mock_database_context)
+        session = mock_database_context.get_current_session()
+        rows = [(_make_problem_model(problem_id=pid), 1) for pid in (1, 2, 3, 4)]
+        session.execute.return_value.all.return_value = rows
+        repo._attach_tags_and_map_to_entities = AsyncMock(
+            side_effect=lambda models: [MagicMock(problem_id=ProblemId(m.problem_id)) for m in models]
+        )
+        exclude_ids = ProblemIdBitmap.from_values(range(1, 1000, 2))  # 1, 3, ... (500개)
+
+        result = await repo.find_recommended_candidates([self._tag_criteria(1)], exclude_ids, per_tag_limit=1)
+
+        statement = str(session.execute.call_args.args[0])
+        assert "NOT IN" not in statement
+        assert [p.problem_id.value for p in result[1]] == [2]
@@ -0,0 +1,105 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.activity.domain.entity.user_activity import UserActivity
+from app.common.domain.vo.collections import ProblemIdBitmap
+from app.common.domain.vo.identifiers import BaekjoonAccountId, ProblemId, UserAccountId
+from app.recommendation.application.command.exclusion_cache_command import InvalidateExclusionCacheCommand
+from app.recommendation.application.service.exclusion_cache_service import ExclusionCacheService
+
+
+def _make_service(with_gateway: bool = True) -> ExclusionCacheService:
+    return ExclusionCacheService(
+        problem_history_repository=AsyncMock(),
+        exclusion_bitmap_gateway=AsyncMock() if with_gateway else None,
+    )
+
+
+class TestProblemIdBitmap:
+    """ProblemIdBitmap VO 테스트"""
+
+    def test_membership_and_len(self):
+        bitmap = ProblemIdBitmap.from_values([1000, 1007, 1008])
+
+        assert 1000 in bitmap
+        assert ProblemId(1008) in bitmap
+        assert 1001 not in bitmap
+        assert 999999 not in bitmap
+        assert len(bitmap) == 3
+
+    def test_union_keeps_both_sides(self):
+        merged = ProblemIdBitmap.from_values([1]) | ProblemIdBitmap.from_values([30000])
+
+        assert list(merged) == [1, 30000]
+
+    def test_empty_is_falsy(self):
+        assert not ProblemIdBitmap.empty()
+
+
+class TestLoadUserExclusion:
+    """load_user_exclusion() 테스트"""
+
+    async def test_cache_hit_skips_db(self):
+        service = _make_service()
+        service.exclusion_bitmap_gateway.get_user_exclusion.return_value = ProblemIdBitmap.from_values([7])
+
+        result = await service.load_user_exclusion(
+            UserAccountId(1), BaekjoonAccountId("tester"), UserActivity.create(UserAccountId(1))
+        )
+
+        assert list(result) == [7]
+        service.problem_history_repository.find_solved_ids_by_bj_account_id.assert_not_called()
+
+    async def test_cache_miss_merges_history_and_banned(self):
+        service = _make_service()
+        service.exclusion_bitmap_gateway.get_user_exclusion.return_value = None
+        service.exclusion_bitmap_gateway.get_solved_history.return_value = None
+        service.problem_history_repository.find_solved_ids_by_bj_account_id.return_value = {1000, 1001}
+        activity = UserActivity.create(UserAccountId(1))
+        activity.ban_problem(ProblemId(2000))
+
+        result = await service.load_user_exclusion(UserAccountId(1), BaekjoonAccountId("tester"), activity)
+
+        assert set(result) == {1000, 1001, 2000}
+        service.exclusion_bitmap_gateway.store_user_exclusion.assert_called_once_with(1, result)
+        service.exclusion_bitmap_gateway.store_solved_history.assert_called_once()
+
+    async def test_without_gateway_builds_from_db(self):
+        service = _make_service(with_gateway=False)
+        service.problem_history_repository.find_solved_ids_by_bj_account_id.return_value = {5}
+
+        result = await service.load_user_exclusion(
+            UserAccountId(1), BaekjoonAccountId("tester"), UserActivity.create(UserAccountId(1))
+        )
+
+        assert list(result) == [5]
+
+
+class TestInvalidate:
+    """invalidate() 테스트"""
+
+    async def test_invalidate_forwards_ids(self):
+        service = _make_service()
+
+        await service.invalidate(InvalidateExclusionCacheCommand(user_account_id=1, bj_account_id="tester"))
+
+        service.exclusion_bitmap_gateway.invalidate.assert_called_once_with(
+            user_account_id=1, bj_account_id="tester"
+        )
+
+    async def test_invalidate_inside_transaction_waits_for_commit(self):
+        from app.core.database import _pop_after_commit_events, _session_context
+        service = _make_service()
+
+        token = _session_context.set(MagicMock())
+        try:
+            await service.invalidate(InvalidateExclusionCacheCommand(user_account_id=1, bj_account_id="tester"))
+        finally:
+            _session_context.reset(token)
+
+        service.exclusion_bitmap_gateway.invalidate.assert_not_called()
+        for dispatch_fn in _pop_after_commit_events():
+            await dispatch_fn()
+        service.exclusion_bitmap_gateway.invalidate.assert_called_once_with(
+            user_account_id=1, bj_account_id="tester"
+        )
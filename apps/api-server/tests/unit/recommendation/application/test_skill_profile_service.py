@@ -0,0 +1,79 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.common.domain.vo.identifiers import BaekjoonAccountId, TagId, TierId, UserAccountId
+from app.recommendation.application.command.skill_profile_command import InvalidateSkillProfileCommand
+from app.recommendation.application.service.skill_profile_service import SkillProfileService
+
+
+def _make_service(with_gateway: bool = True) -> SkillProfileService:
+    service = SkillProfileService(
+        baekjoon_account_repository=AsyncMock(),
+        tag_skill_repository=AsyncMock(),
+        tag_stat_cache_gateway=AsyncMock() if with_gateway else None,
+    )
+    service.tag_skill_repository.find_all_active.return_value = []
+    return service
+
+
+def _bj_account() -> MagicMock:
+    bj_account = MagicMock()
+    bj_account.bj_account_id = BaekjoonAccountId("tester")
+    bj_account.current_tier_id = TierId(10)
+    return bj_account
+
+
+STAT = TagAccountStat(tag_id=TagId(1), solved_problem_count=3, highest_tier_id=TierId(5), last_solved_date=None)
+
+
+class TestSkillProfileService:
+    """SkillProfileService 단위 테스트"""
+
+    async def test_cache_hit_skips_stat_query(self):
+        service = _make_service()
+        service.tag_stat_cache_gateway.get.return_value = [STAT]
+
+        profile = await service.load(UserAccountId(1), _bj_account())
+
+        assert profile.stat(TagId(1)) == STAT
+        service.baekjoon_account_repository.get_tag_stats.assert_not_called()
+
+    async def test_cache_miss_queries_and_stores(self):
+        service = _make_service()
+        service.tag_stat_cache_gateway.get.return_value = None
+        service.baekjoon_account_repository.get_tag_stats.return_value = [STAT]
+
+        await service.load(UserAccountId(1), _bj_account())
+
+        service.tag_stat_cache_gateway.store.assert_awaited_once_with(1, [STAT])
+
+    async def test_invalidate_deletes_user_cache(self):
+        service = _make_service()
+
+        await service.invalidate(InvalidateSkillProfileCommand(user_account_id=7))
+
+        service.tag_stat_cache_gateway.invalidate.assert_awaited_once_with(7)
+
+    async def test_invalidate_inside_transaction_waits_for_commit(self):
+        from app.core.database import _pop_after_commit_events, _session_context
+        service = _make_service()
+
+        token = _session_context.set(MagicMock())
+        try:
+            await service.invalidate(InvalidateSkillProfileCommand(user_account_id=7))
+        finally:
+            _session_context.reset(token)
+
+        service.tag_stat_cache_gateway.invalidate.assert_not_called()
+        for dispatch_fn in _pop_after_commit_events():
+            await dispatch_fn()
+        service.tag_stat_cache_gateway.invalidate.assert_awaited_once_with(7)
+
+    async def test_without_gateway_always_queries(self):
+        service = _make_service(with_gateway=False)
+        service.baekjoon_account_repository.get_tag_stats.return_value = [STAT]
+
+        profile = await service.load(UserAccountId(1), _bj_account())
+
+        assert profile.stat(TagId(1)) == STAT
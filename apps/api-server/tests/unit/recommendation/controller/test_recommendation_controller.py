@@ -25,6 +25,7 @@ class TestRecommendationController:
         self, mock_current_user, mock_recommendation_usecase
     ):
         mock_query = MagicMock()
+        mock_query.trace_id = None
         mock_recommendation_usecase.execute.return_value = mock_query
 
         from app.recommendation.presentation.schema.response.recommendation_response import RecommendationResponse
@@ -37,9 +38,62 @@ class TestRecommendationController:
                 tags="[]",
                 count=3,
                 exclusion_mode="LENIENT",
+                x_recommendation_trace=None,
+                x_admin_key=None,
                 current_user=mock_current_user,
                 recommendation_usecase=mock_recommendation_usecase,
+                admin_api_key="admin-secret",
             )
 
         mock_recommendation_usecase.execute.assert_called_once()
         assert isinstance(result, ApiResponse)
+
+    async def test_get_recommended_problems_returns_trace_id_header(
+        self, mock_current_user, mock_recommendation_usecase
+    ):
+        mock_query = MagicMock()
+        mock_query.trace_id = "abc123"
+        mock_recommendation_usecase.execute.return_value = mock_query
+
+        from app.recommendation.presentation.schema.response.recommendation_response import RecommendationResponse
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr(RecommendationResponse, "from_query", lambda q: {})
+            result = await get_recommended_problems(
+                level="[]",
+                tags="[]",
+                count=3,
+                exclusion_mode="LENIENT",
+                x_recommendation_trace="1",
+                x_admin_key="admin-secret",
+                current_user=mock_current_user,
+                recommendation_usecase=mock_recommendation_usecase,
+                admin_api_key="admin-secret",
+            )
+
+        assert mock_recommendation_usecase.execute.call_args.kwargs["trace_requested"] is True
+        assert result.headers["X-Recommendation-Trace-Id"] == "abc123"
+
+    @pytest.mark.parametrize("x_admin_key", [None, "wrong-key"])
+    async def test_trace_header_without_valid_admin_key_is_ignored(
+        self, mock_current_user, mock_recommendation_usecase, x_admin_key
+    ):
+        mock_query = MagicMock()
+        mock_query.trace_id = None
+        mock_recommendation_usecase.execute.return_value = mock_query
+
+        from app.recommendation.presentation.schema.response.recommendation_response import RecommendationResponse
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr(RecommendationResponse, "from_query", lambda q: {})
+            await get_recommended_problems(
+                level="[]",
+                tags="[]",
+                count=3,
+                exclusion_mode="LENIENT",
+                x_recommendation_trace="1",
+                x_admin_key=x_admin_key,
+                current_user=mock_current_user,
+                recommendation_usecase=mock_recommendation_usecase,
+                admin_api_key="admin-secret",
+            )
+
+        assert mock_recommendation_usecase.execute.call_args.kwargs["trace_requested"] is False
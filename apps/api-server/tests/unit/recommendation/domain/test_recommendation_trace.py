@@ -0,0 +1,26 @@
+from app.recommendation.domain.entity.recommendation_trace import RecommendationTrace
+
+
+class TestRecommendationTrace:
+    """RecommendationTrace 단위 테스트"""
+
+    def test_keeps_only_top_tag_scores(self):
+        trace = RecommendationTrace.create(1, {})
+        for i in range(50):
+            trace.record_tag_score(f"tag{i}", review=float(i), level_up=0.0, target=0.0, is_target=False)
+
+        scores = trace.to_dict()["tag_scores"]
+
+        assert len(scores) == 20
+        assert scores[0]["tag_name"] == "tag49"
+        assert scores[-1]["tag_name"] == "tag30"
+
+    def test_attempt_summary(self):
+        trace = RecommendationTrace.create(1, {})
+        trace.record_attempt("dp", False, reason="NO_CANDIDATE")
+        trace.record_attempt("greedy", True, problem_id=1000)
+
+        data = trace.to_dict()
+
+        assert data["attempt_summary"] == {"total": 2, "success": 1, "failed": 1}
+        assert RecommendationTrace.from_dict(data).attempts == trace.attempts
@@ -0,0 +1,49 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.common.domain.vo.identifiers import TagId
+from app.recommendation.domain.vo.tag_candidate import TagCandidate, TagCandidates
+
+
+def _candidates(scores: list[float]) -> TagCandidates:
+    return TagCandidates.from_list([
+        TagCandidate.create(MagicMock(), TagAccountStat.empty(TagId(i)), score)
+        for i, score in enumerate(scores, 1)
+    ])
+
+
+class TestWeightedRandomSample:
+    """TagCandidates.weighted_random_sample() 테스트"""
+
+    def test_sample_has_no_duplicates(self):
+        candidates = _candidates([10, 20, 30, 40, 50])
+
+        for _ in range(50):
+            sampled = list(candidates.weighted_random_sample(3))
+            assert len(sampled) == 3
+            assert len({c.stat.tag_id for c in sampled}) == 3
+
+    def test_k_larger_than_size_returns_all(self):
+        candidates = _candidates([1, 2])
+
+        assert len(candidates.weighted_random_sample(5)) == 2
+
+    def test_zero_weight_candidate_is_rarely_drawn(self):
+        candidates = _candidates([0, 1000])
+
+        drawn = [list(candidates.weighted_random_sample(1))[0].stat.tag_id.value for _ in range(200)]
+
+        assert drawn.count(2) > 190
+
+
+class TestWeightedRandomChoices:
+    """TagCandidates.weighted_random_choices() 테스트"""
+
+    def test_returns_requested_length_with_replacement(self):
+        candidates = _candidates([5, 5])
+
+        assert len(candidates.weighted_random_choices(10)) == 10
+
+    def test_empty_collection_returns_empty(self):
+        assert TagCandidates.empty().weighted_random_choices(3) == []
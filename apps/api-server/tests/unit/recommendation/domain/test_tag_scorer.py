@@ -0,0 +1,85 @@
+import pytest
+from datetime import date, timedelta
+
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.common.domain.enums import SkillCode, TagLevel
+from app.common.domain.vo.identifiers import TagId, TierId
+from app.recommendation.domain.entity.tag_skill import TagSkill
+from app.recommendation.domain.service.tag_scorer import TagScorer
+from app.recommendation.domain.vo.user_skill_profile import TagSkillLevel, UserSkillProfile
+
+TODAY = date(2026, 3, 1)
+
+
+def _skill(code: SkillCode, min_solved: int, period: int = 7, min_user_tier: int = 0, min_problem_tier: int = 0) -> TagSkill:
+    return TagSkill.create(
+        tag_id=TagId(1),
+        tag_level=TagLevel.BEGINNER,
+        skill_code=code,
+        min_solved_problem=min_solved,
+        recommendation_period=period,
+        min_user_tier=TierId(min_user_tier),
+        min_solved_problem_tier=TierId(min_problem_tier),
+    )
+
+
+def _skills() -> dict:
+    return {
+        (1, SkillCode.IM): _skill(SkillCode.IM, 0, period=7),
+        (1, SkillCode.AD): _skill(SkillCode.AD, 10, period=14),
+        (1, SkillCode.MAS): _skill(SkillCode.MAS, 30, period=30, min_user_tier=20),
+    }
+
+
+def _stat(solved: int, days_ago: int | None = None, highest: int | None = 10, tag_id: int = 1) -> TagAccountStat:
+    return TagAccountStat(
+        tag_id=TagId(tag_id),
+        solved_problem_count=solved,
+        highest_tier_id=TierId(highest) if highest is not None else None,
+        last_solved_date=TODAY - timedelta(days=days_ago) if days_ago is not None else None,
+    )
+
+
+def _level(stat: TagAccountStat, user_tier: int = 10) -> TagSkillLevel:
+    return UserSkillProfile.build([stat], _skills(), TierId(user_tier)).level(stat.tag_id)
+
+
+class TestScoreAll:
+    """TagScorer.score_all() 테스트"""
+
+    def test_new_tag_gets_new_tag_score(self):
+        scorer = TagScorer(today=TODAY)
+
+        score = scorer.score(_level(_stat(0, highest=None)))
+
+        assert score.review == 40
+        assert score.total == 40
+
+    def test_undated_record_gets_mid_score(self):
+        scorer = TagScorer(today=TODAY)
+
+        assert scorer.score(_level(_stat(20))).review == 20
+
+    def test_review_score_grows_after_period_and_is_capped(self):
+        scorer = TagScorer(today=TODAY)
+
+        # AD 숙련도 (추천 주기 14일)
+        assert scorer.score(_level(_stat(20, days_ago=10))).review == 0
+        assert scorer.score(_level(_stat(20, days_ago=16))).review == 14
+        assert scorer.score(_level(_stat(20, days_ago=100))).review == 50
+
+    def test_level_up_and_target_bonus(self):
+        scorer = TagScorer(target_tag_ids={1}, today=TODAY)
+
+        score = scorer.score(_level(_stat(8, days_ago=1)))
+
+        assert score.level_up == 30
+        assert score.target == 30
+        assert score.total == 60
+
+    def test_scores_keep_input_order(self):
+        scorer = TagScorer(today=TODAY)
+
+        scores = scorer.score_all([_level(_stat(0, highest=None)), _level(_stat(20))])
+
+        assert [s.review for s in scores] == [40, 20]
@@ -0,0 +1,86 @@
+import pytest
+
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.common.domain.enums import SkillCode, TagLevel
+from app.common.domain.vo.identifiers import TagId, TierId
+from app.recommendation.domain.entity.tag_skill import TagSkill
+from app.recommendation.domain.vo.user_skill_profile import UserSkillProfile
+
+
+def _skill(code: SkillCode, min_solved: int, min_user_tier: int = 0, min_problem_tier: int = 0) -> TagSkill:
+    return TagSkill.create(
+        tag_id=TagId(1),
+        tag_level=TagLevel.BEGINNER,
+        skill_code=code,
+        min_solved_problem=min_solved,
+        recommendation_period=7,
+        min_user_tier=TierId(min_user_tier),
+        min_solved_problem_tier=TierId(min_problem_tier),
+    )
+
+
+def _skills() -> dict:
+    return {
+        (1, SkillCode.IM): _skill(SkillCode.IM, 0),
+        (1, SkillCode.AD): _skill(SkillCode.AD, 10, min_problem_tier=8),
+        (1, SkillCode.MAS): _skill(SkillCode.MAS, 30, min_user_tier=20),
+    }
+
+
+def _stat(solved: int, highest: int | None = 10, tag_id: int = 1) -> TagAccountStat:
+    return TagAccountStat(
+        tag_id=TagId(tag_id),
+        solved_problem_count=solved,
+        highest_tier_id=TierId(highest) if highest is not None else None,
+        last_solved_date=None,
+    )
+
+
+class TestUserSkillProfile:
+    """UserSkillProfile 단위 테스트"""
+
+    def test_highest_satisfied_skill_and_next_skill(self):
+        profile = UserSkillProfile.build([_stat(12)], _skills(), TierId(25))
+
+        level = profile.level(TagId(1))
+
+        assert level.skill_code == SkillCode.AD
+        assert level.next_skill.skill_code == SkillCode.MAS
+        assert level.problems_to_next_skill == 18
+
+    def test_user_tier_blocks_skill_but_not_achieved_level(self):
+        profile = UserSkillProfile.build([_stat(35)], _skills(), TierId(10))
+
+        level = profile.level(TagId(1))
+
+        assert level.skill_code == SkillCode.AD
+        assert level.achieved_level == SkillCode.MAS
+
+    def test_missing_highest_tier_only_blocks_recommendation_skill(self):
+        profile = UserSkillProfile.build([_stat(12, highest=None)], _skills(), TierId(10))
+
+        level = profile.level(TagId(1))
+
+        assert level.skill_code == SkillCode.IM
+        assert level.achieved_level == SkillCode.AD
+
+    def test_tag_without_record_uses_empty_stat(self):
+        profile = UserSkillProfile.build([], _skills(), TierId(10))
+
+        level = profile.level(TagId(1))
+
+        assert profile.stat(TagId(1)) is None
+        assert level.stat.solved_problem_count == 0
+        assert level.skill_code == SkillCode.IM
+        assert not profile.is_above_intermediate(TagId(1))
+
+    def test_unknown_tag_has_no_skill(self):
+        profile = UserSkillProfile.build([_stat(5, tag_id=99)], _skills(), TierId(10))
+
+        assert profile.level(TagId(99)).skill is None
+        assert profile.level(TagId(123)).achieved_level == SkillCode.IM
+
+    def test_prerequisite_requires_record_above_intermediate(self):
+        profile = UserSkillProfile.build([_stat(12)], _skills(), TierId(10))
+
+        assert profile.is_above_intermediate(TagId(1))
@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from app.common.domain.vo.collections import ProblemIdBitmap
+from app.recommendation.infra.gateway.exclusion_bitmap_gateway_impl import ExclusionBitmapGatewayImpl
+
+
+class TestExclusionBitmapGateway:
+    """ExclusionBitmapGatewayImpl 단위 테스트"""
+
+    def _make_gateway(self) -> tuple[ExclusionBitmapGatewayImpl, AsyncMock]:
+        redis_client = AsyncMock()
+        gateway = ExclusionBitmapGatewayImpl(redis_client=redis_client)
+        return gateway, redis_client
+
+    async def test_store_and_get_round_trip(self):
+        gateway, redis = self._make_gateway()
+        bitmap = ProblemIdBitmap.from_values({1000, 1001, 35000})
+
+        await gateway.store_user_exclusion(42, bitmap)
+        stored_key, stored_value = redis.set.call_args[0]
+        redis.get.return_value = stored_value
+
+        result = await gateway.get_user_exclusion(42)
+
+        assert stored_key == "rec:excl:user:42"
+        assert set(result) == {1000, 1001, 35000}
+
+    async def test_get_miss_returns_none(self):
+        gateway, redis = self._make_gateway()
+        redis.get.return_value = None
+
+        assert await gateway.get_solved_history("tester") is None
+
+    async def test_get_failure_returns_none(self):
+        gateway, redis = self._make_gateway()
+        redis.get.side_effect = Exception("redis down")
+
+        assert await gateway.get_user_exclusion(42) is None
+
+    async def test_invalidate_deletes_user_and_bj_keys(self):
+        gateway, redis = self._make_gateway()
+
+        await gateway.invalidate(user_account_id=42, bj_account_id="tester")
+
+        redis.delete.assert_called_once_with("rec:excl:user:42", "rec:excl:bj:tester")
+
+    async def test_invalidate_without_keys_is_noop(self):
+        gateway, redis = self._make_gateway()
+
+        await gateway.invalidate()
+
+        redis.delete.assert_not_called()
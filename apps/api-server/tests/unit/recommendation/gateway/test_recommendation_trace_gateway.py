@@ -0,0 +1,48 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from app.recommendation.domain.entity.recommendation_trace import RecommendationTrace
+from app.recommendation.infra.gateway.recommendation_trace_gateway_impl import RecommendationTraceGatewayImpl
+
+
+class TestRecommendationTraceGateway:
+    """RecommendationTraceGatewayImpl 단위 테스트"""
+
+    def _make_gateway(self) -> tuple[RecommendationTraceGatewayImpl, AsyncMock, AsyncMock]:
+        redis_client = AsyncMock()
+        raw_client = AsyncMock()
+        redis_client.get_client.return_value = raw_client
+        gateway = RecommendationTraceGatewayImpl(redis_client=redis_client)
+        return gateway, redis_client, raw_client
+
+    async def test_save_and_find_round_trip(self):
+        gateway, redis, raw = self._make_gateway()
+        trace = RecommendationTrace.create(1, {"count": 3})
+        trace.record_attempt("그리디", True, problem_id=1000)
+
+        await gateway.save(trace)
+        stored_key, stored_value = redis.set.call_args[0]
+        redis.get.return_value = stored_value
+
+        result = await gateway.find_by_id(trace.trace_id)
+
+        assert stored_key == f"rec:trace:{trace.trace_id}"
+        raw.lpush.assert_awaited_once_with("rec:trace:recent", trace.trace_id)
+        assert result.trace_id == trace.trace_id
+        assert result.attempts == trace.attempts
+
+    async def test_find_recent_skips_expired(self):
+        gateway, redis, raw = self._make_gateway()
+        trace = RecommendationTrace.create(1, {})
+        raw.lrange.return_value = [trace.trace_id, "expired"]
+        redis.get.side_effect = lambda key: trace.to_dict() if key.endswith(trace.trace_id) else None
+
+        result = await gateway.find_recent(10)
+
+        assert [t.trace_id for t in result] == [trace.trace_id]
+
+    async def test_save_failure_is_swallowed(self):
+        gateway, redis, _ = self._make_gateway()
+        redis.set.side_effect = Exception("redis down")
+
+        await gateway.save(RecommendationTrace.create(1, {}))
@@ -0,0 +1,33 @@
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+
+from app.baekjoon.domain.vo.tag_account_stat import TagAccountStat
+from app.common.domain.vo.identifiers import TagId, TierId
+from app.recommendation.infra.gateway.tag_stat_cache_gateway_impl import TagStatCacheGatewayImpl
+
+
+class TestTagStatCacheGateway:
+    """TagStatCacheGatewayImpl 단위 테스트"""
+
+    async def test_store_and_get_round_trip(self):
+        redis = AsyncMock()
+        gateway = TagStatCacheGatewayImpl(redis_client=redis)
+        stats = [
+            TagAccountStat(TagId(1), 12, TierId(10), date(2026, 3, 1)),
+            TagAccountStat(TagId(2), 3, None, None),
+        ]
+
+        await gateway.store(42, stats)
+        stored_key, stored_value = redis.set.call_args[0]
+        redis.get.return_value = stored_value
+
+        assert stored_key == "rec:tagstat:user:42"
+        assert await gateway.get(42) == stats
+
+    async def test_get_failure_returns_none(self):
+        redis = AsyncMock()
+        redis.get.side_effect = Exception("redis down")
+        gateway = TagStatCacheGatewayImpl(redis_client=redis)
+
+        assert await gateway.get(42) is None
@@ -1,6 +1,10 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 
+from app.common.domain.enums import FilterCode
+from app.common.domain.vo.identifiers import LevelFilterId
+from app.recommendation.domain.entity.level_filter import LevelFilter
+from app.recommendation.infra.cache.level_filter_table import LevelFilterTable
 from app.recommendation.infra.repository.level_filter_repository_impl import LevelFilterRepositoryImpl
 
 
@@ -17,3 +21,71 @@ class TestLevelFilterRepository:
         result = await repo.find_all_active()
 
         assert result == []
+
+
+def _filter(filter_id: int, skill: str, code: str) -> LevelFilter:
+    level_filter = LevelFilter.create(
+        filter_code=FilterCode(code),
+        display_name=code,
+        tag_skill_code=skill,
+        min_tag_skill_rate=0,
+        max_tag_skill_rate=100,
+    )
+    level_filter.filter_id = LevelFilterId(filter_id)
+    return level_filter
+
+
+class TestLevelFilterTable:
+    """LevelFilterTable 경유 조회 테스트 (DB 미사용)"""
+
+    def _make_repo(self) -> LevelFilterRepositoryImpl:
+        table = LevelFilterTable(db=MagicMock())
+        table.load([
+            _filter(2, "IM", "HARD"),
+            _filter(1, "IM", "EASY"),
+            _filter(3, "AD", "EASY"),
+        ])
+        return LevelFilterRepositoryImpl(db=MagicMock(), level_filter_table=table)
+
+    async def test_find_by_skill_and_codes_uses_table(self):
+        repo = self._make_repo()
+
+        result = await repo.find_by_skill_and_codes("IM", ["HARD", "EASY", "EXTREME"])
+
+        assert [f.filter_id.value for f in result] == [1, 2]
+
+    async def test_find_by_skill_and_code_uses_table(self):
+        repo = self._make_repo()
+
+        assert (await repo.find_by_skill_and_code("AD", "EASY")).filter_id.value == 3
+        assert await repo.find_by_skill_and_code("MAS", "EASY") is None
+
+    async def test_invalidated_table_is_not_ready(self):
+        repo = self._make_repo()
+
+        repo.level_filter_table.invalidate()
+
+        assert not repo.level_filter_table.is_ready
+
+    async def test_save_reloads_and_broadcasts_after_commit(self):
+        from app.core.database import _pop_after_commit_events, _session_context
+        table = MagicMock()
+        table.reload = AsyncMock()
+        reference_data_cache = MagicMock()
+        reference_data_cache.broadcast_invalidation = AsyncMock()
+        db = MagicMock()
+        db.get_current_session.return_value.flush = AsyncMock()
+        repo = LevelFilterRepositoryImpl(db=db, level_filter_table=table, reference_data_cache=reference_data_cache)
+
+        token = _session_context.set(MagicMock())
+        try:
+            await repo.save(_filter(1, "IM", "EASY"))
+        finally:
+            _session_context.reset(token)
+
+        table.invalidate.assert_called_once()
+        table.reload.assert_not_called()
+        for dispatch_fn in _pop_after_commit_events():
+            await dispatch_fn()
+        table.reload.assert_awaited_once()
+        reference_data_cache.broadcast_invalidation.assert_awaited_once_with(topic="level-filter")
@@ -0,0 +1,33 @@
+from app.common.domain.vo.identifiers import TierId
+from app.config.tier_config import TIER_CONFIG
+from app.tier.domain.entity.tier import Tier
+from app.tier.domain.vo.tier_table import UNKNOWN_TIER_CODE, TierTable
+
+
+class TestTierTable:
+    """TierTable 테스트"""
+
+    def test_static_table_covers_tier_config(self):
+        table = TierTable.static()
+
+        assert len(table) == len(TIER_CONFIG)
+        assert table.code(0) == "Unrated"
+        assert table.code(11) == "G5"
+        assert table.get(31).tier_rating == 3000
+
+    def test_codes_resolves_in_bulk_and_deduplicates(self):
+        table = TierTable.static()
+
+        assert table.codes([5, 5, 16, 99]) == {5: "B1", 16: "P5", 99: UNKNOWN_TIER_CODE}
+
+    def test_codes_empty(self):
+        assert TierTable.static().codes([]) == {}
+
+    def test_from_tiers_orders_all_by_level(self):
+        table = TierTable.from_tiers([
+            Tier.create(TierId(2), 2, "B4", 60),
+            Tier.create(TierId(1), 1, "B5", 30),
+        ])
+
+        assert [tier.tier_code for tier in table.all()] == ["B5", "B4"]
+        assert table.get(3) is None